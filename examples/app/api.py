@@ -33,9 +33,9 @@ def patch(body, id):
     employee = models.Employee.query.filter_by(id=id).first()
     if employee is None:
         return ("Employee not found.", 404)
-    employee.name = body["name"]
-    employee.division = body["division"]
-    employee.salary = body["salary"]
+    if body.pop("id", id) != id:
+        return ("The id of an employee cannot be changed.", 400)
+    employee.update_from_dict(**body)
     database.db.session.commit()
     return 200
 
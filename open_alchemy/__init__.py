@@ -9,7 +9,9 @@ from sqlalchemy.ext import declarative
 
 from open_alchemy import types as oa_types
 
+from . import advise as _advise_module
 from . import build as _build_module
+from . import cache as _cache
 from . import exceptions
 from . import model_factory as _model_factory
 from . import models_file as _models_file
@@ -17,6 +19,7 @@ from . import schemas as _schemas_module
 from .build import PackageFormat
 from .helpers import define_all as _define_all
 from .helpers import inheritance as _inheritance
+from .helpers import preload as _preload
 from .helpers import ref as _ref
 from .helpers import schema as _schema_helper
 from .schemas import artifacts as _schemas_artifacts
@@ -64,11 +67,11 @@ def init_model_factory(
     schemas = components.get("schemas", {})
 
     # Pre-processing schemas
-    _schemas_module.process(schemas=schemas, spec_filename=spec_path)
+    index = _schemas_module.process(schemas=schemas, spec_filename=spec_path)
 
     # Getting artifacts
     schemas_artifacts = _schemas_artifacts.get_from_schemas(
-        schemas=schemas, stay_within_model=True
+        schemas=schemas, stay_within_model=True, index=index
     )
 
     # Binding the base and schemas
@@ -93,13 +96,17 @@ def init_model_factory(
 
     if models_filename is not None:
         schemas_artifacts = _schemas_artifacts.get_from_schemas(
-            schemas=schemas, stay_within_model=False
+            schemas=schemas, stay_within_model=False, index=index
         )
         models_file_contents = _models_file.generate(artifacts=schemas_artifacts)
         with open(models_filename, "w") as out_file:
             out_file.write(models_file_contents)
 
-    _define_all.define_all(model_factory=_register_model, schemas=schemas)
+    _define_all.define_all(
+        model_factory=_register_model,
+        schemas=schemas,
+        parents={name: entry.parent for name, entry in index.items()},
+    )
 
     return _register_model
 
@@ -167,11 +174,55 @@ def init_json(
     )
 
 
+def _load_yaml(spec_filename: str, *, spec_cache: bool) -> oa_types.Schema:
+    """
+    Load an OpenAPI specification from a YAML file.
+
+    If spec_cache is True, the de-serialized specification is cached next to the file
+    keyed by the hash of the contents of the file so that the YAML does not have to be
+    parsed again until the file changes.
+
+    Raise ImportError if pyyaml has not been installed.
+
+    Args:
+        spec_filename: filename of an OpenAPI spec in YAML format
+        spec_cache: Whether to use the cache of the de-serialized specification.
+
+    Returns:
+        The de-serialized specification.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        import yaml  # noqa: F401 pylint: disable=unused-import
+    except ImportError as exc:
+        raise ImportError(
+            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
+        ) from exc
+
+    from .facades import yaml as yaml_facade
+
+    with open(spec_filename) as spec_file:
+        spec_contents = spec_file.read()
+
+    if not spec_cache:
+        return yaml_facade.load(spec_contents)
+
+    file_hash = _cache.calculate_hash(spec_contents)
+    spec = _cache.spec_get(filename=spec_filename, file_hash=file_hash)
+    if spec is None:
+        spec = yaml_facade.load(spec_contents)
+        _cache.spec_set(filename=spec_filename, file_hash=file_hash, spec=spec)
+
+    return spec
+
+
 def init_yaml(
     spec_filename: str,
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    spec_cache: bool = False,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a YAML file.
@@ -184,6 +235,8 @@ def init_yaml(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        spec_cache: (optional) Whether to cache the de-serialized specification next
+            to the file so that the YAML is only parsed again after the file changes.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -193,15 +246,7 @@ def init_yaml(
             base based on the OpenAPI specification.
 
     """
-    try:
-        import yaml  # pylint: disable=import-outside-toplevel
-    except ImportError as exc:
-        raise ImportError(
-            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
-        ) from exc
-
-    with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
+    spec = _load_yaml(spec_filename, spec_cache=spec_cache)
 
     return _init_optional_base(
         base=base,
@@ -211,6 +256,65 @@ def init_yaml(
     )
 
 
+def preload(
+    spec_filename: str,
+    *,
+    base: typing.Optional[typing.Type] = None,
+    models_filename: typing.Optional[str] = None,
+    freeze: bool = True,
+    spec_cache: bool = False,
+) -> BaseAndModelFactory:
+    """
+    Construct and prepare all the models in the master process of a pre-fork server.
+
+    Constructs the models in the same way as init_json or init_yaml based on the
+    extension of the file, compiles the from_dict converter of each model, configures
+    the mappers and, by default, freezes all objects for the garbage collector. Worker
+    processes forked afterwards share the memory of the models copy-on-write instead
+    of each constructing them.
+
+    Raise ImportError if the file is not JSON and pyyaml has not been installed.
+
+    Args:
+        spec_filename: filename of an OpenAPI spec in JSON (.json) or YAML format
+        base: (optional) The declarative base for the models.
+              If base=None, construct a new SQLAlchemy declarative base.
+        models_filename: (optional) The path to write the models file to. If it is not
+            provided, the models file is not created.
+        freeze: (optional) Whether to call gc.freeze after the models have been
+            prepared. Should only be turned off if the process does not fork.
+        spec_cache: (optional) Whether to cache the de-serialized YAML specification
+            in the same way as for init_yaml.
+
+    Returns:
+        A tuple (Base, model_factory), where:
+
+        Base: a SQLAlchemy declarative base class
+        model_factory: A factory that returns SQLAlchemy models derived from the
+            base based on the OpenAPI specification.
+
+    """
+    if spec_filename.lower().endswith(".json"):
+        import json  # pylint: disable=import-outside-toplevel
+
+        with open(spec_filename) as spec_file:
+            spec = json.load(spec_file)
+    else:
+        spec = _load_yaml(spec_filename, spec_cache=spec_cache)
+
+    base, model_factory = _init_optional_base(
+        base=base,
+        spec=spec,
+        models_filename=models_filename,
+        spec_path=spec_filename,
+    )
+
+    names = _define_all.calculate_order(schemas=spec["components"]["schemas"])
+    _preload.prepare(models=[model_factory(name=name) for name in names], freeze=freeze)
+
+    return base, model_factory
+
+
 def _get_base(*, name: str, schemas: oa_types.Schemas) -> typing.Type:
     """
     Retrieve the base class of a schema considering inheritance.
@@ -296,7 +400,7 @@ def build_yaml(
     Create an OpenAlchemy distribution package with the SQLAlchemy models.
 
     The package can be uploaded to, for example, PyPI or a private repository for
-    distribution.
+    distribution. The de-serialized specification is cached next to the file.
 
     The formats can be combined with the bitwise operator "or" (``|``), for
     instance, building both sdist and wheel packages can be specified like that:
@@ -312,26 +416,62 @@ def build_yaml(
         format_: (optional) The format(s) of the archive(s) to build.
 
     """
-    try:
-        import yaml  # pylint: disable=import-outside-toplevel
-    except ImportError as exc:
-        raise ImportError(
-            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
-        ) from exc
-
-    with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
+    spec = _load_yaml(spec_filename, spec_cache=True)
 
     return _build_module.execute(
         spec=spec, name=package_name, path=dist_path, format_=format_
     )
 
 
+def advise_json(spec_filename: str) -> typing.List[_advise_module.Finding]:
+    """
+    Find performance problems of the models of an OpenAPI specification in JSON.
+
+    Args:
+        spec_filename: filename of an OpenAPI spec in JSON format
+
+    Returns:
+        The performance problems of the models, for example foreign key columns
+        without an index.
+
+    """
+    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
+    # need it:
+    import json  # pylint: disable=import-outside-toplevel
+
+    with open(spec_filename) as spec_file:
+        spec = json.load(spec_file)
+
+    return _advise_module.execute(spec=spec)
+
+
+def advise_yaml(spec_filename: str) -> typing.List[_advise_module.Finding]:
+    """
+    Find performance problems of the models of an OpenAPI specification in YAML.
+
+    Raise ImportError if pyyaml has not been installed.
+
+    Args:
+        spec_filename: filename of an OpenAPI spec in YAML format
+
+    Returns:
+        The performance problems of the models, for example foreign key columns
+        without an index.
+
+    """
+    spec = _load_yaml(spec_filename, spec_cache=False)
+
+    return _advise_module.execute(spec=spec)
+
+
 __all__ = [
     "init_model_factory",
     "init_json",
     "init_yaml",
+    "preload",
     "build_json",
     "build_yaml",
+    "advise_json",
+    "advise_yaml",
     "PackageFormat",
 ]
@@ -0,0 +1,341 @@
+"""Advise on performance problems of the models of a specification."""
+
+import dataclasses
+import enum
+import typing
+
+from . import build
+from . import types
+from .schemas import artifacts as schemas_artifacts
+
+
+@enum.unique
+class Code(str, enum.Enum):
+    """The kind of a performance problem."""
+
+    FOREIGN_KEY_NOT_INDEXED = "foreign-key-not-indexed"
+    ONE_TO_MANY_NOT_INDEXED = "one-to-many-not-indexed"
+    RELATIONSHIP_TARGET_NOT_INDEXED = "relationship-target-not-indexed"
+    UNBOUNDED_STRING_PRIMARY_KEY = "unbounded-string-primary-key"
+    JSON_COMPOSITE_INDEX = "json-composite-index"
+
+
+class FindingTypedDict(types.TypedDict, total=True):
+    """TypedDict representation of a finding."""
+
+    code: str
+    model: str
+    property: typing.Optional[str]
+    message: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Finding:
+    """A performance problem of a model."""
+
+    # The kind of the problem
+    code: Code
+    # The name of the model with the problem
+    model: str
+    # The name of the property with the problem, if it is caused by a property
+    property: typing.Optional[str]
+    # The description of the problem
+    message: str
+
+    def to_dict(self) -> FindingTypedDict:
+        """Convert to dictionary."""
+        return {
+            "code": self.code.value,
+            "model": self.model,
+            "property": self.property,
+            "message": self.message,
+        }
+
+
+# Formats of string properties with a fixed size column
+_FIXED_SIZE_STRING_FORMATS = {"date", "date-time"}
+
+
+def _get_indexed_columns(
+    *, artifacts: types.ModelsModelArtifacts
+) -> typing.Dict[str, typing.Set[str]]:
+    """
+    Calculate the columns of each table that are the first column of an index.
+
+    The columns are those with x-index or x-unique, the first primary key column and
+    the first column of any x-composite-index or x-composite-unique.
+
+    Args:
+        artifacts: The artifacts of the models.
+
+    Returns:
+        The indexed columns keyed by tablename.
+
+    """
+    indexed_columns: typing.Dict[str, typing.Set[str]] = {}
+    primary_key_tablenames: typing.Set[str] = set()
+    for model_artifacts in artifacts.values():
+        columns = indexed_columns.setdefault(model_artifacts.tablename, set())
+        for name, property_artifacts in model_artifacts.properties:
+            if not isinstance(
+                property_artifacts,
+                (types.SimplePropertyArtifacts, types.JsonPropertyArtifacts),
+            ):
+                continue
+            extension = property_artifacts.extension
+            if extension.index or extension.unique:
+                columns.add(name)
+            if (
+                extension.primary_key
+                and model_artifacts.tablename not in primary_key_tablenames
+            ):
+                primary_key_tablenames.add(model_artifacts.tablename)
+                columns.add(name)
+        for index_spec in model_artifacts.composite_index or []:
+            columns.add(index_spec["expressions"][0])
+        for unique_spec in model_artifacts.composite_unique or []:
+            columns.add(unique_spec["columns"][0])
+    return indexed_columns
+
+
+class _Context(typing.NamedTuple):
+    """The information about all models that the checks of a property use."""
+
+    # The artifacts of all models
+    artifacts: types.ModelsModelArtifacts
+    # The columns of each table that are the first column of an index
+    indexed_columns: typing.Dict[str, typing.Set[str]]
+    # The tablename and name of the foreign key columns of one-to-many relationships
+    one_to_many_columns: typing.Set[typing.Tuple[str, str]]
+
+
+def _is_unbounded_string(artifacts: types.SimplePropertyArtifacts) -> bool:
+    """Check whether a property is stored in a string column without a length."""
+    return (
+        artifacts.open_api.type == "string"
+        and artifacts.open_api.format not in _FIXED_SIZE_STRING_FORMATS
+        and not artifacts.extension.native_uuid
+        and artifacts.open_api.max_length is None
+    )
+
+
+def _check_primary_key(
+    *,
+    name: str,
+    property_name: str,
+    artifacts: types.TAnyPropertyArtifacts,
+    context: _Context,  # pylint: disable=unused-argument
+) -> typing.Optional[Finding]:
+    """Check whether a property is a string primary key without maxLength."""
+    if (
+        isinstance(artifacts, types.SimplePropertyArtifacts)
+        and artifacts.extension.primary_key
+        and _is_unbounded_string(artifacts)
+    ):
+        return Finding(
+            code=Code.UNBOUNDED_STRING_PRIMARY_KEY,
+            model=name,
+            property=property_name,
+            message=(
+                f"The {property_name} primary key is a string without maxLength which "
+                "makes the primary key index and any foreign keys referencing it "
+                "larger than necessary, define maxLength."
+            ),
+        )
+    return None
+
+
+def _check_composite_index(
+    *, name: str, artifacts: types.ModelArtifacts
+) -> typing.Iterator[Finding]:
+    """Check whether x-composite-index includes any JSON properties."""
+    json_names = {
+        property_name
+        for property_name, property_artifacts in artifacts.properties
+        if isinstance(property_artifacts, types.JsonPropertyArtifacts)
+    }
+    for index_spec in artifacts.composite_index or []:
+        for expression in index_spec["expressions"]:
+            if expression in json_names:
+                yield Finding(
+                    code=Code.JSON_COMPOSITE_INDEX,
+                    model=name,
+                    property=expression,
+                    message=(
+                        f"x-composite-index includes the {expression} JSON property "
+                        "which most databases cannot index efficiently, remove it or "
+                        "use x-gin-index."
+                    ),
+                )
+
+
+def _split_foreign_key(foreign_key: str) -> typing.Tuple[str, str]:
+    """Split a foreign key into the tablename and the column name."""
+    table, column = foreign_key.rsplit(".", 1)
+    return table.rsplit(".", 1)[-1], column
+
+
+def _check_foreign_key(
+    *,
+    name: str,
+    property_name: str,
+    artifacts: types.TAnyPropertyArtifacts,
+    context: _Context,
+) -> typing.Optional[Finding]:
+    """Check whether the column of a foreign key property is indexed."""
+    if not isinstance(
+        artifacts, (types.SimplePropertyArtifacts, types.JsonPropertyArtifacts)
+    ):
+        return None
+    foreign_key = artifacts.extension.foreign_key
+    tablename = context.artifacts[name].tablename
+    if (
+        foreign_key is None
+        or property_name in context.indexed_columns[tablename]
+        # Reported for the one-to-many relationship instead
+        or (tablename, property_name) in context.one_to_many_columns
+    ):
+        return None
+    return Finding(
+        code=Code.FOREIGN_KEY_NOT_INDEXED,
+        model=name,
+        property=property_name,
+        message=(
+            f"The {tablename}.{property_name} foreign key column is not indexed which "
+            f"makes joins and deletes of the referenced {foreign_key} rows scan the "
+            "table, add x-index."
+        ),
+    )
+
+
+def _check_one_to_many(
+    *,
+    name: str,
+    property_name: str,
+    artifacts: types.TAnyPropertyArtifacts,
+    context: _Context,
+) -> typing.Optional[Finding]:
+    """Check whether the foreign key column of a one-to-many relationship is indexed."""
+    if not isinstance(artifacts, types.OneToManyRelationshipPropertyArtifacts):
+        return None
+    child_tablename = context.artifacts[artifacts.parent].tablename
+    column = artifacts.foreign_key_property
+    if column in context.indexed_columns[child_tablename]:
+        return None
+    return Finding(
+        code=Code.ONE_TO_MANY_NOT_INDEXED,
+        model=name,
+        property=property_name,
+        message=(
+            f"Loading the {property_name} relationship filters {child_tablename} by "
+            f"the {column} column which is not indexed, define the {column} property "
+            f"with x-index on {artifacts.parent}."
+        ),
+    )
+
+
+def _check_x_to_one(
+    *,
+    name: str,
+    property_name: str,
+    artifacts: types.TAnyPropertyArtifacts,
+    context: _Context,
+) -> typing.Optional[Finding]:
+    """Check whether the target column of an x-to-one relationship is indexed."""
+    if not isinstance(artifacts, types.XToOneRelationshipPropertyArtifacts):
+        return None
+    target_tablename, column = _split_foreign_key(artifacts.foreign_key)
+    target_indexed_columns = context.indexed_columns.get(target_tablename)
+    if target_indexed_columns is None or column in target_indexed_columns:
+        return None
+    return Finding(
+        code=Code.RELATIONSHIP_TARGET_NOT_INDEXED,
+        model=name,
+        property=property_name,
+        message=(
+            f"The {property_name} relationship joins {target_tablename} on the "
+            f"{column} column which is not indexed, add x-unique or x-index to the "
+            f"{column} property of {artifacts.parent}."
+        ),
+    )
+
+
+def advise(*, schemas: types.Schemas) -> typing.List[Finding]:
+    """
+    Find performance problems of the models of the processed schemas.
+
+    The problems are:
+    - foreign key columns that are not indexed,
+    - one-to-many relationships where the foreign key column of the child is not
+        indexed,
+    - x-to-one relationships that join on a column of the target that is not
+        indexed,
+    - string primary keys without maxLength and
+    - JSON properties in x-composite-index.
+
+    A column is indexed if it is the first column of an index, which includes the
+    primary key and unique constraints.
+
+    Args:
+        schemas: The schemas after they have been processed.
+
+    Returns:
+        The findings in the order of the models and their properties.
+
+    """
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+    context = _Context(
+        artifacts=artifacts,
+        indexed_columns=_get_indexed_columns(artifacts=artifacts),
+        one_to_many_columns={
+            (
+                artifacts[property_artifacts.parent].tablename,
+                property_artifacts.foreign_key_property,
+            )
+            for model_artifacts in artifacts.values()
+            for _, property_artifacts in model_artifacts.properties
+            if isinstance(
+                property_artifacts, types.OneToManyRelationshipPropertyArtifacts
+            )
+        },
+    )
+
+    findings: typing.List[Finding] = []
+    for name, model_artifacts in artifacts.items():
+        for property_name, property_artifacts in model_artifacts.properties:
+            for check in (
+                _check_primary_key,
+                _check_foreign_key,
+                _check_one_to_many,
+                _check_x_to_one,
+            ):
+                finding = check(
+                    name=name,
+                    property_name=property_name,
+                    artifacts=property_artifacts,
+                    context=context,
+                )
+                if finding is not None:
+                    findings.append(finding)
+        findings.extend(_check_composite_index(name=name, artifacts=model_artifacts))
+
+    return findings
+
+
+def execute(*, spec: typing.Any) -> typing.List[Finding]:
+    """
+    Find performance problems of the models of a specification.
+
+    Raises MalformedSchemaError if the specification is not valid.
+
+    Args:
+        spec: The specification.
+
+    Returns:
+        The findings.
+
+    """
+    schemas = build.get_schemas(spec=spec)
+    return advise(schemas=schemas)
@@ -14,12 +14,26 @@ The structure of the file is:
         }
     }
 }
+
+The de-serialized specification is stored separately, in a binary form that is much
+faster to load than JSON or YAML, in a file with the name:
+__open_alchemy_<sha256 of spec filename>_spec_cache__
+
+The file contains a marshalled dictionary:
+
+{
+    "hash": "<sha256 hash of the file contents>",
+    "version": <marshal version>,
+    "spec": <the de-serialized specification>
+}
 """
 
 import hashlib
 import json
+import marshal  # nosec: the cache is only read from next to the spec file.
 import pathlib
 import shutil
+import typing
 
 from . import exceptions
 
@@ -45,6 +59,20 @@ def calculate_cache_path(path: pathlib.Path) -> pathlib.Path:
     return path.parent / f"__open_alchemy_{calculate_hash(path.name)}_cache__"
 
 
+def calculate_spec_cache_path(path: pathlib.Path) -> pathlib.Path:
+    """
+    Calculate the name of the cache file for the de-serialized spec.
+
+    Args:
+        path: The path to the spec file.
+
+    Returns:
+        The path to the spec cache file.
+
+    """
+    return path.parent / f"__open_alchemy_{calculate_hash(path.name)}_spec_cache__"
+
+
 _HASH_KEY = "hash"
 _DATA_KEY = "data"
 _DATA_SCHEMAS_KEY = "schemas"
@@ -171,3 +199,76 @@ def schemas_are_valid(filename: str) -> None:
     cache_data_schemas[_DATA_SCHEMAS_VALID_KEY] = True
 
     cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+
+_VERSION_KEY = "version"
+_SPEC_KEY = "spec"
+
+
+def spec_get(*, filename: str, file_hash: str) -> typing.Optional[typing.Any]:
+    """
+    Retrieve the de-serialized spec from the cache.
+
+    Algorithm:
+    1. If the cache does not exist or is not a file, return None.
+    2. Try to unmarshal the cache, if it fails or it is not a dictionary, return None.
+    3. If the hash or the marshal version in the cache are different to the expected
+        values, return None.
+    4. Return the spec stored in the cache.
+
+    Args:
+        filename: The name of the OpenAPI specification file.
+        file_hash: The hash of the contents of the spec file.
+
+    Returns:
+        The de-serialized spec or None if the cache is not valid for the spec.
+
+    """
+    cache_path = calculate_spec_cache_path(pathlib.Path(filename))
+    if not cache_path.exists() or not cache_path.is_file():
+        return None
+
+    try:
+        cache = marshal.loads(cache_path.read_bytes())  # nosec
+    except (EOFError, ValueError, TypeError, OSError):
+        return None
+
+    cache_valid = (
+        isinstance(cache, dict)
+        and cache.get(_HASH_KEY) == file_hash
+        and cache.get(_VERSION_KEY) == marshal.version
+        and _SPEC_KEY in cache
+    )
+    if not cache_valid:
+        return None
+
+    return cache[_SPEC_KEY]
+
+
+def spec_set(*, filename: str, file_hash: str, spec: typing.Any) -> None:
+    """
+    Store the de-serialized spec in the cache.
+
+    Specs that contain values that cannot be marshalled, such as dates, are not cached.
+    The spec is also not cached if the cache cannot be written, for example, because
+    the folder of the spec file is read-only.
+
+    Args:
+        filename: The name of the OpenAPI specification file.
+        file_hash: The hash of the contents of the spec file.
+        spec: The de-serialized spec.
+
+    """
+    cache = {_HASH_KEY: file_hash, _VERSION_KEY: marshal.version, _SPEC_KEY: spec}
+    try:
+        contents = marshal.dumps(cache)
+    except ValueError:
+        return
+
+    cache_path = calculate_spec_cache_path(pathlib.Path(filename))
+    try:
+        if cache_path.exists() and not cache_path.is_file():
+            shutil.rmtree(cache_path)
+        cache_path.write_bytes(contents)
+    except OSError:
+        return
@@ -1,9 +1,13 @@
 """Define the CLI module."""
 import argparse
+import json
 import logging
 import pathlib
+import sys
 
 from open_alchemy import PackageFormat
+from open_alchemy import advise_json
+from open_alchemy import advise_yaml
 from open_alchemy import build_json
 from open_alchemy import build_yaml
 from open_alchemy import exceptions
@@ -89,6 +93,20 @@ def build_application_parser() -> argparse.Namespace:
     generate_parser.add_argument("output", type=str, help="specify the output file")
     generate_parser.set_defaults(func=generate)
 
+    # Define the parser for the "advise" subcommand.
+    advise_parser = subparsers.add_parser(
+        "advise",
+        description=(
+            "Report performance problems of the SQLAlchemy models as JSON, exits "
+            "with status 1 if there are any."
+        ),
+        help="report performance problems",
+    )
+    advise_parser.add_argument(
+        "specfile", type=str, help="specify the specification file"
+    )
+    advise_parser.set_defaults(func=advise)
+
     # Return the parsed arguments for a particular command.
     return parser.parse_args()
 
@@ -136,3 +154,33 @@ def generate(args):
     # Regenerate the models.
     generator = generators.get(specfile.suffix.lower())
     generator(args.specfile, models_filename=args.output)
+
+
+def advise(args: argparse.Namespace) -> None:
+    """
+    Define the advise subcommand.
+
+    Write the findings as JSON to stdout and exit with status 1 if there are any.
+
+    Args:
+        args: CLI arguments from the parser.
+    """
+    # Check the specfile.
+    specfile = pathlib.Path(args.specfile)
+    validate_specfile(specfile)
+
+    # Select the advisor method.
+    advisors = dict(zip(VALID_EXTENSIONS, [advise_json, advise_yaml, advise_yaml]))
+
+    # Find the performance problems.
+    advisor = advisors[specfile.suffix.lower()]
+    findings = advisor(args.specfile)
+
+    json.dump(
+        {"findings": [finding.to_dict() for finding in findings]},
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+    if findings:
+        sys.exit(1)
@@ -0,0 +1,335 @@
+"""Generate data transfer object (DTO) classes for models."""
+
+import base64
+import dataclasses
+import keyword
+import typing
+
+from . import types
+from .helpers import calculate_nullable
+
+# The expression converting a value for to_dict based on the format where {} is
+# replaced by the value
+_TO_DICT_CONVERSIONS = {
+    "date": "{}.isoformat()",
+    "date-time": "{}.isoformat()",
+}
+_BINARY_TO_DICT_CONVERSIONS = {
+    types.BinaryEncoding.UTF_8.value: "str({}, 'utf-8')",
+    types.BinaryEncoding.BASE64.value: "base64.b64encode({}).decode('ascii')",
+    types.BinaryEncoding.BYTES.value: "{}",
+}
+# Names that can't be used as identifiers in the source because the source already
+# uses them as the name of a parameter
+_RESERVED = {"self"}
+
+
+@dataclasses.dataclass(frozen=True)
+class Field:
+    """The information about a property that is stored on a DTO."""
+
+    # The name of the property
+    name: str
+    # Whether the value can be None
+    nullable: bool
+    # Whether to_dict includes the property if the value is None
+    return_none: bool
+    # The expression converting the value for to_dict where {} is replaced by the value
+    to_dict: str = "{}"
+
+
+def _calculate_field(
+    *, name: str, artifacts: types.TAnyPropertyArtifacts
+) -> typing.Optional[Field]:
+    """Calculate the field for a property, if the property is stored on a DTO."""
+    if isinstance(artifacts, types.SimplePropertyArtifacts):
+        if artifacts.open_api.write_only or artifacts.extension.dict_ignore:
+            return None
+        to_dict = "{}"
+        if artifacts.open_api.type == "string":
+            if artifacts.open_api.format == "binary":
+                to_dict = _BINARY_TO_DICT_CONVERSIONS[
+                    artifacts.extension.binary_encoding
+                    or types.BinaryEncoding.UTF_8.value
+                ]
+            elif artifacts.extension.native_uuid:
+                to_dict = "str({})"
+            else:
+                to_dict = _TO_DICT_CONVERSIONS.get(
+                    artifacts.open_api.format or "", "{}"
+                )
+        return Field(
+            name=name,
+            nullable=calculate_nullable.calculate_nullable(
+                nullable=artifacts.open_api.nullable,
+                generated=artifacts.extension.autoincrement is True,
+                required=artifacts.required,
+                defaulted=artifacts.open_api.default is not None
+                or artifacts.extension.server_default is not None,
+            ),
+            return_none=artifacts.required or artifacts.open_api.nullable is True,
+            to_dict=to_dict,
+        )
+
+    if isinstance(artifacts, types.JsonPropertyArtifacts):
+        if artifacts.open_api.write_only:
+            return None
+        return Field(
+            name=name,
+            nullable=True,
+            return_none=artifacts.required or artifacts.open_api.nullable is True,
+        )
+
+    return None
+
+
+def calculate_fields(*, artifacts: types.ModelArtifacts) -> typing.List[Field]:
+    """
+    Calculate the fields of the DTO of a model.
+
+    The fields are the properties of the model that are stored in columns and that
+    to_dict returns, which excludes writeOnly and x-dict-ignore properties.
+
+    Args:
+        artifacts: The artifacts of the model.
+
+    Returns:
+        The fields.
+
+    """
+    fields = (
+        _calculate_field(name=name, artifacts=property_artifacts)
+        for name, property_artifacts in artifacts.properties
+    )
+    return [field for field in fields if field is not None]
+
+
+def _is_identifier(name: str) -> bool:
+    """Check whether a property name can be used as an identifier in the source."""
+    return name.isidentifier() and not keyword.iskeyword(name) and name not in _RESERVED
+
+
+def _attribute(*, field: Field, index: int) -> str:
+    """
+    Calculate the name of the slot of a field.
+
+    A property with a name that is not a valid identifier is stored in a slot named
+    after the index of the field.
+
+    """
+    if _is_identifier(field.name):
+        return field.name
+    return f"_dto_slot_{index}"
+
+
+def _argument(*, field: Field, index: int, value: str) -> str:
+    """Calculate the keyword argument passing the value of a field to __init__."""
+    if _is_identifier(field.name):
+        return f"{field.name}={value}"
+    return f"**{{name_{index}: {value}}}"
+
+
+def _value_to_dict(*, field: Field, value: str) -> str:
+    """Calculate the expression converting the value of a field for to_dict."""
+    if field.to_dict == "{}":
+        return value
+    return f"None if {value} is None else {field.to_dict.format(value)}"
+
+
+def check_arguments(
+    args: typing.Tuple[typing.Any, ...], kwargs: typing.Dict[str, typing.Any]
+) -> typing.Any:
+    """
+    Check the arguments of a DTO with property names that aren't valid identifiers.
+
+    Args:
+        args: The positional arguments of __init__ which should only be the instance.
+        kwargs: The keyword arguments of __init__.
+
+    Raises TypeError if there is a positional argument, an unexpected keyword
+    argument or a required keyword argument is missing.
+
+    Returns:
+        The instance.
+
+    """
+    instance, *positional = args
+    class_name = instance.__class__.__name__
+    if positional:
+        raise TypeError(f"{class_name}() takes no positional arguments")
+    fields: typing.Tuple[Field, ...] = instance._fields
+    unexpected = kwargs.keys() - {field.name for field in fields}
+    if unexpected:
+        raise TypeError(
+            f"{class_name}() got unexpected keyword arguments: {sorted(unexpected)!r}"
+        )
+    missing = [
+        field.name
+        for field in fields
+        if not field.nullable and field.name not in kwargs
+    ]
+    if missing:
+        raise TypeError(
+            f"{class_name}() missing required keyword arguments: {missing!r}"
+        )
+    return instance
+
+
+def generate(*, fields: typing.Sequence[Field]) -> str:
+    """
+    Generate the source of a DTO class named _Dto that inherits from _Parent.
+
+    The names of the properties are not part of the source. The source refers to the
+    name of the field at index i as name_i and to the names of the slots as slots. If
+    the name of any property is not a valid identifier, __init__ accepts any arguments
+    which are checked using check_arguments.
+
+    Args:
+        fields: All the fields of the class, including those of the parent class.
+
+    Returns:
+        The source of the class.
+
+    """
+    lines = ["class _Dto(_Parent):", "    __slots__ = slots"]
+    attributes = [
+        (index, field, _attribute(field=field, index=index))
+        for index, field in enumerate(fields)
+    ]
+
+    # __init__
+    if not fields:
+        lines.extend(["    def __init__(self):", "        pass"])
+    elif all(field.name == attribute for _, field, attribute in attributes):
+        args = ", ".join(
+            f"{field.name}=None" if field.nullable else field.name for field in fields
+        )
+        lines.append(f"    def __init__(self, *, {args}):")
+        lines.extend(f"        self.{field.name} = {field.name}" for field in fields)
+    else:
+        lines.extend(
+            [
+                "    def __init__(*args, **kwargs):",
+                "        self = check_arguments(args, kwargs)",
+            ]
+        )
+        lines.extend(
+            f"        self.{attribute} = kwargs.get(name_{index})"
+            for index, _, attribute in attributes
+        )
+
+    # from_row
+    values = ", ".join(
+        _argument(
+            field=field,
+            index=index,
+            value=f"values.get(name_{index})"
+            if field.nullable
+            else f"values[name_{index}]",
+        )
+        for index, field, _ in attributes
+    )
+    lines.extend(
+        [
+            "    @classmethod",
+            "    def from_row(cls, row):",
+            "        values = getattr(row, '_mapping', row)",
+            f"        return cls({values})",
+        ]
+    )
+
+    # to_dict, the keys are in the same order as the fields
+    lines.extend(["    def to_dict(self):", "        return_dict = {}"])
+    for index, field, attribute in attributes:
+        value = f"self.{attribute}"
+        if field.return_none:
+            lines.append(
+                f"        return_dict[name_{index}] = "
+                f"{_value_to_dict(field=field, value=value)}"
+            )
+            continue
+        lines.extend(
+            [
+                f"        if {value} is not None:",
+                f"            return_dict[name_{index}] = "
+                f"{field.to_dict.format(value)}",
+            ]
+        )
+    lines.append("        return return_dict")
+
+    # __repr__ and __eq__
+    repr_args = ", ".join(
+        f"{{name_{index}}}={{self.{attribute}!r}}" for index, _, attribute in attributes
+    )
+    values_tuple = "".join(f"self.{attribute}, " for _, _, attribute in attributes)
+    other_tuple = "".join(f"other.{attribute}, " for _, _, attribute in attributes)
+    lines.extend(
+        [
+            "    def __repr__(self):",
+            f"        return f'{{self.__class__.__name__}}({repr_args})'",
+            "    def __eq__(self, other):",
+            "        if other.__class__ is not self.__class__:",
+            "            return NotImplemented",
+            f"        return ({values_tuple}) == ({other_tuple})",
+        ]
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+def dto_factory(
+    *, name: str, artifacts: types.ModelArtifacts, parent: typing.Optional[typing.Type]
+) -> typing.Type:
+    """
+    Construct the DTO class of a model.
+
+    The DTO is a plain class with __slots__ for the properties of the model that are
+    stored in columns which is constructed from rows using from_row and converted to
+    dictionaries in the same way as the model using to_dict. The DTO of a model that
+    inherits derives from the DTO of the parent model.
+
+    Args:
+        name: The name of the model.
+        artifacts: The artifacts of the model.
+        parent: The DTO class of the parent model, if the model inherits.
+
+    Returns:
+        The DTO class.
+
+    """
+    fields_by_name: typing.Dict[str, Field] = {}
+    if parent is not None:
+        fields_by_name.update((field.name, field) for field in parent._fields)
+    parent_names = set(fields_by_name)
+    fields_by_name.update(
+        (field.name, field) for field in calculate_fields(artifacts=artifacts)
+    )
+    fields = list(fields_by_name.values())
+    slots = {
+        field.name: _attribute(field=field, index=index)
+        for index, field in enumerate(fields)
+        if field.name not in parent_names
+    }
+
+    source = generate(fields=fields)
+    namespace: typing.Dict[str, typing.Any] = {
+        "__name__": __name__,
+        "base64": base64,
+        "check_arguments": check_arguments,
+        "slots": tuple(slots.values()),
+        "_Parent": object if parent is None else parent,
+        **{f"name_{index}": field.name for index, field in enumerate(fields)},
+    }
+    exec(  # pylint: disable=exec-used
+        compile(source, "<open_alchemy dto>", "exec"), namespace
+    )
+    dto = namespace["_Dto"]
+    dto.__name__ = dto.__qualname__ = f"{name}Dto"
+    # Expose the slots of properties with names that are not valid identifiers
+    # under the name of the property
+    for field_name, attribute in slots.items():
+        if field_name != attribute:
+            setattr(dto, field_name, getattr(dto, attribute))
+    dto.__doc__ = f"Data transfer object for the {name} model."
+    dto._fields = tuple(fields)
+    return dto
@@ -78,3 +78,11 @@ class CLIError(BaseError):
 
 class CacheError(BaseError):
     """Raised when an error occurs when the cache is used."""
+
+
+class InstanceCycleError(BaseError, ValueError):
+    """Raised when to_dict reaches an instance that it is already converting."""
+
+
+class InvalidCursorError(BaseError, ValueError):
+    """Raised when a keyset pagination cursor cannot be decoded."""
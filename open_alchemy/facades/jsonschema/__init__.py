@@ -11,6 +11,99 @@ ValidationError = jsonschema.ValidationError
 validate = jsonschema.validate  # pylint: disable=invalid-name
 
 
+# The values that are valid for binary properties in addition to strings
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+def _is_bytes_like_binary(instance: typing.Any, schema: typing.Any) -> bool:
+    """Check whether a value is bytes like and the schema has the binary format."""
+    return (
+        isinstance(schema, dict)
+        and schema.get("format") == "binary"
+        and isinstance(instance, _BYTES_LIKE)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _binary_validator_class(cls: typing.Any) -> typing.Any:
+    """
+    Extend a validator class to accept bytes like values for binary properties.
+
+    The type, maxLength and minLength keywords treat bytes like values of properties
+    with the binary format like strings.
+
+    Args:
+        cls: The validator class to extend.
+
+    Returns:
+        The extended validator class.
+
+    """
+    type_ = cls.VALIDATORS["type"]
+    max_length = cls.VALIDATORS["maxLength"]
+    min_length = cls.VALIDATORS["minLength"]
+
+    def binary_type(
+        validator_: typing.Any,
+        types: typing.Any,
+        instance: typing.Any,
+        schema: typing.Any,
+    ) -> typing.Iterator[typing.Any]:
+        """Validate the type treating bytes like binary values like strings."""
+        if _is_bytes_like_binary(instance, schema) and "string" in (
+            types if isinstance(types, list) else [types]
+        ):
+            return
+        yield from type_(validator_, types, instance, schema)
+
+    def binary_max_length(
+        validator_: typing.Any, value: int, instance: typing.Any, schema: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        """Validate the maximum length including bytes like binary values."""
+        if _is_bytes_like_binary(instance, schema):
+            if len(instance) > value:
+                yield ValidationError(f"{instance!r} is too long")
+            return
+        yield from max_length(validator_, value, instance, schema)
+
+    def binary_min_length(
+        validator_: typing.Any, value: int, instance: typing.Any, schema: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        """Validate the minimum length including bytes like binary values."""
+        if _is_bytes_like_binary(instance, schema):
+            if len(instance) < value:
+                yield ValidationError(f"{instance!r} is too short")
+            return
+        yield from min_length(validator_, value, instance, schema)
+
+    return jsonschema.validators.extend(
+        cls,
+        {
+            "type": binary_type,
+            "maxLength": binary_max_length,
+            "minLength": binary_min_length,
+        },
+    )
+
+
+def validator(schema: typing.Dict[str, typing.Any]) -> typing.Any:
+    """
+    Create a validator for a schema.
+
+    Bytes like values are valid for properties with the binary format, in the same
+    way as for strings, since from_dict accepts them for binary properties.
+
+    Args:
+        schema: The schema to validate against.
+
+    Returns:
+        The validator for the version of JSON schema the schema uses.
+
+    """
+    cls = jsonschema.validators.validator_for(schema)
+    return _binary_validator_class(cls)(schema)
+
+
 def _filename_to_dict(filename: str) -> typing.Dict:
     """
     Map filename for a JSON file to the de-serialized dictionary.
@@ -3,6 +3,7 @@
 import typing
 
 import open_alchemy
+from open_alchemy import exceptions
 from open_alchemy import types
 
 
@@ -49,6 +50,28 @@ def get_model_schema(*, name: str) -> typing.Optional[types.Schema]:
     return model._schema  # pylint: disable=protected-access
 
 
+def get_schema(*, model: typing.Type) -> types.Schema:
+    """
+    Get the schema a model was constructed with.
+
+    Raise ModelAttributeError if the model does not have a record of its schema.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The schema of the model.
+
+    """
+    schema = getattr(model, "_schema", None)
+    if schema is None:
+        raise exceptions.ModelAttributeError(
+            "Model does not have a record of its schema. "
+            "To support to_dict set the _schema class variable."
+        )
+    return schema
+
+
 def set_model(*, name: str, model: typing.Type) -> None:
     """
     Set model by name on models.
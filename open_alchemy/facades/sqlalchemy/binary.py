@@ -0,0 +1,109 @@
+"""Read the values of binary columns in chunks."""
+
+import typing
+
+import sqlalchemy
+
+from open_alchemy import exceptions
+
+
+def _where_primary_key(*, model: typing.Any, ident: typing.Any) -> typing.Any:
+    """
+    Calculate the clause that selects the row of a model with a primary key.
+
+    Raise MissingArgumentError if the number of values does not match the number of
+    columns of the primary key.
+
+    Args:
+        model: The model to select the row of.
+        ident: The value of the primary key or, for composite primary keys, a tuple
+            with the value of each column in the order of the columns.
+
+    Returns:
+        The clause.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    values = ident if isinstance(ident, tuple) else (ident,)
+    if len(values) != len(mapper.primary_key):
+        raise exceptions.MissingArgumentError(
+            f"The primary key of {model.__name__} has {len(mapper.primary_key)} "
+            f"columns but {len(values)} values were passed in."
+        )
+    return sqlalchemy.and_(
+        *(
+            mapper.get_property_by_column(column).class_attribute == value
+            for column, value in zip(mapper.primary_key, values)
+        )
+    )
+
+
+def _chunks(
+    *,
+    bind: typing.Any,
+    column: typing.Any,
+    model: typing.Any,
+    where: typing.Any,
+    length: int,
+    chunk_size: int,
+) -> typing.Iterator[bytes]:
+    """Query the chunks of the value of a binary column."""
+    for start in range(1, length + 1, chunk_size):
+        chunk = bind.execute(
+            sqlalchemy.select(
+                [sqlalchemy.func.substr(column, start, chunk_size, type_=column.type)]
+            )
+            .select_from(model)
+            .where(where)
+        ).scalar()
+        yield bytes(chunk)
+
+
+def stream(
+    *,
+    bind: typing.Any,
+    model: typing.Any,
+    name: str,
+    ident: typing.Any,
+    chunk_size: int,
+) -> typing.Iterator[bytes]:
+    """
+    Read the value of a binary column of a row in chunks.
+
+    The length of the value is queried straight away and each chunk is queried using
+    SUBSTR as it is iterated over so that the value is never loaded at once. Nothing is
+    yielded if the row does not exist or if the value is NULL.
+
+    Raise MissingArgumentError if the number of values of the primary key does not
+    match the number of columns of the primary key.
+    Raise ValueError if the chunk size is not positive.
+
+    Args:
+        bind: The session or connection used to execute the queries.
+        model: The model with the binary column.
+        name: The name of the property of the binary column.
+        ident: The value of the primary key of the row.
+        chunk_size: The maximum number of bytes of each chunk.
+
+    Returns:
+        The chunks of the value.
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+
+    where = _where_primary_key(model=model, ident=ident)
+    column = getattr(model, name)
+    length = bind.execute(
+        sqlalchemy.select([sqlalchemy.func.length(column)])
+        .select_from(model)
+        .where(where)
+    ).scalar()
+    return _chunks(
+        bind=bind,
+        column=column,
+        model=model,
+        where=where,
+        length=length or 0,
+        chunk_size=chunk_size,
+    )
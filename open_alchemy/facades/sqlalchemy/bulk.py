@@ -0,0 +1,499 @@
+"""Bulk operations using SQLAlchemy Core."""
+
+import itertools
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from open_alchemy import exceptions
+
+TValues = typing.Dict[str, typing.Any]
+TTableValues = typing.List[typing.Tuple[sqlalchemy.Table, TValues]]
+TColumnKeys = typing.Tuple[str, ...]
+
+# The dialects that support INSERT ... ON CONFLICT DO UPDATE mapped to their insert
+_ON_CONFLICT_INSERTS: typing.Dict[str, typing.Callable[..., typing.Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+# The prefix of the bound parameters for the columns in the WHERE clause of updates
+_WHERE_PARAM_PREFIX = "_where_"
+
+
+class UpsertCounts(typing.NamedTuple):
+    """The number of rows inserted and updated by an upsert."""
+
+    inserted: int
+    updated: int
+
+
+def _get_tables(*, mapper: typing.Any) -> typing.List[sqlalchemy.Table]:
+    """
+    Get the tables of a model with the base table first.
+
+    Models using single table inheritance share a table with their parent which is only
+    included once.
+
+    Args:
+        mapper: The mapper of the model.
+
+    Returns:
+        The tables of the model.
+
+    """
+    tables: typing.List[sqlalchemy.Table] = []
+    for ancestor in reversed(list(mapper.iterate_to_root())):
+        if ancestor.local_table not in tables:
+            tables.append(ancestor.local_table)
+    return tables
+
+
+def calculate_table_values(*, model: typing.Any, values: TValues) -> TTableValues:
+    """
+    Split the values of the properties of a model into the values for each table.
+
+    Raise MalformedModelDictionaryError if a value is not for a column or if the primary
+    key of a model with joined table inheritance is not defined.
+
+    Args:
+        model: The model the values are for.
+        values: The values keyed by property name.
+
+    Returns:
+        The values keyed by column name for each table of the model with the base table
+        first.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    column_attrs = mapper.column_attrs
+    tables = _get_tables(mapper=mapper)
+    table_values: typing.Dict[sqlalchemy.Table, TValues] = {
+        table: {} for table in tables
+    }
+
+    for name, value in values.items():
+        if name not in column_attrs:
+            raise exceptions.MalformedModelDictionaryError(
+                "Only column properties can be inserted in bulk.",
+                parameter_name=name,
+            )
+        for column in column_attrs[name].columns:
+            table_values[column.table][column.key] = value
+
+    # Record the identity of models using polymorphism
+    polymorphic_on = mapper.polymorphic_on
+    if polymorphic_on is not None and mapper.polymorphic_identity is not None:
+        table_values[polymorphic_on.table].setdefault(
+            polymorphic_on.key, mapper.polymorphic_identity
+        )
+
+    # The primary key of the rows of joined tables cannot be retrieved from a bulk
+    # insert
+    if len(tables) > 1:
+        for table in tables:
+            missing = [
+                column.key
+                for column in table.primary_key.columns
+                if column.key not in table_values[table]
+            ]
+            if missing:
+                raise exceptions.MalformedModelDictionaryError(
+                    "The primary key is required to insert models with joined table "
+                    "inheritance in bulk.",
+                    table=table.name,
+                    missing=missing,
+                )
+
+    return [(table, table_values[table]) for table in tables]
+
+
+def _insert_chunk(*, bind: typing.Any, chunk: typing.List[TTableValues]) -> None:
+    """
+    Insert a chunk of rows.
+
+    The rows for each table are inserted before the rows of the next table so that the
+    base table rows exist before the rows that reference them are inserted. Rows are
+    grouped by the columns they define since executemany requires every row of a
+    statement to define the same columns.
+
+    Args:
+        bind: The session or connection used to execute the inserts.
+        chunk: The values for each table for each row.
+
+    """
+    for table_index, (table, _) in enumerate(chunk[0]):
+        groups: typing.Dict[typing.Tuple[str, ...], typing.List[TValues]] = {}
+        for row in chunk:
+            _, values = row[table_index]
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+        for group in groups.values():
+            bind.execute(table.insert(), group)
+
+
+def _chunks(
+    iterable: typing.Iterable[TTableValues], chunk_size: int
+) -> typing.Iterator[typing.List[TTableValues]]:
+    """Split an iterable into lists of at most chunk size elements."""
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def insert(
+    *,
+    bind: typing.Any,
+    model: typing.Any,
+    rows: typing.Iterable[TValues],
+    chunk_size: int,
+) -> int:
+    """
+    Insert rows for a model using executemany in chunks.
+
+    Raise ValueError if the chunk size is not positive.
+
+    Args:
+        bind: The session or connection used to execute the inserts.
+        model: The model to insert rows for.
+        rows: The values keyed by property name for each row.
+        chunk_size: The maximum number of rows in each executemany.
+
+    Returns:
+        The number of rows that were inserted.
+
+    """
+    table_values_iter = map(
+        lambda values: calculate_table_values(model=model, values=values), rows
+    )
+    count = 0
+    for chunk in _chunks(table_values_iter, chunk_size):
+        _insert_chunk(bind=bind, chunk=chunk)
+        count += len(chunk)
+    return count
+
+
+def _get_unique_keys(*, table: sqlalchemy.Table) -> typing.List[TColumnKeys]:
+    """
+    Get the keys of the columns of the primary key, unique constraints and indexes.
+
+    Unique constraints are defined by x-unique on a property and x-composite-unique on
+    a model. Properties with both x-unique and x-index and unique x-composite-index
+    entries become unique indexes instead.
+
+    Args:
+        table: The table to get the unique keys for.
+
+    Returns:
+        The primary key followed by the unique constraints and indexes ordered by their
+        columns.
+
+    """
+    constraint_keys = (
+        tuple(column.key for column in constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, sqlalchemy.UniqueConstraint)
+    )
+    # Indexes on expressions cannot be used as the target of ON CONFLICT
+    index_keys = (
+        tuple(column.key for column in index.columns)
+        for index in table.indexes
+        if index.unique and len(index.columns) == len(index.expressions)
+    )
+    primary_key = tuple(column.key for column in table.primary_key.columns)
+    unique_keys = set(itertools.chain(constraint_keys, index_keys))
+    unique_keys.discard(primary_key)
+    return [primary_key, *sorted(unique_keys)]
+
+
+def _get_conflict_keys(
+    *, unique_keys: typing.List[TColumnKeys], values: TValues
+) -> TColumnKeys:
+    """
+    Get the keys of the columns used to detect whether a row already exists.
+
+    Raise MalformedModelDictionaryError if the values don't define a value for all the
+    columns of any unique keys.
+
+    Args:
+        unique_keys: The primary key and unique constraints of the table.
+        values: The values of the row.
+
+    Returns:
+        The first unique key for which all columns have a value.
+
+    """
+    conflict_keys = next(
+        filter(lambda keys: all(key in values for key in keys), unique_keys), None
+    )
+    if conflict_keys is None:
+        raise exceptions.MalformedModelDictionaryError(
+            "To upsert in bulk, the primary key or the properties of a unique "
+            "constraint are required.",
+            values=values,
+        )
+    return conflict_keys
+
+
+def _deduplicate(
+    *, unique_keys: typing.List[TColumnKeys], rows: typing.List[TValues]
+) -> typing.List[typing.Tuple[TColumnKeys, TValues]]:
+    """
+    Remove the rows with the same values for the columns used to detect conflicts.
+
+    A statement cannot insert or update the same row more than once, so the last row
+    with the same values is used.
+
+    Raise MalformedModelDictionaryError if a row doesn't define a value for all the
+    columns of any unique keys.
+
+    Args:
+        unique_keys: The primary key and unique constraints of the table.
+        rows: The values of the rows.
+
+    Returns:
+        The keys of the columns used to detect conflicts and the values of each
+        remaining row in the order of the last row with the same values.
+
+    """
+    unique_rows: typing.Dict[
+        typing.Tuple[TColumnKeys, typing.Tuple[typing.Any, ...]],
+        typing.Tuple[TColumnKeys, TValues],
+    ] = {}
+    for row in rows:
+        conflict_keys = _get_conflict_keys(unique_keys=unique_keys, values=row)
+        key = (conflict_keys, tuple(row[key] for key in conflict_keys))
+        unique_rows.pop(key, None)
+        unique_rows[key] = (conflict_keys, row)
+    return list(unique_rows.values())
+
+
+def _get_dialect(*, bind: typing.Any) -> typing.Any:
+    """Get the dialect of a session or connection."""
+    if isinstance(bind, orm.Session):
+        return bind.get_bind().dialect
+    return bind.dialect
+
+
+def _select_existing(
+    *,
+    bind: typing.Any,
+    table: sqlalchemy.Table,
+    conflict_keys: TColumnKeys,
+    rows: typing.List[TValues],
+) -> typing.Set[typing.Tuple[typing.Any, ...]]:
+    """Select the values of the conflict columns of the rows that already exist."""
+    columns = [table.columns[key] for key in conflict_keys]
+    values = [tuple(row[key] for key in conflict_keys) for row in rows]
+    query = sqlalchemy.select(columns).where(sqlalchemy.tuple_(*columns).in_(values))
+    return set(map(tuple, bind.execute(query)))
+
+
+def _upsert_on_conflict(
+    *,
+    bind: typing.Any,
+    insert_: typing.Callable[..., typing.Any],
+    table: sqlalchemy.Table,
+    conflict_keys: TColumnKeys,
+    keys: TColumnKeys,
+    rows: typing.List[TValues],
+) -> None:
+    """Upsert rows using INSERT ... ON CONFLICT DO UPDATE."""
+    statement = insert_(table)
+    update_keys = [key for key in keys if key not in conflict_keys]
+    if update_keys:
+        statement = statement.on_conflict_do_update(
+            index_elements=list(conflict_keys),
+            set_={key: statement.excluded[key] for key in update_keys},
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=list(conflict_keys))
+    bind.execute(statement, rows)
+
+
+def _upsert_merge(
+    *,
+    bind: typing.Any,
+    table: sqlalchemy.Table,
+    conflict_keys: TColumnKeys,
+    keys: TColumnKeys,
+    rows: typing.List[TValues],
+    existing: typing.Set[typing.Tuple[typing.Any, ...]],
+) -> None:
+    """Upsert rows by inserting the new and updating the existing rows."""
+    new_rows: typing.List[TValues] = []
+    existing_rows: typing.List[TValues] = []
+    for row in rows:
+        if tuple(row[key] for key in conflict_keys) in existing:
+            existing_rows.append(row)
+        else:
+            new_rows.append(row)
+
+    if new_rows:
+        bind.execute(table.insert(), new_rows)
+
+    update_keys = [key for key in keys if key not in conflict_keys]
+    if existing_rows and update_keys:
+        statement = (
+            table.update()
+            .where(
+                sqlalchemy.and_(
+                    *(
+                        table.columns[key]
+                        == sqlalchemy.bindparam(f"{_WHERE_PARAM_PREFIX}{key}")
+                        for key in conflict_keys
+                    )
+                )
+            )
+            .values({key: sqlalchemy.bindparam(key) for key in update_keys})
+        )
+        bind.execute(
+            statement,
+            [
+                {
+                    **{key: row[key] for key in update_keys},
+                    **{
+                        f"{_WHERE_PARAM_PREFIX}{key}": row[key] for key in conflict_keys
+                    },
+                }
+                for row in existing_rows
+            ],
+        )
+
+
+def _upsert_table(
+    *,
+    bind: typing.Any,
+    table: sqlalchemy.Table,
+    unique_keys: typing.List[TColumnKeys],
+    rows: typing.List[TValues],
+) -> UpsertCounts:
+    """
+    Upsert rows into a table.
+
+    Rows with the same values for the columns used to detect conflicts are
+    de-duplicated, keeping the last row. The remaining rows are grouped by the columns
+    used to detect conflicts and the columns they define since each statement
+    requires the same columns for every row.
+
+    Args:
+        bind: The session or connection used to execute the statements.
+        table: The table to upsert into.
+        unique_keys: The keys that can be used to detect conflicts.
+        rows: The values of the rows.
+
+    Returns:
+        The number of rows that were inserted and that already existed and were
+        updated. Existing rows that only define the columns used to detect conflicts
+        are left unchanged and are not counted.
+
+    """
+    groups: typing.Dict[
+        typing.Tuple[TColumnKeys, TColumnKeys], typing.List[TValues]
+    ] = {}
+    unique_rows = _deduplicate(unique_keys=unique_keys, rows=rows)
+    for conflict_keys, row in unique_rows:
+        groups.setdefault((conflict_keys, tuple(sorted(row))), []).append(row)
+
+    insert_ = _ON_CONFLICT_INSERTS.get(_get_dialect(bind=bind).name)
+    existing_count = 0
+    updated_count = 0
+    for (conflict_keys, keys), group in groups.items():
+        existing = _select_existing(
+            bind=bind, table=table, conflict_keys=conflict_keys, rows=group
+        )
+        group_existing_count = sum(
+            1 for row in group if tuple(row[key] for key in conflict_keys) in existing
+        )
+        existing_count += group_existing_count
+        if any(key not in conflict_keys for key in keys):
+            updated_count += group_existing_count
+        if insert_ is not None:
+            _upsert_on_conflict(
+                bind=bind,
+                insert_=insert_,
+                table=table,
+                conflict_keys=conflict_keys,
+                keys=keys,
+                rows=group,
+            )
+        else:
+            _upsert_merge(
+                bind=bind,
+                table=table,
+                conflict_keys=conflict_keys,
+                keys=keys,
+                rows=group,
+                existing=existing,
+            )
+
+    return UpsertCounts(
+        inserted=len(unique_rows) - existing_count, updated=updated_count
+    )
+
+
+def upsert(
+    *,
+    bind: typing.Any,
+    model: typing.Any,
+    rows: typing.Iterable[TValues],
+    chunk_size: int,
+) -> UpsertCounts:
+    """
+    Insert or update rows for a model in chunks.
+
+    A row is updated if a row with the same primary key already exists. If a row does
+    not define the primary key, the first unique constraint for which the row defines
+    all the columns is used instead. For models with joined table inheritance the
+    primary key is used for all tables.
+
+    Rows of a chunk with the same values for the columns used to detect conflicts are
+    de-duplicated and the last of those rows is used.
+
+    SQLite and PostgreSQL use INSERT ... ON CONFLICT DO UPDATE. For other dialects the
+    existing rows of each chunk are updated and the remaining rows are inserted.
+
+    The counts are calculated by selecting the rows of each chunk that already exist
+    before they are upserted. They are approximate if another transaction inserts or
+    deletes the same rows concurrently.
+
+    Raise ValueError if the chunk size is not positive.
+
+    Args:
+        bind: The session or connection used to execute the statements.
+        model: The model to upsert rows for.
+        rows: The values keyed by property name for each row.
+        chunk_size: The maximum number of rows in each chunk.
+
+    Returns:
+        The number of rows that were inserted and updated.
+
+    """
+    table_values_iter = map(
+        lambda values: calculate_table_values(model=model, values=values), rows
+    )
+    inserted = 0
+    updated = 0
+    for chunk in _chunks(table_values_iter, chunk_size):
+        for table_index, (table, _) in enumerate(chunk[0]):
+            unique_keys = _get_unique_keys(table=table)
+            # Only the primary key identifies the rows of all joined tables
+            if len(chunk[0]) > 1:
+                unique_keys = unique_keys[:1]
+            table_rows = [row[table_index][1] for row in chunk]
+            table_counts = _upsert_table(
+                bind=bind, table=table, unique_keys=unique_keys, rows=table_rows
+            )
+            # The base table determines whether the row was inserted or updated
+            if table_index == 0:
+                inserted += table_counts.inserted
+                updated += table_counts.updated
+
+    return UpsertCounts(inserted=inserted, updated=updated)
@@ -0,0 +1,45 @@
+"""Listen for changes to the instances of models."""
+
+import typing
+
+import sqlalchemy
+
+_ATTRIBUTE_EVENTS = ("set", "append", "remove")
+_INSTANCE_EVENTS = ("expire", "refresh")
+_MAPPER_EVENTS = ("after_insert", "after_update")
+
+
+def listen_changes(
+    *, model: typing.Any, callback: typing.Callable[[typing.Any], None]
+) -> None:
+    """
+    Call a function with an instance of a model whenever the instance changes.
+
+    The function is called when a mapped attribute is set, when a collection is
+    appended to or removed from, when the instance is expired or refreshed and after
+    the instance is inserted or updated during a flush. Only instances of the model,
+    not of any sub classes, are listened to.
+
+    Args:
+        model: The model to listen to.
+        callback: The function to call with the instance that changed.
+
+    """
+
+    def on_attribute(target: typing.Any, *_args: typing.Any) -> None:
+        """Handle attribute events."""
+        callback(target)
+
+    def on_mapper(
+        _mapper: typing.Any, _connection: typing.Any, target: typing.Any
+    ) -> None:
+        """Handle mapper events."""
+        callback(target)
+
+    for attribute in sqlalchemy.inspect(model).attrs:
+        for name in _ATTRIBUTE_EVENTS:
+            sqlalchemy.event.listen(getattr(model, attribute.key), name, on_attribute)
+    for name in _INSTANCE_EVENTS:
+        sqlalchemy.event.listen(model, name, on_attribute)
+    for name in _MAPPER_EVENTS:
+        sqlalchemy.event.listen(model, name, on_mapper)
@@ -11,6 +11,8 @@ def construct(*, artifacts: oa_types.JsonPropertyArtifacts) -> types.Column:
     """
     Construct column from artifacts.
 
+    The column uses the JSONB type on PostgreSQL and the JSON type otherwise.
+
     Args:
         artifacts: The artifacts of the column.
 
@@ -18,7 +20,7 @@ def construct(*, artifacts: oa_types.JsonPropertyArtifacts) -> types.Column:
         The SQLAlchemy column.
 
     """
-    type_ = types.JSON()
+    type_ = types.JSON().with_variant(types.JSONB(), "postgresql")
     foreign_key: typing.Optional[types.ForeignKey] = None
     if artifacts.extension.foreign_key is not None:
         foreign_key_kwargs: oa_types.TKwargs = {}
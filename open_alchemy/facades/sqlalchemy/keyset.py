@@ -0,0 +1,110 @@
+"""Construct keyset pagination queries for models."""
+
+import typing
+
+import sqlalchemy
+
+# The name of a property and whether the order is descending
+TOrder = typing.Sequence[typing.Tuple[str, bool]]
+
+
+def primary_key(*, model: typing.Any) -> typing.List[str]:
+    """
+    Calculate the names of the properties of the primary key columns of a model.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The names in the order of the columns of the primary key.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    return [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+
+
+def is_nullable(*, model: typing.Any, name: str) -> bool:
+    """
+    Calculate whether the column of a property of a model is nullable.
+
+    Primary key columns are never nullable, even if they are defined as nullable.
+
+    Args:
+        model: The model.
+        name: The name of the property.
+
+    Returns:
+        Whether the column is nullable.
+
+    """
+    column = sqlalchemy.inspect(model).get_property(name).columns[0]
+    return bool(column.nullable) and not column.primary_key
+
+
+def _where_after(
+    *, model: typing.Any, order: TOrder, values: typing.Sequence[typing.Any]
+) -> typing.Any:
+    """
+    Calculate the clause that selects the rows after a row in the order.
+
+    The clause is (a > x) OR (a = x AND b > y) OR ... which, unlike comparing row
+    values, supports mixed ascending and descending orders on all databases.
+
+    Args:
+        model: The model to select the rows of.
+        order: The order of the rows.
+        values: The values of the columns of the order of the row.
+
+    Returns:
+        The clause.
+
+    """
+    attributes = [getattr(model, name) for name, _ in order]
+    clauses = []
+    for index, ((_, descending), attribute, value) in enumerate(
+        zip(order, attributes, values)
+    ):
+        equal_clauses = [
+            previous_attribute == previous_value
+            for previous_attribute, previous_value in zip(
+                attributes[:index], values[:index]
+            )
+        ]
+        after_clause = attribute < value if descending else attribute > value
+        clauses.append(sqlalchemy.and_(*equal_clauses, after_clause))
+    return sqlalchemy.or_(*clauses)
+
+
+def paginate(
+    *,
+    model: typing.Any,
+    stmt: typing.Any,
+    order: TOrder,
+    values: typing.Optional[typing.Sequence[typing.Any]],
+    limit: int,
+) -> typing.Any:
+    """
+    Order a select statement and select a page of rows after a row.
+
+    Args:
+        model: The model the statement selects.
+        stmt: The select statement, for example with filters. Any order of the
+            statement is replaced. If None the instances of the model are selected.
+        order: The order of the rows which must be unique.
+        values: The values of the columns of the order of the last row of the
+            previous page. If None the first page is selected.
+        limit: The maximum number of rows to select.
+
+    Returns:
+        The statement that selects the page.
+
+    """
+    if stmt is None:
+        stmt = sqlalchemy.select(model)
+    if values is not None:
+        stmt = stmt.where(_where_after(model=model, order=order, values=values))
+    order_by = [
+        getattr(model, name).desc() if descending else getattr(model, name).asc()
+        for name, descending in order
+    ]
+    return stmt.order_by(None).order_by(*order_by).limit(limit)
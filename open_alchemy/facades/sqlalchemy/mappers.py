@@ -0,0 +1,14 @@
+"""Configure the mappers of models."""
+
+from sqlalchemy import orm
+
+
+def configure() -> None:
+    """
+    Configure the mappers of all models that have not been configured yet.
+
+    Configuring resolves, for example, the relationships between the models which
+    otherwise happens the first time a model is used.
+
+    """
+    orm.configure_mappers()
@@ -0,0 +1,107 @@
+"""Construct and modify queries for models."""
+
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+
+def select_columns(
+    *, model: typing.Any, names: typing.Iterable[str], stmt: typing.Any = None
+) -> typing.Any:
+    """
+    Select only the columns of a model.
+
+    Args:
+        model: The model to select the columns of.
+        names: The names of the properties of the columns to select.
+        stmt: A select statement, for example with filters, which is changed to only
+            select the columns.
+
+    Returns:
+        The statement that selects the columns.
+
+    """
+    columns = [getattr(model, name) for name in names]
+    if stmt is None:
+        return sqlalchemy.select(columns)
+    return stmt.with_only_columns(columns)
+
+
+def relationship_load_option(
+    *, model: typing.Any, name: str, parent: typing.Any = None
+) -> typing.Tuple[typing.Any, typing.Any]:
+    """
+    Calculate the option that eagerly loads a relationship.
+
+    Relationships to many are loaded using selectinload and other relationships using
+    joinedload.
+
+    Args:
+        model: The model with the relationship.
+        name: The name of the relationship property.
+        parent: The option that loads the relationship the model is reached through.
+
+    Returns:
+        The option and the model the relationship refers to.
+
+    """
+    attribute = getattr(model, name)
+    relationship = attribute.property
+    loader_name = "selectinload" if relationship.uselist else "joinedload"
+    loader = getattr(orm if parent is None else parent, loader_name)
+    return loader(attribute), relationship.mapper.class_
+
+
+def nest_options(*, option: typing.Any, options: typing.List[typing.Any]) -> typing.Any:
+    """
+    Apply options to what is loaded by an option.
+
+    Args:
+        option: The option that loads a relationship.
+        options: The options for the model the relationship refers to.
+
+    Returns:
+        The option with the nested options.
+
+    """
+    if not options:
+        return option
+    return option.options(*options)
+
+
+def load_only_option(*, model: typing.Any, names: typing.List[str]) -> typing.Any:
+    """
+    Calculate the option that only loads some columns of a model.
+
+    The primary key is always loaded.
+
+    Args:
+        model: The model to load the columns of.
+        names: The names of the properties of the columns to load.
+
+    Returns:
+        The option that only loads the columns.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    attributes = [getattr(model, name) for name in names] or [
+        mapper.get_property_by_column(column).class_attribute
+        for column in mapper.primary_key
+    ]
+    return orm.load_only(*attributes)
+
+
+def noload_option(*, model: typing.Any, name: str) -> typing.Any:
+    """
+    Calculate the option that does not load a relationship.
+
+    Args:
+        model: The model with the relationship.
+        name: The name of the relationship property.
+
+    Returns:
+        The option that does not load the relationship.
+
+    """
+    return orm.noload(getattr(model, name))
@@ -38,6 +38,7 @@ def construct(*, artifacts: oa_types.SimplePropertyArtifacts) -> types.Column:
             value=artifacts.open_api.default,
             type_=artifacts.open_api.type,
             format_=artifacts.open_api.format,
+            native_uuid=artifacts.extension.native_uuid is True,
         )
 
     # Calculate server default
@@ -67,7 +68,7 @@ def construct(*, artifacts: oa_types.SimplePropertyArtifacts) -> types.Column:
     kwargs: oa_types.TKwargs = {}
     if artifacts.extension.kwargs is not None:
         kwargs = artifacts.extension.kwargs
-    return types.Column(
+    column = types.Column(
         type_,
         foreign_key,
         nullable=nullable,
@@ -76,6 +77,26 @@ def construct(*, artifacts: oa_types.SimplePropertyArtifacts) -> types.Column:
         **opt_kwargs,
         **kwargs,
     )
+    if isinstance(type_, types.Enum):
+        sqlalchemy.event.listen(column, "before_parent_attach", _name_enum)
+    return column
+
+
+def _name_enum(column: types.Column, table: sqlalchemy.Table) -> None:
+    """
+    Name the native enum type of a column after its table and column.
+
+    Databases such as PostgreSQL create a named type for each native enum, the name is
+    only known once the column is added to the table.
+
+    Args:
+        column: The column with the native enum type.
+        table: The table the column is added to.
+
+    """
+    enum_type = column.type
+    if isinstance(enum_type, types.Enum) and enum_type.name is None:
+        enum_type.name = f"{table.name}_{column.name}"
 
 
 def _determine_type(*, artifacts: oa_types.SimplePropertyArtifacts) -> types.Type:
@@ -150,9 +171,18 @@ def _handle_number(*, artifacts: oa_types.SimplePropertyArtifacts) -> types.Numb
     )
 
 
-def _handle_string(
-    *, artifacts: oa_types.SimplePropertyArtifacts
-) -> typing.Union[types.String, types.Binary, types.Date, types.DateTime]:
+TStringType = typing.Union[
+    types.String,
+    types.Binary,
+    types.Date,
+    types.DateTime,
+    types.Uuid,
+    types.Enum,
+    types.EnumCode,
+]
+
+
+def _handle_string(*, artifacts: oa_types.SimplePropertyArtifacts) -> TStringType:
     """
     Handle artifacts for an string type.
 
@@ -165,19 +195,90 @@ def _handle_string(
         The SQLAlchemy string type of the column.
 
     """
-    if artifacts.open_api.format == "binary":
-        if artifacts.open_api.max_length is None:
-            return types.Binary()
-        return types.Binary(length=artifacts.open_api.max_length)
-    if artifacts.open_api.format == "date":
-        return types.Date()
-    if artifacts.open_api.format == "date-time":
-        return types.DateTime()
+    if artifacts.extension.enum_storage is not None:
+        return _handle_enum(artifacts=artifacts)
+    handler = _STRING_FORMAT_HANDLERS.get(
+        artifacts.open_api.format or "", _handle_plain_string
+    )
+    return handler(artifacts=artifacts)
+
+
+def _handle_plain_string(*, artifacts: oa_types.SimplePropertyArtifacts) -> TStringType:
+    """
+    Handle artifacts for a string type without a format with a special type.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The SQLAlchemy string type with the maximum length of the column.
+
+    """
     if artifacts.open_api.max_length is None:
         return types.String()
     return types.String(length=artifacts.open_api.max_length)
 
 
+def _handle_binary(*, artifacts: oa_types.SimplePropertyArtifacts) -> TStringType:
+    """
+    Handle artifacts for a string type with the binary format.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The SQLAlchemy binary type with the maximum length of the column.
+
+    """
+    if artifacts.open_api.max_length is None:
+        return types.Binary()
+    return types.Binary(length=artifacts.open_api.max_length)
+
+
+def _handle_uuid(*, artifacts: oa_types.SimplePropertyArtifacts) -> TStringType:
+    """
+    Handle artifacts for a string type with the uuid format.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The SQLAlchemy UUID type with x-native-uuid and the string type otherwise.
+
+    """
+    if artifacts.extension.native_uuid:
+        return types.Uuid()
+    return _handle_plain_string(artifacts=artifacts)
+
+
+# The handler for each string format with a special type
+_STRING_FORMAT_HANDLERS: typing.Dict[str, typing.Callable[..., TStringType]] = {
+    "binary": _handle_binary,
+    "date": lambda **_: types.Date(),
+    "date-time": lambda **_: types.DateTime(),
+    "uuid": _handle_uuid,
+}
+
+
+def _handle_enum(
+    *, artifacts: oa_types.SimplePropertyArtifacts
+) -> typing.Union[types.Enum, types.EnumCode]:
+    """
+    Handle artifacts for an enum string type with x-enum-storage.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The native enum type or the type that stores the code of each value.
+
+    """
+    assert artifacts.open_api.enum is not None
+    if artifacts.extension.enum_storage == oa_types.EnumStorage.SMALL_INTEGER:
+        return types.EnumCode(artifacts.open_api.enum)
+    return types.Enum(*artifacts.open_api.enum)
+
+
 def _handle_boolean() -> types.Boolean:
     """
     Handle artifacts for an boolean type.
@@ -1,7 +1,11 @@
 """SQLAlchemy types."""
 
+import typing
+import uuid
+
 import sqlalchemy
 from sqlalchemy import orm
+from sqlalchemy.dialects import postgresql
 
 from ... import types as oa_types
 
@@ -17,10 +21,100 @@ Binary = sqlalchemy.LargeBinary
 Date = sqlalchemy.Date
 DateTime = sqlalchemy.DateTime
 Boolean = sqlalchemy.Boolean
+Enum = sqlalchemy.Enum
 JSON = sqlalchemy.JSON
+JSONB = postgresql.JSONB
 Relationship = orm.RelationshipProperty
 
 
+class Uuid(sqlalchemy.types.TypeDecorator):  # pylint: disable=abstract-method
+    """
+    UUID type that uses the native UUID type of PostgreSQL and CHAR(32) otherwise.
+
+    Other databases store the 32 hexadecimal digits of the UUID without dashes. The
+    values are uuid.UUID instances, strings are accepted when binding parameters.
+    """
+
+    impl = sqlalchemy.CHAR(32)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: typing.Any) -> typing.Any:
+        """Use the native UUID type for PostgreSQL and CHAR(32) otherwise."""
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(sqlalchemy.CHAR(32))
+
+    def process_bind_param(
+        self, value: typing.Optional[typing.Union[uuid.UUID, str]], dialect: typing.Any
+    ) -> typing.Any:
+        """Convert the value to a UUID for PostgreSQL and to hexadecimal otherwise."""
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        if dialect.name == "postgresql":
+            return value
+        return value.hex
+
+    def process_result_value(
+        self, value: typing.Optional[typing.Union[uuid.UUID, str]], dialect: typing.Any
+    ) -> typing.Optional[uuid.UUID]:
+        """Convert the value from the database to a UUID."""
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(value)
+
+    @property
+    def python_type(self) -> typing.Type[uuid.UUID]:
+        """The Python type of the values."""
+        return uuid.UUID
+
+
+class EnumCode(sqlalchemy.types.TypeDecorator):  # pylint: disable=abstract-method
+    """
+    Enum type that stores the index of each value in a SMALLINT column.
+
+    The values are strings, they are converted to their code when binding parameters
+    and back when loading results. Values are only ever added to the end of the enum
+    so that the codes of stored values do not change.
+    """
+
+    impl = sqlalchemy.SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: typing.Sequence[str]) -> None:
+        """Construct the type from the values of the enum."""
+        super().__init__()
+        self.values = tuple(values)
+        self._codes = {value: code for code, value in enumerate(values)}
+
+    def process_bind_param(
+        self, value: typing.Optional[str], dialect: typing.Any
+    ) -> typing.Any:
+        """Convert the value to its code."""
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError as exc:
+            raise ValueError(
+                f"{value!r} is not one of the values of the enum {self.values!r}."
+            ) from exc
+
+    def process_result_value(
+        self, value: typing.Optional[int], dialect: typing.Any
+    ) -> typing.Optional[str]:
+        """Convert the code from the database to the value."""
+        if value is None:
+            return None
+        return self.values[value]
+
+    @property
+    def python_type(self) -> typing.Type[str]:
+        """The Python type of the values."""
+        return str
+
+
 class TOptColumnArgs(oa_types.TypedDict, total=False):
     """Keyword arguments for Column."""
 
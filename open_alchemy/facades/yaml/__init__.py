@@ -0,0 +1,25 @@
+"""Facade for PyYAML."""
+
+import typing
+
+import yaml
+
+# Re mapping values
+YAMLError = yaml.YAMLError
+
+# Use the libyaml based loader if PyYAML has been built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load(stream: typing.Union[str, typing.IO]) -> typing.Any:
+    """
+    De-serialize YAML using the fastest available safe loader.
+
+    Args:
+        stream: The YAML document as a string or a file.
+
+    Returns:
+        The de-serialized document.
+
+    """
+    return yaml.load(stream, Loader=SafeLoader)
@@ -1,24 +1,101 @@
 """Define all the models with x-tablename properties."""
 
+import typing
+
+from .. import exceptions
 from .. import types
 from . import inheritance as inheritance_helper
 from . import schema as schema_helper
 
+Parents = typing.Dict[str, typing.Optional[str]]
+
 
-def define_all(*, model_factory: types.ModelFactory, schemas: types.Schemas) -> None:
+def _calculate_parents(*, schemas: types.Schemas) -> Parents:
     """
-    Define all the models with x-tablename properties.
+    Calculate the direct parent of each constructable schema.
 
     Args:
-        model_factory: Factory used to construct models.
-        schemas: The schemas from which to define all.
+        schemas: All the schemas.
+
+    Returns:
+        The name of each constructable schema mapped to the name of its parent or None
+        if it does not inherit.
 
     """
+    parents: Parents = {}
     for name, schema in schemas.items():
         if not schema_helper.constructable(schema=schema, schemas=schemas):
             continue
+        parents[name] = None
         if schema_helper.inherits(schema=schema, schemas=schemas):
-            parents = inheritance_helper.get_parents(schema=schema, schemas=schemas)
-            for parent in parents:
-                model_factory(name=parent)
+            parents[name] = inheritance_helper.retrieve_parent(
+                schema=schema, schemas=schemas
+            )
+    return parents
+
+
+def calculate_order(
+    *, schemas: types.Schemas, parents: typing.Optional[Parents] = None
+) -> typing.List[str]:
+    """
+    Calculate the order in which the models have to be constructed.
+
+    The parents are calculated once for all schemas after which the inheritance chains
+    are followed so that any parent is ordered before its children. Otherwise the order
+    of the schemas is retained. Each model is included exactly once.
+
+    Raise InheritanceError if the inheritance chain of a schema is circular.
+
+    Args:
+        schemas: All the schemas.
+        parents: The name of each constructable schema mapped to the name of its
+            parent, calculated from the schemas if it is not passed in.
+
+    Returns:
+        The names of the schemas to construct in the order they have to be constructed.
+
+    """
+    if parents is None:
+        parents = _calculate_parents(schemas=schemas)
+
+    order: typing.List[str] = []
+    ordered: typing.Set[str] = set()
+    for name in parents:
+        # Follow the inheritance chain until a schema that has already been ordered
+        chain: typing.List[str] = []
+        chain_set: typing.Set[str] = set()
+        current: typing.Optional[str] = name
+        while current is not None and current not in ordered:
+            if current in chain_set:
+                cycle = " -> ".join([*chain, current])
+                raise exceptions.InheritanceError(
+                    f"Circular inheritance chain detected: {cycle}"
+                )
+            chain.append(current)
+            chain_set.add(current)
+            current = parents.get(current)
+
+        order.extend(reversed(chain))
+        ordered.update(chain)
+
+    return order
+
+
+def define_all(
+    *,
+    model_factory: types.ModelFactory,
+    schemas: types.Schemas,
+    parents: typing.Optional[Parents] = None,
+) -> None:
+    """
+    Define all the models with x-tablename properties.
+
+    Args:
+        model_factory: Factory used to construct models.
+        schemas: The schemas from which to define all.
+        parents: The name of each constructable schema mapped to the name of its
+            parent, calculated from the schemas if it is not passed in.
+
+    """
+    for name in calculate_order(schemas=schemas, parents=parents):
         model_factory(name=name)
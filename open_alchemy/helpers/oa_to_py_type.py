@@ -2,13 +2,18 @@
 
 import datetime
 import typing
+import uuid
 
 from open_alchemy import exceptions
 from open_alchemy import types
 
 
 def convert(
-    *, value: types.TColumnDefault, type_: str, format_: typing.Optional[str]
+    *,
+    value: types.TColumnDefault,
+    type_: str,
+    format_: typing.Optional[str],
+    native_uuid: bool = False,
 ) -> types.TPyColumnDefault:
     """
     Convert an OpenAPI value to it's python type based on the format.
@@ -17,6 +22,7 @@ def convert(
         value: The value to convert.
         type_: The OpenAPI type.
         format_: The OpenAPI format.
+        native_uuid: Whether a uuid value is stored using the Uuid type.
 
     Returns:
         The value converted to its equivalent Python type.
@@ -39,6 +45,11 @@ def convert(
             raise exceptions.MalformedSchemaError("Invalid date-time string.") from exc
     if isinstance(value, str) and format_ == "binary":
         return value.encode()
+    if isinstance(value, str) and format_ == "uuid" and native_uuid:
+        try:
+            return uuid.UUID(value)
+        except ValueError as exc:
+            raise exceptions.MalformedSchemaError("Invalid uuid string.") from exc
     if format_ == "double":
         raise exceptions.MalformedSchemaError("Double format is not supported.")
     return value
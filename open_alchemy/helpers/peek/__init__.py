@@ -8,9 +8,17 @@ from open_alchemy.facades import jsonschema
 
 from .. import ext_prop as ext_prop_helper
 from . import helpers
+from . import storage
 
 PeekValue = helpers.PeekValue
 
+# The extension properties that change how values are stored and converted
+binary_encoding = storage.binary_encoding
+enum_storage = storage.enum_storage
+gin_index = storage.gin_index
+native_uuid = storage.native_uuid
+to_dict_cache = storage.to_dict_cache
+
 
 def type_(*, schema: types.Schema, schemas: types.Schemas) -> str:
     """
@@ -221,6 +229,30 @@ def max_length(*, schema: types.Schema, schemas: types.Schemas) -> typing.Option
     return value
 
 
+def enum_(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[typing.List[typing.Any]]:
+    """
+    Retrieve the enum property from a property schema.
+
+    Raises MalformedSchemaError if the enum value is not a list.
+
+    Args:
+        schema: The schema to get the enum from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The enum value or None if it was not found.
+
+    """
+    value = peek_key(schema=schema, schemas=schemas, key=types.OpenApiProperties.ENUM)
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        raise exceptions.MalformedSchemaError("An enum value must be of type list.")
+    return value
+
+
 def read_only(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optional[bool]:
     """
     Determine whether schema is readOnly.
@@ -461,6 +493,34 @@ def secondary(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optiona
     return value
 
 
+def secondary_index(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[bool]:
+    """
+    Retrieve the x-secondary-index of the schema.
+
+    Raises MalformedSchemaError if the x-secondary-index value is not a boolean.
+
+    Args:
+        schema: The schema to get x-secondary-index from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-secondary-index or None.
+
+    """
+    value = peek_key(
+        schema=schema, schemas=schemas, key=types.ExtensionProperties.SECONDARY_INDEX
+    )
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.MalformedSchemaError(
+            "The x-secondary-index property must be of type boolean."
+        )
+    return value
+
+
 def uselist(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optional[bool]:
     """
     Retrieve the x-uselist of the schema.
@@ -0,0 +1,158 @@
+"""Peek at the extension properties that change how values are stored and converted."""
+
+import typing
+
+from open_alchemy import exceptions
+from open_alchemy import types
+
+from . import helpers
+
+
+def to_dict_cache(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[bool]:
+    """
+    Retrieve the x-to-dict-cache of the schema.
+
+    Raises MalformedSchemaError if the x-to-dict-cache value is not a boolean.
+
+    Args:
+        schema: The schema to get x-to-dict-cache from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-to-dict-cache or None.
+
+    """
+    value = helpers.peek_key(
+        schema, schemas, types.ExtensionProperties.TO_DICT_CACHE, set(), skip_ref=None
+    )
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.MalformedSchemaError(
+            "The x-to-dict-cache property must be of type boolean."
+        )
+    return value
+
+
+def binary_encoding(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[str]:
+    """
+    Retrieve the x-binary-encoding property from a property schema.
+
+    Raises MalformedSchemaError if the x-binary-encoding value is not one of utf-8,
+    base64 or bytes.
+
+    Args:
+        schema: The schema to get the x-binary-encoding from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-binary-encoding value.
+
+    """
+    value = helpers.peek_key(
+        schema, schemas, types.ExtensionProperties.BINARY_ENCODING, set(), skip_ref=None
+    )
+    if value is None:
+        return None
+    if not isinstance(value, str) or value not in {
+        encoding.value for encoding in types.BinaryEncoding
+    }:
+        raise exceptions.MalformedSchemaError(
+            "A x-binary-encoding value must be one of utf-8, base64 or bytes."
+        )
+    return value
+
+
+def enum_storage(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[str]:
+    """
+    Retrieve the x-enum-storage property from a property schema.
+
+    Raises MalformedSchemaError if the x-enum-storage value is not one of native or
+    small-integer.
+
+    Args:
+        schema: The schema to get the x-enum-storage from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-enum-storage value.
+
+    """
+    value = helpers.peek_key(
+        schema, schemas, types.ExtensionProperties.ENUM_STORAGE, set(), skip_ref=None
+    )
+    if value is None:
+        return None
+    if not isinstance(value, str) or value not in {
+        storage.value for storage in types.EnumStorage
+    }:
+        raise exceptions.MalformedSchemaError(
+            "A x-enum-storage value must be one of native or small-integer."
+        )
+    return value
+
+
+def native_uuid(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[bool]:
+    """
+    Retrieve the x-native-uuid property from a property schema.
+
+    Raises MalformedSchemaError if the x-native-uuid value is not a boolean.
+
+    Args:
+        schema: The schema to get the x-native-uuid from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-native-uuid value.
+
+    """
+    value = helpers.peek_key(
+        schema, schemas, types.ExtensionProperties.NATIVE_UUID, set(), skip_ref=None
+    )
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.MalformedSchemaError(
+            "A x-native-uuid value must be of type boolean."
+        )
+    return value
+
+
+def gin_index(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[typing.Union[bool, str]]:
+    """
+    Retrieve the x-gin-index property from a property schema.
+
+    Raises MalformedSchemaError if the x-gin-index value is not a boolean or one of
+    jsonb_ops or jsonb_path_ops.
+
+    Args:
+        schema: The schema to get the x-gin-index from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-gin-index value.
+
+    """
+    value = helpers.peek_key(
+        schema, schemas, types.ExtensionProperties.GIN_INDEX, set(), skip_ref=None
+    )
+    if value is None or isinstance(value, bool):
+        return value
+    if not isinstance(value, str) or value not in {
+        operator_class.value for operator_class in types.GinIndexOperatorClass
+    }:
+        raise exceptions.MalformedSchemaError(
+            "A x-gin-index value must be a boolean or one of jsonb_ops or "
+            "jsonb_path_ops."
+        )
+    return value
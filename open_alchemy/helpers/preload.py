@@ -0,0 +1,29 @@
+"""Prepare the models in the master process of a pre-fork server."""
+
+import gc
+import typing
+
+from ..facades.sqlalchemy import mappers as sqlalchemy_mappers
+
+
+def prepare(*, models: typing.Iterable[typing.Any], freeze: bool) -> None:
+    """
+    Do everything the models otherwise do the first time they are used.
+
+    The from_dict converter of each model is compiled and the mappers are configured.
+    If freeze is True, any garbage is collected and all remaining objects are moved to
+    the permanent generation of the garbage collector so that collections in forked
+    processes don't write to, and therefore copy, the memory pages of the objects.
+
+    Args:
+        models: The models to prepare.
+        freeze: Whether to freeze the objects for the garbage collector.
+
+    """
+    for model in models:
+        model.precompile()
+    sqlalchemy_mappers.configure()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
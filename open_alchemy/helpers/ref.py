@@ -349,11 +349,13 @@ class _RemoteSchemaStore:
                     ) from exc
             else:
                 # Import as needed to make yaml optional
-                import yaml  # pylint: disable=import-outside-toplevel
+                from ..facades import (  # pylint: disable=import-outside-toplevel
+                    yaml as yaml_facade,
+                )
 
                 try:
-                    schemas = yaml.safe_load(in_file)
-                except yaml.scanner.ScannerError as exc:
+                    schemas = yaml_facade.load(in_file)
+                except yaml_facade.YAMLError as exc:
                     raise exceptions.SchemaNotFoundError(
                         "The remote reference file is not valid YAML. The path "
                         f"is: {context}"
@@ -0,0 +1,49 @@
+"""Add __slots__ to frozen dataclasses."""
+
+import dataclasses
+import typing
+
+TClass = typing.TypeVar("TClass", bound=type)
+
+
+def _artifacts_getstate(self: typing.Any) -> typing.List[typing.Any]:
+    """Get the state of a slotted frozen dataclass for copy and pickle."""
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def _artifacts_setstate(self: typing.Any, state: typing.List[typing.Any]) -> None:
+    """Set the state of a slotted frozen dataclass for copy and pickle."""
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def slotted(cls: TClass) -> TClass:
+    """
+    Re-create a frozen dataclass with __slots__ for its fields.
+
+    Equivalent to dataclass(frozen=True, slots=True) which is not available before
+    Python 3.10. Instances do not have a __dict__ which significantly reduces the
+    memory used by the artifacts of large specifications.
+
+    Args:
+        cls: The frozen dataclass to add slots to.
+
+    Returns:
+        The dataclass with __slots__.
+
+    """
+    inherited_slots = {
+        slot for base in cls.__mro__[1:-1] for slot in getattr(base, "__slots__", ())
+    }
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict["__slots__"] = tuple(
+        name for name in field_names if name not in inherited_slots
+    )
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__getstate__"] = _artifacts_getstate
+    cls_dict["__setstate__"] = _artifacts_setstate
+    return typing.cast(TClass, type(cls)(cls.__name__, cls.__bases__, cls_dict))
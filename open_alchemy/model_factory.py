@@ -3,6 +3,7 @@
 import typing
 
 from . import column_factory
+from . import dto_factory
 from . import exceptions
 from . import mixins
 from . import table_args
@@ -65,6 +66,9 @@ def model_factory(
     description = peek.description(schema=schema, schemas={})
     if description is not None:
         model_schema[types.OpenApiProperties.DESCRIPTION.value] = description
+    to_dict_cache = peek.to_dict_cache(schema=schema, schemas={})
+    if to_dict_cache:
+        model_schema[types.ExtensionProperties.TO_DICT_CACHE] = to_dict_cache
 
     for prop_name, prop_artifacts in model_artifacts.properties:
         prop_column = column_factory.column_factory(artifacts=prop_artifacts)
@@ -89,13 +93,21 @@ def model_factory(
 
     # Assembling model
     base = get_base(name=name, schemas=schemas)
+    dto = dto_factory.dto_factory(
+        name=name,
+        artifacts=model_artifacts,
+        parent=getattr(base, "Dto", None) if inherits is not None else None,
+    )
     return type(
         name,
         (base, utility_base.UtilityBase, *mixin_classes),
         {
             "_schema": model_schema,
+            "Dto": dto,
             **model_class_vars,
-            "__table_args__": table_args.construct(schema=schema),
+            "__table_args__": table_args.construct(
+                schema=schema, artifacts=model_artifacts
+            ),
             **_get_kwargs(schema=schema),
             **_prepare_model_dict(schema=schema),
             "__abstract__": False,
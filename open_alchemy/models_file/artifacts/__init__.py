@@ -8,6 +8,7 @@ from open_alchemy.schemas.artifacts import types as artifacts_types
 from .. import types
 from . import args as _args
 from . import column as _column
+from . import dto as _dto
 from . import typed_dict as _typed_dict
 
 
@@ -30,6 +31,7 @@ def calculate(
         artifacts=artifacts
     )
     required_args, not_required_args = _args.calculate(artifacts=artifacts)
+    dto_fields = _dto.calculate(artifacts=artifacts)
 
     # Calculate model parent class
     parent_cls: str
@@ -84,4 +86,5 @@ def calculate(
                 parent_class=typed_dict_not_required_parent_class,
             ),
         ),
+        dto=types.DtoArtifacts(name=name, fields=dto_fields, parent_cls=parent_cls),
     )
@@ -64,6 +64,15 @@ def _map_default(
     if artifacts.open_api.type == "string" and artifacts.open_api.format == "binary":
         return f"b{default}"
 
+    # Handle UUID
+    if (
+        isinstance(artifacts, artifacts_types.SimplePropertyArtifacts)
+        and artifacts.open_api.type == "string"
+        and artifacts.open_api.format == "uuid"
+        and artifacts.extension.native_uuid
+    ):
+        return f"uuid.UUID({default})"
+
     # Map type
     mapped_default = oa_to_py_type.convert(
         value=default, type_=artifacts.open_api.type, format_=artifacts.open_api.format
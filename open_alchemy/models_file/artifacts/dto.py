@@ -0,0 +1,33 @@
+"""Calculate the data transfer object artifacts for a model."""
+
+import typing
+
+from open_alchemy import dto_factory
+from open_alchemy.schemas.artifacts import types as artifacts_types
+
+from .. import types
+from . import type_
+
+
+def calculate(
+    *, artifacts: artifacts_types.ModelArtifacts
+) -> typing.List[types.DtoFieldArtifacts]:
+    """
+    Calculate the data transfer object field artifacts from model schema artifacts.
+
+    Args:
+        artifacts: The schema artifacts for a model.
+
+    Returns:
+        The artifacts for the fields of the data transfer object.
+
+    """
+    properties = dict(artifacts.properties)
+    return [
+        types.DtoFieldArtifacts(
+            name=field.name,
+            type=type_.model(artifacts=properties[field.name]),
+            nullable=field.nullable,
+        )
+        for field in dto_factory.calculate_fields(artifacts=artifacts)
+    ]
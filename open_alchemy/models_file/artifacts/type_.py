@@ -1,5 +1,9 @@
 """Functions for calculating the type."""
 
+import json
+import sys
+import typing
+
 from open_alchemy import types
 from open_alchemy.helpers import calculate_nullable
 from open_alchemy.helpers import type_ as type_helper
@@ -20,6 +24,18 @@ _SIMPLE_TYPE_MAPPING = {
     "number": lambda _: "float",
     "boolean": lambda _: "bool",
 }
+# The type of the values from_dict accepts for binary properties
+_BINARY_FROM_DICT_TYPE = "typing.Union[str, bytes, bytearray, memoryview]"
+
+
+def _literal(values: typing.List[str]) -> str:
+    """Calculate the Literal type of the values of an enum."""
+    literal: str
+    if sys.version_info[1] < 8:
+        literal = "typing_extensions.Literal"
+    else:  # version compatibility
+        literal = "typing.Literal"
+    return f"{literal}[{', '.join(json.dumps(value) for value in values)}]"
 
 
 def _model_simple_property(
@@ -28,6 +44,13 @@ def _model_simple_property(
     """Calculate the Python type of a simple property."""
     assert artifacts.open_api.type in type_helper.SIMPLE_TYPES
     type_ = _SIMPLE_TYPE_MAPPING[artifacts.open_api.type](artifacts.open_api.format)
+    if artifacts.extension.native_uuid:
+        type_ = "uuid.UUID"
+    if (
+        artifacts.extension.enum_storage is not None
+        and artifacts.open_api.enum is not None
+    ):
+        type_ = _literal(artifacts.open_api.enum)
     optional = calculate_nullable.calculate_nullable(
         nullable=artifacts.open_api.nullable,
         generated=artifacts.extension.autoincrement is True,
@@ -134,13 +157,22 @@ def typed_dict(*, artifacts: schemas_artifacts.types.TAnyPropertyArtifacts) -> s
         )
 
     if artifacts.type == types.PropertyType.SIMPLE:
-        # Revert back to str for binary, date and date-time
-        if artifacts.open_api.format == "binary":
+        # Revert back to str for binary, unless bytes are returned, date, date-time and
+        # uuid
+        if artifacts.open_api.format == "binary" and not (
+            isinstance(artifacts, schemas_artifacts.types.SimplePropertyArtifacts)
+            and artifacts.extension.binary_encoding == types.BinaryEncoding.BYTES
+        ):
             model_type = model_type.replace("bytes", "str")
         if artifacts.open_api.format == "date":
             model_type = model_type.replace("datetime.date", "str")
         if artifacts.open_api.format == "date-time":
             model_type = model_type.replace("datetime.datetime", "str")
+        if (
+            isinstance(artifacts, schemas_artifacts.types.SimplePropertyArtifacts)
+            and artifacts.extension.native_uuid
+        ):
+            model_type = model_type.replace("uuid.UUID", "str")
 
     return model_type
 
@@ -201,4 +233,11 @@ def arg_from_dict(*, artifacts: schemas_artifacts.types.TAnyPropertyArtifacts) -
     if artifacts.type == types.PropertyType.RELATIONSHIP:
         init_type = init_type.replace(f"T{artifacts.parent}", f"{artifacts.parent}Dict")
 
+    # Binary values can be strings or bytes like values
+    if (
+        isinstance(artifacts, schemas_artifacts.types.SimplePropertyArtifacts)
+        and artifacts.open_api.format == "binary"
+    ):
+        init_type = init_type.replace("bytes", _BINARY_FROM_DICT_TYPE)
+
     return init_type
@@ -23,6 +23,10 @@ _TYPED_DICT_NOT_REQUIRED_TEMPLATE_FILENAME = os.path.join(
 )
 with open(_TYPED_DICT_NOT_REQUIRED_TEMPLATE_FILENAME) as in_file:
     _TYPED_DICT_NOT_REQUIRED_TEMPLATE = in_file.read()
+# Data transfer object template
+_DTO_TEMPLATE_FILENAME = os.path.join(_DIRECTORY, "dto.j2")
+with open(_DTO_TEMPLATE_FILENAME) as in_file:
+    _DTO_TEMPLATE = in_file.read()
 # Overall template
 _TEMPLATE_FILENAME = os.path.join(_DIRECTORY, "template.j2")
 with open(_TEMPLATE_FILENAME) as in_file:
@@ -82,6 +86,29 @@ def typed_dict_not_required(*, artifacts: types.TypedDictArtifacts) -> str:
     return template.render(artifacts=artifacts)
 
 
+def dto(*, artifacts: types.DtoArtifacts) -> str:
+    """
+    Generate the data transfer object protocol source code.
+
+    Args:
+        artifacts: The artifacts required for the data transfer object source code.
+
+    Returns:
+        The data transfer object protocol source code.
+
+    """
+    template = jinja2.Template(_DTO_TEMPLATE)
+
+    arg_source = ""
+    if artifacts.fields:
+        arg_source = ", *" + "".join(
+            f", {field.name}: {field.type}" + (" = None" if field.nullable else "")
+            for field in artifacts.fields
+        )
+
+    return template.render(artifacts=artifacts, arg_source=arg_source)
+
+
 def _arg_single_required(artifacts: types.ColumnArgArtifacts, name: str) -> str:
     """
     Transform the name and type of a single required argument to the input source.
@@ -203,6 +230,7 @@ def generate(*, artifacts: types.ModelArtifacts) -> str:
     typed_dict_not_required_source = typed_dict_not_required(
         artifacts=artifacts.typed_dict
     )
+    dto_source = dto(artifacts=artifacts.dto)
 
     # Construct overall source code
     template = jinja2.Template(_TEMPLATE, trim_blocks=True)
@@ -211,4 +239,5 @@ def generate(*, artifacts: types.ModelArtifacts) -> str:
         typed_dict_required=typed_dict_required_source,
         typed_dict_not_required=typed_dict_not_required_source,
         sqlalchemy=sqlalchemy_source,
+        dto=dto_source,
     )
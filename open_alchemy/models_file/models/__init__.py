@@ -11,7 +11,7 @@ _TEMPLATE_FILE = os.path.join(_DIRECTORY, "template.j2")
 with open(_TEMPLATE_FILE) as in_file:
     _TEMPLATE = in_file.read()
 
-_ALL_IMPORTS = {"datetime", "typing"}
+_ALL_IMPORTS = {"datetime", "typing", "uuid"}
 
 
 def generate(*, models: typing.List[str]) -> str:
@@ -31,6 +31,8 @@ def generate(*, models: typing.List[str]) -> str:
             break
         if "datetime." in model:
             imports.add("datetime")
+        if "uuid." in model:
+            imports.add("uuid")
 
     template = jinja2.Template(_TEMPLATE, trim_blocks=True)
     return template.render(
@@ -111,6 +111,30 @@ class TypedDictArtifacts:
     not_required: TypedDictClassArtifacts
 
 
+@dataclasses.dataclass
+class DtoFieldArtifacts:
+    """Artifacts for a field of the data transfer object of a model."""
+
+    # The name of the field based on the name of the property
+    name: str
+    # The type of the field
+    type: str
+    # Whether the field can be None which makes it optional for __init__
+    nullable: bool
+
+
+@dataclasses.dataclass
+class DtoArtifacts:
+    """Artifacts for the data transfer object of a model."""
+
+    # The name of the model based on the name of the schema
+    name: str
+    # The fields based on the properties of the schema that are stored in columns
+    fields: typing.List[DtoFieldArtifacts]
+    # The parent class based on the version of Python
+    parent_cls: str
+
+
 @dataclasses.dataclass
 class ModelArtifacts:
     """Artifacts for a model template."""
@@ -119,6 +143,8 @@ class ModelArtifacts:
     sqlalchemy: SQLAlchemyModelArtifacts
     # The artifacts for the TypedDicts
     typed_dict: TypedDictArtifacts
+    # The artifacts for the data transfer object
+    dto: DtoArtifacts
 
 
 _DocstringWrapper = textwrap.TextWrapper(width=75)  # pylint: disable=invalid-name
@@ -3,26 +3,34 @@
 import typing
 
 from .. import types as _types
-from . import association
-from . import backref
-from . import foreign_key
+from . import relationships
 from . import validation
+from .helpers import index as _index_helper
 
 
 def process(
     *, schemas: _types.Schemas, spec_filename: typing.Optional[str] = None
-) -> None:
+) -> _index_helper.Index:
     """
     Pre-process schemas.
 
+    The index of the constructable schemas is calculated once and shared by all the
+    processing actions.
+
     The processing actions executed are:
-    1. Calculate the back references.
+    1. Validate the schemas,
+    2. calculate the back references, foreign keys and association schemas in a single
+        pass over the properties.
 
     Args:
         schemas: The schemas to pre-process in place.
+        spec_filename: The filename of the spec, used to cache the validation result.
+
+    Returns:
+        The index of the constructable schemas after processing.
 
     """
-    validation.process(schemas=schemas, spec_filename=spec_filename)
-    backref.process(schemas=schemas)
-    foreign_key.process(schemas=schemas)
-    association.process(schemas=schemas)
+    index = _index_helper.calculate(schemas=schemas)
+    validation.process(schemas=schemas, spec_filename=spec_filename, index=index)
+    relationships.process(schemas=schemas, index=index)
+    return index
@@ -1,9 +1,11 @@
 """Retrieve artifacts from the schemas."""
 
+import sys
 import typing
 
 from ... import types as _oa_types
 from .. import validation
+from ..helpers import index as index_helper
 from ..helpers import iterate
 from . import model
 from . import property_
@@ -140,7 +142,7 @@ def _from_schemas_get_properties_artifacts(
     required_set = set(iterate.required_items(schema=schema, schemas=schemas))
     return map(
         lambda args: (
-            args[0],
+            sys.intern(args[0]),
             property_.get(schemas, schema, args[0], args[1], args[0] in required_set),
         ),
         properties,
@@ -184,7 +186,10 @@ def _from_schemas_get_model(
 
 
 def get_from_schemas(
-    *, schemas: _oa_types.Schemas, stay_within_model: bool
+    *,
+    schemas: _oa_types.Schemas,
+    stay_within_model: bool,
+    index: typing.Optional[index_helper.Index] = None,
 ) -> types.ModelsModelArtifacts:
     """
     Get the artifacts from schemas.
@@ -195,12 +200,13 @@ def get_from_schemas(
         schemas: The schemas to get artifacts from.
         stay_within_model: Whether only properties from within a model should be
             included.
+        index: The index of the constructable schemas.
 
     Returns:
         The artifacts for the schemas.
 
     """
-    constructables = iterate.constructable(schemas=schemas)
+    constructables = iterate.constructable(schemas=schemas, index=index)
     return dict(
         map(
             lambda args: (
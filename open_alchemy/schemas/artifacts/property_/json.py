@@ -36,6 +36,7 @@ def get(
     primary_key = peek.primary_key(schema=schema, schemas=schemas)
     index = peek.index(schema=schema, schemas=schemas)
     unique = peek.unique(schema=schema, schemas=schemas)
+    gin_index = peek.gin_index(schema=schema, schemas=schemas)
 
     foreign_key = peek.foreign_key(schema=schema, schemas=schemas)
 
@@ -64,5 +65,6 @@ def get(
             foreign_key=foreign_key,
             kwargs=kwargs,
             foreign_key_kwargs=foreign_key_kwargs,
+            gin_index=gin_index,
         ),
     )
@@ -1,5 +1,6 @@
 """Retrieve artifacts for a relationship property."""
 
+import dataclasses
 import typing
 
 from .... import types as oa_types
@@ -419,6 +420,4 @@ def get(
         schemas=schemas,
         parent_schema=parent_schema,
     )
-    artifacts.required = required
-
-    return artifacts
+    return dataclasses.replace(artifacts, required=required)
@@ -1,5 +1,7 @@
 """Retrieve artifacts for a simple property."""
 
+import sys
+
 from .... import types as oa_types
 from ....helpers import peek
 from .. import types
@@ -20,8 +22,11 @@ def get(
         The artifacts for the property.
 
     """
-    type_ = peek.type_(schema=schema, schemas=schemas)
+    # Types and formats repeat across properties, share a single copy of each
+    type_ = sys.intern(peek.type_(schema=schema, schemas=schemas))
     format_ = peek.prefer_local(get_value=peek.format_, schema=schema, schemas=schemas)
+    if format_ is not None:
+        format_ = sys.intern(format_)
     max_length = peek.prefer_local(
         get_value=peek.max_length, schema=schema, schemas=schemas
     )
@@ -64,6 +69,16 @@ def get(
     )
 
     dict_ignore = peek.dict_ignore(schema=schema, schemas=schemas)
+    binary_encoding = peek.prefer_local(
+        get_value=peek.binary_encoding, schema=schema, schemas=schemas
+    )
+    enum = peek.prefer_local(get_value=peek.enum_, schema=schema, schemas=schemas)
+    enum_storage = peek.prefer_local(
+        get_value=peek.enum_storage, schema=schema, schemas=schemas
+    )
+    native_uuid = peek.prefer_local(
+        get_value=peek.native_uuid, schema=schema, schemas=schemas
+    )
 
     # Generate the schema
     schema_artifact: oa_types.ColumnSchema = {
@@ -85,6 +100,16 @@ def get(
         schema_artifact[oa_types.OpenApiProperties.WRITE_ONLY.value] = write_only
     if dict_ignore is not None:
         schema_artifact[oa_types.ExtensionProperties.DICT_IGNORE.value] = dict_ignore
+    if binary_encoding is not None:
+        schema_artifact[
+            oa_types.ExtensionProperties.BINARY_ENCODING.value
+        ] = binary_encoding
+    # The values are checked by from_dict when they are stored in a compact form
+    if enum_storage is not None:
+        schema_artifact[oa_types.OpenApiProperties.ENUM.value] = enum
+        schema_artifact[oa_types.ExtensionProperties.ENUM_STORAGE.value] = enum_storage
+    if native_uuid is not None:
+        schema_artifact[oa_types.ExtensionProperties.NATIVE_UUID.value] = native_uuid
 
     return types.SimplePropertyArtifacts(
         type=oa_types.PropertyType.SIMPLE,
@@ -99,6 +124,7 @@ def get(
             default=default,
             read_only=read_only,
             write_only=write_only,
+            enum=enum,
         ),
         extension=types.ExtensionSimplePropertyArtifacts(
             primary_key=primary_key is True,
@@ -110,5 +136,8 @@ def get(
             kwargs=kwargs,
             foreign_key_kwargs=foreign_key_kwargs,
             dict_ignore=dict_ignore,
+            binary_encoding=binary_encoding,
+            enum_storage=enum_storage,
+            native_uuid=native_uuid,
         ),
     )
@@ -5,7 +5,9 @@ import typing
 from .. import types
 from ..helpers import inheritance
 from ..helpers import peek
+from ..table_args import factory
 from .helpers import association as association_helper
+from .helpers import index as index_helper
 from .helpers import iterate
 
 
@@ -48,7 +50,7 @@ _TTablenameParentAllNames = typing.Dict[str, _TParentAllNames]
 
 
 def _get_tablename_schema_names(
-    *, schemas: types.Schemas, tablenames: typing.Set[str]
+    *, index: index_helper.Index, tablenames: typing.Set[str]
 ) -> _TTablenameParentAllNames:
     """
     Get a mapping of tablenames to all schema names with that tablename.
@@ -62,7 +64,7 @@ def _get_tablename_schema_names(
         name.
 
     Args:
-        schemas: All defines schemas.
+        index: The index of the constructable schemas.
         tablenames: All tablenames to filter for.
 
     Returns:
@@ -71,41 +73,22 @@ def _get_tablename_schema_names(
 
     """
     # Get mapping of tablename to parent schema name
-    constructables = iterate.constructable(schemas=schemas)
-    not_single_inheritance_constructables = filter(
-        lambda args: inheritance.calculate_type(schema=args[1], schemas=schemas)
-        != inheritance.Type.SINGLE_TABLE,
-        constructables,
-    )
-    tablename_parent_name_map = dict(
-        map(
-            lambda args: (
-                peek.prefer_local(
-                    get_value=peek.tablename, schema=args[1], schemas=schemas
-                ),
-                args[0],
-            ),
-            not_single_inheritance_constructables,
-        )
-    )
+    tablename_parent_name_map = {
+        entry.tablename: name
+        for name, entry in index.items()
+        if entry.inheritance_type != inheritance.Type.SINGLE_TABLE
+    }
 
     # Get a list of schema names and tablenames which appear in the mapping
-    constructables = iterate.constructable(schemas=schemas)
-    name_tablenames = map(
-        lambda args: (
-            args[0],
-            peek.prefer_local(
-                get_value=peek.tablename, schema=args[1], schemas=schemas
-            ),
-        ),
-        constructables,
-    )
-    filtered_name_tablenames = filter(
-        lambda args: args[1] in tablenames, name_tablenames
+    filtered_name_tablenames = (
+        (name, entry.tablename)
+        for name, entry in index.items()
+        if entry.tablename in tablenames
     )
 
     mapping: _TTablenameParentAllNames = {}
     for name, tablename in filtered_name_tablenames:
+        assert tablename is not None
         if tablename not in mapping:
             mapping[tablename] = _TParentAllNames(
                 parent_name=tablename_parent_name_map[tablename], all_names=[]
@@ -221,6 +204,8 @@ def _combine_defined_expected_schema(
     1. For the expected schema:
         a. Remove required array
         b. Filter the properties where their foreign is already defined
+        c. Remove x-index from the properties that are already the first expression
+            of an index defined by x-composite-index
     2. Combine the expected schema in an allOf with the defined schema parent name.
     3. Change the name to the parent name.
 
@@ -243,6 +228,21 @@ def _combine_defined_expected_schema(
         if peek.foreign_key(schema=property_[1], schemas={})
         not in parent_name_foreign_keys.foreign_keys
     }
+    composite_index = peek.prefer_local(
+        get_value=peek.composite_index,
+        schema=schemas[parent_name_foreign_keys.parent_name],
+        schemas=schemas,
+    )
+    if composite_index is not None:
+        indexed_names = {
+            index_spec["expressions"][0]
+            for index_spec in factory.map_index(spec=composite_index)
+        }
+        for property_name, property_schema in expected_schema_value[
+            types.OpenApiProperties.PROPERTIES
+        ].items():
+            if property_name in indexed_names:
+                property_schema.pop(types.ExtensionProperties.INDEX.value, None)
     return types.TNameSchema(
         name=parent_name_foreign_keys.parent_name,
         schema={
@@ -255,7 +255,10 @@ def _combine_defined_expected_schema(
 
 
 def _combine_defined_expected_schemas(
-    *, association_schemas: typing.List[types.TNameSchema], schemas: types.Schemas
+    *,
+    association_schemas: typing.List[types.TNameSchema],
+    schemas: types.Schemas,
+    index: index_helper.Index,
 ) -> typing.Iterator[types.TNameSchema]:
     """
     Combine all association schemas with any defined schemas.
@@ -263,6 +266,7 @@ def _combine_defined_expected_schemas(
     Args:
         association_schemas: All expected association schemas.
         schemas: All defined schemas.
+        index: The index of the constructable schemas.
 
     Returns:
         The association schemas merged with any existing schemas.
@@ -272,7 +276,7 @@ def _combine_defined_expected_schemas(
         association_schemas=association_schemas
     )
     tablename_schema_names = _get_tablename_schema_names(
-        schemas=schemas, tablenames=association_tablenames
+        index=index, tablenames=association_tablenames
     )
     tablename_foreign_keys = _get_tablename_foreign_keys(
         tablename_parent_all_names=tablename_schema_names, schemas=schemas
@@ -291,7 +295,56 @@ def _combine_defined_expected_schemas(
         )
 
 
-def process(*, schemas: types.Schemas) -> None:
+def get_property_artifacts(
+    schemas: types.Schemas, schema: types.Schema, property_schema: types.Schema
+) -> typing.Optional[types.TNameSchema]:
+    """
+    Get the association schema required by a property.
+
+    Args:
+        schemas: All defined schemas.
+        schema: The constructable schema the property is on.
+        property_schema: The schema of the property.
+
+    Returns:
+        The association schema or None if the property is not a many-to-many
+        relationship.
+
+    """
+    if not association_helper.requires_association(schemas, property_schema):
+        return None
+    return association_helper.calculate_schema(
+        property_schema=property_schema, parent_schema=schema, schemas=schemas
+    )
+
+
+def apply(
+    *,
+    schemas: types.Schemas,
+    association_schemas: typing.List[types.TNameSchema],
+    index: index_helper.Index,
+) -> None:
+    """
+    Add association schemas to the schemas, combining them with any defined schemas.
+
+    Args:
+        schemas: The schemas to add the association schemas to.
+        association_schemas: The association schemas to add.
+        index: The index of the constructable schemas which is updated with the added
+            schemas.
+
+    """
+    combined_association_schemas = _combine_defined_expected_schemas(
+        association_schemas=association_schemas, schemas=schemas, index=index
+    )
+    for association in combined_association_schemas:
+        schemas[association.name] = association.schema
+        index_helper.update(index=index, schemas=schemas, name=association.name)
+
+
+def process(
+    *, schemas: types.Schemas, index: typing.Optional[index_helper.Index] = None
+) -> None:
     """
     Pre-process the schemas to add association schemas as necessary.
 
@@ -301,14 +354,19 @@ def process(*, schemas: types.Schemas) -> None:
     2. Filter for properties that (1) are relationships and (2) are many-to-many
         relationships
     3. Convert the property schema to an association schema
-    4. Add them to the schemas
+    4. Add them to the schemas and update the index
 
     Args:
         schemas: The schemas to process.
+        index: The index of the constructable schemas, calculated if it is not passed
+            in.
 
     """
+    if index is None:
+        index = index_helper.calculate(schemas=schemas)
+
     association_properties = association_helper.get_association_property_iterator(
-        schemas=schemas
+        schemas=schemas, index=index
     )
     association_schemas = list(
         map(
@@ -320,8 +378,4 @@ def process(*, schemas: types.Schemas) -> None:
             association_properties,
         )
     )
-    combined_association_schemas = _combine_defined_expected_schemas(
-        association_schemas=association_schemas, schemas=schemas
-    )
-    for association in combined_association_schemas:
-        schemas[association.name] = association.schema
+    apply(schemas=schemas, association_schemas=association_schemas, index=index)
@@ -1,12 +1,12 @@
 """Pre-process schemas by adding any back references into the schemas."""
 
-import functools
 import typing
 
 from .. import types
 from ..helpers import peek
 from ..helpers import ref as ref_helper
 from .helpers import backref as backref_helper
+from .helpers import index as index_helper
 from .helpers import iterate
 from .helpers import process as process_helper
 
@@ -78,6 +78,27 @@ def _calculate_artifacts(
     return TArtifacts(ref_schema_name, backref, return_schema)
 
 
+def get_property_artifacts(
+    schemas: types.Schemas, schema_name: str, property_schema: types.Schema
+) -> typing.Optional[TArtifacts]:
+    """
+    Get the back reference of a property.
+
+    Args:
+        schemas: All schemas.
+        schema_name: The name of the schema the property is on.
+        property_schema: The schema of the property.
+
+    Returns:
+        The information to define the back reference or None if the property does not
+        define a back reference.
+
+    """
+    if not backref_helper.defined(schemas, property_schema):
+        return None
+    return _calculate_artifacts(schema_name, schemas, property_schema)
+
+
 def _get_schema_backrefs(
     schemas: types.Schemas,
     schema_name: str,
@@ -102,16 +123,13 @@ def _get_schema_backrefs(
     names_properties = iterate.properties_items(
         schema=schema, schemas=schemas, stay_within_model=True
     )
-    # Remove property name
-    properties = map(lambda arg: arg[1], names_properties)
-    # Remove properties that don't define back references
-    defines_backref_schemas = functools.partial(backref_helper.defined, schemas)
-    backref_properties = filter(defines_backref_schemas, properties)
     # Capture information for back references
-    calculate_artifacts_schema_name_schemas = functools.partial(
-        _calculate_artifacts, schema_name, schemas
+    backrefs = map(
+        lambda args: get_property_artifacts(schemas, schema_name, args[1]),
+        names_properties,
     )
-    return map(calculate_artifacts_schema_name_schemas, backref_properties)
+    # Remove properties that don't define back references
+    return filter(None, backrefs)
 
 
 def _backrefs_to_schema(backrefs: process_helper.TArtifactsIter) -> types.Schema:
@@ -133,27 +151,44 @@ def _backrefs_to_schema(backrefs: process_helper.TArtifactsIter) -> types.Schema
     }
 
 
-def process(*, schemas: types.Schemas) -> None:
+def apply(
+    *, schemas: types.Schemas, backrefs: typing.Iterable[process_helper.TArtifacts]
+) -> None:
     """
-    Pre-process the schemas to add back references as required.
+    Add the back references to the schemas.
 
     These are added as allOf with x-backrefs which include the property name and schema
     for the property.
 
     Args:
-        schemas: The schemas to process.
+        schemas: The schemas to add the back references to.
+        backrefs: The back references to add.
 
     """
-    # Retrieve back references
-    backrefs = process_helper.get_artifacts(
-        schemas=schemas, get_schema_artifacts=_get_schema_backrefs
-    )
     # Map to a schema for each grouped back references
     backref_schemas = process_helper.calculate_outputs(
-        artifacts=backrefs, calculate_output=_backrefs_to_schema
+        artifacts=iter(backrefs), calculate_output=_backrefs_to_schema
     )
     # Convert to list to resolve iterator
     backref_schema_list = list(backref_schemas)
     # Add backreferences to schemas
     for name, backref_schema in backref_schema_list:
         schemas[name] = {"allOf": [schemas[name], backref_schema]}
+
+
+def process(
+    *, schemas: types.Schemas, index: typing.Optional[index_helper.Index] = None
+) -> None:
+    """
+    Pre-process the schemas to add back references as required.
+
+    Args:
+        schemas: The schemas to process.
+        index: The index of the constructable schemas.
+
+    """
+    # Retrieve back references
+    backrefs = process_helper.get_artifacts(
+        schemas=schemas, get_schema_artifacts=_get_schema_backrefs, index=index
+    )
+    apply(schemas=schemas, backrefs=backrefs)
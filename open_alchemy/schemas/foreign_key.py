@@ -8,6 +8,7 @@ from ..helpers import foreign_key as foreign_key_helper
 from ..helpers import peek
 from ..helpers import property_
 from ..helpers import relationship
+from .helpers import index as index_helper
 from .helpers import iterate
 from .helpers import process as process_helper
 
@@ -233,22 +234,56 @@ def _calculate_foreign_key_property_artifacts(
     )
 
 
-def _get_schema_foreign_keys(
+def get_property_artifacts(
     schemas: types.Schemas,
     schema_name: str,
     schema: types.Schema,
-) -> process_helper.TArtifactsIter:
+    property_name: str,
+    property_schema: types.Schema,
+) -> typing.Optional[TArtifacts]:
     """
-    Retrieve the foreign keys for a schema.
+    Get the foreign key required by a property.
 
     Assume schema is constructable.
 
     Algorithm:
-    1. validate property schema and filter for whether a foreign key is required,
-    2. validate the full relationship schema and filter for foreign keys not already
-        defined and
+    1. validate property schema and check whether a foreign key is required,
+    2. validate the full relationship schema and check whether the foreign key is
+        already defined and
     3. capture the artifacts for the foreign key.
 
+    Args:
+        schemas: All schemas.
+        schema_name: The name of the schema the property is on.
+        schema: The constructable schema the property is on.
+        property_name: The name of the property.
+        property_schema: The schema of the property.
+
+    Returns:
+        The artifacts for the foreign key or None if no foreign key is required.
+
+    """
+    if not _requires_foreign_key(schemas, property_schema):
+        return None
+    if not _foreign_key_property_not_defined(
+        schemas, schema, property_name, property_schema
+    ):
+        return None
+    return _calculate_foreign_key_property_artifacts(
+        schemas, schema_name, schema, property_name, property_schema
+    )
+
+
+def _get_schema_foreign_keys(
+    schemas: types.Schemas,
+    schema_name: str,
+    schema: types.Schema,
+) -> process_helper.TArtifactsIter:
+    """
+    Retrieve the foreign keys for a schema.
+
+    Assume schema is constructable.
+
     Args:
         schemas: All schemas.
         schema_name: The name of the schema.
@@ -262,25 +297,15 @@ def _get_schema_foreign_keys(
     names_properties = iterate.properties_items(
         schema=schema, schemas=schemas, stay_within_model=True
     )
-    # Validate and remove properties that don't require foreign keys
-    foreign_key_name_properties = filter(
-        lambda args: _requires_foreign_key(schemas, args[1]), names_properties
-    )
-    # Validate relationship and remove properties that already have a defined foreign
-    # key
-    undefined_foreign_key_name_properties = filter(
-        lambda args: _foreign_key_property_not_defined(
-            schemas, schema, args[0], args[1]
-        ),
-        foreign_key_name_properties,
-    )
     # Convert to artifacts
-    return map(
-        lambda args: _calculate_foreign_key_property_artifacts(
+    foreign_keys = map(
+        lambda args: get_property_artifacts(
             schemas, schema_name, schema, args[0], args[1]
         ),
-        undefined_foreign_key_name_properties,
+        names_properties,
     )
+    # Remove properties that don't require a foreign key
+    return filter(None, foreign_keys)
 
 
 def _foreign_keys_to_schema(
@@ -304,24 +329,43 @@ def _foreign_keys_to_schema(
     }
 
 
-def process(*, schemas: types.Schemas):
+def apply(
+    *,
+    schemas: types.Schemas,
+    foreign_keys: typing.Iterable[process_helper.TArtifacts],
+) -> None:
     """
-    Pre-process the schemas to add foreign keys as required.
+    Add the foreign keys to the schemas.
 
     Args:
-        schemas: The schemas to process.
+        schemas: The schemas to add the foreign keys to.
+        foreign_keys: The foreign keys to add.
 
     """
-    # Retrieve foreign keys
-    foreign_keys = process_helper.get_artifacts(
-        schemas=schemas, get_schema_artifacts=_get_schema_foreign_keys
-    )
     # Map to a schema for each grouped foreign keys
     foreign_key_schemas = process_helper.calculate_outputs(
-        artifacts=foreign_keys, calculate_output=_foreign_keys_to_schema
+        artifacts=iter(foreign_keys), calculate_output=_foreign_keys_to_schema
     )
     # Convert to list to resolve iterator
     foreign_key_schema_list = list(foreign_key_schemas)
     # Add foreign keys to schemas
     for name, foreign_key_schema in foreign_key_schema_list:
         schemas[name] = {"allOf": [schemas[name], foreign_key_schema]}
+
+
+def process(
+    *, schemas: types.Schemas, index: typing.Optional[index_helper.Index] = None
+) -> None:
+    """
+    Pre-process the schemas to add foreign keys as required.
+
+    Args:
+        schemas: The schemas to process.
+        index: The index of the constructable schemas.
+
+    """
+    # Retrieve foreign keys
+    foreign_keys = process_helper.get_artifacts(
+        schemas=schemas, get_schema_artifacts=_get_schema_foreign_keys, index=index
+    )
+    apply(schemas=schemas, foreign_keys=foreign_keys)
@@ -6,10 +6,11 @@ from ... import types
 from ...helpers import foreign_key as foreign_key_helper
 from ...helpers import peek
 from ...helpers import relationship
+from ..helpers import index as index_helper
 from ..helpers import iterate
 
 
-def _requires_association(schemas: types.Schemas, schema: types.Schema) -> bool:
+def requires_association(schemas: types.Schemas, schema: types.Schema) -> bool:
     """
     Calculate whether a property requires an association table.
 
@@ -33,7 +34,7 @@ class TParentPropertySchema(typing.NamedTuple):
 
 
 def get_association_property_iterator(
-    *, schemas: types.Schemas
+    *, schemas: types.Schemas, index: typing.Optional[index_helper.Index] = None
 ) -> typing.Iterable[TParentPropertySchema]:
     """
     Get an iterator for properties that require association tables from the schemas.
@@ -44,19 +45,20 @@ def get_association_property_iterator(
 
     Args:
         schemas: All defined schemas.
+        index: The index of the constructable schemas.
 
     Returns:
         An iterator with properties that require an association table along with the
         schemas and the parent schema.
 
     """
-    constructables = iterate.constructable(schemas=schemas)
+    constructables = iterate.constructable(schemas=schemas, index=index)
     for name, schema in constructables:
         properties = iterate.properties_items(
             schema=schema, schemas=schemas, stay_within_model=True
         )
         association_property_schemas = filter(
-            lambda args: _requires_association(schemas, args[1]), properties
+            lambda args: requires_association(schemas, args[1]), properties
         )
         yield from (
             TParentPropertySchema(
@@ -214,7 +216,9 @@ def calculate_schema(
         b. tablename of the secondary value,
         c. properties based on the parent and referenced schema and
         d. required with the property names and
-    5. calculate the schema name based on the secondary value and avoiding any existing
+    5. unless x-secondary-index is false, index the child property so that the
+        association table can be searched by the child and
+    6. calculate the schema name based on the secondary value and avoiding any existing
         schema names.
 
     The following is the form of the schema:
@@ -238,6 +242,8 @@ def calculate_schema(
                 # if the child property defines maxLength
                 maxLength: <child property maxLength>
                 x-foreign-key: <child tablename>.<child property name>
+                # unless x-secondary-index is false
+                x-index: true
         required:
             - <parent tablename>_<parent property name>
             - <child tablename>_<child property name>
@@ -257,6 +263,14 @@ def calculate_schema(
         property_schema=property_schema, schemas=schemas
     )
     ref_property = calculate_property_schema(schema=ref_schema, schemas=schemas)
+    # The primary key only supports searching by the parent, index the child as well
+    items = peek.items(schema=property_schema, schemas=schemas)
+    assert items is not None
+    secondary_index = peek.prefer_local(
+        get_value=peek.secondary_index, schema=items, schemas=schemas
+    )
+    if secondary_index is not False:
+        ref_property.schema[types.ExtensionProperties.INDEX.value] = True
 
     schema = {
         types.OpenApiProperties.TYPE: "object",
@@ -0,0 +1,106 @@
+"""Index of the constructable schemas to avoid re-scanning all schemas."""
+
+import typing
+
+from ... import exceptions
+from ... import types
+from ...helpers import inheritance
+from ...helpers import peek
+from ...helpers import schema as schema_helper
+
+
+class IndexEntry(typing.NamedTuple):
+    """
+    Information about a constructable schema.
+
+    The values are None if they could not be calculated because the schema is not valid.
+
+    Attrs:
+        tablename: The value of x-tablename of the schema.
+        parent: The name of the parent of the schema if it inherits.
+        inheritance_type: The type of inheritance of the schema.
+
+    """
+
+    tablename: typing.Optional[str]
+    parent: typing.Optional[str]
+    inheritance_type: typing.Optional[inheritance.Type]
+
+
+Index = typing.Dict[str, IndexEntry]
+
+
+def _calculate_entry(*, schema: types.Schema, schemas: types.Schemas) -> IndexEntry:
+    """
+    Calculate the index entry for a constructable schema.
+
+    Args:
+        schema: The constructable schema.
+        schemas: All the schemas used to resolve any $ref.
+
+    Returns:
+        The entry for the schema.
+
+    """
+    try:
+        tablename = peek.prefer_local(
+            get_value=peek.tablename, schema=schema, schemas=schemas
+        )
+    except exceptions.BaseError:
+        return IndexEntry(tablename=None, parent=None, inheritance_type=None)
+
+    try:
+        inheritance_type = inheritance.calculate_type(schema=schema, schemas=schemas)
+        parent = None
+        if inheritance_type != inheritance.Type.NONE:
+            parent = inheritance.retrieve_parent(schema=schema, schemas=schemas)
+    except (exceptions.BaseError, KeyError):
+        return IndexEntry(tablename=tablename, parent=None, inheritance_type=None)
+
+    return IndexEntry(
+        tablename=tablename, parent=parent, inheritance_type=inheritance_type
+    )
+
+
+def calculate(*, schemas: types.Schemas) -> Index:
+    """
+    Calculate the index of the constructable schemas.
+
+    Includes the same schemas, in the same order, as iterate.constructable.
+
+    Args:
+        schemas: All the schemas.
+
+    Returns:
+        The constructable schema names mapped to their entry.
+
+    """
+    if not isinstance(schemas, dict):
+        return {}
+
+    index: Index = {}
+    for name, schema in schemas.items():
+        try:
+            if not schema_helper.constructable(schema=schema, schemas=schemas):
+                continue
+        except (exceptions.MalformedSchemaError, exceptions.SchemaNotFoundError):
+            continue
+
+        index[name] = _calculate_entry(schema=schema, schemas=schemas)
+
+    return index
+
+
+def update(*, index: Index, schemas: types.Schemas, name: str) -> None:
+    """
+    Update the index after a schema has been added to or changed in the schemas.
+
+    Assume that the schema is constructable.
+
+    Args:
+        index: The index to update in place.
+        schemas: All the schemas, including the added or changed schema.
+        name: The name of the schema that was added or changed.
+
+    """
+    index[name] = _calculate_entry(schema=schemas[name], schemas=schemas)
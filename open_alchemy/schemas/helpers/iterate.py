@@ -9,24 +9,31 @@ from ...helpers import inheritance
 from ...helpers import peek
 from ...helpers import ref
 from ...helpers import schema as schema_helper
+from . import index as index_helper
 
 
 def constructable(
-    *, schemas: types.Schemas
+    *, schemas: types.Schemas, index: typing.Optional[index_helper.Index] = None
 ) -> typing.Iterator[typing.Tuple[str, types.Schema]]:
     """
     Create an iterable with all constructable schemas from all schemas.
 
     Iterates over all items in the schemas, checks whether a schema is constructable and
-    yields those that are.
+    yields those that are. If the index of the constructable schemas is passed, the
+    schemas in the index are yielded instead.
 
     Args:
         schemas: The schemas to iterate over.
+        index: The index of the constructable schemas.
 
     Returns:
         iterable with all schemas that are constructable.
 
     """
+    if index is not None:
+        yield from ((name, schemas[name]) for name in index)
+        return
+
     for name, schema in schemas.items():
         try:
             if not schema_helper.constructable(schema=schema, schemas=schemas):
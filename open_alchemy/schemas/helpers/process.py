@@ -4,6 +4,7 @@ import itertools
 import typing
 
 from ... import types
+from . import index as index_helper
 from . import iterate
 
 
@@ -24,7 +25,10 @@ TGetSchemaArtifacts = typing.Callable[
 
 
 def get_artifacts(
-    *, schemas: types.Schemas, get_schema_artifacts: TGetSchemaArtifacts
+    *,
+    schemas: types.Schemas,
+    get_schema_artifacts: TGetSchemaArtifacts,
+    index: typing.Optional[index_helper.Index] = None,
 ) -> TArtifactsIter:
     """
     Get all artifacts information from the schemas.
@@ -37,13 +41,14 @@ def get_artifacts(
     Args:
         schemas: The schemas to process.
         get_schema_artifacts: Function that retrieves the artifacts for the schema.
+        index: The index of the constructable schemas.
 
     Returns:
         All backreference information.
 
     """
     # Retrieve all constructable schemas
-    constructables = iterate.constructable(schemas=schemas)
+    constructables = iterate.constructable(schemas=schemas, index=index)
     # Retrieve all artifacts
     artifacts_iters = map(
         lambda args: get_schema_artifacts(schemas, *args), constructables
@@ -64,7 +69,8 @@ def calculate_outputs(
     Convert artifacts iterator to an output iterator.
 
     Algorithm:
-    1. sort and group by schema name and
+    1. group by schema name into a bucket per schema in a single pass, retaining the
+        order in which the schema names and artifacts are first seen, and
     2. call calculate_output on the grouped artifacts.
 
     Args:
@@ -75,10 +81,9 @@ def calculate_outputs(
         An iterator with the converted output.
 
     """
-    # Sort and group
-    sorted_artifacts = sorted(artifacts, key=lambda backref: backref.schema_name)
-    grouped_artifacts = itertools.groupby(
-        sorted_artifacts, lambda backref: backref.schema_name
-    )
+    # Group into buckets
+    buckets: typing.Dict[str, typing.List[TArtifacts]] = {}
+    for artifact in artifacts:
+        buckets.setdefault(artifact.schema_name, []).append(artifact)
     # Map to output
-    return map(lambda args: (args[0], calculate_output(args[1])), grouped_artifacts)
+    return map(lambda args: (args[0], calculate_output(iter(args[1]))), buckets.items())
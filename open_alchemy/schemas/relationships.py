@@ -0,0 +1,96 @@
+"""
+Pre-process schemas for relationships in a single pass.
+
+Combines the back reference, foreign key and association pre-processors so that each
+property of each constructable schema is only visited once.
+"""
+
+import typing
+
+from .. import types
+from . import association
+from . import backref
+from . import foreign_key
+from .helpers import index as index_helper
+from .helpers import iterate
+from .helpers import process as process_helper
+
+
+class _TArtifacts(typing.NamedTuple):
+    """All the artifacts collected from the properties."""
+
+    backrefs: typing.List[process_helper.TArtifacts]
+    foreign_keys: typing.List[process_helper.TArtifacts]
+    association_schemas: typing.List[types.TNameSchema]
+
+
+def _get_artifacts(*, schemas: types.Schemas, index: index_helper.Index) -> _TArtifacts:
+    """
+    Collect the artifacts of all pre-processors from all properties.
+
+    Assume the schemas are valid.
+
+    Args:
+        schemas: All the schemas.
+        index: The index of the constructable schemas.
+
+    Returns:
+        The back references, foreign keys and association schemas.
+
+    """
+    artifacts = _TArtifacts(backrefs=[], foreign_keys=[], association_schemas=[])
+
+    for schema_name, schema in iterate.constructable(schemas=schemas, index=index):
+        names_properties = iterate.properties_items(
+            schema=schema, schemas=schemas, stay_within_model=True
+        )
+        for property_name, property_schema in names_properties:
+            backref_artifacts = backref.get_property_artifacts(
+                schemas, schema_name, property_schema
+            )
+            if backref_artifacts is not None:
+                artifacts.backrefs.append(backref_artifacts)
+
+            foreign_key_artifacts = foreign_key.get_property_artifacts(
+                schemas, schema_name, schema, property_name, property_schema
+            )
+            if foreign_key_artifacts is not None:
+                artifacts.foreign_keys.append(foreign_key_artifacts)
+
+            association_schema = association.get_property_artifacts(
+                schemas, schema, property_schema
+            )
+            if association_schema is not None:
+                artifacts.association_schemas.append(association_schema)
+
+    return artifacts
+
+
+def process(
+    *, schemas: types.Schemas, index: typing.Optional[index_helper.Index] = None
+) -> None:
+    """
+    Pre-process the schemas to add back references, foreign keys and associations.
+
+    Equivalent to running the back reference, foreign key and association
+    pre-processors one after the other. The artifacts of all of them are collected in a
+    single pass over the properties before any of them are added to the schemas.
+
+    Args:
+        schemas: The schemas to process.
+        index: The index of the constructable schemas, calculated if it is not passed
+            in.
+
+    """
+    if index is None:
+        index = index_helper.calculate(schemas=schemas)
+
+    artifacts = _get_artifacts(schemas=schemas, index=index)
+
+    backref.apply(schemas=schemas, backrefs=artifacts.backrefs)
+    foreign_key.apply(schemas=schemas, foreign_keys=artifacts.foreign_keys)
+    association.apply(
+        schemas=schemas,
+        association_schemas=artifacts.association_schemas,
+        index=index,
+    )
@@ -5,6 +5,7 @@ import typing
 from ... import cache
 from ... import exceptions as _exceptions
 from ... import types as _oa_types
+from ..helpers import index as index_helper
 from ..helpers import iterate
 from . import association
 from . import model
@@ -58,18 +59,23 @@ def _process_model(
         )
 
 
-def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
+def _other_schemas_checks(
+    *,
+    schemas: _oa_types.Schemas,
+    index: typing.Optional[index_helper.Index] = None,
+) -> types.Result:
     """
     Check that at least 1 model is defined and for multiple tablename.
 
     Args:
         schemas: All defined schemas.
+        index: The index of the constructable schemas.
 
     Returns:
         Whether the schemas are valid with a reason if they are not.
 
     """
-    one_model_result = check_one_model(schemas=schemas)
+    one_model_result = check_one_model(schemas=schemas, index=index)
     if not one_model_result.valid:
         return one_model_result
 
@@ -89,7 +95,10 @@ def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
 
 
 def process(
-    *, schemas: _oa_types.Schemas, spec_filename: typing.Optional[str] = None
+    *,
+    schemas: _oa_types.Schemas,
+    spec_filename: typing.Optional[str] = None,
+    index: typing.Optional[index_helper.Index] = None,
 ) -> None:
     """
     Validate schemas.
@@ -97,6 +106,7 @@ def process(
     Args:
         schemas: The schemas to validate.
         spec_filename: The filename of the spec, used to cache the result.
+        index: The index of the constructable schemas.
 
     """
     if spec_filename is not None:
@@ -108,7 +118,7 @@ def process(
         raise _exceptions.MalformedSchemaError(schemas_result.reason)
 
     # Check constructable schemas model
-    constructables = iterate.constructable(schemas=schemas)
+    constructables = iterate.constructable(schemas=schemas, index=index)
     model_results = map(
         lambda args: (args[0], model.check(schemas, args[1])), constructables
     )
@@ -120,12 +130,12 @@ def process(
         raise _exceptions.MalformedSchemaError(f"{name} :: {result.reason}")
 
     # Check constructable schemas properties
-    constructables = iterate.constructable(schemas=schemas)
+    constructables = iterate.constructable(schemas=schemas, index=index)
     for constructable in constructables:
         name, schema = constructable
         _process_model(schemas, name, schema)
 
-    other_results_result = _other_schemas_checks(schemas=schemas)
+    other_results_result = _other_schemas_checks(schemas=schemas, index=index)
     if not other_results_result.valid:
         raise _exceptions.MalformedSchemaError(other_results_result.reason)
 
@@ -133,18 +143,23 @@ def process(
         cache.schemas_are_valid(spec_filename)
 
 
-def check_one_model(*, schemas: _oa_types.Schemas) -> types.Result:
+def check_one_model(
+    *,
+    schemas: _oa_types.Schemas,
+    index: typing.Optional[index_helper.Index] = None,
+) -> types.Result:
     """
     Check that there is at least 1 model in the schemas.
 
     Args:
         schemas: The schemas to validate.
+        index: The index of the constructable schemas.
 
     Returns:
         Whether the schemas contain at least 1 model.
 
     """
-    constructables = iterate.constructable(schemas=schemas)
+    constructables = iterate.constructable(schemas=schemas, index=index)
     if not any(constructables):
         return types.Result(
             False,
@@ -195,6 +195,8 @@ def _check_modifiers(
     peek.description(schema=schema, schemas=schemas)
     # Check mixins value
     peek.mixins(schema=schema, schemas=schemas)
+    # Check to dict cache value
+    peek.to_dict_cache(schema=schema, schemas=schemas)
 
     # Check kwargs
     kwargs_result = _check_kwargs(schema=schema, schemas=schemas)
@@ -27,6 +27,7 @@ def check(schemas: oa_types.Schemas, schema: oa_types.Schema) -> types.Result:
         peek.prefer_local(get_value=peek.index, schema=schema, schemas=schemas)
         peek.prefer_local(get_value=peek.unique, schema=schema, schemas=schemas)
         peek.prefer_local(get_value=peek.primary_key, schema=schema, schemas=schemas)
+        peek.prefer_local(get_value=peek.gin_index, schema=schema, schemas=schemas)
         autoincrement = peek.peek_key(
             schema=schema,
             schemas=schemas,
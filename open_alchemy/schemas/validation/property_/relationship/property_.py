@@ -167,6 +167,16 @@ def _check_object(
     return types.Result(True, None)
 
 
+_ARRAY_ITEMS_ONLY_KEYS = (
+    oa_types.ExtensionProperties.SECONDARY,
+    oa_types.ExtensionProperties.SECONDARY_INDEX,
+    oa_types.ExtensionProperties.BACKREF,
+    oa_types.ExtensionProperties.FOREIGN_KEY_COLUMN,
+    oa_types.ExtensionProperties.KWARGS,
+    oa_types.ExtensionProperties.USELIST,
+)
+
+
 def _check_array_root(
     *, schema: oa_types.Schema, schemas: oa_types.Schemas
 ) -> types.OptResult:
@@ -176,64 +186,13 @@ def _check_array_root(
     # Check writeOnly
     peek.write_only(schema=schema, schemas=schemas)
 
-    # Check secondary
-    if (
-        peek.peek_key(
-            schema=schema, schemas=schemas, key=oa_types.ExtensionProperties.SECONDARY
-        )
-        is not None
-    ):
-        return types.Result(
-            False,
-            "x-secondary cannot be defined on x-to-many relationship property root",
-        )
-    # Check backref
-    if (
-        peek.peek_key(
-            schema=schema, schemas=schemas, key=oa_types.ExtensionProperties.BACKREF
-        )
-        is not None
-    ):
-        return types.Result(
-            False,
-            "x-backref cannot be defined on x-to-many relationship property root",
-        )
-    # Check foreign-key-column
-    if (
-        peek.peek_key(
-            schema=schema,
-            schemas=schemas,
-            key=oa_types.ExtensionProperties.FOREIGN_KEY_COLUMN,
-        )
-        is not None
-    ):
-        return types.Result(
-            False,
-            "x-foreign-key-column cannot be defined on x-to-many relationship "
-            "property root",
-        )
-    # Check kwargs
-    if (
-        peek.peek_key(
-            schema=schema, schemas=schemas, key=oa_types.ExtensionProperties.KWARGS
-        )
-        is not None
-    ):
-        return types.Result(
-            False,
-            "x-kwargs cannot be defined on x-to-many relationship property root",
-        )
-    # Check uselist
-    if (
-        peek.peek_key(
-            schema=schema, schemas=schemas, key=oa_types.ExtensionProperties.USELIST
-        )
-        is not None
-    ):
-        return types.Result(
-            False,
-            "x-uselist cannot be defined on x-to-many relationship property root",
-        )
+    # Check keys only valid on the items
+    for key in _ARRAY_ITEMS_ONLY_KEYS:
+        if peek.peek_key(schema=schema, schemas=schemas, key=key) is not None:
+            return types.Result(
+                False,
+                f"{key} cannot be defined on x-to-many relationship property root",
+            )
 
     return None
 
@@ -263,7 +222,12 @@ def _check_many_to_many(
     """Check many to many schema."""
     # Check items secondary
     secondary = peek.secondary(schema=schema, schemas=schemas)
+    secondary_index = peek.secondary_index(schema=schema, schemas=schemas)
     if secondary is None:
+        if secondary_index is not None:
+            return types.Result(
+                False, "x-secondary-index can only be defined alongside x-secondary"
+            )
         return None
 
     # Check for foreign key column
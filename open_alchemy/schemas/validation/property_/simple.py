@@ -1,5 +1,7 @@
 """Define validation rules for simple properties."""
 
+import typing
+
 from .... import exceptions
 from .... import types as oa_types
 from ....helpers import peek
@@ -17,6 +19,8 @@ _VALID_TYPE_FORMAT = {
     ("number", "float"),
     ("boolean", None),
 }
+# The number of values that fit into the codes of a SMALLINT column
+_SMALL_INTEGER_MAX_VALUES = 32768
 
 
 def _check_modifiers(
@@ -59,6 +63,88 @@ def _check_modifiers(
             False, f"{type_}{format_str} does not support x-autoincrement"
         )
 
+    return _check_storage_modifiers(
+        schema=schema, schemas=schemas, type_=type_, format_=format_
+    )
+
+
+def _check_storage_modifiers(
+    *,
+    schema: oa_types.Schema,
+    schemas: oa_types.Schemas,
+    type_: str,
+    format_: typing.Optional[str],
+) -> types.OptResult:
+    """Check the modifiers that change how the value of the property is stored."""
+    format_str = ""
+    if format_ is not None:
+        format_str = f" {format_} format"
+
+    # Check binary encoding
+    binary_encoding = peek.prefer_local(
+        get_value=peek.binary_encoding, schema=schema, schemas=schemas
+    )
+    if binary_encoding is not None and (type_ != "string" or format_ != "binary"):
+        return types.Result(
+            False, f"{type_}{format_str} does not support x-binary-encoding"
+        )
+
+    # Check enum storage
+    enum_storage = peek.prefer_local(
+        get_value=peek.enum_storage, schema=schema, schemas=schemas
+    )
+    if enum_storage is not None:
+        if type_ != "string" or format_ is not None:
+            return types.Result(
+                False, f"{type_}{format_str} does not support x-enum-storage"
+            )
+        enum_result = _check_enum_storage_values(
+            enum_storage=enum_storage,
+            enum=peek.prefer_local(
+                get_value=peek.enum_, schema=schema, schemas=schemas
+            ),
+        )
+        if enum_result is not None:
+            return enum_result
+
+    # Check native UUID
+    native_uuid = peek.prefer_local(
+        get_value=peek.native_uuid, schema=schema, schemas=schemas
+    )
+    if native_uuid is not None and (type_ != "string" or format_ != "uuid"):
+        return types.Result(
+            False, f"{type_}{format_str} does not support x-native-uuid"
+        )
+
+    # Check GIN index
+    gin_index = peek.prefer_local(
+        get_value=peek.gin_index, schema=schema, schemas=schemas
+    )
+    if gin_index is not None:
+        return types.Result(False, f"{type_}{format_str} does not support x-gin-index")
+
+    return None
+
+
+def _check_enum_storage_values(
+    *, enum_storage: str, enum: typing.Optional[typing.List[typing.Any]]
+) -> types.OptResult:
+    """Check the enum values of a property with x-enum-storage."""
+    if not enum:
+        return types.Result(False, "x-enum-storage requires an enum with values")
+    if not all(isinstance(value, str) for value in enum):
+        return types.Result(False, "x-enum-storage requires string enum values")
+    if len(set(enum)) != len(enum):
+        return types.Result(False, "x-enum-storage requires unique enum values")
+    if (
+        enum_storage == oa_types.EnumStorage.SMALL_INTEGER
+        and len(enum) > _SMALL_INTEGER_MAX_VALUES
+    ):
+        return types.Result(
+            False,
+            "x-enum-storage small-integer supports at most "
+            f"{_SMALL_INTEGER_MAX_VALUES} enum values",
+        )
     return None
 
 
@@ -143,6 +229,8 @@ def check(schemas: oa_types.Schemas, schema: oa_types.Schema) -> types.Result:
         peek.prefer_local(get_value=peek.read_only, schema=schema, schemas=schemas)
         # Check writeOnly
         peek.prefer_local(get_value=peek.write_only, schema=schema, schemas=schemas)
+        # Check enum
+        peek.prefer_local(get_value=peek.enum_, schema=schema, schemas=schemas)
 
     except exceptions.SchemaNotFoundError as exc:
         return types.Result(False, f"reference :: {exc}")
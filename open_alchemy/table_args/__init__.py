@@ -15,15 +15,20 @@ TableArg = typing.Union[sa_schema.UniqueConstraint, sa_schema.Index, Kwargs]
 TableArgs = typing.Tuple[TableArg, ...]
 
 
-def construct(*, schema: types.Schema) -> TableArgs:
+def construct(
+    *, schema: types.Schema, artifacts: typing.Optional[types.ModelArtifacts] = None
+) -> TableArgs:
     """
     Construct any table args from the object schema.
 
     Look for x-composite-unique and x-composite-index keys in the schema and construct
-    any unique constraints and indexes based on their value.
+    any unique constraints and indexes based on their value. Also add listeners that
+    create the GIN indexes of any JSON properties with x-gin-index in the artifacts
+    on PostgreSQL.
 
     Args:
         schema: The schema for the object.
+        artifacts: The artifacts of the model.
 
     Returns:
         A tuple with any unique constraints and indexes.
@@ -46,6 +51,11 @@ def construct(*, schema: types.Schema) -> TableArgs:
         table_args.append(factory.index_factory(spec=index_spec))
     # Handle any kwargs
     kwargs = _calculate_kwargs(schema=schema)
+    # Handle x-gin-index
+    if artifacts is not None:
+        gin_indexes = factory.gin_index_factory(artifacts=artifacts)
+        if gin_indexes:
+            kwargs["listeners"] = [("after_create", ddl) for ddl in gin_indexes]
     if kwargs:
         table_args.append([kwargs])
 
@@ -7,6 +7,7 @@ import os
 import typing
 
 from sqlalchemy import schema
+from sqlalchemy.dialects import postgresql
 
 from open_alchemy import exceptions
 from open_alchemy import types
@@ -19,12 +20,13 @@ _COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, *_PATHS, "common-schemas.json")
     _resolver,  # pylint: disable=invalid-name
     (_COMMON_SCHEMAS,),
 ) = jsonschema.resolver(_COMMON_SCHEMAS_FILE)
+_POSTGRESQL_PREPARER = postgresql.dialect().identifier_preparer
 
 
 def _spec_to_schema_name(
     *,
     spec: typing.Union[types.AnyUnique, types.AnyIndex],
-    schema_names: typing.Optional[typing.List[str]] = None
+    schema_names: typing.Optional[typing.List[str]] = None,
 ) -> str:
     """
     Convert a specification to the name of the matched schema.
@@ -229,3 +231,60 @@ def index_factory(*, spec: types.AnyIndex) -> typing.Iterator[schema.Index]:
     """
     mapped_spec = map_index(spec=spec)
     return map(_construct_index, mapped_spec)
+
+
+def _quote(name: str) -> str:
+    """Quote an identifier for PostgreSQL in the same way as the DDL of an Index."""
+    return _POSTGRESQL_PREPARER.quote(name)
+
+
+def _construct_gin_index(
+    *, tablename: str, name: str, gin_index: typing.Union[bool, str]
+) -> schema.DDLElement:
+    """
+    Construct the DDL creating the GIN index of a JSON property.
+
+    Args:
+        tablename: The name of the table of the model.
+        name: The name of the property.
+        gin_index: The x-gin-index value of the property.
+
+    Returns:
+        The DDL that is only executed on PostgreSQL.
+
+    """
+    column = _quote(name)
+    if isinstance(gin_index, str):
+        column = f"{column} {gin_index}"
+    index_name = _quote(f"ix_{tablename}_{name}_gin")
+    ddl = schema.DDL(f"CREATE INDEX {index_name} ON %(fullname)s USING gin ({column})")
+    return ddl.execute_if(dialect="postgresql")  # type: ignore
+
+
+def gin_index_factory(
+    *, artifacts: types.ModelArtifacts
+) -> typing.List[schema.DDLElement]:
+    """
+    Generate the DDL creating the GIN indexes of the JSON properties of a model.
+
+    The indexes are created for properties with x-gin-index. The DDL is executed
+    after the table is created and only on PostgreSQL so that no index is created on
+    other databases.
+
+    Args:
+        artifacts: The artifacts of the model.
+
+    Returns:
+        The DDL for each GIN index.
+
+    """
+    return [
+        _construct_gin_index(
+            tablename=artifacts.tablename,
+            name=name,
+            gin_index=property_artifacts.extension.gin_index,
+        )
+        for name, property_artifacts in artifacts.properties
+        if isinstance(property_artifacts, types.JsonPropertyArtifacts)
+        and property_artifacts.extension.gin_index
+    ]
@@ -1,9 +1,11 @@
 """Types shared across modules."""
+# pylint: disable=too-many-lines
 
 import dataclasses
 import datetime
 import enum
 import typing
+import uuid
 
 try:  # pragma: no cover
     from typing import Literal  # pylint: disable=unused-import
@@ -14,6 +16,8 @@ except ImportError:  # pragma: no cover
     from typing_extensions import Protocol  # type: ignore
     from typing_extensions import TypedDict  # type: ignore
 
+from .helpers import slots
+
 Schema = typing.Dict[str, typing.Any]
 Schemas = typing.Dict[str, Schema]
 TKwargs = typing.Dict[str, typing.Any]
@@ -44,6 +48,7 @@ class OpenApiProperties(str, enum.Enum):
     DEFAULT: Literal["default"] = "default"
     REQUIRED: Literal["required"] = "required"
     PROPERTIES: Literal["properties"] = "properties"
+    ENUM: Literal["enum"] = "enum"
 
 
 @enum.unique
@@ -59,6 +64,7 @@ class ExtensionProperties(str, enum.Enum):
     JSON: Literal["x-json"] = "x-json"
     BACKREF: Literal["x-backref"] = "x-backref"
     SECONDARY: Literal["x-secondary"] = "x-secondary"
+    SECONDARY_INDEX: Literal["x-secondary-index"] = "x-secondary-index"
     USELIST: Literal["x-uselist"] = "x-uselist"
     KWARGS: Literal["x-kwargs"] = "x-kwargs"
     FOREIGN_KEY_KWARGS: Literal["x-foreign-key-kwargs"] = "x-foreign-key-kwargs"
@@ -72,6 +78,11 @@ class ExtensionProperties(str, enum.Enum):
     BACKREFS: Literal["x-backrefs"] = "x-backrefs"
     DE_REF: Literal["x-de-$ref"] = "x-de-$ref"
     SCHEMA_NAME: Literal["x-schema-name"] = "x-schema-name"
+    TO_DICT_CACHE: Literal["x-to-dict-cache"] = "x-to-dict-cache"
+    BINARY_ENCODING: Literal["x-binary-encoding"] = "x-binary-encoding"
+    ENUM_STORAGE: Literal["x-enum-storage"] = "x-enum-storage"
+    NATIVE_UUID: Literal["x-native-uuid"] = "x-native-uuid"
+    GIN_INDEX: Literal["x-gin-index"] = "x-gin-index"
 
 
 class ModelFactory(Protocol):
@@ -119,7 +130,9 @@ IndexList = typing.List[Index]
 AnyIndex = typing.Union[ColumnList, ColumnListList, Index, IndexList]
 TColumnDefault = typing.Optional[typing.Union[str, int, float, bool]]
 TPyColumnDefault = typing.Optional[
-    typing.Union[str, int, float, bool, bytes, datetime.date, datetime.datetime]
+    typing.Union[
+        str, int, float, bool, bytes, datetime.date, datetime.datetime, uuid.UUID
+    ]
 ]
 
 
@@ -139,6 +152,11 @@ _ColumnSchemaBase = TypedDict(
         "readOnly": bool,
         "writeOnly": bool,
         "x-foreign-key": str,
+        "x-binary-encoding": str,
+        "enum": typing.List[typing.Any],
+        "x-enum-storage": str,
+        "x-native-uuid": bool,
+        "x-index": bool,
     },
     total=False,
 )
@@ -195,6 +213,31 @@ class PropertyType(str, enum.Enum):
     BACKREF = "BACKREF"
 
 
+@enum.unique
+class BinaryEncoding(str, enum.Enum):
+    """The encoding of the dictionary values of binary properties."""
+
+    UTF_8 = "utf-8"
+    BASE64 = "base64"
+    BYTES = "bytes"
+
+
+@enum.unique
+class EnumStorage(str, enum.Enum):
+    """How the values of enum string properties are stored in the database."""
+
+    NATIVE = "native"
+    SMALL_INTEGER = "small-integer"
+
+
+@enum.unique
+class GinIndexOperatorClass(str, enum.Enum):
+    """The operator class of the GIN index of a JSON property."""
+
+    JSONB_OPS = "jsonb_ops"
+    JSONB_PATH_OPS = "jsonb_path_ops"
+
+
 @enum.unique
 class RelationshipType(str, enum.Enum):
     """The relationship type."""
@@ -208,7 +251,8 @@ class RelationshipType(str, enum.Enum):
 TMixins = typing.List[str]
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class PropertyArtifacts:
     """Information about a property."""
 
@@ -237,6 +281,7 @@ class _OpenApiSimplePropertyTypedDictBase(TypedDict, total=False):
     default: typing.Union[int, float, str, bool]
     read_only: bool
     write_only: bool
+    enum: typing.List[typing.Any]
 
 
 class OpenApiSimplePropertyTypedDict(_OpenApiSimplePropertyTypedDictBase, total=True):
@@ -245,7 +290,8 @@ class OpenApiSimplePropertyTypedDict(_OpenApiSimplePropertyTypedDictBase, total=
     type: str
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class OpenApiSimplePropertyArtifacts:
     """OpenAPI artifacts for the simple property."""
 
@@ -256,6 +302,7 @@ class OpenApiSimplePropertyArtifacts:
     default: typing.Optional[typing.Union[int, float, str, bool]]
     read_only: typing.Optional[bool]
     write_only: typing.Optional[bool]
+    enum: typing.Optional[typing.List[typing.Any]]
 
     def to_dict(self) -> OpenApiSimplePropertyTypedDict:
         """Convert to dictionary."""
@@ -269,6 +316,7 @@ class OpenApiSimplePropertyArtifacts:
                 "default",
                 "read_only",
                 "write_only",
+                "enum",
             ]
         ] = [
             "format",
@@ -277,6 +325,7 @@ class OpenApiSimplePropertyArtifacts:
             "default",
             "read_only",
             "write_only",
+            "enum",
         ]
         for opt_key in opt_keys:
             value = getattr(self, opt_key)
@@ -298,6 +347,9 @@ class _ExtensionSimplePropertyTypedDictBase(TypedDict, total=False):
     foreign_key: str
     kwargs: TKwargs
     foreign_key_kwargs: TKwargs
+    binary_encoding: str
+    enum_storage: str
+    native_uuid: bool
 
 
 class ExtensionSimplePropertyTypedDict(
@@ -308,8 +360,9 @@ class ExtensionSimplePropertyTypedDict(
     primary_key: bool
 
 
-@dataclasses.dataclass
-class ExtensionSimplePropertyArtifacts:
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
+class ExtensionSimplePropertyArtifacts:  # pylint: disable=too-many-instance-attributes
     """OpenAPI artifacts for the simple property."""
 
     primary_key: bool
@@ -321,6 +374,9 @@ class ExtensionSimplePropertyArtifacts:
     kwargs: typing.Optional[TKwargs]
     foreign_key_kwargs: typing.Optional[TKwargs]
     dict_ignore: typing.Optional[bool]
+    binary_encoding: typing.Optional[str]
+    enum_storage: typing.Optional[str]
+    native_uuid: typing.Optional[bool]
 
     def to_dict(self) -> ExtensionSimplePropertyTypedDict:
         """Convert to dictionary."""
@@ -337,6 +393,9 @@ class ExtensionSimplePropertyArtifacts:
                 "foreign_key",
                 "kwargs",
                 "foreign_key_kwargs",
+                "binary_encoding",
+                "enum_storage",
+                "native_uuid",
             ]
         ] = [
             "autoincrement",
@@ -346,6 +405,9 @@ class ExtensionSimplePropertyArtifacts:
             "foreign_key",
             "kwargs",
             "foreign_key_kwargs",
+            "binary_encoding",
+            "enum_storage",
+            "native_uuid",
         ]
         for opt_key in opt_keys:
             value = getattr(self, opt_key)
@@ -373,7 +435,8 @@ class SimplePropertyTypedDict(_SimplePropertyTypedDictBase, total=True):
     required: bool
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class SimplePropertyArtifacts(PropertyArtifacts):
     """Information about a simple property."""
 
@@ -407,7 +470,8 @@ class OpenApiJsonPropertyTypedDict(TypedDict, total=False):
     write_only: bool
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class OpenApiJsonPropertyArtifacts:
     """OpenAPI artifacts for the JSON property."""
 
@@ -443,6 +507,7 @@ class _ExtensionJsonPropertyTypedDictBase(TypedDict, total=False):
     foreign_key: str
     kwargs: TKwargs
     foreign_key_kwargs: TKwargs
+    gin_index: typing.Union[bool, str]
 
 
 class ExtensionJsonPropertyTypedDict(_ExtensionJsonPropertyTypedDictBase, total=True):
@@ -451,7 +516,8 @@ class ExtensionJsonPropertyTypedDict(_ExtensionJsonPropertyTypedDictBase, total=
     primary_key: bool
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class ExtensionJsonPropertyArtifacts:
     """OpenAPI artifacts for the JSON property."""
 
@@ -461,6 +527,7 @@ class ExtensionJsonPropertyArtifacts:
     foreign_key: typing.Optional[str]
     kwargs: typing.Optional[TKwargs]
     foreign_key_kwargs: typing.Optional[TKwargs]
+    gin_index: typing.Optional[typing.Union[bool, str]]
 
     def to_dict(self) -> ExtensionJsonPropertyTypedDict:
         """Convert to dictionary."""
@@ -473,6 +540,7 @@ class ExtensionJsonPropertyArtifacts:
                 "foreign_key",
                 "kwargs",
                 "foreign_key_kwargs",
+                "gin_index",
             ]
         ] = [
             "index",
@@ -480,6 +548,7 @@ class ExtensionJsonPropertyArtifacts:
             "foreign_key",
             "kwargs",
             "foreign_key_kwargs",
+            "gin_index",
         ]
         for opt_key in opt_keys:
             value = getattr(self, opt_key)
@@ -507,7 +576,8 @@ class JsonPropertyTypedDict(_JsonPropertyTypedDictBase, total=True):
     required: bool
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class JsonPropertyArtifacts(PropertyArtifacts):
     """Information about a JSON property."""
 
@@ -533,7 +603,8 @@ class JsonPropertyArtifacts(PropertyArtifacts):
         return return_dict
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class RelationshipPropertyArtifacts(PropertyArtifacts):
     """Information about a relationship property."""
 
@@ -552,7 +623,8 @@ class RelationshipPropertyArtifacts(PropertyArtifacts):
     required: bool
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class NotManyToManyRelationshipPropertyArtifacts(RelationshipPropertyArtifacts):
     """Information about a relationship that is not many-to-many property."""
 
@@ -588,7 +660,8 @@ class OneToManyRelationshipPropertyTypedDict(
     foreign_key_property: str
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class OneToManyRelationshipPropertyArtifacts(
     NotManyToManyRelationshipPropertyArtifacts
 ):
@@ -653,7 +726,8 @@ class XToOneRelationshipPropertyTypedDict(
     foreign_key_property: str
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class XToOneRelationshipPropertyArtifacts(NotManyToManyRelationshipPropertyArtifacts):
     """Information about a x-to-one relationship property."""
 
@@ -704,7 +778,8 @@ class XToOneRelationshipPropertyArtifacts(NotManyToManyRelationshipPropertyArtif
 ManyToOneRelationshipPropertyTypedDict = XToOneRelationshipPropertyTypedDict
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class ManyToOneRelationshipPropertyArtifacts(XToOneRelationshipPropertyArtifacts):
     """Information about a many-to-one relationship property."""
 
@@ -712,17 +787,16 @@ class ManyToOneRelationshipPropertyArtifacts(XToOneRelationshipPropertyArtifacts
         RelationshipType.MANY_TO_ONE,
     ]
 
-    def to_dict(  # pylint: disable=useless-super-delegation
-        self,
-    ) -> ManyToOneRelationshipPropertyTypedDict:
+    def to_dict(self) -> ManyToOneRelationshipPropertyTypedDict:
         """Convert to dictionary."""
-        return super().to_dict()
+        return XToOneRelationshipPropertyArtifacts.to_dict(self)
 
 
 OneToOneRelationshipPropertyTypedDict = XToOneRelationshipPropertyTypedDict
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class OneToOneRelationshipPropertyArtifacts(XToOneRelationshipPropertyArtifacts):
     """Information about a one-to-one relationship property."""
 
@@ -730,11 +804,9 @@ class OneToOneRelationshipPropertyArtifacts(XToOneRelationshipPropertyArtifacts)
         RelationshipType.ONE_TO_ONE,
     ]
 
-    def to_dict(  # pylint: disable=useless-super-delegation
-        self,
-    ) -> OneToOneRelationshipPropertyTypedDict:
+    def to_dict(self) -> OneToOneRelationshipPropertyTypedDict:
         """Convert to dictionary."""
-        return super().to_dict()
+        return XToOneRelationshipPropertyArtifacts.to_dict(self)
 
 
 class _ManyToManyRelationshipPropertyTypedDictBase(TypedDict, total=False):
@@ -759,7 +831,8 @@ class ManyToManyRelationshipPropertyTypedDict(
     secondary: str
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class ManyToManyRelationshipPropertyArtifacts(RelationshipPropertyArtifacts):
     """Information about a x-to-one relationship property."""
 
@@ -835,7 +908,8 @@ class BackrefSubType(str, enum.Enum):
     ARRAY = "ARRAY"
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class BackrefPropertyArtifacts(PropertyArtifacts):
     """Information about a back reference property."""
 
@@ -920,7 +994,8 @@ class ModelBackrefArtifacts(typing.NamedTuple):
     child: str
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class ModelExPropertiesArtifacts:
     """Information about a model excluding its properties."""
 
@@ -967,7 +1042,8 @@ class ModelExPropertiesArtifacts:
         return return_dict
 
 
-@dataclasses.dataclass
+@slots.slotted
+@dataclasses.dataclass(frozen=True)
 class ModelArtifacts(ModelExPropertiesArtifacts):
     """Full information about a model."""
 
@@ -1,17 +1,29 @@
 """Base class providing utilities for SQLAlchemy models."""
 
+import copy
 import json
 import typing
 
 from .. import exceptions
 from .. import types as oa_types
-from ..facades import jsonschema
 from ..facades import models
+from ..facades.sqlalchemy import binary as sqlalchemy_binary
+from ..facades.sqlalchemy import bulk as sqlalchemy_bulk
 from ..helpers import peek
 from ..helpers import schema as schema_helper
-from . import from_dict
+from . import keyset
+from . import properties
 from . import repr_
+from . import to_columns
 from . import to_dict
+from .from_dict import codegen as from_dict_codegen
+from .from_dict import model as from_dict_model
+from .from_dict import parallel as from_dict_parallel
+from .to_dict import cache as to_dict_cache
+from .to_dict import fields as to_dict_fields
+from .to_dict import load_options as to_dict_load_options
+from .to_dict import memo as to_dict_memo
+from .to_dict import rows as to_dict_rows
 
 TUtilityBase = typing.TypeVar("TUtilityBase", bound="UtilityBase")
 TOptUtilityBase = typing.Optional[TUtilityBase]
@@ -41,13 +53,7 @@ class UtilityBase:
             The schema.
 
         """
-        # Checking for _schema
-        if not hasattr(cls, "_schema"):
-            raise exceptions.ModelAttributeError(
-                "Model does not have a record of its schema. "
-                "To support to_dict set the _schema class variable."
-            )
-        return cls._schema
+        return models.get_schema(model=cls)
 
     @classmethod
     def get_properties(cls) -> oa_types.Schema:
@@ -63,45 +69,47 @@ class UtilityBase:
         """
         schema = cls._get_schema()
         # Checking that _schema has properties
-        properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
-        if properties is None:
+        model_properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
+        if model_properties is None:
             raise exceptions.MalformedSchemaError(
                 "The model schema does not have any properties.", schema=schema
             )
-        return properties
-
-    @staticmethod
-    def _get_parent(*, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
-        """Get the parent model of a model."""
-        parent_name = peek.inherits(schema=schema, schemas={})
-        if parent_name is None or not isinstance(parent_name, str):
-            raise exceptions.MalformedSchemaError(
-                "To construct a model that inherits x-inherits must be present and a "
-                "string.",
-                schema=schema,
-                x_inherits=parent_name,
-                x_inherits_type=type(parent_name),
-            )
-        # Try to get model
-        parent: TOptUtilityBase = models.get_model(name=parent_name)
-        if parent is None:
-            raise exceptions.SchemaNotFoundError(
-                "The parent model was not found on open_alchemy.models.",
-                schema=schema,
-                parent_model_name=parent_name,
-            )
-        return parent
+        return model_properties
 
     @classmethod
     def construct_from_dict_init(
         cls: typing.Type[TUtilityBase], **kwargs: typing.Any
     ) -> typing.Dict[str, typing.Any]:
         """Construct the dictionary passed to model construction."""
-        # Check dictionary
+        return cls._construct_from_dict(kwargs, partial=False)
+
+    @classmethod
+    def construct_from_dict_update(
+        cls: typing.Type[TUtilityBase], **kwargs: typing.Any
+    ) -> typing.Dict[str, typing.Any]:
+        """Construct the dictionary of the values to update a model instance with."""
+        return cls._construct_from_dict(kwargs, partial=True)
+
+    @classmethod
+    def _construct_from_dict(
+        cls, kwargs: typing.Dict[str, typing.Any], *, partial: bool
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Check and convert the values in a dictionary for the columns of the model.
+
+        Args:
+            kwargs: The values to check and convert.
+            partial: Whether only the values that are passed in are checked rather
+                than the complete model dictionary.
+
+        Returns:
+            The values converted for the columns of the model.
+
+        """
         schema = cls._get_schema()
         try:
-            jsonschema.validate(instance=kwargs, schema=schema)
-        except jsonschema.ValidationError as exc:
+            return cls._get_from_dict_converter()(kwargs, partial)
+        except from_dict_codegen.ValidationError as exc:
             raise exceptions.MalformedModelDictionaryError(
                 "The dictionary passed to from_dict is not a valid instance of the "
                 "model schema.",
@@ -109,33 +117,35 @@ class UtilityBase:
                 kwargs=kwargs,
             ) from exc
 
-        # Assemble dictionary for construction
-        properties = cls.get_properties()
-        model_dict: typing.Dict[str, typing.Any] = {}
-        for name, value in kwargs.items():
-            # Get the specification and type of the property
-            property_schema = properties.get(name)
-            if property_schema is None:
-                raise exceptions.MalformedModelDictionaryError(
-                    "A parameter was passed in that is not a property in the model "
-                    "schema.",
-                    parameter_name=name,
-                    schema=schema,
-                )
+    @classmethod
+    def _get_from_dict_converter(cls) -> from_dict_codegen.TModelConverter:
+        """
+        Get the function that checks and converts the dictionary for the model.
 
-            # Convert to column value
-            try:
-                model_dict[name] = from_dict.convert(
-                    value=value, schema=property_schema
-                )
-            except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
-                exc.property_name = name  # type: ignore
-                exc.property_value = value  # type: ignore
-                raise
+        The function is generated the first time it is needed for the schema of the
+        model and then stored on the model.
+
+        Returns:
+            The function.
+
+        """
+        schema = cls._get_schema()
+        compiled = vars(cls).get("_from_dict_converter")
+        if compiled is None or compiled[0] is not schema:
+            compiled = (schema, from_dict_codegen.compile_(schema=schema))
+            setattr(cls, "_from_dict_converter", compiled)
+        return compiled[1]
+
+    @classmethod
+    def precompile(cls) -> None:
+        """
+        Compile what the model otherwise compiles the first time it is used.
+
+        Useful to compile the from_dict converter once in the master process of a
+        pre-fork server rather than in every worker.
 
-        return model_dict
+        """
+        cls._get_from_dict_converter()
 
     @classmethod
     def from_dict(cls: typing.Type[TUtilityBase], **kwargs: typing.Any) -> TUtilityBase:
@@ -151,34 +161,155 @@ class UtilityBase:
         Returns:
             An instance of the model constructed using the dictionary.
 
+        """
+        return cls(**from_dict_model.calculate(model=cls, kwargs=kwargs, partial=False))
+
+    def update_from_dict(self, **kwargs: typing.Any) -> None:
+        """
+        Update the model instance in place from a dictionary.
+
+        Only the values that are passed in are checked against the schemas of their
+        properties and converted in the same way as for from_dict before they are set
+        on the instance.
+
+        Raise MalformedModelDictionaryError when a value does not satisfy the schema
+        of its property, is not a property of the model or is for a readOnly property.
+
+        Args:
+            kwargs: The values to update the instance with.
+
+        """
+        values = from_dict_model.calculate(
+            model=type(self), kwargs=kwargs, partial=True
+        )
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def parallel_from_dicts(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Check and convert dictionaries for the model in worker processes.
+
+        Each row is checked and converted in the same way as for from_dict in a pool of
+        worker processes. Each worker compiles the checks and conversions once from the
+        schema of the model and returns the values for the columns rather than model
+        instances. The values can then be inserted in the current process, for example,
+        by constructing the model with them or using Session.bulk_insert_mappings.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the model
+        schema or includes a relationship.
+        Raise ValueError if the number of workers or the chunk size is not positive.
+
+        Args:
+            rows: The dictionaries to convert.
+            workers: The number of worker processes, defaults to the number of CPUs.
+            chunk_size: The number of rows sent to a worker at a time.
+
+        Returns:
+            The values for the columns of each row in the same order as the rows.
+
         """
         schema = cls._get_schema()
-        # Handle model that inherits
-        if schema_helper.inherits(schema=schema, schemas={}):
-            # Retrieve parent model
-            parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
-
-            # Construct parent initialization dictionary
-            # Get properties for schema
-            properties = cls.get_properties()
-            # Pass kwargs that don't belong to the current model to the parent
-            parent_kwargs = {
-                key: value for key, value in kwargs.items() if key not in properties
-            }
-            parent_init_dict = parent.construct_from_dict_init(**parent_kwargs)
+        parent = properties.get_parent_model(schema=schema)
+        parent_schema = None if parent is None else models.get_schema(model=parent)
+        return from_dict_parallel.convert(
+            schemas=from_dict_parallel.Schemas(model=schema, parent=parent_schema),
+            rows=rows,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
 
-            # COnstruct child (the current model) initialization dictionary
-            child_kwargs = {
-                key: value for key, value in kwargs.items() if key in properties
-            }
-            init_dict = {
-                **parent_init_dict,
-                **cls.construct_from_dict_init(**child_kwargs),
-            }
-        else:
-            init_dict = cls.construct_from_dict_init(**kwargs)
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Insert rows for the model from dictionaries using SQLAlchemy Core.
+
+        Each row is checked and converted in the same way as for from_dict without
+        constructing a model instance. The rows are inserted in chunks using executemany
+        which skips the unit of work of the session. For models with joined table
+        inheritance, rows are inserted into each table starting with the base table.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the model
+        schema, includes a relationship or, for joined table inheritance, does not
+        include the primary key.
+
+        Rows are inserted chunk by chunk, use a transaction to insert all or none of the
+        rows.
+
+        Args:
+            bind: The session or connection used to execute the inserts.
+            rows: The dictionaries to insert.
+            chunk_size: The maximum number of rows to insert with each executemany.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        init_dicts = map(
+            lambda row: from_dict_model.calculate(model=cls, kwargs=row, partial=False),
+            rows,
+        )
+        return sqlalchemy_bulk.insert(
+            bind=bind, model=cls, rows=init_dicts, chunk_size=chunk_size
+        )
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> sqlalchemy_bulk.UpsertCounts:
+        """
+        Insert or update rows for the model from dictionaries using SQLAlchemy Core.
+
+        Each row is checked and converted in the same way as for from_dict without
+        constructing a model instance. A row is updated if a row with the same primary
+        key or, if the primary key is not included, the same values for the columns of
+        a unique constraint already exists. Otherwise the row is inserted. SQLite and
+        PostgreSQL use INSERT ... ON CONFLICT DO UPDATE, other databases update the
+        existing and insert the new rows of each chunk. Rows of a chunk for the same
+        row are de-duplicated and the last of them is used.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the model
+        schema, includes a relationship or does not include the primary key or the
+        columns of a unique constraint or index.
+
+        Rows are upserted chunk by chunk, use a transaction to upsert all or none of the
+        rows.
 
-        return cls(**init_dict)
+        Args:
+            bind: The session or connection used to execute the statements.
+            rows: The dictionaries to upsert.
+            chunk_size: The maximum number of rows to upsert with each statement.
+
+        Returns:
+            The number of rows that were inserted and updated. Existing rows that only
+            include the primary key or unique columns are unchanged and not counted.
+            The counts are approximate if other transactions change the same rows
+            concurrently.
+
+        """
+        init_dicts = map(
+            lambda row: from_dict_model.calculate(model=cls, kwargs=row, partial=False),
+            rows,
+        )
+        return sqlalchemy_bulk.upsert(
+            bind=bind, model=cls, rows=init_dicts, chunk_size=chunk_size
+        )
 
     @classmethod
     def from_str(cls: typing.Type[TUtilityBase], value: str) -> TUtilityBase:
@@ -214,17 +345,46 @@ class UtilityBase:
         return cls.from_dict(**dict_value)
 
     @classmethod
-    def instance_to_dict(cls, instance: TUtilityBase) -> typing.Dict[str, typing.Any]:
-        """Convert instance of the model to a dictionary."""
+    def instance_to_dict(
+        cls,
+        instance: TUtilityBase,
+        *,
+        fields: to_dict_fields.TOptGroupedFields = None,
+        exclude: to_dict_fields.TOptGroupedFields = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instance of the model to a dictionary.
+
+        Args:
+            instance: The instance to convert.
+            fields (optional): The grouped paths of the properties to include.
+            exclude (optional): The grouped paths of the properties to exclude.
+            depth (optional): The maximum number of relationships to follow.
+
+        Returns:
+            The dictionary representation of the instance.
+
+        """
         schema = cls._get_schema()
-        properties = cls.get_properties()
+        model_properties = cls.get_properties()
+        nested_depth = None if depth is None else depth - 1
 
         # Collecting the values of the properties
         return_dict: typing.Dict[str, typing.Any] = {}
-        for name, property_schema in properties.items():
+        for name, property_schema in model_properties.items():
             # Handle for writeOnly
             if peek.write_only(schema=property_schema, schemas={}):
                 continue
+            # Handle for properties that were not requested
+            if not to_dict_fields.includes(name, fields=fields, exclude=exclude):
+                continue
+            if (
+                depth is not None
+                and depth < 1
+                and not to_dict.is_column(schema=property_schema)
+            ):
+                continue
 
             value = getattr(instance, name, None)
 
@@ -236,8 +396,17 @@ class UtilityBase:
                 # Don't consider for coverage due to coverage bug
                 continue  # pragma: no cover
 
+            nested_fields, nested_exclude = to_dict_fields.nested(
+                name, fields=fields, exclude=exclude
+            )
             try:
-                return_dict[name] = to_dict.convert(schema=property_schema, value=value)
+                return_dict[name] = to_dict.convert(
+                    schema=property_schema,
+                    value=value,
+                    fields=nested_fields,
+                    exclude=nested_exclude,
+                    depth=nested_depth,
+                )
             except exceptions.BaseError as exc:
                 exc.schema = schema  # type: ignore
                 exc.property_schema = property_schema  # type: ignore
@@ -247,10 +416,148 @@ class UtilityBase:
 
         return return_dict
 
-    def to_dict(self) -> typing.Dict[str, typing.Any]:
+    def to_dict(
+        self,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+        cycle: str = to_dict_memo.CycleStrategy.NONE,
+    ) -> typing.Dict[str, typing.Any]:
         """
         Convert model instance to dictionary.
 
+        Instances that are reached more than once are only converted once and their
+        dictionary is reused. Reaching an instance that is already being converted,
+        for example through a self-referencing relationship, is handled based on cycle.
+
+        Raises ValueError if cycle is not a valid strategy.
+        Raises InstanceCycleError if an instance is reached that is already being
+            converted and cycle is "error".
+
+        Args:
+            fields (optional): The properties to include. The properties of
+                relationships are selected using dotted paths, for example,
+                "division.name". By default all properties are included.
+            exclude (optional): The properties to exclude using the same paths as
+                fields.
+            depth (optional): The maximum number of relationships to follow. By
+                default all relationships are followed.
+            cycle (optional): How to handle an instance that is already being
+                converted, "none" converts it to None and "error" raises an error.
+                Only used for the outermost call.
+
+        Returns:
+            The dictionary representation of the model.
+
+        """
+        fields_paths = None if fields is None else tuple(fields)
+        exclude_paths = None if exclude is None else tuple(exclude)
+
+        memo = to_dict_memo.get()
+        if memo is not None:
+            return self._memoized_to_dict(  # type: ignore
+                memo, fields=fields_paths, exclude=exclude_paths, depth=depth
+            )
+
+        cycle_strategy = to_dict_memo.CycleStrategy(cycle)
+        with to_dict_memo.start(cycle=cycle_strategy) as memo:
+            if (
+                fields_paths is None
+                and exclude_paths is None
+                and depth is None
+                and cycle_strategy == to_dict_memo.CycleStrategy.NONE
+                and self._get_schema().get(oa_types.ExtensionProperties.TO_DICT_CACHE)
+            ):
+                cached_dict = to_dict_cache.get(self)
+                if cached_dict is None:
+                    cached_dict = self._memoized_to_dict(
+                        memo, fields=None, exclude=None, depth=None
+                    )
+                    assert cached_dict is not None
+                    to_dict_cache.store(
+                        self,
+                        cached_dict,
+                        dependencies=to_dict_cache.calculate_dependencies(self),
+                    )
+                return copy.deepcopy(cached_dict)
+
+            return_dict = self._memoized_to_dict(
+                memo, fields=fields_paths, exclude=exclude_paths, depth=depth
+            )
+            assert return_dict is not None
+            return return_dict
+
+    def _memoized_to_dict(
+        self,
+        memo: to_dict_memo.Memo,
+        *,
+        fields: typing.Optional[typing.Tuple[str, ...]],
+        exclude: typing.Optional[typing.Tuple[str, ...]],
+        depth: typing.Optional[int],
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Convert model instance to dictionary reusing the dictionaries in the memo.
+
+        Raises InstanceCycleError if the instance is already being converted and the
+            cycle strategy is "error".
+
+        Args:
+            memo: The memo of the call to to_dict.
+            fields: The paths of the properties to include.
+            exclude: The paths of the properties to exclude.
+            depth: The maximum number of relationships to follow.
+
+        Returns:
+            The dictionary representation of the model or None if the instance is
+            already being converted.
+
+        """
+        if id(self) in memo.converting:
+            if memo.cycle == to_dict_memo.CycleStrategy.ERROR:
+                raise exceptions.InstanceCycleError(
+                    "The instance is already being converted to a dictionary.",
+                    instance=self,
+                )
+            memo.cuts += 1
+            return None
+
+        key = to_dict_memo.calculate_key(
+            self, fields=fields, exclude=exclude, depth=depth
+        )
+        memoized = memo.dicts.get(key)
+        if memoized is not None:
+            return memoized[1]
+
+        cuts = memo.cuts
+        memo.converting.add(id(self))
+        try:
+            return_dict = self._to_dict(
+                fields=to_dict_fields.group(fields),
+                exclude=to_dict_fields.group(exclude),
+                depth=depth,
+            )
+        finally:
+            memo.converting.remove(id(self))
+        # The dictionary depends on where the conversion started if a cycle was cut
+        if memo.cuts == cuts:
+            memo.dicts[key] = (self, return_dict)
+        return return_dict
+
+    def _to_dict(
+        self,
+        *,
+        fields: to_dict_fields.TOptGroupedFields,
+        exclude: to_dict_fields.TOptGroupedFields,
+        depth: typing.Optional[int],
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert model instance to dictionary including the properties of any parents.
+
+        Args:
+            fields: The grouped paths of the properties to include.
+            exclude: The grouped paths of the properties to exclude.
+            depth: The maximum number of relationships to follow.
+
         Returns:
             The dictionary representation of the model.
 
@@ -258,11 +565,260 @@ class UtilityBase:
         schema = self._get_schema()
         if schema_helper.inherits(schema=schema, schemas={}):
             # Retrieve parent model and convert to dict
-            parent: typing.Type[UtilityBase] = self._get_parent(schema=schema)
-            parent_dict = parent.instance_to_dict(self)
-            return {**parent_dict, **self.instance_to_dict(self)}
+            parent: typing.Type[UtilityBase] = properties.get_parent(schema=schema)
+            parent_dict = parent.instance_to_dict(
+                self, fields=fields, exclude=exclude, depth=depth
+            )
+            return {
+                **parent_dict,
+                **self.instance_to_dict(
+                    self, fields=fields, exclude=exclude, depth=depth
+                ),
+            }
+
+        return self.instance_to_dict(self, fields=fields, exclude=exclude, depth=depth)
+
+    @classmethod
+    def rows_to_dicts(
+        cls, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert rows with the values of the columns of the model to dictionaries.
+
+        The values are converted in the same way as for to_dict. Only properties stored
+        in columns are included and any properties missing from a row are skipped.
+
+        Args:
+            rows: The rows, for example the result of executing a select statement,
+                where the values are keyed by the name of the property.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        return to_dict_rows.convert(model=cls, rows=rows)
+
+    @classmethod
+    def select_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Query the columns of the model and convert the rows to dictionaries.
+
+        Avoids constructing model instances by only selecting the columns of the
+        properties of the model which are converted using rows_to_dicts.
+
+        Args:
+            session: The session used to execute the query.
+            stmt: A select statement, for example with filters, for the model. Only the
+                columns are selected, regardless of what the statement selects.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        stmt = to_dict_rows.select_columns(model=cls, stmt=stmt)
+        return to_dict_rows.convert(model=cls, rows=session.execute(stmt))
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        session: typing.Any,
+        after: typing.Optional[str] = None,
+        limit: int = 100,
+        order_by: typing.Optional[typing.Iterable[str]] = None,
+        stmt: typing.Any = None,
+        dicts: bool = False,
+    ) -> keyset.Page:
+        """
+        Query a page of rows of the model after the last row of the previous page.
+
+        Instead of skipping the rows of the previous pages using OFFSET, the page
+        starts after the values of the columns of the order of the last row of the
+        previous page so that, with an index on those columns, each page costs the
+        same as the first page. The values are encoded in an opaque cursor.
 
-        return self.instance_to_dict(self)
+        Raises ValueError if limit is less than 1.
+        Raises ModelAttributeError if a property in order_by is not stored in a
+        column, is writeOnly, is not of a simple type or is nullable.
+        Raises InvalidCursorError if after is not a cursor for the order.
+
+        Args:
+            session: The session used to execute the query.
+            after (optional): The cursor of the previous page. By default the first
+                page is queried.
+            limit (optional): The maximum number of rows of the page.
+            order_by (optional): The names of the properties to order the rows by,
+                prefixed with - for descending order. The properties of the primary
+                key are added to make the order unique. By default the rows are
+                ordered by the primary key.
+            stmt (optional): A select statement, for example with filters, for the
+                model. Any order of the statement is replaced.
+            dicts (optional): Whether to only select the columns of the model and
+                convert the rows to dictionaries in the same way as select_dicts
+                instead of returning model instances.
+
+        Returns:
+            The model instances or dictionaries of the page and the cursor to pass as
+            after to query the next page, which is None for the last page.
+
+        """
+        return keyset.paginate(
+            model=cls,
+            session=session,
+            after=after,
+            limit=limit,
+            order_by=order_by,
+            stmt=stmt,
+            dicts=dicts,
+        )
+
+    @classmethod
+    def to_columns(
+        cls,
+        items: typing.Iterable[typing.Any],
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert model instances or rows to an array for each column of the model.
+
+        Integer, number and boolean properties are converted to int64, float64 and
+        bool arrays, date and date-time properties to datetime64 arrays (NumPy) or
+        date and timestamp arrays (Arrow) and other properties to object or string
+        arrays. Nullable columns are converted to masked arrays, except for Arrow which
+        stores None values as nulls.
+
+        Raises ValueError if backend is not numpy, arrow or array.
+        Raises ImportError if the package required by the backend is not installed.
+        Raises InvalidInstanceError if a column that is not nullable has a None value.
+
+        Args:
+            items: The model instances or rows, for example the result of executing a
+                select statement, where the values are keyed by the name of the
+                property.
+            fields (optional): The properties to include. By default all properties
+                stored in columns are included.
+            backend (optional): The library used to construct the arrays, one of numpy,
+                arrow or array for the array module of the standard library. By default
+                numpy is used if it is installed, then pyarrow and otherwise array.
+
+        Returns:
+            The array of each column keyed by the name of the property.
+
+        """
+        columns = to_columns.calculate_columns(model=cls)
+        if fields is not None:
+            field_set = set(fields)
+            columns = {
+                name: column for name, column in columns.items() if name in field_set
+            }
+        return to_columns.convert(columns=columns, items=items, backend=backend)
+
+    @classmethod
+    def stream_binary(
+        cls,
+        session: typing.Any,
+        name: str,
+        ident: typing.Any,
+        *,
+        chunk_size: int = 1024 * 1024,
+    ) -> typing.Iterator[bytes]:
+        """
+        Read the value of a binary property of a row from the database in chunks.
+
+        Only the length of the value and one chunk at a time are queried so that large
+        values are never loaded into memory at once and no model instance is
+        constructed. Nothing is yielded if the row does not exist or the value is None.
+
+        Raises ModelAttributeError if the property is not a binary property stored in
+        a column.
+        Raises MissingArgumentError if the number of values of the primary key does not
+        match the number of columns of the primary key.
+        Raises ValueError if the chunk size is not positive.
+
+        Args:
+            session: The session or connection used to execute the queries.
+            name: The name of the binary property.
+            ident: The value of the primary key of the row or, for a composite primary
+                key, a tuple with the values in the order of the columns.
+            chunk_size (optional): The maximum number of bytes of each chunk.
+
+        Returns:
+            The chunks of the value.
+
+        """
+        row_properties = properties.row_properties(model=cls)
+        if (
+            name not in row_properties
+            or peek.format_(schema=row_properties[name][0], schemas={}) != "binary"
+        ):
+            raise exceptions.ModelAttributeError(
+                f"{name} is not a binary property of the model."
+            )
+        return sqlalchemy_binary.stream(
+            bind=session, model=cls, name=name, ident=ident, chunk_size=chunk_size
+        )
+
+    @classmethod
+    def to_dict_load_options(
+        cls, depth: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict accesses.
+
+        Walks the relationship properties of the model, including readOnly properties,
+        and the relationship properties of the models they refer to. Relationships to
+        many are loaded using selectinload and other relationships using joinedload.
+        Relationships back to a model that has already been passed through are not
+        followed.
+
+        Args:
+            depth: The maximum number of relationships to follow from the model. By
+                default all relationships are followed.
+
+        Returns:
+            The loader options to pass to the options of a query for the model.
+
+        """
+        return to_dict_load_options.relationships(
+            model=cls, parent=None, depth=depth, path=(cls,)
+        )
+
+    @classmethod
+    def load_only_options(
+        cls,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load what to_dict with fields accesses.
+
+        Only the columns of the included properties are loaded. Included relationships
+        are eagerly loaded in the same way as for to_dict_load_options and the other
+        relationships are not loaded. Relationships back to a model that has already
+        been passed through are not followed.
+
+        Args:
+            fields (optional): The properties to include using the same paths as
+                to_dict. By default all properties are included.
+            exclude (optional): The properties to exclude using the same paths as
+                to_dict.
+            depth (optional): The maximum number of relationships to follow. By
+                default all relationships are followed.
+
+        Returns:
+            The loader options to pass to the options of a query for the model.
+
+        """
+        return to_dict_load_options.load_only(
+            model=cls,
+            fields=to_dict_fields.group(fields),
+            exclude=to_dict_fields.group(exclude),
+            depth=depth,
+            path=(cls,),
+        )
 
     def to_str(self) -> str:
         """
@@ -279,5 +835,4 @@ class UtilityBase:
 
     def __repr__(self) -> str:
         """Calculate the repr for the model."""
-        properties = self.get_properties()
-        return repr_.calculate(instance=self, properties=properties)
+        return repr_.calculate(instance=self, properties=self.get_properties())
@@ -0,0 +1,579 @@
+"""
+Generate the function that validates and converts the dictionary for a model.
+
+The generated code checks each value against the schema of its property with the same
+outcome as validating the dictionary against the model schema using jsonschema and
+converts it to the column value straight away. Schemas with keywords the generator
+does not support, such as those of JSON and readOnly properties, fall back to a
+jsonschema validator for the property followed by the generic conversion.
+"""
+
+import datetime
+import numbers
+import typing
+import uuid
+
+from ... import exceptions
+from ... import types as oa_types
+from ...facades import jsonschema
+from . import convert as generic_convert
+from . import object_
+from . import simple
+
+TConverter = typing.Callable[[typing.Any], typing.Any]
+TModelConverter = typing.Callable[..., typing.Dict[str, typing.Any]]
+# The source of the checks and of the conversion of a property
+TSource = typing.Tuple[str, str]
+
+
+class ValidationError(Exception):
+    """Raised when a dictionary is not a valid instance of the model schema."""
+
+
+# Keywords that do not change the outcome of validation
+_ANNOTATION_KEYS = frozenset(
+    (
+        oa_types.OpenApiProperties.DESCRIPTION.value,
+        oa_types.OpenApiProperties.DEFAULT.value,
+        oa_types.OpenApiProperties.NULLABLE.value,
+        oa_types.OpenApiProperties.WRITE_ONLY.value,
+        oa_types.OpenApiProperties.FORMAT.value,
+        "title",
+        "example",
+    )
+)
+_MODEL_KEYS = frozenset(
+    (
+        oa_types.OpenApiProperties.TYPE.value,
+        oa_types.OpenApiProperties.PROPERTIES.value,
+        oa_types.OpenApiProperties.REQUIRED.value,
+    )
+)
+_SIMPLE_KEYS = frozenset(
+    (
+        oa_types.OpenApiProperties.TYPE.value,
+        oa_types.OpenApiProperties.MAX_LENGTH.value,
+        oa_types.OpenApiProperties.READ_ONLY.value,
+        "enum",
+    )
+)
+_OBJECT_KEYS = frozenset(
+    (oa_types.OpenApiProperties.TYPE.value, oa_types.OpenApiProperties.READ_ONLY.value)
+)
+_ARRAY_KEYS = frozenset(
+    (
+        oa_types.OpenApiProperties.TYPE.value,
+        oa_types.OpenApiProperties.READ_ONLY.value,
+        oa_types.OpenApiProperties.ITEMS.value,
+    )
+)
+
+# Whether a value is an instance of the type, the same as the jsonschema type checker
+_TYPE_CHECKS = {
+    "integer": (
+        "(isinstance(value, int) and not isinstance(value, bool)) "
+        "or (isinstance(value, float) and value.is_integer())"
+    ),
+    "number": "isinstance(value, numbers.Number) and not isinstance(value, bool)",
+    "string": "isinstance(value, str)",
+    "boolean": "isinstance(value, bool)",
+}
+# Binary properties also accept bytes like values which are used without copying
+# them and UUID properties also accept UUID values
+_STRING_TYPE_CHECKS = {
+    "binary": "isinstance(value, (str, bytes, bytearray, memoryview))",
+    "uuid": "isinstance(value, (str, uuid.UUID))",
+}
+
+# The conversion of a valid value to the column value
+_CONVERSIONS = {
+    "integer": (
+        "    if not isinstance(value, int):\n"
+        "        raise exceptions.InvalidInstanceError(\n"
+        '            "Integer type columns must have int values."\n'
+        "        )\n"
+        "    return value\n"
+    ),
+    "number": (
+        "    if not isinstance(value, (float, int)):\n"
+        "        raise exceptions.InvalidInstanceError(\n"
+        '            "Number type columns must have float values."\n'
+        "        )\n"
+        "    return value\n"
+    ),
+    "boolean": "    return value\n",
+}
+_STRING_CONVERSIONS = {
+    "date": "    return datetime.date.fromisoformat(value)\n",
+    "date-time": "    return datetime.datetime.fromisoformat(value)\n",
+    "uuid": (
+        "    if not isinstance(value, str):\n"
+        "        return value\n"
+        "    return decode_uuid(value)\n"
+    ),
+}
+_BINARY_CONVERSIONS = {
+    oa_types.BinaryEncoding.UTF_8.value: "    return value.encode()\n",
+    oa_types.BinaryEncoding.BASE64.value: "    return decode_base64(value)\n",
+    oa_types.BinaryEncoding.BYTES.value: "    return value.encode()\n",
+}
+
+
+def _unbool(
+    element: typing.Any, true: typing.Any = object(), false: typing.Any = object()
+) -> typing.Any:
+    """Replace booleans with sentinels so that they are not equal to 1 and 0."""
+    if element is True:
+        return true
+    if element is False:
+        return false
+    return element
+
+
+def enum_contains(value: typing.Any, enum: typing.List[typing.Any]) -> bool:
+    """
+    Check whether a value is one of the values of an enum.
+
+    Booleans are not equal to 1 and 0, which is how jsonschema compares the values.
+
+    Args:
+        value: The value to check.
+        enum: The values of the enum.
+
+    Returns:
+        Whether the value is in the enum.
+
+    """
+    if value in (0, 1):
+        unbooled = _unbool(value)
+        return any(unbooled == _unbool(each) for each in enum)
+    return value in enum
+
+
+def _keys_supported(
+    schema: typing.Dict[str, typing.Any], supported: typing.FrozenSet[str]
+) -> bool:
+    """Check whether the generator supports all the keywords of a schema."""
+    return all(
+        isinstance(key, str)
+        and (key in supported or key in _ANNOTATION_KEYS or key.startswith("x-"))
+        for key in schema.keys()
+    )
+
+
+def _is_converted_generically(schema: typing.Any) -> bool:
+    """Check whether a property must be validated and converted by the fallback."""
+    return (
+        not isinstance(schema, dict)
+        or schema.get(oa_types.OpenApiProperties.READ_ONLY, False) is not False
+        or schema.get(oa_types.ExtensionProperties.JSON, False) is not False
+    )
+
+
+def _is_relationship(schema: typing.Any) -> bool:
+    """Check whether a schema is for a supported object relationship."""
+    return (
+        not _is_converted_generically(schema)
+        and schema.get(oa_types.OpenApiProperties.TYPE) == "object"
+        and isinstance(schema.get(oa_types.ExtensionProperties.DE_REF), str)
+        and _keys_supported(schema, _OBJECT_KEYS)
+    )
+
+
+def _generate_simple(
+    *, name: str, schema: typing.Dict[str, typing.Any], constants: typing.Dict
+) -> typing.Optional[TSource]:
+    """
+    Generate the source for a simple property.
+
+    Args:
+        name: The prefix for the names of any constants.
+        schema: The schema of the property.
+        constants: The values the source refers to, updated with any new values.
+
+    Returns:
+        The source or None if the schema is not supported.
+
+    """
+    type_ = schema.get(oa_types.OpenApiProperties.TYPE)
+    if (
+        not isinstance(type_, str)
+        or type_ not in _TYPE_CHECKS
+        or not _keys_supported(schema, _SIMPLE_KEYS)
+    ):
+        return None
+
+    format_ = _format(type_=type_, schema=schema)
+    if format_ is None:
+        return None
+    type_check = _STRING_TYPE_CHECKS.get(format_, _TYPE_CHECKS[type_])
+    checks = [
+        f"    if not ({type_check}):\n",
+        "        raise ValidationError\n",
+    ]
+
+    if oa_types.OpenApiProperties.MAX_LENGTH in schema:
+        max_length = schema[oa_types.OpenApiProperties.MAX_LENGTH]
+        if not isinstance(max_length, int) or isinstance(max_length, bool):
+            return None
+        if type_ == "string":
+            length_check = f"len(value) > {max_length!r}"
+            if format_ == "uuid":
+                length_check = f"isinstance(value, str) and {length_check}"
+            checks.append(f"    if {length_check}:\n")
+            checks.append("        raise ValidationError\n")
+
+    if "enum" in schema:
+        if not isinstance(schema["enum"], list):
+            return None
+        enum_name = f"{name}_enum"
+        constants[enum_name] = schema["enum"]
+        checks.append(f"    if not enum_contains(value, {enum_name}):\n")
+        checks.append("        raise ValidationError\n")
+
+    conversion = _conversion(type_=type_, format_=format_, schema=schema)
+    if conversion is None:
+        return None
+    return "".join(checks), conversion
+
+
+def _format(
+    *, type_: str, schema: typing.Dict[str, typing.Any]
+) -> typing.Optional[str]:
+    """
+    Calculate the format of a simple property that changes the generated source.
+
+    Args:
+        type_: The type of the property.
+        schema: The schema of the property.
+
+    Returns:
+        The format, an empty string if the source does not depend on the format or
+        None if the schema is not supported.
+
+    """
+    if type_ != "string":
+        return ""
+    format_ = schema.get(oa_types.OpenApiProperties.FORMAT)
+    if format_ is None:
+        return ""
+    if not isinstance(format_, str):
+        return None
+    # Without x-native-uuid the values of uuid properties are plain strings
+    if (
+        format_ == "uuid"
+        and schema.get(oa_types.ExtensionProperties.NATIVE_UUID) is not True
+    ):
+        return ""
+    return format_
+
+
+def _conversion(
+    *, type_: str, format_: str, schema: typing.Dict[str, typing.Any]
+) -> typing.Optional[str]:
+    """
+    Calculate the source that converts the value of a simple property.
+
+    Args:
+        type_: The type of the property.
+        format_: The format of the property.
+        schema: The schema of the property.
+
+    Returns:
+        The source or None if the schema is not supported.
+
+    """
+    if type_ != "string":
+        return _CONVERSIONS[type_]
+    if format_ != "binary":
+        return _STRING_CONVERSIONS.get(format_, "    return value\n")
+
+    encoding = schema.get(
+        oa_types.ExtensionProperties.BINARY_ENCODING,
+        oa_types.BinaryEncoding.UTF_8.value,
+    )
+    if not isinstance(encoding, str) or encoding not in _BINARY_CONVERSIONS:
+        return None
+    return (
+        "    if not isinstance(value, str):\n"
+        "        return value\n"
+        f"{_BINARY_CONVERSIONS[encoding]}"
+    )
+
+
+def _generate_object(
+    *, name: str, schema: typing.Dict[str, typing.Any], constants: typing.Dict
+) -> typing.Optional[TSource]:
+    """
+    Generate the source for a many-to-one or one-to-one relationship property.
+
+    Args:
+        name: The prefix for the names of any constants.
+        schema: The schema of the property.
+        constants: The values the source refers to, updated with any new values.
+
+    Returns:
+        The source or None if the schema is not supported.
+
+    """
+    if not _is_relationship(schema):
+        return None
+
+    schema_name = f"{name}_schema"
+    constants[schema_name] = schema
+    return (
+        "    if not isinstance(value, dict):\n        raise ValidationError\n",
+        f"    return object_convert(value, schema={schema_name})\n",
+    )
+
+
+def _generate_array(
+    *, name: str, schema: typing.Dict[str, typing.Any], constants: typing.Dict
+) -> typing.Optional[TSource]:
+    """
+    Generate the source for a one-to-many or many-to-many relationship property.
+
+    Args:
+        name: The prefix for the names of any constants.
+        schema: The schema of the property.
+        constants: The values the source refers to, updated with any new values.
+
+    Returns:
+        The source or None if the schema is not supported.
+
+    """
+    items_schema = schema.get(oa_types.OpenApiProperties.ITEMS)
+    if not _keys_supported(schema, _ARRAY_KEYS) or not _is_relationship(items_schema):
+        return None
+
+    schema_name = f"{name}_items_schema"
+    constants[schema_name] = items_schema
+    return (
+        (
+            "    if not isinstance(value, list):\n"
+            "        raise ValidationError\n"
+            "    for item in value:\n"
+            "        if not isinstance(item, dict):\n"
+            "            raise ValidationError\n"
+        ),
+        f"    return [object_convert(item, schema={schema_name}) for item in value]\n",
+    )
+
+
+def _generate_fallback(
+    *, name: str, schema: oa_types.Schema, constants: typing.Dict
+) -> TSource:
+    """
+    Generate the source for a property the generator does not support.
+
+    The value is validated using jsonschema and converted using the generic conversion.
+
+    Args:
+        name: The prefix for the names of any constants.
+        schema: The schema of the property.
+        constants: The values the source refers to, updated with any new values.
+
+    Returns:
+        The source.
+
+    """
+    schema_name = f"{name}_schema"
+    validator_name = f"{name}_validator"
+    constants[schema_name] = schema
+    constants[validator_name] = jsonschema.validator(schema)
+    return (
+        (
+            f"    if not {validator_name}.is_valid(value):\n"
+            "        raise ValidationError\n"
+        ),
+        f"    return generic_convert(schema={schema_name}, value=value)\n",
+    )
+
+
+def _generate_property(
+    *, name: str, schema: oa_types.Schema, constants: typing.Dict
+) -> str:
+    """
+    Generate the functions that validate and convert the value of a property.
+
+    The validate function only checks the value whereas the convert function checks
+    and converts the value. Both raise ValidationError if the value is not valid.
+
+    Args:
+        name: The suffix for the names of the functions.
+        schema: The schema of the property.
+        constants: The values the source refers to, updated with any new values.
+
+    Returns:
+        The source of the functions.
+
+    """
+    source: typing.Optional[TSource] = None
+    if not _is_converted_generically(schema):
+        type_ = schema.get(oa_types.OpenApiProperties.TYPE)
+        if type_ == "object":
+            source = _generate_object(name=name, schema=schema, constants=constants)
+        elif type_ == "array":
+            source = _generate_array(name=name, schema=schema, constants=constants)
+        else:
+            source = _generate_simple(name=name, schema=schema, constants=constants)
+    if source is None:
+        source = _generate_fallback(name=name, schema=schema, constants=constants)
+
+    checks, conversion = source
+    return (
+        f"def validate_{name}(value):\n{checks}\n\n"
+        f"def convert_{name}(value):\n{checks}{conversion}"
+    )
+
+
+def _model_supported(schema: oa_types.Schema) -> bool:
+    """Check whether the generator supports the keywords of a model schema."""
+    properties = schema.get(oa_types.OpenApiProperties.PROPERTIES, {})
+    required = schema.get(oa_types.OpenApiProperties.REQUIRED, [])
+    return (
+        _keys_supported(schema, _MODEL_KEYS)
+        and schema.get(oa_types.OpenApiProperties.TYPE, "object") == "object"
+        and isinstance(properties, dict)
+        and isinstance(required, list)
+        and all(isinstance(name, str) for name in required)
+    )
+
+
+def generate(
+    *, schema: oa_types.Schema
+) -> typing.Tuple[str, typing.Dict[str, typing.Any], typing.Dict[str, str]]:
+    """
+    Generate the source of the functions for the properties of a model.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        The source, the values the source refers to and the suffix of the names of the
+        functions for each property.
+
+    """
+    constants: typing.Dict[str, typing.Any] = {}
+    functions: typing.List[str] = []
+    names: typing.Dict[str, str] = {}
+    properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
+    if not isinstance(properties, dict):
+        properties = {}
+    for index, (property_name, property_schema) in enumerate(properties.items()):
+        name = f"property_{index}"
+        functions.append(
+            _generate_property(name=name, schema=property_schema, constants=constants)
+        )
+        names[property_name] = name
+
+    return "\n\n".join(functions), constants, names
+
+
+def compile_(*, schema: oa_types.Schema) -> TModelConverter:
+    """
+    Compile the function that validates and converts the dictionary for a model.
+
+    The function raises ValidationError if the dictionary is not a valid instance of
+    the schema, which takes precedence over any error raised while converting the
+    values. The errors raised while converting a value are annotated with the schema
+    and the property name, schema and value. With partial the required properties
+    are not checked so that only the values that are passed in are validated.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        The function.
+
+    """
+    source, constants, names = generate(schema=schema)
+    namespace: typing.Dict[str, typing.Any] = {
+        **constants,
+        "ValidationError": ValidationError,
+        "exceptions": exceptions,
+        "numbers": numbers,
+        "datetime": datetime,
+        "uuid": uuid,
+        "enum_contains": enum_contains,
+        "object_convert": object_.convert,
+        "decode_base64": simple.decode_base64,
+        "decode_uuid": simple.decode_uuid,
+        "generic_convert": generic_convert,
+    }
+    exec(  # pylint: disable=exec-used
+        compile(source, "<open_alchemy from_dict>", "exec"), namespace
+    )
+    validators: typing.Dict[str, TConverter] = {
+        key: namespace[f"validate_{name}"] for key, name in names.items()
+    }
+    converters: typing.Dict[str, TConverter] = {
+        key: namespace[f"convert_{name}"] for key, name in names.items()
+    }
+
+    properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
+    model_validator = None
+    partial_model_validator = None
+    required: typing.FrozenSet[str] = frozenset()
+    if _model_supported(schema):
+        required = frozenset(schema.get(oa_types.OpenApiProperties.REQUIRED, []))
+    else:
+        model_validator = jsonschema.validator(schema)
+        partial_model_validator = jsonschema.validator(
+            {
+                key: value
+                for key, value in schema.items()
+                if key != oa_types.OpenApiProperties.REQUIRED
+            }
+        )
+
+    def validate(items: typing.Iterator[typing.Tuple[str, typing.Any]]) -> None:
+        """Validate the remaining values."""
+        for name, value in items:
+            validator = validators.get(name)
+            if validator is not None:
+                validator(value)
+
+    def convert(
+        kwargs: typing.Dict[str, typing.Any], partial: bool = False
+    ) -> typing.Dict[str, typing.Any]:
+        """Validate and convert the dictionary for the model."""
+        validator = partial_model_validator if partial else model_validator
+        if validator is not None and not validator.is_valid(kwargs):
+            raise ValidationError
+        if not partial and not required <= kwargs.keys():
+            raise ValidationError
+        if properties is None:
+            raise exceptions.MalformedSchemaError(
+                "The model schema does not have any properties.", schema=schema
+            )
+
+        model_dict: typing.Dict[str, typing.Any] = {}
+        items = iter(kwargs.items())
+        for name, value in items:
+            try:
+                converter = converters.get(name)
+                if converter is None:
+                    raise exceptions.MalformedModelDictionaryError(
+                        "A parameter was passed in that is not a property in the "
+                        "model schema.",
+                        parameter_name=name,
+                        schema=schema,
+                    )
+                try:
+                    model_dict[name] = converter(value)
+                except exceptions.BaseError as exc:
+                    exc.schema = schema  # type: ignore
+                    exc.property_schema = properties[name]  # type: ignore
+                    exc.property_name = name  # type: ignore
+                    exc.property_value = value  # type: ignore
+                    raise
+            except ValidationError:
+                raise
+            except Exception:
+                # An invalid remaining value takes precedence over the error
+                validate(items)
+                raise
+        return model_dict
+
+    return convert
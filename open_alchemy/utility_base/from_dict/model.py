@@ -0,0 +1,53 @@
+"""Calculate the values for the columns of a model from a dictionary."""
+
+import typing
+
+from ...facades import models
+from .. import properties
+from .. import types
+
+
+def calculate(
+    *, model: typing.Any, kwargs: types.TObjectDict, partial: bool
+) -> types.TObjectDict:
+    """
+    Calculate the values for the columns of a model from a dictionary.
+
+    Handles models that inherit by passing any values that don't belong to the model
+    to the parent.
+
+    Raise MalformedModelDictionaryError when the dictionary does not satisfy the model
+    schema.
+
+    Args:
+        model: The model.
+        kwargs: The values to convert.
+        partial: Whether only the values that are passed in are checked rather than
+            the complete model dictionary.
+
+    Returns:
+        The values converted for the columns of the model.
+
+    """
+
+    def construct(
+        construct_model: typing.Any, values: types.TObjectDict
+    ) -> types.TObjectDict:
+        """Check and convert the values for a model."""
+        if partial:
+            return construct_model.construct_from_dict_update(**values)
+        return construct_model.construct_from_dict_init(**values)
+
+    parent = properties.get_parent_model(schema=models.get_schema(model=model))
+    if parent is None:
+        return construct(model, kwargs)
+
+    # Pass kwargs that don't belong to the current model to the parent
+    model_properties = model.get_properties()
+    parent_kwargs = {
+        key: value for key, value in kwargs.items() if key not in model_properties
+    }
+    child_kwargs = {
+        key: value for key, value in kwargs.items() if key in model_properties
+    }
+    return {**construct(parent, parent_kwargs), **construct(model, child_kwargs)}
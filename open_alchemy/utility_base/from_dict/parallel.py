@@ -0,0 +1,196 @@
+"""Check and convert dictionaries for a model in worker processes."""
+
+import collections
+import itertools
+import os
+import typing
+from concurrent import futures
+
+from ... import exceptions
+from ... import types as oa_types
+from . import codegen
+
+TRow = typing.Dict[str, typing.Any]
+TRowConverter = typing.Callable[[TRow], TRow]
+
+
+class Schemas(typing.NamedTuple):
+    """The schemas of a model and of the model it inherits from, if any."""
+
+    model: oa_types.Schema
+    parent: typing.Optional[oa_types.Schema]
+
+
+# The converter of the worker process, set once by the initializer of the worker
+_CONVERTER: typing.Optional[TRowConverter] = None
+
+
+def _relationship_names(schema: oa_types.Schema) -> typing.Set[str]:
+    """Calculate the names of the relationship properties of a schema."""
+    return {
+        name
+        for name, property_schema in schema.get(
+            oa_types.OpenApiProperties.PROPERTIES, {}
+        ).items()
+        if property_schema.get(oa_types.OpenApiProperties.TYPE) in {"object", "array"}
+        and not property_schema.get(oa_types.ExtensionProperties.JSON)
+    }
+
+
+def _construct(
+    *, converter: codegen.TModelConverter, schema: oa_types.Schema, row: TRow
+) -> TRow:
+    """Check and convert the values of a row for a model."""
+    try:
+        return converter(row)
+    except codegen.ValidationError as exc:
+        raise exceptions.MalformedModelDictionaryError(
+            "The dictionary passed to from_dict is not a valid instance of the "
+            "model schema.",
+            schema=schema,
+            kwargs=row,
+        ) from exc
+
+
+def compile_(*, schemas: Schemas) -> TRowConverter:
+    """
+    Compile the function that checks and converts a row for a model.
+
+    The values are checked and converted the same way as for from_dict. The values
+    that are not properties of the model are passed to the model it inherits from.
+
+    Raise MalformedModelDictionaryError if a row includes a relationship since only
+    the values of columns can be returned to the parent process.
+
+    Args:
+        schemas: The schemas of the model and the model it inherits from.
+
+    Returns:
+        The function.
+
+    """
+    model_convert = codegen.compile_(schema=schemas.model)
+    properties = schemas.model.get(oa_types.OpenApiProperties.PROPERTIES, {})
+    relationships = _relationship_names(schemas.model)
+    parent: typing.Optional[typing.Tuple[oa_types.Schema, codegen.TModelConverter]]
+    parent = None
+    if schemas.parent is not None:
+        parent = (schemas.parent, codegen.compile_(schema=schemas.parent))
+        relationships |= _relationship_names(schemas.parent)
+
+    def _convert_row(row: TRow) -> TRow:
+        """Check and convert a row."""
+        for name in row:
+            if name in relationships:
+                raise exceptions.MalformedModelDictionaryError(
+                    "Only column properties can be converted in parallel.",
+                    parameter_name=name,
+                )
+
+        if parent is None:
+            return _construct(converter=model_convert, schema=schemas.model, row=row)
+
+        parent_schema, parent_convert = parent
+        parent_row = {key: value for key, value in row.items() if key not in properties}
+        child_row = {key: value for key, value in row.items() if key in properties}
+        return {
+            **_construct(
+                converter=parent_convert, schema=parent_schema, row=parent_row
+            ),
+            **_construct(converter=model_convert, schema=schemas.model, row=child_row),
+        }
+
+    return _convert_row
+
+
+def initialize(schemas: Schemas) -> None:
+    """
+    Compile the converter for a worker process once.
+
+    Args:
+        schemas: The schemas of the model and the model it inherits from.
+
+    """
+    global _CONVERTER  # pylint: disable=global-statement
+    _CONVERTER = compile_(schemas=schemas)
+
+
+def convert_chunk(rows: typing.List[TRow]) -> typing.List[TRow]:
+    """
+    Check and convert a chunk of rows in a worker process.
+
+    Raise RuntimeError if the worker process has not been initialized.
+
+    Args:
+        rows: The rows to convert.
+
+    Returns:
+        The converted rows in the same order.
+
+    """
+    if _CONVERTER is None:
+        raise RuntimeError("The worker process has not been initialized.")
+    return list(map(_CONVERTER, rows))
+
+
+def _chunks(
+    iterable: typing.Iterable[TRow], chunk_size: int
+) -> typing.Iterator[typing.List[TRow]]:
+    """Split an iterable into lists of at most chunk size elements."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert(
+    *,
+    schemas: Schemas,
+    rows: typing.Iterable[TRow],
+    workers: typing.Optional[int],
+    chunk_size: int,
+) -> typing.Iterator[TRow]:
+    """
+    Check and convert rows for a model in a pool of worker processes.
+
+    The rows are sent to the workers in chunks and at most two chunks per worker are in
+    flight at any time so that the rows do not all have to be in memory.
+
+    Raise ValueError if the number of workers or the chunk size is not positive.
+
+    Args:
+        schemas: The schemas of the model and the model it inherits from.
+        rows: The rows to convert.
+        workers: The number of worker processes, defaults to the number of CPUs.
+        chunk_size: The number of rows sent to a worker at a time.
+
+    Returns:
+        The converted rows in the same order as the rows.
+
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"The number of workers must be positive, got {workers}.")
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+
+    return _convert(schemas=schemas, rows=rows, workers=workers, chunk_size=chunk_size)
+
+
+def _convert(
+    *, schemas: Schemas, rows: typing.Iterable[TRow], workers: int, chunk_size: int
+) -> typing.Iterator[TRow]:
+    """Check and convert rows in a pool of worker processes."""
+    with futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=initialize, initargs=(schemas,)
+    ) as executor:
+        pending: typing.Deque[futures.Future] = collections.deque()
+        for chunk in _chunks(rows, chunk_size):
+            pending.append(executor.submit(convert_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
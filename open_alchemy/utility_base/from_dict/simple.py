@@ -1,6 +1,9 @@
 """Convert simple type from dictionary to the column equivalent."""
 
+import base64
+import binascii
 import datetime
+import uuid
 
 from ... import exceptions
 from ... import types as oa_types
@@ -67,15 +70,93 @@ def _handle_string(
         The converted value.
 
     """
+    format_ = peek.format_(schema=schema, schemas={})
+    if format_ == "binary":
+        return _handle_binary(value, schema=schema)
+    native_uuid = format_ == "uuid" and peek.native_uuid(schema=schema, schemas={})
+    if native_uuid and isinstance(value, uuid.UUID):
+        return value
     if not isinstance(value, str):
         raise exceptions.InvalidInstanceError(
             "String type columns must have str values."
         )
-    format_ = peek.format_(schema=schema, schemas={})
     if format_ == "date":
         return datetime.date.fromisoformat(value)
     if format_ == "date-time":
         return datetime.datetime.fromisoformat(value)
-    if format_ == "binary":
-        return value.encode()
+    if native_uuid:
+        return decode_uuid(value)
     return value
+
+
+def _handle_binary(
+    value: types.TSimpleDict, *, schema: oa_types.Schema
+) -> types.TBinary:
+    """
+    Convert binary format value to column type.
+
+    Bytes like values are used as they are without copying them. Strings are base64
+    decoded if x-binary-encoding is base64 and UTF-8 encoded otherwise.
+
+    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The converted value.
+
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+    if not isinstance(value, str):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with binary format must have str or bytes values."
+        )
+    encoding = peek.binary_encoding(schema=schema, schemas={})
+    if encoding == oa_types.BinaryEncoding.BASE64:
+        return decode_base64(value)
+    return value.encode()
+
+
+def decode_base64(value: str) -> bytes:
+    """
+    Decode a base64 encoded value of a binary property.
+
+    Raises InvalidInstanceError if the value is not valid base64.
+
+    Args:
+        value: The base64 encoded value.
+
+    Returns:
+        The decoded value.
+
+    """
+    try:
+        return base64.b64decode(value, validate=True)
+    except binascii.Error as exc:
+        raise exceptions.InvalidInstanceError(
+            "String type columns with binary format and base64 encoding must have "
+            "base64 encoded values."
+        ) from exc
+
+
+def decode_uuid(value: str) -> uuid.UUID:
+    """
+    Convert the string value of a uuid property to a UUID.
+
+    Raises InvalidInstanceError if the value is not a valid UUID.
+
+    Args:
+        value: The string representation of the UUID.
+
+    Returns:
+        The UUID.
+
+    """
+    try:
+        return uuid.UUID(value)
+    except ValueError as exc:
+        raise exceptions.InvalidInstanceError(
+            "String type columns with uuid format must have UUID values."
+        ) from exc
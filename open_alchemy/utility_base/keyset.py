@@ -0,0 +1,245 @@
+"""Calculate the order and cursors of keyset pagination."""
+
+import base64
+import binascii
+import json
+import typing
+
+from .. import exceptions
+from .. import types as oa_types
+from ..facades.sqlalchemy import keyset as sqlalchemy_keyset
+from ..helpers import peek
+from ..helpers import type_ as type_helper
+from . import properties
+from .from_dict import simple as from_dict_simple
+from .to_dict import rows as to_dict_rows
+from .to_dict import simple as to_dict_simple
+
+
+class Page(typing.NamedTuple):
+    """A page of rows and the cursor of the next page."""
+
+    # The model instances or dictionaries of the rows
+    items: typing.List[typing.Any]
+    # The cursor of the next page or None if this is the last page
+    cursor: typing.Optional[str]
+
+
+class OrderColumn(typing.NamedTuple):
+    """The name of a property the rows are ordered by and the direction."""
+
+    name: str
+    descending: bool
+
+
+def calculate_order(
+    *, order_by: typing.Optional[typing.Iterable[str]], primary_key: typing.List[str]
+) -> typing.List[OrderColumn]:
+    """
+    Calculate the order of the rows of keyset pagination.
+
+    Names prefixed with - are in descending order. Any primary key properties that are
+    not in order_by are added in ascending order so that the order is unique.
+
+    Args:
+        order_by: The names of the properties to order by. By default the rows are
+            ordered by the primary key.
+        primary_key: The names of the properties of the primary key.
+
+    Returns:
+        The order.
+
+    """
+    order = [
+        OrderColumn(name=name[1:], descending=True)
+        if name.startswith("-")
+        else OrderColumn(name=name, descending=False)
+        for name in order_by or []
+    ]
+    names = {column.name for column in order}
+    order.extend(
+        OrderColumn(name=name, descending=False)
+        for name in primary_key
+        if name not in names
+    )
+    return order
+
+
+def check_order_schema(*, name: str, schema: oa_types.Schema) -> None:
+    """
+    Check that the rows can be ordered by a property.
+
+    Raise ModelAttributeError if the property is not of a simple type or is a JSON
+    property.
+
+    Args:
+        name: The name of the property.
+        schema: The schema of the property.
+
+    """
+    if peek.json(schema=schema, schemas={}) or (
+        peek.type_(schema=schema, schemas={}) not in type_helper.SIMPLE_TYPES
+    ):
+        raise exceptions.ModelAttributeError(
+            f"The rows cannot be ordered by {name} because it is not a property of a "
+            "simple type."
+        )
+
+
+def _order_keys(order: typing.List[OrderColumn]) -> typing.List[str]:
+    """Calculate the names of the order prefixed with - if descending."""
+    return [f"-{column.name}" if column.descending else column.name for column in order]
+
+
+def encode_cursor(
+    *,
+    order: typing.List[OrderColumn],
+    schemas: typing.Dict[str, oa_types.Schema],
+    item: typing.Any,
+) -> str:
+    """
+    Calculate the cursor of the page after a row.
+
+    Args:
+        order: The order of the rows.
+        schemas: The schemas of the properties of the order keyed by name.
+        item: The model instance or row of the last row of the page.
+
+    Returns:
+        The URL safe cursor.
+
+    """
+    values = [
+        to_dict_simple.convert(getattr(item, column.name), schema=schemas[column.name])
+        for column in order
+    ]
+    payload = json.dumps(
+        {"order": _order_keys(order), "values": values}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode("ascii")
+
+
+def decode_cursor(
+    *,
+    order: typing.List[OrderColumn],
+    schemas: typing.Dict[str, oa_types.Schema],
+    cursor: str,
+) -> typing.List[typing.Any]:
+    """
+    Calculate the values of the columns of the order of the row of a cursor.
+
+    Raise InvalidCursorError if the cursor is not valid or was created for another
+    order.
+
+    Args:
+        order: The order of the rows.
+        schemas: The schemas of the properties of the order keyed by name.
+        cursor: The cursor.
+
+    Returns:
+        The values in the order of the columns of the order.
+
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error) as exc:
+        raise exceptions.InvalidCursorError("The cursor is not valid.") from exc
+    if (
+        not isinstance(payload, dict)
+        or payload.get("order") != _order_keys(order)
+        or not isinstance(payload.get("values"), list)
+        or len(payload["values"]) != len(order)
+    ):
+        raise exceptions.InvalidCursorError(
+            "The cursor was not created for the order "
+            f"{', '.join(_order_keys(order))}."
+        )
+
+    try:
+        values = [
+            from_dict_simple.convert(value, schema=schemas[column.name])
+            for column, value in zip(order, payload["values"])
+        ]
+    except exceptions.InvalidInstanceError as exc:
+        raise exceptions.InvalidCursorError("The cursor is not valid.") from exc
+    if any(value is None for value in values):
+        raise exceptions.InvalidCursorError("The cursor is not valid.")
+    return values
+
+
+def paginate(
+    *,
+    model: typing.Any,
+    session: typing.Any,
+    after: typing.Optional[str],
+    limit: int,
+    order_by: typing.Optional[typing.Iterable[str]],
+    stmt: typing.Any,
+    dicts: bool,
+) -> Page:
+    """
+    Query a page of rows of a model after the last row of the previous page.
+
+    Raises ValueError if limit is less than 1.
+    Raises ModelAttributeError if a property in order_by is not stored in a column,
+    is writeOnly, is not of a simple type or is nullable.
+    Raises InvalidCursorError if after is not a cursor for the order.
+
+    Args:
+        model: The model to query.
+        session: The session used to execute the query.
+        after: The cursor of the previous page or None for the first page.
+        limit: The maximum number of rows of the page.
+        order_by: The names of the properties to order the rows by, prefixed with -
+            for descending order, or None to order by the primary key.
+        stmt: A select statement for the model or None to query all rows.
+        dicts: Whether to only select the columns of the model and convert the rows
+            to dictionaries instead of returning model instances.
+
+    Returns:
+        The model instances or dictionaries of the page and the cursor of the next
+        page.
+
+    """
+    if limit < 1:
+        raise ValueError(f"The limit must be at least 1, got {limit}.")
+
+    row_properties = properties.row_properties(model=model)
+    order = calculate_order(
+        order_by=order_by, primary_key=sqlalchemy_keyset.primary_key(model=model)
+    )
+    schemas: typing.Dict[str, oa_types.Schema] = {}
+    for column in order:
+        if column.name not in row_properties:
+            raise exceptions.ModelAttributeError(
+                f"The rows cannot be ordered by {column.name} because it is not a "
+                "property stored in a column that is not writeOnly."
+            )
+        schema = row_properties[column.name][0]
+        check_order_schema(name=column.name, schema=schema)
+        if sqlalchemy_keyset.is_nullable(model=model, name=column.name):
+            raise exceptions.ModelAttributeError(
+                f"The rows cannot be ordered by {column.name} because it is nullable."
+            )
+        schemas[column.name] = schema
+    values = (
+        None
+        if after is None
+        else decode_cursor(order=order, schemas=schemas, cursor=after)
+    )
+
+    if dicts:
+        stmt = to_dict_rows.select_columns(model=model, stmt=stmt)
+    # Query one more row to know whether there is a next page
+    stmt = sqlalchemy_keyset.paginate(
+        model=model, stmt=stmt, order=order, values=values, limit=limit + 1
+    )
+    result = session.execute(stmt)
+    rows = list(result if dicts else result.scalars())
+
+    cursor: typing.Optional[str] = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        cursor = encode_cursor(order=order, schemas=schemas, item=rows[-1])
+    items = to_dict_rows.convert(model=model, rows=rows) if dicts else rows
+    return Page(items=items, cursor=cursor)
@@ -0,0 +1,127 @@
+"""Calculate the properties of a model including those of any parent models."""
+
+import typing
+
+from .. import exceptions
+from .. import types as oa_types
+from ..facades import models
+from ..helpers import peek
+from ..helpers import schema as schema_helper
+from . import to_dict
+
+TRowProperties = typing.Dict[str, typing.Tuple[oa_types.Schema, bool]]
+
+
+def get_parent(*, schema: oa_types.Schema) -> typing.Any:
+    """
+    Get the parent model of a model.
+
+    Raise MalformedSchemaError if x-inherits is not defined or not a string.
+    Raise SchemaNotFoundError if the parent model is not on open_alchemy.models.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        The parent model.
+
+    """
+    parent_name = peek.inherits(schema=schema, schemas={})
+    if parent_name is None or not isinstance(parent_name, str):
+        raise exceptions.MalformedSchemaError(
+            "To construct a model that inherits x-inherits must be present and a "
+            "string.",
+            schema=schema,
+            x_inherits=parent_name,
+            x_inherits_type=type(parent_name),
+        )
+    # Try to get model
+    parent = models.get_model(name=parent_name)
+    if parent is None:
+        raise exceptions.SchemaNotFoundError(
+            "The parent model was not found on open_alchemy.models.",
+            schema=schema,
+            parent_model_name=parent_name,
+        )
+    return parent
+
+
+def get_parent_model(*, schema: oa_types.Schema) -> typing.Any:
+    """
+    Get the parent model of a model if the model inherits.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        The parent model or None if the model does not inherit.
+
+    """
+    if not schema_helper.inherits(schema=schema, schemas={}):
+        return None
+    return get_parent(schema=schema)
+
+
+def row_properties(*, model: typing.Any) -> TRowProperties:
+    """
+    Get the properties of a model that are stored in columns.
+
+    Includes the properties of any parent models. WriteOnly properties are excluded.
+
+    Raise ModelAttributeError if the model does not have a record of its schema.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The schema of each property and whether None values are returned.
+
+    """
+    schema = models.get_schema(model=model)
+    properties: TRowProperties = {}
+    parent = get_parent_model(schema=schema)
+    if parent is not None:
+        properties.update(row_properties(model=parent))
+
+    for name, property_schema in model.get_properties().items():
+        if peek.write_only(schema=property_schema, schemas={}):
+            continue
+        if not to_dict.is_column(schema=property_schema):
+            continue
+        properties[name] = (
+            property_schema,
+            to_dict.return_none(schema=schema, property_name=name),
+        )
+
+    return properties
+
+
+def relationships(*, model: typing.Any) -> typing.Dict[str, oa_types.Schema]:
+    """
+    Get the properties of a model that are not stored in columns.
+
+    These are the relationships that to_dict converts, including those of any parent
+    models. WriteOnly properties are excluded.
+
+    Raise ModelAttributeError if the model does not have a record of its schema.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The schema of each relationship.
+
+    """
+    properties: typing.Dict[str, oa_types.Schema] = {}
+    parent = get_parent_model(schema=models.get_schema(model=model))
+    if parent is not None:
+        properties.update(relationships(model=parent))
+
+    for name, property_schema in model.get_properties().items():
+        if peek.write_only(schema=property_schema, schemas={}):
+            continue
+        if to_dict.is_column(schema=property_schema):
+            continue
+        properties[name] = property_schema
+
+    return properties
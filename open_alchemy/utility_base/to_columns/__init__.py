@@ -0,0 +1,254 @@
+"""Convert model instances or rows to typed arrays for each column."""
+
+import collections.abc
+import enum
+import importlib
+import typing
+
+from ... import exceptions
+from ... import types as oa_types
+from ...facades import models
+from ...helpers import calculate_nullable
+from ...helpers import peek
+from .. import properties
+from .. import to_dict
+
+
+@enum.unique
+class ColumnType(str, enum.Enum):
+    """The type of the array of a column."""
+
+    INT64 = "int64"
+    FLOAT64 = "float64"
+    BOOL = "bool"
+    DATE = "date"
+    DATETIME = "datetime"
+    STRING = "string"
+    BINARY = "binary"
+    UUID = "uuid"
+    OBJECT = "object"
+
+
+@enum.unique
+class Backend(str, enum.Enum):
+    """The library used to construct the arrays."""
+
+    NUMPY = "numpy"
+    ARROW = "arrow"
+    ARRAY = "array"
+
+
+class Column(typing.NamedTuple):
+    """The type of a column and whether it can have None values."""
+
+    type_: ColumnType
+    nullable: bool
+
+
+# The module implementing each backend and the package it requires, if any
+_BACKENDS = {
+    Backend.NUMPY: (".numpy_", "numpy"),
+    Backend.ARROW: (".arrow", "pyarrow"),
+    Backend.ARRAY: (".array_", None),
+}
+_STRING_TYPES = {
+    "date": ColumnType.DATE,
+    "date-time": ColumnType.DATETIME,
+    "binary": ColumnType.BINARY,
+}
+_SIMPLE_TYPES = {
+    "integer": ColumnType.INT64,
+    "number": ColumnType.FLOAT64,
+    "boolean": ColumnType.BOOL,
+}
+
+
+def calculate_column(*, schema: oa_types.Schema, property_name: str) -> Column:
+    """
+    Calculate the column for a property that is stored in a column.
+
+    A column is nullable if the property is nullable or, if nullable is not defined,
+    if the property is not required and does not have a default, which is the same
+    as the nullable value of the column of the model.
+
+    Args:
+        schema: The schema of the model.
+        property_name: The name of the property.
+
+    Returns:
+        The column.
+
+    """
+    property_schema = schema[oa_types.OpenApiProperties.PROPERTIES][property_name]
+    required = property_name in schema.get(oa_types.OpenApiProperties.REQUIRED, [])
+    nullable = calculate_nullable.calculate_nullable(
+        nullable=peek.nullable(schema=property_schema, schemas={}),
+        generated=False,
+        defaulted=peek.default(schema=property_schema, schemas={}) is not None,
+        required=required,
+    )
+
+    if peek.json(schema=property_schema, schemas={}):
+        return Column(type_=ColumnType.OBJECT, nullable=nullable)
+    type_ = peek.type_(schema=property_schema, schemas={})
+    if type_ == "string":
+        format_ = peek.format_(schema=property_schema, schemas={})
+        if format_ == "uuid" and peek.native_uuid(schema=property_schema, schemas={}):
+            return Column(type_=ColumnType.UUID, nullable=nullable)
+        return Column(
+            type_=_STRING_TYPES.get(format_ or "", ColumnType.STRING),
+            nullable=nullable,
+        )
+    return Column(type_=_SIMPLE_TYPES[type_], nullable=nullable)
+
+
+def calculate_columns(*, model: typing.Any) -> typing.Dict[str, Column]:
+    """
+    Calculate the columns of the properties of a model that are stored in columns.
+
+    Includes the properties of any parent models. WriteOnly properties are excluded.
+
+    Raise ModelAttributeError if the model does not have a record of its schema.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The type of each column and whether it is nullable.
+
+    """
+    schema = models.get_schema(model=model)
+    columns: typing.Dict[str, Column] = {}
+    parent = properties.get_parent_model(schema=schema)
+    if parent is not None:
+        columns.update(calculate_columns(model=parent))
+
+    for name, property_schema in model.get_properties().items():
+        if peek.write_only(schema=property_schema, schemas={}):
+            continue
+        if not to_dict.is_column(schema=property_schema):
+            continue
+        columns[name] = calculate_column(schema=schema, property_name=name)
+
+    return columns
+
+
+def _get_value(item: typing.Any, name: str) -> typing.Any:
+    """Get the value of a property from a model instance or a row."""
+    mapping = getattr(item, "_mapping", None)
+    if mapping is None and isinstance(item, collections.abc.Mapping):
+        mapping = item
+    if mapping is not None:
+        return mapping.get(name)
+    return getattr(item, name, None)
+
+
+def collect(
+    *, columns: typing.Dict[str, Column], items: typing.Iterable[typing.Any]
+) -> typing.Dict[str, typing.List[typing.Any]]:
+    """
+    Collect the values of each column.
+
+    Raise InvalidInstanceError if a column that is not nullable has a None value.
+
+    Args:
+        columns: The columns keyed by property name.
+        items: The model instances or rows, for example the result of executing a
+            select statement, where the values are keyed by the name of the property.
+
+    Returns:
+        The values of each column.
+
+    """
+    values: typing.Dict[str, typing.List[typing.Any]] = {name: [] for name in columns}
+    for item in items:
+        for name, column_values in values.items():
+            column_values.append(_get_value(item, name))
+
+    for name, column in columns.items():
+        if not column.nullable and any(value is None for value in values[name]):
+            raise exceptions.InvalidInstanceError(
+                f"The {name} property is not nullable but has a None value."
+            )
+
+    return values
+
+
+def _import_backend(backend: Backend) -> typing.Any:
+    """
+    Import the module implementing a backend.
+
+    Raise ImportError if the package the backend requires is not installed.
+
+    Args:
+        backend: The backend to import.
+
+    Returns:
+        The module.
+
+    """
+    module_name, package = _BACKENDS[backend]
+    try:
+        return importlib.import_module(module_name, __name__)
+    except ImportError as exc:
+        raise ImportError(
+            f"Using the {backend.value} backend requires the {package} package. "
+            f"Try `pip install {package}`."
+        ) from exc
+
+
+def _resolve_backend(backend: typing.Optional[str]) -> typing.Any:
+    """
+    Import the module for a backend.
+
+    If no backend is passed, numpy is used if it is installed, then pyarrow and
+    otherwise the array module from the standard library.
+
+    Raise ValueError if the backend is not known.
+
+    Args:
+        backend: The name of the backend.
+
+    Returns:
+        The module implementing the backend.
+
+    """
+    if backend is not None:
+        return _import_backend(Backend(backend))
+
+    for candidate in (Backend.NUMPY, Backend.ARROW):
+        try:
+            return _import_backend(candidate)
+        except ImportError:
+            continue
+    return _import_backend(Backend.ARRAY)
+
+
+def convert(
+    *,
+    columns: typing.Dict[str, Column],
+    items: typing.Iterable[typing.Any],
+    backend: typing.Optional[str] = None,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Convert model instances or rows to an array for each column.
+
+    Raise ValueError if the backend is not known.
+    Raise ImportError if the package the backend requires is not installed.
+    Raise InvalidInstanceError if a column that is not nullable has a None value.
+
+    Args:
+        columns: The columns keyed by property name.
+        items: The model instances or rows.
+        backend: The name of the backend used to construct the arrays.
+
+    Returns:
+        The array of each column.
+
+    """
+    module = _resolve_backend(backend)
+    values = collect(columns=columns, items=items)
+    return {
+        name: module.convert(column=columns[name], values=column_values)
+        for name, column_values in values.items()
+    }
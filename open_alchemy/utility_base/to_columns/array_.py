@@ -0,0 +1,52 @@
+"""Construct the arrays of columns using the array module from the standard library."""
+
+import array
+import typing
+
+from . import Column
+from . import ColumnType
+
+
+class MaskedArray(typing.NamedTuple):
+    """The values of a nullable column and whether each value is None."""
+
+    values: typing.Any
+    mask: "array.array[int]"
+
+
+# The type code of the array and the value used in place of None for each type
+_TYPE_CODES = {
+    ColumnType.INT64: ("q", 0),
+    ColumnType.FLOAT64: ("d", 0.0),
+    ColumnType.BOOL: ("b", False),
+}
+
+
+def convert(*, column: Column, values: typing.List[typing.Any]) -> typing.Any:
+    """
+    Construct the array of a column.
+
+    Integer, number and boolean columns are converted to an array and any other
+    columns to a list. A nullable column is converted to a masked array where None
+    values in an array are replaced by 0 or False.
+
+    Args:
+        column: The column.
+        values: The values of the column.
+
+    Returns:
+        The array or, for a nullable column, the masked array.
+
+    """
+    converted: typing.Any = values
+    if column.type_ in _TYPE_CODES:
+        type_code, fill = _TYPE_CODES[column.type_]
+        converted = array.array(
+            type_code, (fill if value is None else value for value in values)
+        )
+
+    if not column.nullable:
+        return converted
+    return MaskedArray(
+        values=converted, mask=array.array("b", (value is None for value in values))
+    )
@@ -0,0 +1,44 @@
+"""Construct the arrays of columns using Apache Arrow."""
+
+import json
+import typing
+
+import pyarrow  # type: ignore
+
+from . import Column
+from . import ColumnType
+
+_TYPES = {
+    ColumnType.INT64: pyarrow.int64(),
+    ColumnType.FLOAT64: pyarrow.float64(),
+    ColumnType.BOOL: pyarrow.bool_(),
+    ColumnType.DATE: pyarrow.date32(),
+    ColumnType.DATETIME: pyarrow.timestamp("us"),
+    ColumnType.STRING: pyarrow.string(),
+    ColumnType.BINARY: pyarrow.binary(),
+    ColumnType.UUID: pyarrow.binary(16),
+    ColumnType.OBJECT: pyarrow.string(),
+}
+
+
+def convert(*, column: Column, values: typing.List[typing.Any]) -> typing.Any:
+    """
+    Construct the array of a column.
+
+    None values are stored as nulls. JSON columns are stored as the JSON encoded
+    string since their values do not have a single type and UUID columns as the 16
+    bytes of each UUID.
+
+    Args:
+        column: The column.
+        values: The values of the column.
+
+    Returns:
+        The array.
+
+    """
+    if column.type_ == ColumnType.OBJECT:
+        values = [None if value is None else json.dumps(value) for value in values]
+    if column.type_ == ColumnType.UUID:
+        values = [None if value is None else value.bytes for value in values]
+    return pyarrow.array(values, type=_TYPES[column.type_])
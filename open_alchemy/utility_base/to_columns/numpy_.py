@@ -0,0 +1,68 @@
+"""Construct the arrays of columns using NumPy."""
+
+import datetime
+import typing
+
+import numpy
+
+from . import Column
+from . import ColumnType
+
+# The dtype of the array and the value used in place of None for each type
+_DTYPES: typing.Dict[ColumnType, typing.Tuple[typing.Any, typing.Any]] = {
+    ColumnType.INT64: (numpy.int64, 0),
+    ColumnType.FLOAT64: (numpy.float64, 0.0),
+    ColumnType.BOOL: (numpy.bool_, False),
+    ColumnType.DATE: ("datetime64[D]", None),
+    ColumnType.DATETIME: ("datetime64[us]", None),
+}
+
+
+def _naive(value: typing.Optional[datetime.datetime]) -> typing.Any:
+    """Convert a timezone aware date time to a naive date time in UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _object_array(values: typing.List[typing.Any]) -> numpy.ndarray:
+    """Construct a one dimensional array of objects, even if the values are lists."""
+    object_array = numpy.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        object_array[index] = value
+    return object_array
+
+
+def convert(*, column: Column, values: typing.List[typing.Any]) -> typing.Any:
+    """
+    Construct the array of a column.
+
+    Integer, number, boolean, date and date-time columns are converted to an array of
+    the corresponding dtype and any other columns to an array of objects. Date-time
+    values with a timezone are converted to UTC. A nullable column is converted to a
+    masked array.
+
+    Args:
+        column: The column.
+        values: The values of the column.
+
+    Returns:
+        The array or, for a nullable column, the masked array.
+
+    """
+    if column.type_ == ColumnType.DATETIME:
+        values = list(map(_naive, values))
+
+    if column.type_ in _DTYPES:
+        dtype, fill = _DTYPES[column.type_]
+        data = numpy.array(
+            [fill if value is None else value for value in values], dtype=dtype
+        )
+    else:
+        data = _object_array(values)
+
+    if not column.nullable:
+        return data
+    return numpy.ma.MaskedArray(
+        data, mask=numpy.array([value is None for value in values], dtype=bool)
+    )
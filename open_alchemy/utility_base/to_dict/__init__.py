@@ -12,13 +12,24 @@ from . import object_
 from . import simple
 
 
-def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
+def convert(
+    *,
+    schema: oa_types.Schema,
+    value: typing.Any,
+    fields: typing.Optional[typing.List[str]] = None,
+    exclude: typing.Optional[typing.List[str]] = None,
+    depth: typing.Optional[int] = None,
+) -> types.TAnyDict:
     """
     Convert value for a schema to a dictionary.
 
     Args:
         value: The value to convert.
         schema: The schema of the value.
+        fields (optional): The paths of the properties of an object to include.
+        exclude (optional): The paths of the properties of an object to exclude.
+        depth (optional): The maximum number of relationships to follow from an
+            object.
 
     Returns:
         The converted value.
@@ -29,14 +40,89 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
         return value
     type_ = peek.type_(schema=schema, schemas={})
     if type_ == "object":
-        return object_.convert(value, schema=schema)
+        return object_.convert(
+            value, schema=schema, fields=fields, exclude=exclude, depth=depth
+        )
     if type_ == "array":
-        return array.convert(value, schema=schema)
+        return array.convert(
+            value, schema=schema, fields=fields, exclude=exclude, depth=depth
+        )
     if type_ in type_helper.SIMPLE_TYPES:
         return simple.convert(value, schema=schema)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
+def is_column(*, schema: oa_types.Schema) -> bool:
+    """
+    Check whether the value of a property is stored in a column of the model.
+
+    Simple and JSON properties are stored in columns, relationships and readOnly
+    properties are not.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        Whether the property is stored in a column.
+
+    """
+    json = peek.json(schema=schema, schemas={})
+    if json:
+        return True
+    type_ = peek.type_(schema=schema, schemas={})
+    return type_ in type_helper.SIMPLE_TYPES
+
+
+def is_array(*, schema: oa_types.Schema) -> bool:
+    """
+    Check whether a property that is not stored in a column is an array.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        Whether the property is an array.
+
+    """
+    return peek.type_(schema=schema, schemas={}) == "array"
+
+
+def is_read_only(*, schema: oa_types.Schema) -> bool:
+    """
+    Check whether a property that is not stored in a column is readOnly.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        Whether the property or, for arrays, its items are readOnly.
+
+    """
+    if peek.read_only(schema=schema, schemas={}):
+        return True
+    item_schema = peek.items(schema=schema, schemas={})
+    return item_schema is not None and bool(
+        peek.read_only(schema=item_schema, schemas={})
+    )
+
+
+def read_only_properties(*, schema: oa_types.Schema) -> typing.List[str]:
+    """
+    Get the names of the properties a readOnly property includes.
+
+    Args:
+        schema: The schema of the readOnly property.
+
+    Returns:
+        The names of the properties of the object or, for arrays, of the items.
+
+    """
+    item_schema = peek.items(schema=schema, schemas={})
+    if item_schema is not None:
+        schema = item_schema
+    return list(schema.get(oa_types.OpenApiProperties.PROPERTIES, {}))
+
+
 def return_none(*, schema: oa_types.Schema, property_name: str) -> bool:
     """
     Check whether a null value for a property should be returned.
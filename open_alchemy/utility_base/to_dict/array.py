@@ -10,7 +10,14 @@ from .. import types
 from . import object_
 
 
-def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDict:
+def convert(
+    value: typing.Any,
+    *,
+    schema: ao_types.Schema,
+    fields: typing.Optional[typing.List[str]] = None,
+    exclude: typing.Optional[typing.List[str]] = None,
+    depth: typing.Optional[int] = None,
+) -> types.TOptArrayDict:
     """
     Convert array property so that it can be included in an object dictionary.
 
@@ -21,6 +28,10 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
     Args:
         value: The value to convert.
         schema: The schema for the value.
+        fields (optional): The paths of the properties of the items to include.
+        exclude (optional): The paths of the properties of the items to exclude.
+        depth (optional): The maximum number of relationships to follow from the
+            items.
 
     Returns:
         The value converted to a list of dictionary.
@@ -40,7 +51,12 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
         )
     read_only = peek.read_only(schema=schema, schemas={})
     item_conversion = functools.partial(
-        object_.convert, schema=item_schema, read_only=read_only
+        object_.convert,
+        schema=item_schema,
+        read_only=read_only,
+        fields=fields,
+        exclude=exclude,
+        depth=depth,
     )
     try:
         converted_items = map(item_conversion, value)
@@ -0,0 +1,122 @@
+"""Cache the dictionary of an instance until the instance changes."""
+
+import typing
+import weakref
+
+from ...facades.sqlalchemy import events as sqlalchemy_events
+from .. import properties
+from .. import to_dict
+from .. import types
+
+# The keys of the instance and class dictionaries used to record the cache
+_CACHE_KEY = "_open_alchemy_to_dict_cache"
+_DEPENDENTS_KEY = "_open_alchemy_to_dict_dependents"
+_LISTENING_KEY = "_open_alchemy_to_dict_listening"
+
+
+def get(instance: typing.Any) -> types.TOptObjectDict:
+    """
+    Retrieve the cached dictionary of an instance.
+
+    Args:
+        instance: The instance to retrieve the dictionary of.
+
+    Returns:
+        The cached dictionary or None if it is not cached.
+
+    """
+    return vars(instance).get(_CACHE_KEY)
+
+
+def store(
+    instance: typing.Any,
+    value: types.TObjectDict,
+    *,
+    dependencies: typing.Iterable[typing.Any],
+) -> None:
+    """
+    Cache the dictionary of an instance.
+
+    The cache is invalidated when the instance or any of the dependencies change.
+
+    Args:
+        instance: The instance to cache the dictionary of.
+        value: The dictionary of the instance.
+        dependencies: The other instances the dictionary includes values of.
+
+    """
+    _listen(type(instance))
+    vars(instance)[_CACHE_KEY] = value
+    for dependency in dependencies:
+        _listen(type(dependency))
+        dependents = vars(dependency).setdefault(_DEPENDENTS_KEY, weakref.WeakSet())
+        dependents.add(instance)
+
+
+def calculate_dependencies(instance: typing.Any) -> typing.List[typing.Any]:
+    """
+    Get the other instances whose values the dictionary of an instance includes.
+
+    These are the instances of the relationships to_dict follows, the instances of
+    their relationships and so on, and the instances of readOnly properties.
+
+    Args:
+        instance: The instance to get the dependencies of.
+
+    Returns:
+        The instances.
+
+    """
+    found: typing.List[typing.Any] = []
+    seen = {id(instance)}
+    pending = [instance]
+    while pending:
+        current = pending.pop()
+        relationships = properties.relationships(model=type(current))
+        for name, property_schema in relationships.items():
+            value = getattr(current, name, None)
+            if value is None:
+                continue
+            values = value if to_dict.is_array(schema=property_schema) else [value]
+            read_only = to_dict.is_read_only(schema=property_schema)
+            for related_instance in values:
+                if id(related_instance) in seen:
+                    continue
+                seen.add(id(related_instance))
+                found.append(related_instance)
+                # The relationships of readOnly properties are not converted
+                if not read_only:
+                    pending.append(related_instance)
+
+    return found
+
+
+def invalidate(instance: typing.Any) -> None:
+    """
+    Remove the cached dictionary of an instance and of any instance that includes it.
+
+    Args:
+        instance: The instance that changed.
+
+    """
+    instance_dict = vars(instance)
+    instance_dict.pop(_CACHE_KEY, None)
+    dependents = instance_dict.pop(_DEPENDENTS_KEY, None)
+    if dependents is None:
+        return
+    for dependent in dependents:
+        vars(dependent).pop(_CACHE_KEY, None)
+
+
+def _listen(model: typing.Type) -> None:
+    """
+    Invalidate the cache of the instances of a model when they change.
+
+    Args:
+        model: The model to listen to.
+
+    """
+    if vars(model).get(_LISTENING_KEY, False):
+        return
+    setattr(model, _LISTENING_KEY, True)
+    sqlalchemy_events.listen_changes(model=model, callback=invalidate)
@@ -0,0 +1,85 @@
+"""Select the properties to include when converting to a dictionary."""
+
+import typing
+
+# The nested paths of each property, None means all nested properties
+TGroupedFields = typing.Dict[str, typing.Optional[typing.List[str]]]
+TOptGroupedFields = typing.Optional[TGroupedFields]
+TOptPaths = typing.Optional[typing.List[str]]
+
+
+def group(paths: typing.Optional[typing.Iterable[str]]) -> TOptGroupedFields:
+    """
+    Group dotted property paths by their first property.
+
+    For example, ["id", "division.name", "division.id"] is grouped to
+    {"id": None, "division": ["name", "id"]}. A property that is included without a
+    nested path, such as "id", is mapped to None which means that all its nested
+    properties are included.
+
+    Args:
+        paths: The dotted paths of the properties.
+
+    Returns:
+        The nested paths of each property or None if there are no paths.
+
+    """
+    if paths is None:
+        return None
+
+    grouped: TGroupedFields = {}
+    for path in paths:
+        name, _, nested_path = path.partition(".")
+        if not nested_path:
+            grouped[name] = None
+            continue
+        nested_paths = grouped.setdefault(name, [])
+        if nested_paths is not None:
+            nested_paths.append(nested_path)
+
+    return grouped
+
+
+def includes(
+    name: str, *, fields: TOptGroupedFields, exclude: TOptGroupedFields
+) -> bool:
+    """
+    Check whether a property is included.
+
+    A property is included if it is in the fields and it, rather than only some of its
+    nested properties, is not excluded.
+
+    Args:
+        name: The name of the property.
+        fields: The grouped paths of the properties to include.
+        exclude: The grouped paths of the properties to exclude.
+
+    Returns:
+        Whether the property is included.
+
+    """
+    if fields is not None and name not in fields:
+        return False
+    if exclude is not None and name in exclude and exclude[name] is None:
+        return False
+    return True
+
+
+def nested(
+    name: str, *, fields: TOptGroupedFields, exclude: TOptGroupedFields
+) -> typing.Tuple[TOptPaths, TOptPaths]:
+    """
+    Calculate the paths of the nested properties of a property.
+
+    Args:
+        name: The name of the property.
+        fields: The grouped paths of the properties to include.
+        exclude: The grouped paths of the properties to exclude.
+
+    Returns:
+        The paths of the nested properties to include and exclude.
+
+    """
+    nested_fields = fields.get(name) if fields is not None else None
+    nested_exclude = exclude.get(name) if exclude is not None else None
+    return nested_fields, nested_exclude
@@ -0,0 +1,124 @@
+"""Calculate the loader options for the relationships and columns to_dict accesses."""
+
+import typing
+
+from ...facades.sqlalchemy import query as sqlalchemy_query
+from .. import properties
+from .. import to_dict
+from . import fields as fields_helper
+
+
+def relationships(
+    *,
+    model: typing.Any,
+    parent: typing.Any,
+    depth: typing.Optional[int],
+    path: typing.Tuple[typing.Any, ...],
+) -> typing.List[typing.Any]:
+    """
+    Calculate the loader options for the relationships reached from a model.
+
+    Args:
+        model: The model.
+        parent: The option that loads the relationship the model is reached through.
+        depth: The number of relationships that can still be followed.
+        path: The models that have been passed through to reach the model.
+
+    Returns:
+        The loader options.
+
+    """
+    if depth is not None and depth < 1:
+        return []
+
+    options: typing.List[typing.Any] = []
+    for name, property_schema in properties.relationships(model=model).items():
+        option, target = sqlalchemy_query.relationship_load_option(
+            model=model, name=name, parent=parent
+        )
+        # The relationships of readOnly properties are not converted
+        read_only = to_dict.is_read_only(schema=property_schema)
+        nested_options: typing.List[typing.Any] = []
+        if not read_only and target not in path:
+            nested_options = relationships(
+                model=target,
+                parent=option,
+                depth=None if depth is None else depth - 1,
+                path=(*path, target),
+            )
+        options.extend(nested_options or [option])
+
+    return options
+
+
+def load_only(
+    *,
+    model: typing.Any,
+    fields: fields_helper.TOptGroupedFields,
+    exclude: fields_helper.TOptGroupedFields,
+    depth: typing.Optional[int],
+    path: typing.Tuple[typing.Any, ...],
+) -> typing.List[typing.Any]:
+    """
+    Calculate the loader options for the properties of a model.
+
+    Args:
+        model: The model.
+        fields: The grouped paths of the properties to include.
+        exclude: The grouped paths of the properties to exclude.
+        depth: The number of relationships that can still be followed.
+        path: The models that have been passed through to reach the model.
+
+    Returns:
+        The loader options.
+
+    """
+    names = [
+        name
+        for name in properties.row_properties(model=model)
+        if fields_helper.includes(name, fields=fields, exclude=exclude)
+    ]
+    options = [sqlalchemy_query.load_only_option(model=model, names=names)]
+
+    for name, property_schema in properties.relationships(model=model).items():
+        if (depth is not None and depth < 1) or not fields_helper.includes(
+            name, fields=fields, exclude=exclude
+        ):
+            options.append(sqlalchemy_query.noload_option(model=model, name=name))
+            continue
+
+        option, target = sqlalchemy_query.relationship_load_option(
+            model=model, name=name
+        )
+        nested_fields, nested_exclude = fields_helper.nested(
+            name, fields=fields, exclude=exclude
+        )
+        grouped_fields = fields_helper.group(nested_fields)
+        grouped_exclude = fields_helper.group(nested_exclude)
+        nested_options: typing.List[typing.Any] = []
+        if to_dict.is_read_only(schema=property_schema):
+            row_properties = properties.row_properties(model=target)
+            nested_names = [
+                key
+                for key in to_dict.read_only_properties(schema=property_schema)
+                if key in row_properties
+                and fields_helper.includes(
+                    key, fields=grouped_fields, exclude=grouped_exclude
+                )
+            ]
+            nested_options.append(
+                sqlalchemy_query.load_only_option(model=target, names=nested_names)
+            )
+        elif target not in path:
+            nested_options = load_only(
+                model=target,
+                fields=grouped_fields,
+                exclude=grouped_exclude,
+                depth=None if depth is None else depth - 1,
+                path=(*path, target),
+            )
+        options.append(
+            sqlalchemy_query.nest_options(option=option, options=nested_options)
+        )
+
+    return options
@@ -0,0 +1,102 @@
+"""Reuse the dictionaries of instances that a call to to_dict reaches repeatedly."""
+
+import contextlib
+import contextvars
+import dataclasses
+import enum
+import typing
+
+from .. import types
+
+
+@enum.unique
+class CycleStrategy(str, enum.Enum):
+    """How to handle reaching an instance that is already being converted."""
+
+    # Convert the instance to None
+    NONE = "none"
+    # Raise InstanceCycleError
+    ERROR = "error"
+
+
+TKey = typing.Tuple[
+    int,
+    typing.Optional[int],
+    typing.Optional[typing.Tuple[str, ...]],
+    typing.Optional[typing.Tuple[str, ...]],
+]
+
+
+@dataclasses.dataclass
+class Memo:
+    """The dictionaries calculated during a call to to_dict."""
+
+    # How to handle cycles
+    cycle: CycleStrategy
+    # The instance and its dictionary by the id of the instance and the selection
+    dicts: typing.Dict[
+        TKey, typing.Tuple[typing.Any, types.TObjectDict]
+    ] = dataclasses.field(default_factory=dict)
+    # The ids of the instances that are being converted
+    converting: typing.Set[int] = dataclasses.field(default_factory=set)
+    # The number of instances that have been converted to None to cut a cycle
+    cuts: int = 0
+
+
+_MEMO: "contextvars.ContextVar[typing.Optional[Memo]]" = contextvars.ContextVar(
+    "open_alchemy_to_dict_memo", default=None
+)
+
+
+def get() -> typing.Optional[Memo]:
+    """
+    Retrieve the memo of the call to to_dict that is in progress.
+
+    Returns:
+        The memo or None if to_dict is not being called.
+
+    """
+    return _MEMO.get()
+
+
+@contextlib.contextmanager
+def start(*, cycle: CycleStrategy) -> typing.Iterator[Memo]:
+    """
+    Start a memo for a call to to_dict.
+
+    Args:
+        cycle: How to handle cycles.
+
+    Returns:
+        The memo which is available through get until the context exits.
+
+    """
+    memo = Memo(cycle=cycle)
+    token = _MEMO.set(memo)
+    try:
+        yield memo
+    finally:
+        _MEMO.reset(token)
+
+
+def calculate_key(
+    instance: typing.Any,
+    *,
+    fields: typing.Optional[typing.Tuple[str, ...]],
+    exclude: typing.Optional[typing.Tuple[str, ...]],
+    depth: typing.Optional[int],
+) -> TKey:
+    """
+    Calculate the key of the dictionary of an instance in the memo.
+
+    Args:
+        instance: The instance.
+        fields: The paths of the properties to include.
+        exclude: The paths of the properties to exclude.
+        depth: The maximum number of relationships to follow.
+
+    Returns:
+        The key.
+
+    """
+    return (id(instance), depth, fields, exclude)
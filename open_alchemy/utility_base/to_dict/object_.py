@@ -6,9 +6,16 @@ from ... import exceptions
 from ... import types as oa_types
 from ...helpers import peek
 from .. import types
+from . import fields as fields_helper
 
 
-def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
+def _convert_relationship(
+    *,
+    value: types.TModel,
+    fields: typing.Optional[typing.List[str]] = None,
+    exclude: typing.Optional[typing.List[str]] = None,
+    depth: typing.Optional[int] = None,
+) -> types.TOptObjectDict:
     """
     Convert object relationship property to a dictionary.
 
@@ -18,6 +25,9 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
 
     Args:
         value: The value to convert.
+        fields (optional): The paths of the properties to include.
+        exclude (optional): The paths of the properties to exclude.
+        depth (optional): The maximum number of relationships to follow.
 
     Returns:
         The object as a dictionary.
@@ -27,7 +37,9 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
         return None
 
     try:
-        return value.to_dict()
+        if fields is None and exclude is None and depth is None:
+            return value.to_dict()
+        return value.to_dict(fields=fields, exclude=exclude, depth=depth)
     except AttributeError as exc:
         raise exceptions.InvalidModelInstanceError(
             "The object property instance does not have a to_dict implementation."
@@ -40,7 +52,11 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
 
 
 def _convert_read_only(
-    *, schema: oa_types.Schema, value: typing.Any
+    *,
+    schema: oa_types.Schema,
+    value: typing.Any,
+    fields: typing.Optional[typing.List[str]] = None,
+    exclude: typing.Optional[typing.List[str]] = None,
 ) -> types.TOptObjectDict:
     """
     Convert readOnly value to a dictionary.
@@ -64,8 +80,14 @@ def _convert_read_only(
         raise exceptions.MalformedSchemaError(
             "readOnly object definitions must have at least 1 property."
         )
+    grouped_fields = fields_helper.group(fields)
+    grouped_exclude = fields_helper.group(exclude)
     return_dict = {}
     for key in properties.keys():
+        if not fields_helper.includes(
+            key, fields=grouped_fields, exclude=grouped_exclude
+        ):
+            continue
         return_dict[key] = getattr(value, key, None)
     return return_dict
 
@@ -75,6 +97,9 @@ def convert(
     *,
     schema: oa_types.Schema,
     read_only: typing.Optional[bool] = None,
+    fields: typing.Optional[typing.List[str]] = None,
+    exclude: typing.Optional[typing.List[str]] = None,
+    depth: typing.Optional[int] = None,
 ) -> types.TOptObjectDict:
     """
     Convert object schema value to dictionary.
@@ -83,9 +108,16 @@ def convert(
         value: The value to convert.
         schema: The schema for the value.
         read_only (optional): Whether the schema is read only.
+        fields (optional): The paths of the properties to include.
+        exclude (optional): The paths of the properties to exclude.
+        depth (optional): The maximum number of relationships to follow.
 
     """
     schema_read_only = peek.read_only(schema=schema, schemas={})
     if read_only or schema_read_only:
-        return _convert_read_only(schema=schema, value=value)
-    return _convert_relationship(value=value)
+        return _convert_read_only(
+            schema=schema, value=value, fields=fields, exclude=exclude
+        )
+    return _convert_relationship(
+        value=value, fields=fields, exclude=exclude, depth=depth
+    )
@@ -0,0 +1,73 @@
+"""Convert rows with the values of the columns of a model to dictionaries."""
+
+import typing
+
+from ... import exceptions
+from ...facades import models
+from ...facades.sqlalchemy import query as sqlalchemy_query
+from .. import properties
+from .. import to_dict
+from .. import types
+
+
+def convert(
+    *, model: typing.Any, rows: typing.Iterable[typing.Any]
+) -> typing.List[types.TObjectDict]:
+    """
+    Convert rows with the values of the columns of a model to dictionaries.
+
+    Args:
+        model: The model of the rows.
+        rows: The rows where the values are keyed by the name of the property.
+
+    Returns:
+        The dictionary representation of each row.
+
+    """
+    row_properties = properties.row_properties(model=model)
+
+    def row_to_dict(row: typing.Any) -> types.TObjectDict:
+        """Convert a row to a dictionary."""
+        mapping = getattr(row, "_mapping", row)
+        return_dict: types.TObjectDict = {}
+        for name, (property_schema, return_none) in row_properties.items():
+            if name not in mapping:
+                continue
+            value = mapping[name]
+
+            # Handle none value
+            if value is None:
+                if return_none:
+                    return_dict[name] = None
+                # Don't consider for coverage due to coverage bug
+                continue  # pragma: no cover
+
+            try:
+                return_dict[name] = to_dict.convert(schema=property_schema, value=value)
+            except exceptions.BaseError as exc:
+                exc.schema = models.get_schema(model=model)  # type: ignore
+                exc.property_schema = property_schema  # type: ignore
+                exc.property_name = name  # type: ignore
+                exc.property_value = value  # type: ignore
+                raise
+
+        return return_dict
+
+    return list(map(row_to_dict, rows))
+
+
+def select_columns(*, model: typing.Any, stmt: typing.Any) -> typing.Any:
+    """
+    Change a select statement for a model to only select the columns of the model.
+
+    Args:
+        model: The model to select the columns of.
+        stmt: A select statement for the model or None to select all rows.
+
+    Returns:
+        The statement selecting the columns of the properties that are converted.
+
+    """
+    return sqlalchemy_query.select_columns(
+        model=model, names=properties.row_properties(model=model).keys(), stmt=stmt
+    )
@@ -1,6 +1,8 @@
 """Convert simple types (not object nor array)."""
 
+import base64
 import datetime
+import uuid
 
 from ... import exceptions
 from ... import types as oa_types
@@ -52,7 +54,9 @@ def convert(
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
-def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
+def _handle_string(
+    value: types.TSimpleCol, *, schema: oa_types.Schema
+) -> types.TSimpleDict:
     """
     Convert string type column to str.
 
@@ -80,13 +84,45 @@ def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
             )
         return value.isoformat()
     if format_ == "binary":
-        if not isinstance(value, bytes):
+        return _handle_binary(value, schema=schema)
+    if format_ == "uuid" and peek.native_uuid(schema=schema, schemas={}):
+        if not isinstance(value, uuid.UUID):
             raise exceptions.InvalidInstanceError(
-                "String type columns with binary format must have bytes values."
+                "String type columns with uuid format must have UUID values."
             )
-        return value.decode()
+        return str(value)
     if not isinstance(value, str):
         raise exceptions.InvalidInstanceError(
             "String type columns must have str values."
         )
     return value
+
+
+def _handle_binary(
+    value: types.TSimpleCol, *, schema: oa_types.Schema
+) -> types.TSimpleDict:
+    """
+    Convert binary format column based on x-binary-encoding.
+
+    The value is returned as it is, without copying it, for bytes encoding, base64
+    encoded for base64 encoding and UTF-8 decoded otherwise.
+
+    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The converted value.
+
+    """
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with binary format must have bytes values."
+        )
+    encoding = peek.binary_encoding(schema=schema, schemas={})
+    if encoding == oa_types.BinaryEncoding.BYTES:
+        return value
+    if encoding == oa_types.BinaryEncoding.BASE64:
+        return base64.b64encode(value).decode("ascii")
+    return str(value, "utf-8")
@@ -2,11 +2,14 @@
 
 import datetime
 import typing
+import uuid
 
 from .. import types as oa_types
 
+# Types for the values of binary properties
+TBinary = typing.Union[bytes, bytearray, memoryview]
 # Types for converting to dictionary
-TSimpleDict = typing.Union[int, float, str, bool]
+TSimpleDict = typing.Union[int, float, str, bool, TBinary]
 TOptSimpleDict = typing.Optional[TSimpleDict]
 TObjectDict = typing.Dict[str, typing.Any]
 TOptObjectDict = typing.Optional[TObjectDict]
@@ -15,7 +18,7 @@ TOptArrayDict = typing.Optional[TArrayDict]
 TComplexDict = typing.Union[TOptObjectDict, TOptArrayDict]
 TAnyDict = typing.Union[TComplexDict, TOptSimpleDict]
 # Types for converting from a dictionary
-TStringCol = typing.Union[str, bytes, datetime.date, datetime.datetime]
+TStringCol = typing.Union[str, TBinary, datetime.date, datetime.datetime, uuid.UUID]
 TSimpleCol = typing.Union[int, float, TStringCol, bool]
 TOptSimpleCol = typing.Optional[TSimpleCol]
 TObjectCol = typing.Any  # pylint: disable=invalid-name
@@ -29,6 +32,11 @@ TAnyCol = typing.Union[TComplexCol, TSimpleCol]
 class TModel(oa_types.Protocol):
     """Defines interface for a model."""
 
-    def to_dict(self) -> TObjectDict:
+    def to_dict(
+        self,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> TObjectDict:
         """Interface for to_dict."""
         ...
@@ -154,6 +154,34 @@ def test_patch_id_miss(client, db_session):
     assert response.status_code == 404
 
 
+@pytest.mark.app
+@pytest.mark.xfail
+def test_patch_id_change(client, db_session):
+    """
+    GIVEN database with employee
+    WHEN /employee/{id} PATCH is called with the id of the employee and a different id
+        in the body
+    THEN 400 is returned and the id of the employee is not changed.
+    """
+    db_employee = models.Employee(
+        id=1, name="name 1", division="division 1", salary=1.0
+    )
+    db_session.add(db_employee)
+    db_session.flush()
+    employee = {"id": 2, "name": "name 2", "division": "division 2", "salary": 2.0}
+
+    response = client.patch(
+        f"/employee/{db_employee.id}",
+        data=json.dumps(employee),
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    db_session.refresh(db_employee)
+    assert db_employee.id == 1
+    assert db_employee.name == "name 1"
+
+
 @pytest.mark.app
 @pytest.mark.xfail
 def test_patch_id_hit(client, db_session):
@@ -24,6 +24,7 @@ def test_integration_simple():
             default=None,
             read_only=None,
             write_only=None,
+            enum=None,
         ),
         extension=types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -35,6 +36,9 @@ def test_integration_simple():
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=False,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={"type": "boolean"},
         required=False,
@@ -68,6 +72,7 @@ def test_integration_json():
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={"type": "boolean"},
         required=False,
@@ -77,7 +82,7 @@ def test_integration_json():
     column = column_factory.column_factory(artifacts=artifacts)
 
     assert isinstance(column, sqlalchemy.types.Column)
-    assert isinstance(column.type, sqlalchemy.types.JSON)
+    assert isinstance(column.type.impl, sqlalchemy.types.JSON)
 
 
 @pytest.mark.column
@@ -29,6 +29,7 @@ def test_integration():
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={"type": "integer"},
         required=False,
@@ -38,4 +39,4 @@ def test_integration():
     returned_column = json.handle(artifacts=artifacts)
 
     assert isinstance(returned_column, sqlalchemy_types.Column)
-    assert isinstance(returned_column.type, sqlalchemy_types.JSON)
+    assert isinstance(returned_column.type.impl, sqlalchemy_types.JSON)
@@ -25,6 +25,7 @@ def test_integration():
             default=None,
             read_only=None,
             write_only=None,
+            enum=None,
         ),
         extension=artifacts_types.ExtensionSimplePropertyArtifacts(
             primary_key=None,
@@ -36,6 +37,9 @@ def test_integration():
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=None,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={"type": "integer"},
         required=False,
@@ -1,18 +1,21 @@
 """Tests for SQLAlchemy JSON property facade."""
 
+import dataclasses
 import functools
 
 import pytest
 import sqlalchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 
 from open_alchemy import types
 from open_alchemy.facades.sqlalchemy import json
 from open_alchemy.schemas.artifacts import types as artifacts_types
 
 
-def _create_artifacts():
-    """Create column artifacts."""
-    return artifacts_types.JsonPropertyArtifacts(
+def _create_artifacts(*, open_api=None, extension=None, **kwargs):
+    """Create column artifacts with any values overridden."""
+    artifacts = artifacts_types.JsonPropertyArtifacts(
         type=types.PropertyType.JSON,
         open_api=artifacts_types.OpenApiJsonPropertyArtifacts(
             nullable=None,
@@ -26,11 +29,18 @@ def _create_artifacts():
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={"type": "integer"},
         required=False,
         description=None,
     )
+    return dataclasses.replace(
+        artifacts,
+        open_api=dataclasses.replace(artifacts.open_api, **(open_api or {})),
+        extension=dataclasses.replace(artifacts.extension, **(extension or {})),
+        **kwargs,
+    )
 
 
 @pytest.mark.facade
@@ -39,14 +49,44 @@ def test_construct():
     """
     GIVEN artifacts for a type
     WHEN construct is called with the artifacts
-    THEN a column with the JSON type is returned.
+    THEN a column with the JSON type and the JSONB type for PostgreSQL is returned.
     """
     artifacts = _create_artifacts()
 
     returned_column = json.construct(artifacts=artifacts)
 
     assert isinstance(returned_column, sqlalchemy.Column)
-    assert isinstance(returned_column.type, sqlalchemy.JSON)
+    assert isinstance(returned_column.type.impl, sqlalchemy.JSON)
+    assert isinstance(returned_column.type.mapping["postgresql"], postgresql.JSONB)
+
+
+@pytest.mark.parametrize(
+    "dialect, expected_type",
+    [
+        pytest.param(postgresql.dialect(), "JSONB", id="postgresql"),
+        pytest.param(sqlite.dialect(), "JSON", id="sqlite"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_construct_ddl(dialect, expected_type):
+    """
+    GIVEN artifacts for a type and a dialect
+    WHEN construct is called with the artifacts and the DDL of a table with the
+        column is compiled for the dialect
+    THEN the column has the expected type.
+    """
+    artifacts = _create_artifacts()
+
+    returned_column = json.construct(artifacts=artifacts)
+
+    table = sqlalchemy.Table(
+        "table_1",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("column_1", returned_column.type),
+    )
+    ddl = str(sqlalchemy.schema.CreateTable(table).compile(dialect=dialect))
+    assert f"column_1 {expected_type}" in ddl
 
 
 @pytest.mark.facade
@@ -57,8 +97,7 @@ def test_construct_foreign_key():
     WHEN construct is called with the artifacts
     THEN a column with a foreign key is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.extension.foreign_key = "table.column"
+    artifacts = _create_artifacts(extension={"foreign_key": "table.column"})
 
     returned_column = json.construct(artifacts=artifacts)
 
@@ -76,9 +115,12 @@ def test_construct_foreign_key_kwargs():
     WHEN construct is called with the artifacts
     THEN a column with a foreign key with the kwargs is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.extension.foreign_key = "table.column"
-    artifacts.extension.foreign_key_kwargs = {"name": "name 1"}
+    artifacts = _create_artifacts(
+        extension={
+            "foreign_key": "table.column",
+            "foreign_key_kwargs": {"name": "name 1"},
+        }
+    )
 
     returned_column = json.construct(artifacts=artifacts)
 
@@ -122,8 +164,7 @@ def test_construct_args(
     WHEN construct is called with the artifacts
     THEN a column where the key has the expected value is returned.
     """
-    artifacts = _create_artifacts()
-    setattr(getattr(artifacts, art_parent_key), art_item_key, art_value)
+    artifacts = _create_artifacts(**{art_parent_key: {art_item_key: art_value}})
 
     returned_column = json.construct(artifacts=artifacts)
 
@@ -141,8 +182,7 @@ def test_construct_kwargs():
     WHEN construct is called with the artifacts
     THEN the column is constructed with the kwargs.
     """
-    artifacts = _create_artifacts()
-    artifacts.extension.kwargs = {"doc": "doc 1"}
+    artifacts = _create_artifacts(extension={"kwargs": {"doc": "doc 1"}})
 
     returned_column = json.construct(artifacts=artifacts)
 
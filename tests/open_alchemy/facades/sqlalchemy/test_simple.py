@@ -1,6 +1,8 @@
 """Tests for SQLAlchemy simple property facade."""
 
+import dataclasses
 import functools
+import uuid
 
 import pytest
 import sqlalchemy
@@ -8,12 +10,13 @@ import sqlalchemy
 from open_alchemy import exceptions
 from open_alchemy import types
 from open_alchemy.facades.sqlalchemy import simple
+from open_alchemy.facades.sqlalchemy import types as sqlalchemy_types
 from open_alchemy.schemas.artifacts import types as artifacts_types
 
 
-def _create_artifacts():
-    """Create column artifacts."""
-    return artifacts_types.SimplePropertyArtifacts(
+def _create_artifacts(*, open_api=None, extension=None, **kwargs):
+    """Create column artifacts with any values overridden."""
+    artifacts = artifacts_types.SimplePropertyArtifacts(
         type=types.PropertyType.SIMPLE,
         open_api=artifacts_types.OpenApiSimplePropertyArtifacts(
             type="integer",
@@ -23,6 +26,7 @@ def _create_artifacts():
             default=None,
             read_only=None,
             write_only=None,
+            enum=None,
         ),
         extension=artifacts_types.ExtensionSimplePropertyArtifacts(
             primary_key=None,
@@ -34,11 +38,20 @@ def _create_artifacts():
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=None,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={"type": "integer"},
         required=False,
         description=None,
     )
+    return dataclasses.replace(
+        artifacts,
+        open_api=dataclasses.replace(artifacts.open_api, **(open_api or {})),
+        extension=dataclasses.replace(artifacts.extension, **(extension or {})),
+        **kwargs,
+    )
 
 
 @pytest.mark.parametrize(
@@ -58,8 +71,7 @@ def test_construct(type_, expected_type):
     WHEN construct is called with the artifacts
     THEN a column with the expected type is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.open_api.type = type_
+    artifacts = _create_artifacts(open_api={"type": type_})
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -77,8 +89,7 @@ def test_construct_foreign_key():
     WHEN construct is called with the artifacts
     THEN a column with a foreign key is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.extension.foreign_key = "table.column"
+    artifacts = _create_artifacts(extension={"foreign_key": "table.column"})
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -96,9 +107,12 @@ def test_construct_foreign_key_kwargs():
     WHEN construct is called with the artifacts
     THEN a column with a foreign key with the kwargs is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.extension.foreign_key = "table.column"
-    artifacts.extension.foreign_key_kwargs = {"name": "name 1"}
+    artifacts = _create_artifacts(
+        extension={
+            "foreign_key": "table.column",
+            "foreign_key_kwargs": {"name": "name 1"},
+        }
+    )
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -210,8 +224,7 @@ def test_construct_args(
     WHEN construct is called with the artifacts
     THEN a column where the key has the expected value is returned.
     """
-    artifacts = _create_artifacts()
-    setattr(getattr(artifacts, art_parent_key), art_item_key, art_value)
+    artifacts = _create_artifacts(**{art_parent_key: {art_item_key: art_value}})
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -236,8 +249,7 @@ def test_construct_args_required_nullable(required, expected_nullable):
     WHEN construct is called with the artifacts
     THEN a column with the expected nullable value is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.required = required
+    artifacts = _create_artifacts(required=required)
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -252,10 +264,9 @@ def test_construct_default_type_mapped():
     WHEN construct is called with the artifacts
     THEN a column with a default value that is mapped is returned.
     """
-    artifacts = _create_artifacts()
-    artifacts.open_api.type = "string"
-    artifacts.open_api.format = "binary"
-    artifacts.open_api.default = "value 1"
+    artifacts = _create_artifacts(
+        open_api={"type": "string", "format": "binary", "default": "value 1"}
+    )
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -278,9 +289,9 @@ def test_construct_autoincrement(autoincrement, expected_autoincrement):
     WHEN construct is called with the artifacts with autoincrement
     THEN the returned column autoincrement property is equal to autoincrement.
     """
-    artifacts = _create_artifacts()
-    artifacts.open_api.type = "integer"
-    artifacts.extension.autoincrement = autoincrement
+    artifacts = _create_artifacts(
+        open_api={"type": "integer"}, extension={"autoincrement": autoincrement}
+    )
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -295,8 +306,7 @@ def test_construct_kwargs():
     WHEN construct is called with the artifacts
     THEN the column is constructed with the kwargs.
     """
-    artifacts = _create_artifacts()
-    artifacts.extension.kwargs = {"doc": "doc 1"}
+    artifacts = _create_artifacts(extension={"kwargs": {"doc": "doc 1"}})
 
     returned_column = simple.construct(artifacts=artifacts)
 
@@ -317,8 +327,7 @@ class TestDetermineType:
         WHEN _determine_type is called with the artifacts
         THEN FeatureNotImplementedError is raised.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "unsupported"
+        artifacts = _create_artifacts(open_api={"type": "unsupported"})
 
         with pytest.raises(exceptions.FeatureNotImplementedError):
             simple._determine_type(artifacts=artifacts)
@@ -341,8 +350,7 @@ class TestDetermineType:
         WHEN _determine_type is called with the artifacts with the type
         THEN the expected type is returned.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = type_
+        artifacts = _create_artifacts(open_api={"type": type_})
 
         returned_type = simple._determine_type(artifacts=artifacts)
 
@@ -363,9 +371,9 @@ class TestHandleInteger:
         WHEN _handle_integer is called with the artifacts
         THEN FeatureNotImplementedError is raised.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "integer"
-        artifacts.open_api.format = "unsupported"
+        artifacts = _create_artifacts(
+            open_api={"type": "integer", "format": "unsupported"}
+        )
 
         with pytest.raises(exceptions.FeatureNotImplementedError):
             simple._handle_integer(artifacts=artifacts)
@@ -387,9 +395,7 @@ class TestHandleInteger:
         WHEN _handle_integer is called with the artifacts
         THEN the expected type is returned.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "integer"
-        artifacts.open_api.format = format_
+        artifacts = _create_artifacts(open_api={"type": "integer", "format": format_})
 
         integer = simple._handle_integer(artifacts=artifacts)
 
@@ -410,9 +416,9 @@ class TestHandleNumber:
         WHEN _handle_number is called with the artifacts
         THEN FeatureNotImplementedError is raised.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "number"
-        artifacts.open_api.format = "unsupported"
+        artifacts = _create_artifacts(
+            open_api={"type": "number", "format": "unsupported"}
+        )
 
         with pytest.raises(exceptions.FeatureNotImplementedError):
             simple._handle_number(artifacts=artifacts)
@@ -433,9 +439,7 @@ class TestHandleNumber:
         WHEN _handle_integer is called with the artifacts
         THEN the expected type is returned.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "number"
-        artifacts.open_api.format = format_
+        artifacts = _create_artifacts(open_api={"type": "number", "format": format_})
 
         number = simple._handle_number(artifacts=artifacts)
 
@@ -477,6 +481,7 @@ class TestHandleString:
                 id="password",
             ),
             pytest.param("binary", sqlalchemy.LargeBinary, id="binary"),
+            pytest.param("uuid", sqlalchemy.String, id="uuid"),
             pytest.param("unsupported", sqlalchemy.String, id="unsupported"),
         ],
     )
@@ -488,9 +493,7 @@ class TestHandleString:
         WHEN _handle_string is called with the artifacts
         THEN the expected type is returned.
         """
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "string"
-        artifacts.open_api.format = format_
+        artifacts = _create_artifacts(open_api={"type": "string", "format": format_})
 
         string = simple._handle_string(artifacts=artifacts)
 
@@ -513,16 +516,74 @@ class TestHandleString:
         THEN a given expected type column with a maximum length is returned.
         """
         length = 1
-        artifacts = _create_artifacts()
-        artifacts.open_api.type = "string"
-        artifacts.open_api.format = format_
-        artifacts.open_api.max_length = length
+        artifacts = _create_artifacts(
+            open_api={"type": "string", "format": format_, "max_length": length}
+        )
 
         string = simple._handle_string(artifacts=artifacts)
 
         assert isinstance(string, expected_type)
         assert string.length == length
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "enum_storage, expected_type",
+        [
+            pytest.param("native", sqlalchemy.Enum, id="native"),
+            pytest.param(
+                "small-integer", sqlalchemy_types.EnumCode, id="small-integer"
+            ),
+        ],
+    )
+    @pytest.mark.facade
+    @pytest.mark.sqlalchemy
+    def test_valid_enum_storage(enum_storage, expected_type):
+        """
+        GIVEN artifacts with enum and enum_storage
+        WHEN _handle_string is called with the artifacts
+        THEN the expected type with the values of the enum is returned.
+        """
+        artifacts = _create_artifacts(
+            open_api={"type": "string", "enum": ["a", "b"]},
+            extension={"enum_storage": enum_storage},
+        )
+
+        string = simple._handle_string(artifacts=artifacts)
+
+        assert isinstance(string, expected_type)
+        assert list(string.enums if enum_storage == "native" else string.values) == [
+            "a",
+            "b",
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "native_uuid, max_length, expected_type, expected_length",
+        [
+            pytest.param(None, None, sqlalchemy.String, None, id="not native"),
+            pytest.param(None, 36, sqlalchemy.String, 36, id="not native maxLength"),
+            pytest.param(False, 36, sqlalchemy.String, 36, id="native false"),
+            pytest.param(True, None, sqlalchemy_types.Uuid, 32, id="native"),
+        ],
+    )
+    @pytest.mark.facade
+    @pytest.mark.sqlalchemy
+    def test_valid_uuid(native_uuid, max_length, expected_type, expected_length):
+        """
+        GIVEN artifacts with the uuid format, native_uuid and max_length
+        WHEN _handle_string is called with the artifacts
+        THEN the expected type is returned.
+        """
+        artifacts = _create_artifacts(
+            open_api={"type": "string", "format": "uuid", "max_length": max_length},
+            extension={"native_uuid": native_uuid},
+        )
+
+        string = simple._handle_string(artifacts=artifacts)
+
+        assert isinstance(string, expected_type)
+        assert getattr(string, "length", None) == expected_length
+
 
 class TestHandleBoolean:
     """Tests for _handle_boolean."""
@@ -541,3 +602,63 @@ class TestHandleBoolean:
         boolean = simple._handle_boolean()
 
         assert isinstance(boolean, sqlalchemy.Boolean)
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_construct_default_uuid():
+    """
+    GIVEN artifacts with the uuid format with x-native-uuid and a default value
+    WHEN construct is called with the artifacts
+    THEN a column with a UUID default value is returned.
+    """
+    artifacts = _create_artifacts(
+        open_api={
+            "type": "string",
+            "format": "uuid",
+            "default": "12345678-1234-5678-1234-567812345678",
+        },
+        extension={"native_uuid": True},
+    )
+
+    returned_column = simple.construct(artifacts=artifacts)
+
+    assert returned_column.default.arg == uuid.UUID(
+        "12345678-1234-5678-1234-567812345678"
+    )
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_construct_enum_storage_native_name():
+    """
+    GIVEN artifacts with native enum storage
+    WHEN construct is called with the artifacts and the column is added to a table
+    THEN the enum type is named after the table and column.
+    """
+    artifacts = _create_artifacts(
+        open_api={"type": "string", "enum": ["a", "b"]},
+        extension={"enum_storage": "native"},
+    )
+    returned_column = simple.construct(artifacts=artifacts)
+    returned_column.name = "status"
+
+    sqlalchemy.Table("table_1", sqlalchemy.MetaData()).append_column(returned_column)
+
+    assert returned_column.type.name == "table_1_status"
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_name_enum_defined():
+    """
+    GIVEN column with a native enum type that has a name
+    WHEN _name_enum is called with the column and a table
+    THEN the name is not changed.
+    """
+    # pylint: disable=protected-access
+    column = sqlalchemy.Column("status", sqlalchemy.Enum("a", name="name_1"))
+
+    simple._name_enum(column, sqlalchemy.Table("table_1", sqlalchemy.MetaData()))
+
+    assert column.type.name == "name_1"
@@ -0,0 +1,156 @@
+"""Tests for SQLAlchemy types."""
+
+import uuid
+
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from open_alchemy.facades.sqlalchemy import types
+
+_UUID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.mark.parametrize(
+    "dialect, expected_type",
+    [
+        pytest.param(postgresql.dialect(), postgresql.UUID, id="postgresql"),
+        pytest.param(sqlite.dialect(), sqlalchemy.CHAR, id="sqlite"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_uuid_load_dialect_impl(dialect, expected_type):
+    """
+    GIVEN dialect and expected type
+    WHEN load_dialect_impl is called on Uuid with the dialect
+    THEN the expected type is returned.
+    """
+    returned_type = types.Uuid().load_dialect_impl(dialect)
+
+    assert isinstance(returned_type, expected_type)
+
+
+@pytest.mark.parametrize(
+    "value, dialect, expected_value",
+    [
+        pytest.param(None, sqlite.dialect(), None, id="None"),
+        pytest.param(_UUID, postgresql.dialect(), _UUID, id="postgresql UUID"),
+        pytest.param(str(_UUID), postgresql.dialect(), _UUID, id="postgresql str"),
+        pytest.param(_UUID, sqlite.dialect(), _UUID.hex, id="sqlite UUID"),
+        pytest.param(str(_UUID), sqlite.dialect(), _UUID.hex, id="sqlite str"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_uuid_process_bind_param(value, dialect, expected_value):
+    """
+    GIVEN value, dialect and expected value
+    WHEN process_bind_param is called on Uuid with the value and dialect
+    THEN the expected value is returned.
+    """
+    returned_value = types.Uuid().process_bind_param(value, dialect)
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [
+        pytest.param(None, None, id="None"),
+        pytest.param(_UUID, _UUID, id="UUID"),
+        pytest.param(_UUID.hex, _UUID, id="hex"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_uuid_process_result_value(value, expected_value):
+    """
+    GIVEN value from the database and expected value
+    WHEN process_result_value is called on Uuid with the value
+    THEN the expected value is returned.
+    """
+    returned_value = types.Uuid().process_result_value(value, sqlite.dialect())
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_uuid_python_type():
+    """
+    GIVEN Uuid
+    WHEN python_type is accessed
+    THEN UUID is returned.
+    """
+    assert types.Uuid().python_type is uuid.UUID
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [
+        pytest.param(None, None, id="None"),
+        pytest.param("a", 0, id="first"),
+        pytest.param("c", 2, id="last"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_enum_code_process_bind_param(value, expected_value):
+    """
+    GIVEN value and expected code
+    WHEN process_bind_param is called on EnumCode with the value
+    THEN the expected code is returned.
+    """
+    returned_value = types.EnumCode(["a", "b", "c"]).process_bind_param(
+        value, sqlite.dialect()
+    )
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_enum_code_process_bind_param_invalid():
+    """
+    GIVEN value that is not in the enum
+    WHEN process_bind_param is called on EnumCode with the value
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        types.EnumCode(["a"]).process_bind_param("b", sqlite.dialect())
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [
+        pytest.param(None, None, id="None"),
+        pytest.param(0, "a", id="first"),
+        pytest.param(2, "c", id="last"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_enum_code_process_result_value(value, expected_value):
+    """
+    GIVEN code from the database and expected value
+    WHEN process_result_value is called on EnumCode with the code
+    THEN the expected value is returned.
+    """
+    returned_value = types.EnumCode(["a", "b", "c"]).process_result_value(
+        value, sqlite.dialect()
+    )
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_enum_code_python_type():
+    """
+    GIVEN EnumCode
+    WHEN python_type is accessed
+    THEN str is returned.
+    """
+    assert types.EnumCode(["a"]).python_type is str
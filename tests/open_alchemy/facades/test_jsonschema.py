@@ -77,3 +77,91 @@ def test_resolver_multiple(tmp_path):
     jsonschema.validate(instance, schema, resolver=resolver)
     assert schema1_dict == {"RefSchema1": {"type": "string"}}
     assert schema2_dict == {"RefSchema2": {"type": "integer"}}
+
+
+@pytest.mark.parametrize(
+    "schema, instance, expected_valid",
+    [
+        pytest.param({"type": "string"}, "a", True, id="string str"),
+        pytest.param({"type": "string"}, b"a", False, id="string bytes"),
+        pytest.param(
+            {"type": "string", "format": "binary"}, "a", True, id="binary str"
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary"}, b"a", True, id="binary bytes"
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary"},
+            bytearray(b"a"),
+            True,
+            id="binary bytearray",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary"},
+            memoryview(b"a"),
+            True,
+            id="binary memoryview",
+        ),
+        pytest.param(
+            {"type": ["string", "null"], "format": "binary"},
+            b"a",
+            True,
+            id="binary type list",
+        ),
+        pytest.param(
+            {"type": "integer", "format": "binary"},
+            b"a",
+            False,
+            id="binary not string",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary"}, 1, False, id="binary invalid"
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "maxLength": 1},
+            b"a",
+            True,
+            id="binary bytes max length valid",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "maxLength": 1},
+            b"ab",
+            False,
+            id="binary bytes max length invalid",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "maxLength": 1},
+            "ab",
+            False,
+            id="binary str max length invalid",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "minLength": 2},
+            b"ab",
+            True,
+            id="binary bytes min length valid",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "minLength": 2},
+            b"a",
+            False,
+            id="binary bytes min length invalid",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "minLength": 2},
+            "a",
+            False,
+            id="binary str min length invalid",
+        ),
+    ],
+)
+@pytest.mark.facade
+def test_validator(schema, instance, expected_valid):
+    """
+    GIVEN schema and instance
+    WHEN validator is called with the schema and the instance is validated
+    THEN the expected outcome is returned.
+    """
+    returned_validator = jsonschema_facade.validator(schema)
+
+    assert returned_validator.is_valid(instance) == expected_valid
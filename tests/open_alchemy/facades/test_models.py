@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from open_alchemy import exceptions
 from open_alchemy.facades import models
 
 
@@ -80,6 +81,34 @@ def test_get_model_schema_not_defined(mocked_models):
     assert model is None
 
 
+@pytest.mark.facade
+def test_get_schema():
+    """
+    GIVEN model with a schema
+    WHEN get_schema is called with the model
+    THEN the schema is returned.
+    """
+    schema = {"type": "object"}
+    model = type("Model", (), {"_schema": schema})
+
+    returned_schema = models.get_schema(model=model)
+
+    assert returned_schema is schema
+
+
+@pytest.mark.facade
+def test_get_schema_not_defined():
+    """
+    GIVEN model without a schema
+    WHEN get_schema is called with the model
+    THEN ModelAttributeError is raised.
+    """
+    model = type("Model", (), {})
+
+    with pytest.raises(exceptions.ModelAttributeError):
+        models.get_schema(model=model)
+
+
 @pytest.mark.facade
 def test_set_model(mocked_models):
     """
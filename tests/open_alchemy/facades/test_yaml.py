@@ -0,0 +1,48 @@
+"""Tests for yaml facade."""
+
+import pytest
+import yaml
+
+from open_alchemy.facades import yaml as yaml_facade
+
+
+@pytest.mark.facade
+def test_safe_loader():
+    """
+    GIVEN PyYAML
+    WHEN SafeLoader is retrieved
+    THEN the libyaml based loader is used if it is available.
+    """
+    expected_loader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+    assert yaml_facade.SafeLoader is expected_loader
+
+
+@pytest.mark.parametrize(
+    "stream, expected_value",
+    [
+        pytest.param("key: value", {"key": "value"}, id="dictionary"),
+        pytest.param("- 1\n- 2", [1, 2], id="list"),
+    ],
+)
+@pytest.mark.facade
+def test_load(stream, expected_value):
+    """
+    GIVEN YAML document
+    WHEN load is called with the document
+    THEN the de-serialized document is returned.
+    """
+    returned_value = yaml_facade.load(stream)
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.facade
+def test_load_unsafe():
+    """
+    GIVEN YAML document with a python object tag
+    WHEN load is called with the document
+    THEN YAMLError is raised.
+    """
+    with pytest.raises(yaml_facade.YAMLError):
+        yaml_facade.load("!!python/object/apply:os.getcwd []")
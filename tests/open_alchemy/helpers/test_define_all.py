@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from open_alchemy import exceptions
 from open_alchemy.helpers import define_all
 from open_alchemy.helpers import ref
 
@@ -120,6 +121,139 @@ def test_call(schemas, expected_calls):
     )
 
 
+@pytest.mark.parametrize(
+    "schemas, expected_order",
+    [
+        pytest.param({}, [], id="empty"),
+        pytest.param({"Table": {}}, [], id="single not constructable"),
+        pytest.param(
+            {
+                "Table": {"x-tablename": "table"},
+                "RefTable": {"$ref": "#/components/schemas/Table"},
+            },
+            ["Table"],
+            id="$ref",
+        ),
+        pytest.param(
+            {
+                "Child1": {
+                    "allOf": [
+                        {"x-inherits": True},
+                        {"$ref": "#/components/schemas/Parent"},
+                    ]
+                },
+                "Child2": {
+                    "allOf": [
+                        {"x-inherits": "Parent"},
+                        {"$ref": "#/components/schemas/Parent"},
+                    ]
+                },
+                "Parent": {"x-tablename": "parent"},
+            },
+            ["Parent", "Child1", "Child2"],
+            id="multiple children",
+        ),
+        pytest.param(
+            {
+                "Child": {
+                    "allOf": [
+                        {"x-inherits": True},
+                        {"$ref": "#/components/schemas/Parent"},
+                    ]
+                },
+                "Other": {"x-tablename": "other"},
+                "Parent": {
+                    "allOf": [
+                        {"x-inherits": True},
+                        {"$ref": "#/components/schemas/Grandparent"},
+                    ]
+                },
+                "Grandparent": {"x-tablename": "grandparent"},
+            },
+            ["Grandparent", "Parent", "Child", "Other"],
+            id="multiple levels",
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_calculate_order(schemas, expected_order):
+    """
+    GIVEN schemas and expected order
+    WHEN calculate_order is called with the schemas
+    THEN the expected order is returned.
+    """
+    returned_order = define_all.calculate_order(schemas=schemas)
+
+    assert returned_order == expected_order
+
+
+@pytest.mark.helper
+def test_calculate_order_parents():
+    """
+    GIVEN parents of the schemas
+    WHEN calculate_order is called with empty schemas and the parents
+    THEN the order is calculated from the parents.
+    """
+    parents = {"Child": "Parent", "Parent": None}
+
+    returned_order = define_all.calculate_order(schemas={}, parents=parents)
+
+    assert returned_order == ["Parent", "Child"]
+
+
+@pytest.mark.helper
+def test_calculate_order_circular():
+    """
+    GIVEN schemas that inherit from each other
+    WHEN calculate_order is called with the schemas
+    THEN InheritanceError is raised.
+    """
+    schemas = {
+        "Table1": {
+            "allOf": [
+                {"x-inherits": "Table2", "x-tablename": "table1"},
+                {"$ref": "#/components/schemas/Table2"},
+            ]
+        },
+        "Table2": {
+            "allOf": [
+                {"x-inherits": "Table1", "x-tablename": "table2"},
+                {"$ref": "#/components/schemas/Table1"},
+            ]
+        },
+    }
+
+    with pytest.raises(exceptions.InheritanceError):
+        define_all.calculate_order(schemas=schemas)
+
+
+@pytest.mark.helper
+def test_call_once():
+    """
+    GIVEN mocked model factory and schemas with multiple children of a parent
+    WHEN define_all is called with the model factory and schemas
+    THEN the mocked model factory is called exactly once for each model.
+    """
+    model_factory = mock.MagicMock()
+    schemas = {
+        "Child1": {
+            "allOf": [{"x-inherits": True}, {"$ref": "#/components/schemas/Parent"}]
+        },
+        "Child2": {
+            "allOf": [{"x-inherits": True}, {"$ref": "#/components/schemas/Parent"}]
+        },
+        "Parent": {"x-tablename": "parent"},
+    }
+
+    define_all.define_all(model_factory=model_factory, schemas=schemas)
+
+    assert model_factory.mock_calls == [
+        mock.call(name="Parent"),
+        mock.call(name="Child1"),
+        mock.call(name="Child2"),
+    ]
+
+
 @pytest.mark.helper
 def test_remote_ref(tmp_path, _clean_remote_schemas_store):
     """
@@ -1,6 +1,7 @@
 """Tests for oa_to_py_type."""
 
 import datetime
+import uuid
 
 import pytest
 
@@ -57,6 +58,12 @@ def test_convert_invalid(value, type_, format_):
             "date-time",
             datetime.datetime(year=2000, month=1, day=1, hour=1, minute=1, second=1),
         ),
+        (
+            "12345678-1234-5678-1234-567812345678",
+            "string",
+            "uuid",
+            "12345678-1234-5678-1234-567812345678",
+        ),
     ],
     ids=[
         "None",
@@ -72,6 +79,7 @@ def test_convert_invalid(value, type_, format_):
         "string binary",
         "string date",
         "string date-time",
+        "string uuid",
     ],
 )
 @pytest.mark.helper
@@ -84,3 +92,33 @@ def test_convert(value, type_, format_, expected_value):
     returned_value = oa_to_py_type.convert(value=value, type_=type_, format_=format_)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.helper
+def test_convert_native_uuid():
+    """
+    GIVEN uuid value
+    WHEN it is passed to convert with native_uuid
+    THEN a UUID is returned.
+    """
+    returned_value = oa_to_py_type.convert(
+        value="12345678-1234-5678-1234-567812345678",
+        type_="string",
+        format_="uuid",
+        native_uuid=True,
+    )
+
+    assert returned_value == uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.mark.helper
+def test_convert_native_uuid_invalid():
+    """
+    GIVEN value that is not a valid UUID
+    WHEN it is passed to convert with the uuid format and native_uuid
+    THEN MalformedSchemaError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError):
+        oa_to_py_type.convert(
+            value="value 1", type_="string", format_="uuid", native_uuid=True
+        )
@@ -90,6 +90,8 @@ def test_mixins(schema, schemas, expected_mixins):
                 ("json", True, True),
                 ("backref", "table 1", "table 1"),
                 ("secondary", "table 1", "table 1"),
+                ("secondary-index", True, True),
+                ("secondary-index", False, False),
                 ("uselist", True, True),
                 ("kwargs", {"key": "value"}, {"key": "value"}),
                 ("foreign-key-kwargs", {"key": "value"}, {"key": "value"}),
@@ -101,6 +103,19 @@ def test_mixins(schema, schemas, expected_mixins):
                 ("dict-ignore", True, True),
                 ("dict-ignore", False, False),
                 ("schema-name", "schema 1", "schema 1"),
+                ("to-dict-cache", True, True),
+                ("to-dict-cache", False, False),
+                ("binary-encoding", "utf-8", "utf-8"),
+                ("binary-encoding", "base64", "base64"),
+                ("binary-encoding", "bytes", "bytes"),
+                ("enum-storage", "native", "native"),
+                ("enum-storage", "small-integer", "small-integer"),
+                ("native-uuid", True, True),
+                ("native-uuid", False, False),
+                ("gin-index", True, True),
+                ("gin-index", False, False),
+                ("gin-index", "jsonb_ops", "jsonb_ops"),
+                ("gin-index", "jsonb_path_ops", "jsonb_path_ops"),
             ]
         ),
         *(
@@ -120,6 +135,7 @@ def test_mixins(schema, schemas, expected_mixins):
                 "json",
                 "backref",
                 "secondary",
+                "secondary-index",
                 "uselist",
                 "kwargs",
                 "foreign-key-kwargs",
@@ -130,6 +146,11 @@ def test_mixins(schema, schemas, expected_mixins):
                 "server-default",
                 "dict-ignore",
                 "schema-name",
+                "to-dict-cache",
+                "binary-encoding",
+                "enum-storage",
+                "native-uuid",
+                "gin-index",
             ]
         ),
     ],
@@ -170,12 +191,21 @@ def test_peek_value_func(prefix, key_values, func, expected_value):
             ("json", 1),
             ("backref", True),
             ("secondary", True),
+            ("secondary-index", "True"),
             ("uselist", "True"),
             ("foreign-key", True),
             ("foreign-key-column", True),
             ("server-default", True),
             ("dict-ignore", "True"),
             ("schema-name", True),
+            ("to-dict-cache", "True"),
+            ("binary-encoding", True),
+            ("binary-encoding", "other"),
+            ("enum-storage", True),
+            ("enum-storage", "other"),
+            ("native-uuid", "True"),
+            ("gin-index", 1),
+            ("gin-index", "other"),
             ("kwargs", True),
             ("kwargs", {1: True}),
             ("kwargs", {1: True, "key": "value"}),
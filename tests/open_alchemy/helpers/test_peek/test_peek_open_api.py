@@ -126,6 +126,8 @@ VALID_TESTS = [
         2,
         id="maxLength defined different",
     ),
+    pytest.param([], peek.enum_, None, id="enum missing"),
+    pytest.param([("enum", ["a", "b"])], peek.enum_, ["a", "b"], id="enum defined"),
     pytest.param([], peek.read_only, None, id="readOnly missing"),
     pytest.param([("readOnly", True)], peek.read_only, True, id="readOnly defined"),
     pytest.param(
@@ -207,6 +209,7 @@ INVALID_TESTS = [
     pytest.param("nullable", 1.1, peek.nullable, "boolean", id="nullable number"),
     pytest.param("format", True, peek.format_, "string", id="format"),
     pytest.param("maxLength", "1", peek.max_length, "integer", id="maxLength"),
+    pytest.param("enum", "a", peek.enum_, "list", id="enum"),
     pytest.param("readOnly", "1", peek.read_only, "boolean", id="readOnly"),
     pytest.param("writeOnly", "1", peek.write_only, "boolean", id="writeOnly"),
     pytest.param("description", True, peek.description, "string", id="description"),
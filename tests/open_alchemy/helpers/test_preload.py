@@ -0,0 +1,38 @@
+"""Tests for preload helper."""
+
+from unittest import mock
+
+import pytest
+
+from open_alchemy.helpers import preload
+
+
+@pytest.mark.parametrize(
+    "freeze, expected_freeze_calls",
+    [
+        pytest.param(True, 1, id="freeze"),
+        pytest.param(False, 0, id="no freeze"),
+    ],
+)
+@pytest.mark.helper
+def test_prepare(mocker, freeze, expected_freeze_calls):
+    """
+    GIVEN models and freeze
+    WHEN prepare is called with the models and freeze
+    THEN each model is precompiled, the mappers are configured and the objects are
+        frozen based on freeze.
+    """
+    mock_configure = mocker.patch(
+        "open_alchemy.helpers.preload.sqlalchemy_mappers.configure"
+    )
+    mock_collect = mocker.patch("open_alchemy.helpers.preload.gc.collect")
+    mock_freeze = mocker.patch("open_alchemy.helpers.preload.gc.freeze")
+    models = [mock.MagicMock(), mock.MagicMock()]
+
+    preload.prepare(models=models, freeze=freeze)
+
+    for model in models:
+        model.precompile.assert_called_once_with()
+    mock_configure.assert_called_once_with()
+    assert mock_collect.call_count == expected_freeze_calls
+    assert mock_freeze.call_count == expected_freeze_calls
@@ -0,0 +1,45 @@
+"""Fixtures for the integration tests against the database."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+
+@pytest.fixture
+def create_models(engine):
+    """Construct the models of a specification and create the tables."""
+
+    def create(spec):
+        """Construct the models of the specification and create the tables."""
+        base = declarative.declarative_base()
+        model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+        models = {
+            name: model_factory(name=name) for name in spec["components"]["schemas"]
+        }
+        base.metadata.create_all(engine)
+        return models
+
+    return create
+
+
+@pytest.fixture
+def models(request, create_models):
+    """Construct the models of the SPEC of the test module and create the tables."""
+    return create_models(request.module.SPEC)
+
+
+@pytest.fixture
+def statements(engine):
+    """Record the statements executed against the database."""
+    executed = []
+
+    def record(_conn, _cursor, statement, *_args):
+        """Record a statement."""
+        executed.append(statement)
+
+    sqlalchemy.event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    sqlalchemy.event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,223 @@
+"""Integration tests against database for binary properties."""
+
+import pytest
+
+from open_alchemy import exceptions
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "type": {"type": "string"},
+                    "name": {"type": "string"},
+                    "photo": {"type": "string", "format": "binary"},
+                    "signature": {
+                        "type": "string",
+                        "format": "binary",
+                        "x-binary-encoding": "base64",
+                    },
+                    "document": {
+                        "type": "string",
+                        "format": "binary",
+                        "x-binary-encoding": "bytes",
+                    },
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "manager_data": {"type": "string"},
+                        },
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "name, kwargs, expected_dict",
+    [
+        pytest.param(
+            "photo", {"photo": "photo 1"}, {"photo": "photo 1"}, id="utf-8 str"
+        ),
+        pytest.param(
+            "photo", {"photo": b"photo 1"}, {"photo": "photo 1"}, id="utf-8 bytes"
+        ),
+        pytest.param(
+            "signature",
+            {"signature": "AP8="},
+            {"signature": "AP8="},
+            id="base64 str",
+        ),
+        pytest.param(
+            "signature",
+            {"signature": memoryview(b"\x00\xff")},
+            {"signature": "AP8="},
+            id="base64 memoryview",
+        ),
+        pytest.param(
+            "document",
+            {"document": b"\x00\xff"},
+            {"document": b"\x00\xff"},
+            id="bytes bytes",
+        ),
+        pytest.param(
+            "document",
+            {"document": bytearray(b"\x00\xff")},
+            {"document": b"\x00\xff"},
+            id="bytes bytearray",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_from_dict_to_dict(models, sessionmaker, name, kwargs, expected_dict):
+    """
+    GIVEN model with binary properties and a value for a property
+    WHEN the instance is constructed using from_dict, inserted and queried and to_dict
+        and select_dicts are called
+    THEN the value is converted based on the x-binary-encoding of the property.
+    """
+    model = models["Employee"]
+    session = sessionmaker()
+    session.add(model.from_dict(id=1, name="employee 1", **kwargs))
+    session.commit()
+
+    queried_instance = sessionmaker().query(model).first()
+
+    assert queried_instance.to_dict()[name] == expected_dict[name]
+    assert model.select_dicts(sessionmaker())[0][name] == expected_dict[name]
+
+
+@pytest.mark.integration
+def test_from_dict_invalid_base64(models):
+    """
+    GIVEN model with a base64 encoded binary property
+    WHEN from_dict is called with a value that is not valid base64
+    THEN InvalidInstanceError is raised.
+    """
+    with pytest.raises(exceptions.InvalidInstanceError):
+        models["Employee"].from_dict(id=1, signature="not base64!")
+
+
+@pytest.mark.parametrize(
+    "name, value, chunk_size, expected_chunks",
+    [
+        pytest.param("Employee", None, 3, [], id="None"),
+        pytest.param("Employee", b"", 3, [], id="empty"),
+        pytest.param("Employee", b"\x00\xff", 3, [b"\x00\xff"], id="single chunk"),
+        pytest.param(
+            "Employee",
+            b"\x00\x01\x02\x03\x04\x05",
+            3,
+            [b"\x00\x01\x02", b"\x03\x04\x05"],
+            id="multiple chunks",
+        ),
+        pytest.param(
+            "Employee",
+            b"\x00\x01\x02\x03\x04",
+            2,
+            [b"\x00\x01", b"\x02\x03", b"\x04"],
+            id="multiple chunks partial",
+        ),
+        pytest.param(
+            "Manager",
+            b"\x00\x01\x02\x03\x04",
+            3,
+            [b"\x00\x01\x02", b"\x03\x04"],
+            id="joined table inheritance",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_stream_binary(models, sessionmaker, name, value, chunk_size, expected_chunks):
+    """
+    GIVEN model with a row with a binary value
+    WHEN stream_binary is called for the row
+    THEN the value is returned in chunks.
+    """
+    model = models[name]
+    session = sessionmaker()
+    session.add(model(id=1, name="employee 1", document=value))
+    session.add(model(id=2, name="employee 2", document=b"other"))
+    session.commit()
+
+    chunks = list(
+        model.stream_binary(sessionmaker(), "document", 1, chunk_size=chunk_size)
+    )
+
+    assert chunks == expected_chunks
+
+
+@pytest.mark.integration
+def test_stream_binary_missing(models, sessionmaker):
+    """
+    GIVEN model without rows
+    WHEN stream_binary is called
+    THEN no chunks are returned.
+    """
+    assert list(models["Employee"].stream_binary(sessionmaker(), "document", 1)) == []
+
+
+@pytest.mark.parametrize(
+    "name, ident, expected_exception",
+    [
+        pytest.param(
+            "name", 1, exceptions.ModelAttributeError, id="not binary property"
+        ),
+        pytest.param("other", 1, exceptions.ModelAttributeError, id="not a property"),
+        pytest.param(
+            "document",
+            (1, 2),
+            exceptions.MissingArgumentError,
+            id="too many primary key values",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_stream_binary_error(models, sessionmaker, name, ident, expected_exception):
+    """
+    GIVEN model
+    WHEN stream_binary is called with an invalid property name or primary key
+    THEN the expected exception is raised.
+    """
+    with pytest.raises(expected_exception):
+        models["Employee"].stream_binary(sessionmaker(), name, ident)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+@pytest.mark.integration
+def test_stream_binary_chunk_size_invalid(models, sessionmaker, chunk_size):
+    """
+    GIVEN model
+    WHEN stream_binary is called with a chunk size that is not positive
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        models["Employee"].stream_binary(
+            sessionmaker(), "document", 1, chunk_size=chunk_size
+        )
@@ -0,0 +1,572 @@
+"""Integration tests against database for bulk operations."""
+
+import datetime
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy.facades.sqlalchemy import bulk
+
+SIMPLE_SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "joined": {"type": "string", "format": "date"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            }
+        }
+    }
+}
+
+INHERITANCE_SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "type": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "manager_data": {"type": "string"},
+                        },
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+            "Engineer": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {"engineer_info": {"type": "string"}},
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "engineer"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+def _init_models(engine, spec):
+    """Construct the models for a spec and create the tables."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    models = {name: model_factory(name=name) for name in spec["components"]["schemas"]}
+    base.metadata.create_all(engine)
+    return models
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+@pytest.mark.integration
+def test_bulk_insert_dicts_session(engine, sessionmaker, chunk_size):
+    """
+    GIVEN model and dictionaries for rows that define different properties
+    WHEN bulk_insert_dicts is called with a session, the dictionaries and chunk size
+    THEN the number of rows is returned and the rows are inserted.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    rows = [
+        {"id": 1, "name": "employee 1", "joined": "2000-01-01"},
+        {"id": 2, "name": "employee 2"},
+        {"id": 3, "joined": "2000-01-03"},
+        {"id": 4, "name": "employee 4", "joined": "2000-01-04"},
+        {"id": 5},
+    ]
+    session = sessionmaker()
+
+    returned_count = employee.bulk_insert_dicts(session, rows, chunk_size=chunk_size)
+
+    assert returned_count == len(rows)
+    queried_employees = session.query(employee).order_by(employee.id).all()
+    assert [(row.id, row.name, row.joined) for row in queried_employees] == [
+        (1, "employee 1", datetime.date(2000, 1, 1)),
+        (2, "employee 2", None),
+        (3, None, datetime.date(2000, 1, 3)),
+        (4, "employee 4", datetime.date(2000, 1, 4)),
+        (5, None, None),
+    ]
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_connection(engine):
+    """
+    GIVEN model and dictionaries for rows
+    WHEN bulk_insert_dicts is called with a connection and a generator of dictionaries
+    THEN the rows are inserted.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    rows = ({"id": id_, "name": f"employee {id_}"} for id_ in range(1, 4))
+
+    with engine.begin() as connection:
+        returned_count = employee.bulk_insert_dicts(connection, rows, chunk_size=2)
+
+    assert returned_count == 3
+    with engine.connect() as connection:
+        queried_rows = connection.execute(
+            sqlalchemy.select([employee.__table__.c.id, employee.__table__.c.name])
+        ).fetchall()
+    assert sorted(tuple(row) for row in queried_rows) == [
+        (1, "employee 1"),
+        (2, "employee 2"),
+        (3, "employee 3"),
+    ]
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_empty(engine, sessionmaker):
+    """
+    GIVEN model
+    WHEN bulk_insert_dicts is called without any rows
+    THEN 0 is returned.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+
+    returned_count = employee.bulk_insert_dicts(session, [])
+
+    assert returned_count == 0
+    assert session.query(employee).count() == 0
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_inheritance(engine, sessionmaker):
+    """
+    GIVEN models with joined and single table inheritance
+    WHEN bulk_insert_dicts is called for each model
+    THEN the rows are inserted into each table with the polymorphic identity.
+    """
+    models = _init_models(engine, INHERITANCE_SPEC)
+    session = sessionmaker()
+
+    models["Employee"].bulk_insert_dicts(session, [{"id": 1, "name": "employee 1"}])
+    models["Manager"].bulk_insert_dicts(
+        session,
+        [
+            {"id": 2, "name": "employee 2", "manager_data": "manager data 2"},
+            {"id": 3, "name": "employee 3"},
+        ],
+    )
+    models["Engineer"].bulk_insert_dicts(
+        session, [{"id": 4, "name": "employee 4", "engineer_info": "info 4"}]
+    )
+
+    queried_employees = (
+        session.query(models["Employee"]).order_by(models["Employee"].id).all()
+    )
+    assert [(row.id, row.name, row.type) for row in queried_employees] == [
+        (1, "employee 1", "employee"),
+        (2, "employee 2", "manager"),
+        (3, "employee 3", "manager"),
+        (4, "employee 4", "engineer"),
+    ]
+    queried_managers = (
+        session.query(models["Manager"]).order_by(models["Manager"].id).all()
+    )
+    assert [(row.id, row.manager_data) for row in queried_managers] == [
+        (2, "manager data 2"),
+        (3, None),
+    ]
+    queried_engineer = session.query(models["Engineer"]).one()
+    assert (queried_engineer.id, queried_engineer.engineer_info) == (4, "info 4")
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_inheritance_primary_key_missing(engine, sessionmaker):
+    """
+    GIVEN model with joined table inheritance
+    WHEN bulk_insert_dicts is called with a row without the primary key
+    THEN MalformedModelDictionaryError is raised.
+    """
+    manager = _init_models(engine, INHERITANCE_SPEC)["Manager"]
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        manager.bulk_insert_dicts(session, [{"name": "employee 1"}])
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_invalid(engine, sessionmaker):
+    """
+    GIVEN model
+    WHEN bulk_insert_dicts is called with a row that does not satisfy the schema
+    THEN MalformedModelDictionaryError is raised.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        employee.bulk_insert_dicts(session, [{"id": "1"}])
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_relationship(engine, sessionmaker):
+    """
+    GIVEN model with a relationship
+    WHEN bulk_insert_dicts is called with a row with a value for the relationship
+    THEN MalformedModelDictionaryError is raised.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "division": {"$ref": "#/components/schemas/Division"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Division": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    employee = _init_models(engine, spec)["Employee"]
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        employee.bulk_insert_dicts(session, [{"id": 1, "division": {"id": 1}}])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+@pytest.mark.integration
+def test_bulk_insert_dicts_chunk_size_invalid(engine, sessionmaker, chunk_size):
+    """
+    GIVEN model
+    WHEN bulk_insert_dicts is called with a chunk size that is not positive
+    THEN ValueError is raised.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+
+    with pytest.raises(ValueError):
+        employee.bulk_insert_dicts(session, [{"id": 1}], chunk_size=chunk_size)
+
+
+UNIQUE_SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-autoincrement": True,
+                    },
+                    "email": {"type": "string", "x-unique": True},
+                    "division": {"type": "string"},
+                    "number": {"type": "integer"},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "x-composite-unique": ["division", "number"],
+            }
+        }
+    }
+}
+
+
+@pytest.fixture(params=[True, False], ids=["on conflict", "merge"])
+def _on_conflict(request, monkeypatch):
+    """Use INSERT ... ON CONFLICT or disable it to upsert by merging."""
+    if not request.param:
+        monkeypatch.setattr(bulk, "_ON_CONFLICT_INSERTS", {})
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+@pytest.mark.integration
+@pytest.mark.usefixtures("_on_conflict")
+def test_bulk_upsert_dicts_primary_key(engine, sessionmaker, chunk_size):
+    """
+    GIVEN model with existing rows
+    WHEN bulk_upsert_dicts is called with new and existing rows
+    THEN the new rows are inserted, the existing rows are updated and the counts are
+        returned without the existing row that only defines the primary key.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+    employee.bulk_insert_dicts(
+        session,
+        [
+            {"id": 1, "name": "employee 1", "joined": "2000-01-01"},
+            {"id": 2, "name": "employee 2", "joined": "2000-01-02"},
+        ],
+    )
+
+    returned_counts = employee.bulk_upsert_dicts(
+        session,
+        [
+            {"id": 1, "name": "employee 1 updated"},
+            {"id": 3, "name": "employee 3"},
+            {"id": 2},
+            {"id": 4, "joined": "2000-01-04"},
+        ],
+        chunk_size=chunk_size,
+    )
+
+    assert returned_counts == bulk.UpsertCounts(inserted=2, updated=1)
+    assert returned_counts.inserted == 2
+    assert returned_counts.updated == 1
+    queried_employees = session.query(employee).order_by(employee.id).all()
+    assert [(row.id, row.name, row.joined) for row in queried_employees] == [
+        (1, "employee 1 updated", datetime.date(2000, 1, 1)),
+        (2, "employee 2", datetime.date(2000, 1, 2)),
+        (3, "employee 3", None),
+        (4, None, datetime.date(2000, 1, 4)),
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_on_conflict")
+def test_bulk_upsert_dicts_unique(engine):
+    """
+    GIVEN model with unique and composite unique constraints and existing rows
+    WHEN bulk_upsert_dicts is called with rows without the primary key
+    THEN the rows are inserted or updated based on the unique constraints.
+    """
+    employee = _init_models(engine, UNIQUE_SPEC)["Employee"]
+    with engine.begin() as connection:
+        employee.bulk_insert_dicts(
+            connection,
+            [
+                {"email": "email 1", "division": "d", "number": 1, "name": "name 1"},
+                {"email": "email 2", "division": "d", "number": 2, "name": "name 2"},
+            ],
+        )
+
+    with engine.begin() as connection:
+        returned_counts = employee.bulk_upsert_dicts(
+            connection,
+            [
+                {"email": "email 1", "name": "name 1 updated"},
+                {"division": "d", "number": 2, "name": "name 2 updated"},
+                {"email": "email 3", "division": "d", "number": 3, "name": "name 3"},
+            ],
+        )
+
+    assert returned_counts == bulk.UpsertCounts(inserted=1, updated=2)
+    table = employee.__table__
+    with engine.connect() as connection:
+        queried_rows = connection.execute(
+            sqlalchemy.select([table.c.email, table.c.number, table.c.name])
+        ).fetchall()
+    assert sorted(tuple(row) for row in queried_rows) == [
+        ("email 1", 1, "name 1 updated"),
+        ("email 2", 2, "name 2 updated"),
+        ("email 3", 3, "name 3"),
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_on_conflict")
+def test_bulk_upsert_dicts_only_conflict_columns(engine, sessionmaker):
+    """
+    GIVEN model with an existing row
+    WHEN bulk_upsert_dicts is called with rows that only define the primary key
+    THEN the missing row is inserted and the existing row is unchanged and not counted.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+    employee.bulk_insert_dicts(session, [{"id": 1, "name": "employee 1"}])
+
+    returned_counts = employee.bulk_upsert_dicts(session, [{"id": 1}, {"id": 2}])
+
+    assert returned_counts == bulk.UpsertCounts(inserted=1, updated=0)
+    queried_employees = session.query(employee).order_by(employee.id).all()
+    assert [(row.id, row.name) for row in queried_employees] == [
+        (1, "employee 1"),
+        (2, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "chunk_size, expected_counts",
+    [
+        pytest.param(2, bulk.UpsertCounts(inserted=1, updated=3), id="chunks"),
+        pytest.param(1000, bulk.UpsertCounts(inserted=1, updated=1), id="one chunk"),
+    ],
+)
+@pytest.mark.integration
+@pytest.mark.usefixtures("_on_conflict")
+def test_bulk_upsert_dicts_duplicate(engine, sessionmaker, chunk_size, expected_counts):
+    """
+    GIVEN model with an existing row
+    WHEN bulk_upsert_dicts is called with more than one row for the same new and
+        existing rows
+    THEN the last row for each row is used and each row is counted once per chunk.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+    employee.bulk_insert_dicts(session, [{"id": 1, "name": "employee 1"}])
+
+    returned_counts = employee.bulk_upsert_dicts(
+        session,
+        [
+            {"id": 2, "name": "employee 2"},
+            {"id": 1, "name": "employee 1 first"},
+            {"id": 2, "name": "employee 2 updated"},
+            {"id": 1, "name": "employee 1 updated"},
+        ],
+        chunk_size=chunk_size,
+    )
+
+    assert returned_counts == expected_counts
+    queried_employees = session.query(employee).order_by(employee.id).all()
+    assert [(row.id, row.name) for row in queried_employees] == [
+        (1, "employee 1 updated"),
+        (2, "employee 2 updated"),
+    ]
+
+
+UNIQUE_INDEX_SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-autoincrement": True,
+                    },
+                    "email": {"type": "string", "x-unique": True, "x-index": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            }
+        }
+    }
+}
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_on_conflict")
+def test_bulk_upsert_dicts_unique_index(engine):
+    """
+    GIVEN model with a unique index and an existing row
+    WHEN bulk_upsert_dicts is called with rows without the primary key
+    THEN the rows are inserted or updated based on the unique index.
+    """
+    employee = _init_models(engine, UNIQUE_INDEX_SPEC)["Employee"]
+    with engine.begin() as connection:
+        employee.bulk_insert_dicts(connection, [{"email": "email 1", "name": "name 1"}])
+
+    with engine.begin() as connection:
+        returned_counts = employee.bulk_upsert_dicts(
+            connection,
+            [
+                {"email": "email 1", "name": "name 1 updated"},
+                {"email": "email 2", "name": "name 2"},
+            ],
+        )
+
+    assert returned_counts == bulk.UpsertCounts(inserted=1, updated=1)
+    table = employee.__table__
+    with engine.connect() as connection:
+        queried_rows = connection.execute(
+            sqlalchemy.select([table.c.email, table.c.name])
+        ).fetchall()
+    assert sorted(tuple(row) for row in queried_rows) == [
+        ("email 1", "name 1 updated"),
+        ("email 2", "name 2"),
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_on_conflict")
+def test_bulk_upsert_dicts_inheritance(engine, sessionmaker):
+    """
+    GIVEN model with joined table inheritance and an existing row
+    WHEN bulk_upsert_dicts is called with new and existing rows
+    THEN the rows of all tables are inserted or updated.
+    """
+    manager = _init_models(engine, INHERITANCE_SPEC)["Manager"]
+    session = sessionmaker()
+    manager.bulk_insert_dicts(
+        session, [{"id": 1, "name": "employee 1", "manager_data": "data 1"}]
+    )
+
+    returned_counts = manager.bulk_upsert_dicts(
+        session,
+        [
+            {"id": 1, "name": "employee 1 updated", "manager_data": "data 1 updated"},
+            {"id": 2, "name": "employee 2", "manager_data": "data 2"},
+        ],
+    )
+
+    assert returned_counts == bulk.UpsertCounts(inserted=1, updated=1)
+    queried_managers = session.query(manager).order_by(manager.id).all()
+    assert [
+        (row.id, row.name, row.type, row.manager_data) for row in queried_managers
+    ] == [
+        (1, "employee 1 updated", "manager", "data 1 updated"),
+        (2, "employee 2", "manager", "data 2"),
+    ]
+
+
+@pytest.mark.integration
+def test_bulk_upsert_dicts_unique_missing(engine, sessionmaker):
+    """
+    GIVEN model with unique constraints
+    WHEN bulk_upsert_dicts is called with a row without the columns of any unique key
+    THEN MalformedModelDictionaryError is raised.
+    """
+    employee = _init_models(engine, UNIQUE_SPEC)["Employee"]
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        employee.bulk_upsert_dicts(session, [{"division": "d", "name": "name 1"}])
+
+
+@pytest.mark.integration
+def test_bulk_upsert_dicts_invalid(engine, sessionmaker):
+    """
+    GIVEN model
+    WHEN bulk_upsert_dicts is called with a row that does not satisfy the schema
+    THEN MalformedModelDictionaryError is raised.
+    """
+    employee = _init_models(engine, SIMPLE_SPEC)["Employee"]
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        employee.bulk_upsert_dicts(session, [{"id": "1"}])
@@ -0,0 +1,119 @@
+"""Integration tests against database for data transfer objects."""
+
+import pytest
+import sqlalchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "type": {"type": "string"},
+                    "joined": {"type": "string", "format": "date", "nullable": True},
+                    "photo": {"type": "string", "format": "binary"},
+                    "password": {"type": "string", "writeOnly": True},
+                    "settings": {"type": "object", "x-json": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "required": ["name"],
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "manager_data": {"type": "string"},
+                        },
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def models(models, sessionmaker):  # pylint: disable=redefined-outer-name
+    """Add some rows to the tables of the models."""
+    session = sessionmaker()
+    session.add(
+        models["Employee"].from_dict(
+            id=1,
+            name="employee 1",
+            joined="2000-01-01",
+            photo="photo 1",
+            password="password 1",
+            settings={"key": "value 1"},
+            division={"id": 1, "name": "division 1"},
+        )
+    )
+    session.add(models["Employee"].from_dict(id=2, name="employee 2"))
+    session.add(
+        models["Manager"].from_dict(
+            id=3, name="employee 3", joined="2000-01-03", manager_data="data 3"
+        )
+    )
+    session.commit()
+    session.close()
+
+    return models
+
+
+@pytest.mark.parametrize("name", ["Employee", "Manager", "Division"])
+@pytest.mark.integration
+def test_dto(models, sessionmaker, name):
+    """
+    GIVEN model with rows
+    WHEN the columns are selected and the data transfer object is constructed from
+        each row and converted to a dictionary
+    THEN the same dictionaries as to_dict without relationships are returned.
+    """
+    model = models[name]
+    session = sessionmaker()
+    expected_dicts = []
+    for instance in session.query(model).order_by(model.id):
+        # Skip the relationship and the properties of any polymorphic sub classes
+        expected_dicts.append(
+            {
+                key: value
+                for key, value in instance.to_dict().items()
+                if key != "division" and hasattr(model, key)
+            }
+        )
+    stmt = sqlalchemy.select(
+        [getattr(model, field.name) for field in model.Dto._fields]
+    ).order_by(model.id)
+
+    dtos = [model.Dto.from_row(row) for row in session.execute(stmt)]
+
+    assert [dto.to_dict() for dto in dtos] == expected_dicts
+    assert all(not hasattr(dto, "__dict__") for dto in dtos)
@@ -0,0 +1,116 @@
+"""Integration tests against database for x-enum-storage."""
+
+import pytest
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+STATUSES = ["pending_approval", "approved", "rejected"]
+
+
+def _spec(enum_storage):
+    """Construct the specification of a model with an enum string property."""
+    status = {"type": "string", "enum": STATUSES, "x-index": True}
+    if enum_storage is not None:
+        status["x-enum-storage"] = enum_storage
+    return {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "status": status,
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                }
+            }
+        }
+    }
+
+
+def _model(engine, enum_storage):
+    """Construct the model and create the table."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=_spec(enum_storage), base=base)
+    model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    return model
+
+
+@pytest.mark.parametrize(
+    "enum_storage, expected_stored_status",
+    [
+        pytest.param("native", "approved", id="native"),
+        pytest.param("small-integer", 1, id="small-integer"),
+    ],
+)
+@pytest.mark.integration
+def test_from_dict_to_dict(engine, sessionmaker, enum_storage, expected_stored_status):
+    """
+    GIVEN model with an enum string property with x-enum-storage
+    WHEN an instance is constructed using from_dict, inserted and queried by the value
+        and to_dict is called
+    THEN the value is a string on the instance and in the dictionary and is stored
+        based on x-enum-storage.
+    """
+    model = _model(engine, enum_storage)
+    session = sessionmaker()
+    session.add(model.from_dict(id=1, status="approved"))
+    session.add(model.from_dict(id=2, status="rejected"))
+    session.commit()
+
+    queried_instance = (
+        sessionmaker().query(model).filter(model.status == "approved").one()
+    )
+
+    assert queried_instance.status == "approved"
+    assert queried_instance.to_dict() == {"id": 1, "status": "approved"}
+    with engine.connect() as connection:
+        stored_status = connection.execute(
+            sqlalchemy.text("SELECT status FROM employee WHERE id = 1")
+        ).scalar()
+    assert stored_status == expected_stored_status
+
+
+@pytest.mark.parametrize("enum_storage", ["native", "small-integer"])
+@pytest.mark.integration
+def test_from_dict_invalid(engine, enum_storage):
+    """
+    GIVEN model with an enum string property with x-enum-storage
+    WHEN from_dict is called with a value that is not in the enum
+    THEN MalformedModelDictionaryError is raised.
+    """
+    model = _model(engine, enum_storage)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(id=1, status="other")
+
+
+@pytest.mark.integration
+def test_storage_size():
+    """
+    GIVEN models with an indexed enum string property stored as a string, as a native
+        enum and as a small integer
+    WHEN the same rows are inserted for each model into an empty SQLite database
+    THEN the small integer storage uses less pages than the string storage.
+    """
+    sizes = {}
+    for enum_storage in (None, "native", "small-integer"):
+        engine = sqlalchemy.create_engine("sqlite://")
+        model = _model(engine, enum_storage)
+        session = orm.Session(bind=engine)
+        session.add_all(
+            model(id=id_, status=STATUSES[id_ % len(STATUSES)]) for id_ in range(5000)
+        )
+        session.commit()
+        with engine.connect() as connection:
+            sizes[enum_storage] = connection.execute(
+                sqlalchemy.text("PRAGMA page_count")
+            ).scalar()
+
+    assert sizes["native"] == sizes[None]
+    assert sizes["small-integer"] < sizes[None] * 0.75
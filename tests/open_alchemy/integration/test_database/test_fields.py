@@ -0,0 +1,265 @@
+"""Integration tests against database for converting some properties to dictionaries."""
+
+import pytest
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "salary": {"type": "number"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "budget": {"type": "number"},
+                    "manager": {"$ref": "#/components/schemas/Employee"},
+                    "company": {
+                        "readOnly": True,
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "name": {"type": "string"},
+                            "address": {"type": "string"},
+                        },
+                    },
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Company": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "address": {"type": "string"},
+                    "divisions": {
+                        "type": "array",
+                        "items": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/Division"},
+                                {"x-backref": "company"},
+                            ]
+                        },
+                    },
+                },
+                "x-tablename": "company",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def models(models, sessionmaker):  # pylint: disable=redefined-outer-name
+    """Add some rows to the tables of the models."""
+    session = sessionmaker()
+    session.add(
+        models["Company"].from_dict(
+            id=1,
+            name="company 1",
+            address="address 1",
+            divisions=[
+                {
+                    "id": 1,
+                    "name": "division 1",
+                    "budget": 1.0,
+                    "manager": {"id": 1, "name": "employee 1", "salary": 10.0},
+                },
+                {"id": 2, "name": "division 2", "budget": 2.0},
+            ],
+        )
+    )
+    session.commit()
+    session.close()
+
+    return models
+
+
+COMPANY_READ_ONLY_DICT = {"id": 1, "name": "company 1", "address": "address 1"}
+COMPANY_DICT = {
+    **COMPANY_READ_ONLY_DICT,
+    "divisions": [
+        {
+            "id": 1,
+            "name": "division 1",
+            "budget": 1.0,
+            "manager": {"id": 1, "name": "employee 1", "salary": 10.0},
+            "company": COMPANY_READ_ONLY_DICT,
+        },
+        {
+            "id": 2,
+            "name": "division 2",
+            "budget": 2.0,
+            "company": COMPANY_READ_ONLY_DICT,
+        },
+    ],
+}
+
+TESTS = [
+    pytest.param("Company", {}, COMPANY_DICT, id="all"),
+    pytest.param(
+        "Company",
+        {"fields": ["id", "name"]},
+        {"id": 1, "name": "company 1"},
+        id="fields",
+    ),
+    pytest.param(
+        "Company",
+        {"fields": ["divisions.name"]},
+        {"divisions": [{"name": "division 1"}, {"name": "division 2"}]},
+        id="fields nested",
+    ),
+    pytest.param(
+        "Company",
+        {"fields": ["divisions.manager.name"]},
+        {"divisions": [{"manager": {"name": "employee 1"}}, {}]},
+        id="fields nested deep",
+    ),
+    pytest.param(
+        "Company",
+        {"fields": ["name", "divisions"]},
+        {"name": "company 1", "divisions": COMPANY_DICT["divisions"]},
+        id="fields relationship",
+    ),
+    pytest.param(
+        "Company",
+        {
+            "exclude": [
+                "address",
+                "divisions.budget",
+                "divisions.manager",
+                "divisions.company",
+            ]
+        },
+        {
+            "id": 1,
+            "name": "company 1",
+            "divisions": [
+                {"id": 1, "name": "division 1"},
+                {"id": 2, "name": "division 2"},
+            ],
+        },
+        id="exclude",
+    ),
+    pytest.param(
+        "Company",
+        {
+            "fields": ["id", "divisions.id", "divisions.name"],
+            "exclude": ["divisions.id"],
+        },
+        {"id": 1, "divisions": [{"name": "division 1"}, {"name": "division 2"}]},
+        id="fields and exclude",
+    ),
+    pytest.param(
+        "Company",
+        {"depth": 0},
+        {"id": 1, "name": "company 1", "address": "address 1"},
+        id="depth 0",
+    ),
+    pytest.param(
+        "Company",
+        {"depth": 1},
+        {
+            "id": 1,
+            "name": "company 1",
+            "address": "address 1",
+            "divisions": [
+                {"id": 1, "name": "division 1", "budget": 1.0},
+                {"id": 2, "name": "division 2", "budget": 2.0},
+            ],
+        },
+        id="depth 1",
+    ),
+    pytest.param(
+        "Division",
+        {"fields": ["name", "company.name"], "depth": 1},
+        {"name": "division 1", "company": {"name": "company 1"}},
+        id="readOnly fields",
+    ),
+    pytest.param(
+        "Division",
+        {"exclude": ["company.address", "manager", "budget"]},
+        {"id": 1, "name": "division 1", "company": {"id": 1, "name": "company 1"}},
+        id="readOnly exclude",
+    ),
+    pytest.param(
+        "Division",
+        {"fields": ["name", "company"], "depth": 0},
+        {"name": "division 1"},
+        id="readOnly depth 0",
+    ),
+]
+
+
+@pytest.mark.parametrize("name, kwargs, expected_dict", TESTS)
+@pytest.mark.integration
+def test_to_dict(models, sessionmaker, name, kwargs, expected_dict):
+    """
+    GIVEN model with rows
+    WHEN to_dict is called with fields, exclude or depth
+    THEN the expected dictionary is returned.
+    """
+    model = models[name]
+    session = sessionmaker()
+    instance = session.query(model).order_by(model.id).first()
+
+    returned_dict = instance.to_dict(**kwargs)
+
+    assert returned_dict == expected_dict
+
+
+@pytest.mark.parametrize("name, kwargs, expected_dict", TESTS)
+@pytest.mark.integration
+def test_load_only_options(
+    models, sessionmaker, statements, name, kwargs, expected_dict
+):
+    """
+    GIVEN model with rows
+    WHEN the rows are queried with load_only_options and converted using to_dict with
+        the same fields, exclude and depth
+    THEN the expected dictionary is returned without executing any statements after
+        the query.
+    """
+    model = models[name]
+    session = sessionmaker()
+    instance = (
+        session.query(model)
+        .options(*model.load_only_options(**kwargs))
+        .order_by(model.id)
+        .first()
+    )
+    statements.clear()
+
+    returned_dict = instance.to_dict(**kwargs)
+
+    assert returned_dict == expected_dict
+    assert not statements
+
+
+@pytest.mark.integration
+def test_load_only_options_columns(models, sessionmaker, statements):
+    """
+    GIVEN model with rows
+    WHEN the rows are queried with load_only_options with fields
+    THEN the columns of the properties that are not included are not selected.
+    """
+    company = models["Company"]
+    session = sessionmaker()
+
+    session.query(company).options(
+        *company.load_only_options(fields=["name", "divisions.name"])
+    ).all()
+
+    assert len(statements) == 2
+    assert "company.name" in statements[0]
+    assert "address" not in statements[0]
+    assert "division.name" in statements[1]
+    assert "budget" not in statements[1]
+    assert "employee" not in "".join(statements)
@@ -0,0 +1,229 @@
+"""Integration tests against database for keyset pagination."""
+
+import datetime
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "salary": {"type": "number", "nullable": False, "x-index": True},
+                    "joined": {"type": "string", "format": "date", "nullable": False},
+                    "division": {"type": "string", "nullable": True},
+                    "title": {"type": "string"},
+                    "password": {
+                        "type": "string",
+                        "writeOnly": True,
+                        "nullable": False,
+                    },
+                    "settings": {"type": "object", "x-json": True},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "required": ["name"],
+            }
+        }
+    }
+}
+SALARIES = [300.0, 100.0, 200.0, 100.0, 300.0, 200.0, 100.0]
+
+
+@pytest.fixture
+def model(engine, sessionmaker):
+    """Construct the model, create the table and insert the rows."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=SPEC, base=base)
+    model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    session.add_all(
+        model(
+            id=id_,
+            name=f"employee {id_}",
+            salary=salary,
+            joined=datetime.date(2021, 1, 1 + id_ % 3),
+            password="password 1",
+        )
+        for id_, salary in enumerate(SALARIES, start=1)
+    )
+    session.commit()
+    return model
+
+
+def _paginate(session, model, limit, **kwargs):
+    """Query all the pages and return the items of each page."""
+    pages = []
+    cursor = None
+    while True:
+        page = model.paginate_keyset(session, after=cursor, limit=limit, **kwargs)
+        pages.append(page.items)
+        cursor = page.cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize(
+    "order_by, limit, expected_ids",
+    [
+        pytest.param(None, 3, [[1, 2, 3], [4, 5, 6], [7]], id="primary key"),
+        pytest.param(None, 7, [[1, 2, 3, 4, 5, 6, 7]], id="single page"),
+        pytest.param(None, 10, [[1, 2, 3, 4, 5, 6, 7]], id="limit larger"),
+        pytest.param(
+            ["salary"], 2, [[2, 4], [7, 3], [6, 1], [5]], id="property with ties"
+        ),
+        pytest.param(
+            ["-salary"], 3, [[1, 5, 3], [6, 2, 4], [7]], id="property descending"
+        ),
+        pytest.param(
+            ["-salary", "-id"], 3, [[5, 1, 6], [3, 7, 4], [2]], id="descending id"
+        ),
+        pytest.param(
+            ["joined", "-salary"],
+            2,
+            [[3, 6], [1, 4], [7, 5], [2]],
+            id="date and descending",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_paginate_keyset(model, sessionmaker, order_by, limit, expected_ids):
+    """
+    GIVEN model with rows
+    WHEN paginate_keyset is called with the cursor of each page until there is no
+        cursor
+    THEN the instances are returned in the order without duplicates or gaps.
+    """
+    pages = _paginate(sessionmaker(), model, limit, order_by=order_by)
+
+    assert [[instance.id for instance in page] for page in pages] == expected_ids
+
+
+@pytest.mark.integration
+def test_paginate_keyset_stmt(model, sessionmaker):
+    """
+    GIVEN model with rows
+    WHEN paginate_keyset is called with a statement with a filter and an order
+    THEN the rows matching the filter are returned in the keyset order.
+    """
+    stmt = (
+        sqlalchemy.select(model).where(model.salary < 300.0).order_by(model.name.desc())
+    )
+
+    pages = _paginate(sessionmaker(), model, 4, stmt=stmt)
+
+    assert [[instance.id for instance in page] for page in pages] == [
+        [2, 3, 4, 6],
+        [7],
+    ]
+
+
+@pytest.mark.integration
+def test_paginate_keyset_dicts(model, sessionmaker):
+    """
+    GIVEN model with rows
+    WHEN paginate_keyset is called with dicts
+    THEN the pages contain the dictionaries of the rows.
+    """
+    pages = _paginate(sessionmaker(), model, 4, order_by=["-joined"], dicts=True)
+
+    assert [[item["id"] for item in page] for page in pages] == [
+        [2, 5, 1, 4],
+        [7, 3, 6],
+    ]
+    assert pages[0][0] == {
+        "id": 2,
+        "name": "employee 2",
+        "salary": 100.0,
+        "joined": "2021-01-03",
+        "division": None,
+    }
+
+
+@pytest.mark.integration
+def test_paginate_keyset_query_cost(model, engine, sessionmaker):
+    """
+    GIVEN model with rows and an index on salary
+    WHEN the query plan of a page after a cursor ordered by salary is explained
+    THEN the index is used to find the rows instead of scanning and skipping the
+        rows of the previous pages.
+    """
+    session = sessionmaker()
+    statements = []
+
+    def record(conn, cursor, statement, *args):  # pylint: disable=unused-argument
+        statements.append((statement, args[0]))
+
+    sqlalchemy.event.listen(engine, "before_cursor_execute", record)
+    try:
+        first_page = model.paginate_keyset(session, limit=2, order_by=["salary"])
+        model.paginate_keyset(
+            session, after=first_page.cursor, limit=2, order_by=["salary"]
+        )
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", record)
+
+    statement, parameters = statements[-1]
+    with engine.connect() as connection:
+        plan = " ".join(
+            str(row[-1])
+            for row in connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+        )
+    assert "ix_employee_salary" in plan
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        pytest.param(["other"], id="not defined"),
+        pytest.param(["password"], id="writeOnly"),
+        pytest.param(["settings"], id="JSON"),
+        pytest.param(["division"], id="nullable"),
+        pytest.param(["title"], id="nullable by default"),
+    ],
+)
+@pytest.mark.integration
+def test_paginate_keyset_order_by_invalid(model, sessionmaker, order_by):
+    """
+    GIVEN model
+    WHEN paginate_keyset is called with order_by with a property that cannot be used
+    THEN ModelAttributeError is raised.
+    """
+    with pytest.raises(exceptions.ModelAttributeError):
+        model.paginate_keyset(sessionmaker(), order_by=order_by)
+
+
+@pytest.mark.integration
+def test_paginate_keyset_limit_invalid(model, sessionmaker):
+    """
+    GIVEN model
+    WHEN paginate_keyset is called with a limit of 0
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        model.paginate_keyset(sessionmaker(), limit=0)
+
+
+@pytest.mark.integration
+def test_paginate_keyset_cursor_other_order(model, sessionmaker):
+    """
+    GIVEN model and the cursor of a page ordered by salary
+    WHEN paginate_keyset is called with the cursor and the default order
+    THEN InvalidCursorError is raised.
+    """
+    session = sessionmaker()
+    page = model.paginate_keyset(session, limit=2, order_by=["salary"])
+
+    with pytest.raises(exceptions.InvalidCursorError):
+        model.paginate_keyset(session, after=page.cursor, limit=2)
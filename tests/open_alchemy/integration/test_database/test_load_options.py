@@ -0,0 +1,244 @@
+"""Integration tests against database for eagerly loading what to_dict accesses."""
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "manager": {"$ref": "#/components/schemas/Employee"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Company": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "divisions": {
+                        "type": "array",
+                        "items": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/Division"},
+                                {"x-backref": "company"},
+                            ]
+                        },
+                    },
+                },
+                "x-tablename": "company",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def models(models, sessionmaker):  # pylint: disable=redefined-outer-name
+    """Add some rows to the tables of the models."""
+    session = sessionmaker()
+    for company_id in range(3):
+        divisions = []
+        for division_id in range(2):
+            id_ = company_id * 2 + division_id
+            manager = models["Employee"](id=id_, name=f"employee {id_}")
+            divisions.append(
+                models["Division"](id=id_, name=f"division {id_}", manager=manager)
+            )
+        session.add(
+            models["Company"](
+                id=company_id, name=f"company {company_id}", divisions=divisions
+            )
+        )
+    session.commit()
+    session.close()
+
+    return models
+
+
+def _to_dicts(sessionmaker, model, options):
+    """Query for all instances of a model and convert them to dictionaries."""
+    session = sessionmaker()
+    instances = session.query(model).options(*options).order_by(model.id).all()
+    returned_dicts = [instance.to_dict() for instance in instances]
+    session.close()
+    return returned_dicts
+
+
+@pytest.mark.parametrize(
+    "name, depth, expected_count",
+    [
+        pytest.param("Company", None, 2, id="company"),
+        pytest.param("Company", 1, 8, id="company depth 1"),
+        pytest.param("Company", 0, 10, id="company depth 0"),
+        pytest.param("Division", None, 1, id="division"),
+    ],
+)
+@pytest.mark.integration
+def test_to_dict_load_options(
+    models, sessionmaker, statements, name, depth, expected_count
+):
+    """
+    GIVEN models with nested relationships and rows
+    WHEN the rows are queried with to_dict_load_options and converted using to_dict
+    THEN the expected number of statements is executed and the dictionaries are the
+        same as without the options.
+    """
+    model = models[name]
+    expected_dicts = _to_dicts(sessionmaker, model, [])
+    statements.clear()
+
+    returned_dicts = _to_dicts(
+        sessionmaker, model, model.to_dict_load_options(depth=depth)
+    )
+
+    assert len(statements) == expected_count
+    assert returned_dicts == expected_dicts
+
+
+CYCLE_SPEC = {
+    "components": {
+        "schemas": {
+            "Badge": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "badge",
+                "type": "object",
+            },
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "employees": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Employee"},
+                    },
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Team": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "team",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "type": {"type": "string"},
+                    "team": {"$ref": "#/components/schemas/Team"},
+                    "badge": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/Badge"},
+                            {"writeOnly": True},
+                        ]
+                    },
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "managed": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/Division"},
+                            },
+                        },
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "name, depth, expected_paths",
+    [
+        pytest.param("Badge", None, [], id="no relationships"),
+        pytest.param(
+            "Employee",
+            None,
+            [["team", "division", "employees"]],
+            id="cycle writeOnly",
+        ),
+        pytest.param("Employee", 1, [["team"]], id="depth"),
+        pytest.param(
+            "Manager",
+            None,
+            [
+                ["team", "division", "employees", "team"],
+                ["managed", "employees", "team", "division"],
+            ],
+            id="inherits",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_to_dict_load_options_paths(name, depth, expected_paths):
+    """
+    GIVEN models with relationships that form a cycle, inheritance and writeOnly
+        relationships
+    WHEN to_dict_load_options is called
+    THEN options with the expected relationship paths are returned.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=CYCLE_SPEC, base=base)
+    model = model_factory(name=name)
+
+    options = model.to_dict_load_options(depth=depth)
+
+    assert [
+        [attribute.key for attribute in option.path] for option in options
+    ] == expected_paths
+
+
+@pytest.mark.parametrize("name", ["Employee", "Manager"])
+@pytest.mark.integration
+def test_load_only_options_cycle(sessionmaker, create_models, name):
+    """
+    GIVEN models with relationships that form a cycle
+    WHEN the models are queried with load_only_options
+    THEN the query is executed.
+    """
+    model = create_models(CYCLE_SPEC)[name]
+    session = sessionmaker()
+
+    returned_instances = session.query(model).options(*model.load_only_options()).all()
+
+    assert returned_instances == []
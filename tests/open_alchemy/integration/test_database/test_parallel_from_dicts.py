@@ -0,0 +1,120 @@
+"""Integration tests against database for converting dictionaries in parallel."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base.from_dict import model as from_dict_model
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "joined": {"type": "string", "format": "date"},
+                    "type": {"type": "string"},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "required": ["name"],
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "manager_data": {"type": "string"},
+                        },
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "name, rows",
+    [
+        pytest.param(
+            "Employee",
+            [
+                {"id": index, "name": f"employee {index}", "joined": "2000-01-01"}
+                for index in range(1, 8)
+            ],
+            id="Employee",
+        ),
+        pytest.param(
+            "Manager",
+            [
+                {"id": index, "name": f"manager {index}", "manager_data": "data"}
+                for index in range(1, 8)
+            ],
+            id="Manager joined table inheritance",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_parallel_from_dicts(models, sessionmaker, name, rows):
+    """
+    GIVEN model and rows
+    WHEN parallel_from_dicts is called with the rows and the model is constructed with
+        the result and inserted
+    THEN the values are the same as for from_dict and the rows are inserted.
+    """
+    model = models[name]
+
+    mappings = list(model.parallel_from_dicts(rows, workers=2, chunk_size=3))
+
+    assert mappings == [
+        from_dict_model.calculate(model=model, kwargs=row, partial=False)
+        for row in rows
+    ]
+    session = sessionmaker()
+    session.add_all([model(**mapping) for mapping in mappings])
+    session.commit()
+    queried_dicts = [
+        instance.to_dict()
+        for instance in sessionmaker().query(model).order_by(model.id)
+    ]
+    assert queried_dicts == [model.from_dict(**row).to_dict() for row in rows]
+
+
+@pytest.mark.integration
+def test_parallel_from_dicts_relationship(models):
+    """
+    GIVEN model and rows where a row includes a relationship
+    WHEN parallel_from_dicts is called with the rows
+    THEN MalformedModelDictionaryError is raised.
+    """
+    rows = [{"id": 1, "name": "employee 1", "division": {"id": 1}}]
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        list(models["Employee"].parallel_from_dicts(rows, workers=1))
@@ -508,6 +508,78 @@ def test_many_to_many(engine, sessionmaker):
     assert queried_ref_model.tables[0].name == "table name 1"
 
 
+@pytest.mark.parametrize(
+    "secondary_index_additions, expected_indexes",
+    [
+        pytest.param({}, ["ix_association_ref_table_id"], id="default"),
+        pytest.param(
+            {"x-secondary-index": True},
+            ["ix_association_ref_table_id"],
+            id="x-secondary-index true",
+        ),
+        pytest.param({"x-secondary-index": False}, [], id="x-secondary-index false"),
+    ],
+)
+@pytest.mark.integration
+def test_many_to_many_secondary_index(
+    engine, secondary_index_additions, expected_indexes
+):
+    """
+    GIVEN specification with a schema with a many to many object relationship
+    WHEN schema is created
+    THEN the column of the association table referencing the child is indexed
+        unless x-secondary-index is false.
+    """
+    # Defining specification
+    spec = {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                },
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_tables": {
+                            "type": "array",
+                            "items": {
+                                "allOf": [
+                                    {"$ref": "#/components/schemas/RefTable"},
+                                    {
+                                        "x-secondary": "association",
+                                        **secondary_index_additions,
+                                    },
+                                ]
+                            },
+                        },
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Querying the indexes of the association table
+    indexes = [
+        row[0]
+        for row in engine.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type='index' AND tbl_name='association' AND sql IS NOT NULL"
+        )
+    ]
+    assert indexes == expected_indexes
+
+
 @pytest.mark.integration
 def test_many_to_many_pre_defined(engine, sessionmaker):
     """
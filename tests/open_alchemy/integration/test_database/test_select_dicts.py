@@ -0,0 +1,180 @@
+"""Integration tests against database for selecting dictionaries."""
+
+import pytest
+import sqlalchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "type": {"type": "string"},
+                    "joined": {"type": "string", "format": "date", "nullable": True},
+                    "photo": {"type": "string", "format": "binary"},
+                    "password": {"type": "string", "writeOnly": True},
+                    "settings": {"type": "object", "x-json": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "required": ["name"],
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "manager_data": {"type": "string"},
+                        },
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+            "Engineer": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {"engineer_info": {"type": "string"}},
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "engineer"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def models(models, sessionmaker):  # pylint: disable=redefined-outer-name
+    """Add some rows to the tables of the models."""
+    session = sessionmaker()
+    division = models["Division"](id=1, name="division 1")
+    session.add(division)
+    session.add(
+        models["Employee"].from_dict(
+            id=1,
+            name="employee 1",
+            joined="2000-01-01",
+            photo="photo 1",
+            password="password 1",
+            settings={"key": "value 1"},
+        )
+    )
+    session.add(models["Employee"].from_dict(id=2, name="employee 2"))
+    session.add(
+        models["Manager"].from_dict(
+            id=3, name="employee 3", joined="2000-01-03", manager_data="data 3"
+        )
+    )
+    session.add(
+        models["Engineer"].from_dict(id=4, name="employee 4", engineer_info="info 4")
+    )
+    session.flush()
+    session.query(models["Employee"]).get(1).division = division
+    session.commit()
+    session.close()
+
+    return models
+
+
+@pytest.mark.parametrize("name", ["Employee", "Manager", "Engineer", "Division"])
+@pytest.mark.integration
+def test_select_dicts(models, sessionmaker, name):
+    """
+    GIVEN model with rows
+    WHEN select_dicts is called
+    THEN the same dictionaries as to_dict without relationships are returned.
+    """
+    model = models[name]
+    session = sessionmaker()
+    expected_dicts = []
+    for instance in session.query(model).order_by(model.id):
+        # Skip the relationship and the properties of any polymorphic sub classes
+        expected_dicts.append(
+            {
+                key: value
+                for key, value in instance.to_dict().items()
+                if key != "division" and hasattr(model, key)
+            }
+        )
+
+    returned_dicts = model.select_dicts(session)
+
+    assert sorted(returned_dicts, key=lambda value: value["id"]) == expected_dicts
+
+
+@pytest.mark.integration
+def test_select_dicts_stmt(models, sessionmaker):
+    """
+    GIVEN model with rows and a statement with a filter
+    WHEN select_dicts is called with the statement
+    THEN the dictionaries for the filtered rows are returned.
+    """
+    employee = models["Employee"]
+    session = sessionmaker()
+    stmt = sqlalchemy.select(employee).where(employee.id == 1)
+
+    returned_dicts = employee.select_dicts(session, stmt)
+
+    assert returned_dicts == [
+        {
+            "id": 1,
+            "name": "employee 1",
+            "type": "employee",
+            "joined": "2000-01-01",
+            "photo": "photo 1",
+            "settings": {"key": "value 1"},
+        }
+    ]
+
+
+@pytest.mark.integration
+def test_rows_to_dicts_connection(models, engine):
+    """
+    GIVEN model with rows
+    WHEN rows_to_dicts is called with the result of selecting some columns with a
+        connection
+    THEN the dictionaries for the selected columns are returned.
+    """
+    table = models["Employee"].__table__
+    stmt = sqlalchemy.select([table.c.id, table.c.joined]).order_by(table.c.id)
+
+    with engine.connect() as connection:
+        returned_dicts = models["Employee"].rows_to_dicts(connection.execute(stmt))
+
+    assert returned_dicts == [
+        {"id": 1, "joined": "2000-01-01"},
+        {"id": 2, "joined": None},
+        {"id": 3, "joined": "2000-01-03"},
+        {"id": 4, "joined": None},
+    ]
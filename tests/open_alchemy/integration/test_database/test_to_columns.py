@@ -0,0 +1,124 @@
+"""Integration tests against database for converting rows to columns."""
+
+import datetime
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy.utility_base.to_columns import array_
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "salary": {"type": "number"},
+                    "active": {"type": "boolean"},
+                    "joined": {"type": "string", "format": "date"},
+                    "settings": {"type": "object", "x-json": True},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "required": ["id", "name", "active"],
+            }
+        }
+    }
+}
+
+
+@pytest.fixture
+def model(engine, sessionmaker):
+    """Construct the model, create the table and add some rows."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=SPEC, base=base)
+    model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    session.add(
+        model.from_dict(
+            id=1,
+            name="employee 1",
+            salary=1.5,
+            active=True,
+            joined="2000-01-01",
+            settings={"key": "value 1"},
+        )
+    )
+    session.add(model.from_dict(id=2, name="employee 2", active=False))
+    session.commit()
+    session.close()
+
+    return model
+
+
+@pytest.mark.parametrize("backend", ["numpy", "arrow", "array"])
+@pytest.mark.integration
+def test_to_columns_instances(model, sessionmaker, backend):
+    """
+    GIVEN model with rows and backend
+    WHEN to_columns is called with the queried instances and the backend
+    THEN the columns have the values of the rows with None where a value is missing.
+    """
+    instances = sessionmaker().query(model).order_by(model.id).all()
+
+    returned_columns = model.to_columns(instances, backend=backend)
+
+    assert list(returned_columns) == [
+        "id",
+        "name",
+        "salary",
+        "active",
+        "joined",
+        "settings",
+    ]
+    values = {name: _to_list(column) for name, column in returned_columns.items()}
+    assert values == {
+        "id": [1, 2],
+        "name": ["employee 1", "employee 2"],
+        "salary": [1.5, None],
+        "active": [True, False],
+        "joined": [datetime.date(2000, 1, 1), None],
+        "settings": [
+            '{"key": "value 1"}' if backend == "arrow" else {"key": "value 1"},
+            None,
+        ],
+    }
+
+
+@pytest.mark.integration
+def test_to_columns_rows(model, engine):
+    """
+    GIVEN model with rows
+    WHEN to_columns is called with the result of selecting some columns with a
+        connection and fields
+    THEN the columns of the fields are returned.
+    """
+    table = model.__table__
+    stmt = sqlalchemy.select([table.c.id, table.c.joined]).order_by(table.c.id)
+
+    with engine.connect() as connection:
+        returned_columns = model.to_columns(
+            connection.execute(stmt), fields=["id", "joined"], backend="numpy"
+        )
+
+    assert returned_columns["id"].tolist() == [1, 2]
+    assert returned_columns["joined"].tolist() == [datetime.date(2000, 1, 1), None]
+
+
+def _to_list(column):
+    """Convert a column of any backend to a list with None for masked values."""
+    if isinstance(column, array_.MaskedArray):
+        return [
+            None if masked else value
+            for value, masked in zip(_to_list(column.values), column.mask)
+        ]
+    if hasattr(column, "to_pylist"):
+        return column.to_pylist()
+    if hasattr(column, "tolist"):
+        return column.tolist()
+    return list(column)
@@ -0,0 +1,284 @@
+"""Integration tests against database for caching the result of to_dict."""
+
+import pytest
+import sqlalchemy
+
+from open_alchemy.utility_base.to_dict import cache
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "manager": {"$ref": "#/components/schemas/Employee"},
+                    "company": {
+                        "readOnly": True,
+                        "type": "object",
+                        "properties": {"name": {"type": "string"}},
+                    },
+                },
+                "x-tablename": "division",
+                "x-to-dict-cache": True,
+                "type": "object",
+            },
+            "Company": {
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-autoincrement": True,
+                    },
+                    "name": {"type": "string"},
+                    "divisions": {
+                        "type": "array",
+                        "items": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/Division"},
+                                {"x-backref": "company"},
+                            ]
+                        },
+                    },
+                },
+                "x-tablename": "company",
+                "x-to-dict-cache": True,
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def company(models, sessionmaker):
+    """Add a company with a division and manager and return it."""
+    session = sessionmaker()
+    company = models["Company"].from_dict(
+        name="company 1",
+        divisions=[
+            {"id": 1, "name": "division 1", "manager": {"id": 1, "name": "employee 1"}}
+        ],
+    )
+    session.add(company)
+    session.commit()
+    yield company
+    session.close()
+
+
+def _raise(*_args, **_kwargs):
+    """Fail if the dictionary is calculated again."""
+    raise AssertionError("to_dict was not cached")
+
+
+@pytest.mark.integration
+def test_cached(models, company, monkeypatch):
+    """
+    GIVEN instance of a model with x-to-dict-cache that has been converted using
+        to_dict
+    WHEN to_dict is called again
+    THEN a copy of the cached dictionary is returned without converting the instance.
+    """
+    first_dict = company.to_dict()
+    monkeypatch.setattr(models["Company"], "instance_to_dict", _raise)
+
+    second_dict = company.to_dict()
+
+    assert second_dict == first_dict
+    assert second_dict is not first_dict
+    assert second_dict == {
+        "id": 1,
+        "name": "company 1",
+        "divisions": [
+            {
+                "id": 1,
+                "name": "division 1",
+                "manager": {"id": 1, "name": "employee 1"},
+                "company": {"name": "company 1"},
+            }
+        ],
+    }
+
+
+@pytest.mark.integration
+def test_cached_deep_copy(company):
+    """
+    GIVEN instance of a model with x-to-dict-cache that has been converted using
+        to_dict
+    WHEN the nested values of the returned dictionary are changed and to_dict is
+        called again
+    THEN the cached dictionary is not changed.
+    """
+    first_dict = company.to_dict()
+    first_dict["divisions"][0]["manager"]["name"] = "changed"
+    first_dict["divisions"].append({"id": 2})
+
+    second_dict = company.to_dict()
+    second_dict["divisions"][0]["name"] = "changed"
+
+    assert company.to_dict()["divisions"] == [
+        {
+            "id": 1,
+            "name": "division 1",
+            "manager": {"id": 1, "name": "employee 1"},
+            "company": {"name": "company 1"},
+        }
+    ]
+
+
+@pytest.mark.integration
+def test_not_cached(models, company):
+    """
+    GIVEN instance of a model without x-to-dict-cache
+    WHEN to_dict is called
+    THEN the dictionary is not cached.
+    """
+    manager = company.divisions[0].manager
+
+    manager.to_dict()
+
+    assert cache.get(manager) is None
+
+
+@pytest.mark.integration
+def test_fields_not_cached(company):
+    """
+    GIVEN instance of a model with x-to-dict-cache
+    WHEN to_dict is called with fields
+    THEN the dictionary is not cached.
+    """
+    returned_dict = company.to_dict(fields=["name"])
+
+    assert returned_dict == {"name": "company 1"}
+    assert cache.get(company) is None
+
+
+@pytest.mark.parametrize(
+    "change, expected_name, expected_division_names",
+    [
+        pytest.param(
+            lambda models, company: setattr(company, "name", "company 2"),
+            "company 2",
+            ["division 1"],
+            id="set",
+        ),
+        pytest.param(
+            lambda models, company: company.divisions.append(
+                models["Division"](id=2, name="division 2")
+            ),
+            "company 1",
+            ["division 1", "division 2"],
+            id="append",
+        ),
+        pytest.param(
+            lambda models, company: company.divisions.remove(company.divisions[0]),
+            "company 1",
+            [],
+            id="remove",
+        ),
+        pytest.param(
+            lambda models, company: setattr(company.divisions[0], "name", "division 2"),
+            "company 1",
+            ["division 2"],
+            id="nested set",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_invalidate(models, company, change, expected_name, expected_division_names):
+    """
+    GIVEN instance of a model with x-to-dict-cache that has been converted using
+        to_dict
+    WHEN the instance or a related instance is changed
+    THEN to_dict returns the changed values.
+    """
+    company.to_dict()
+
+    change(models, company)
+    returned_dict = company.to_dict()
+
+    assert returned_dict["name"] == expected_name
+    assert [
+        division["name"] for division in returned_dict["divisions"]
+    ] == expected_division_names
+
+
+@pytest.mark.integration
+def test_invalidate_nested_deep(company):
+    """
+    GIVEN instance of a model with x-to-dict-cache that has been converted using
+        to_dict
+    WHEN an instance of a model without x-to-dict-cache related through another
+        instance is changed
+    THEN to_dict returns the changed value.
+    """
+    company.to_dict()
+
+    company.divisions[0].manager.name = "employee 2"
+    returned_dict = company.to_dict()
+
+    assert returned_dict["divisions"][0]["manager"]["name"] == "employee 2"
+
+
+@pytest.mark.integration
+def test_invalidate_read_only(company):
+    """
+    GIVEN instance of a model with x-to-dict-cache with a readOnly property that has
+        been converted using to_dict
+    WHEN the instance of the readOnly property is changed
+    THEN to_dict returns the changed value.
+    """
+    division = company.divisions[0]
+    division.to_dict()
+
+    company.name = "company 2"
+    returned_dict = division.to_dict()
+
+    assert returned_dict["company"] == {"name": "company 2"}
+
+
+@pytest.mark.integration
+def test_invalidate_flush(models, sessionmaker):
+    """
+    GIVEN instance of a model with x-to-dict-cache that has been converted using
+        to_dict before it was added to the database
+    WHEN the instance is flushed
+    THEN to_dict returns the generated primary key.
+    """
+    session = sessionmaker()
+    company = models["Company"](name="company 1")
+    assert company.to_dict() == {"name": "company 1", "divisions": []}
+
+    session.add(company)
+    session.flush()
+    returned_dict = company.to_dict()
+
+    assert returned_dict["id"] == 1
+
+
+@pytest.mark.integration
+def test_invalidate_expire(company, engine):
+    """
+    GIVEN instance of a model with x-to-dict-cache that has been converted using
+        to_dict
+    WHEN the row is changed in the database and the instance is expired
+    THEN to_dict returns the value from the database.
+    """
+    company.to_dict()
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.text("UPDATE company SET name = 'company 2' WHERE id = 1")
+        )
+
+    sqlalchemy.orm.object_session(company).expire(company)
+    returned_dict = company.to_dict()
+
+    assert returned_dict["name"] == "company 2"
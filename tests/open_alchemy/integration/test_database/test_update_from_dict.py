@@ -0,0 +1,142 @@
+"""Integration tests against database for updating instances from dictionaries."""
+
+import datetime
+
+import pytest
+
+from open_alchemy import exceptions
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string", "maxLength": 20},
+                    "joined": {"type": "string", "format": "date"},
+                    "type": {"type": "string"},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+                "required": ["name"],
+                "x-kwargs": {
+                    "__mapper_args__": {
+                        "polymorphic_on": "type",
+                        "polymorphic_identity": "employee",
+                    }
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Employee"},
+                    {
+                        "x-tablename": "manager",
+                        "x-inherits": "Employee",
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                            "manager_data": {"type": "string"},
+                        },
+                        "required": ["manager_data"],
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "manager"}
+                        },
+                    },
+                ]
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def models(models, sessionmaker):  # pylint: disable=redefined-outer-name
+    """Add some rows to the tables of the models."""
+    session = sessionmaker()
+    session.add(models["Employee"].from_dict(id=1, name="employee 1"))
+    session.add(
+        models["Manager"].from_dict(id=2, name="employee 2", manager_data="data 2")
+    )
+    session.commit()
+    session.close()
+
+    return models
+
+
+@pytest.mark.integration
+def test_update_from_dict(models, sessionmaker):
+    """
+    GIVEN model with a row
+    WHEN update_from_dict is called on the instance with some of the properties,
+        including a relationship, and the session is committed
+    THEN the row is updated with the converted values and the other values are kept.
+    """
+    session = sessionmaker()
+    instance = session.query(models["Employee"]).get(1)
+
+    instance.update_from_dict(
+        joined="2000-01-01", division={"id": 1, "name": "division 1"}
+    )
+    session.commit()
+
+    queried_instance = sessionmaker().query(models["Employee"]).get(1)
+    assert queried_instance.name == "employee 1"
+    assert queried_instance.joined == datetime.date(year=2000, month=1, day=1)
+    assert queried_instance.division.name == "division 1"
+
+
+@pytest.mark.integration
+def test_update_from_dict_inheritance(models, sessionmaker):
+    """
+    GIVEN model that inherits with a row
+    WHEN update_from_dict is called on the instance with properties of the model and
+        the parent and the session is committed
+    THEN the row is updated.
+    """
+    session = sessionmaker()
+    instance = session.query(models["Manager"]).get(2)
+
+    instance.update_from_dict(name="manager 2", manager_data="new data 2")
+    session.commit()
+
+    queried_instance = sessionmaker().query(models["Manager"]).get(2)
+    assert queried_instance.name == "manager 2"
+    assert queried_instance.manager_data == "new data 2"
+
+
+@pytest.mark.parametrize(
+    "dictionary",
+    [
+        pytest.param({"name": "a name that is too long"}, id="invalid"),
+        pytest.param({"name": None}, id="None"),
+        pytest.param({"key": "value"}, id="not a property"),
+    ],
+)
+@pytest.mark.integration
+def test_update_from_dict_invalid(models, sessionmaker, dictionary):
+    """
+    GIVEN model with a row and a dictionary that does not satisfy the schema
+    WHEN update_from_dict is called on the instance with the dictionary
+    THEN MalformedModelDictionaryError is raised and the instance is not changed.
+    """
+    session = sessionmaker()
+    instance = session.query(models["Employee"]).get(1)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        instance.update_from_dict(**dictionary)
+
+    assert instance.name == "employee 1"
+    assert not session.dirty
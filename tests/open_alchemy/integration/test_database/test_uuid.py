@@ -0,0 +1,141 @@
+"""Integration tests against database for uuid properties."""
+
+import uuid
+
+import pytest
+import sqlalchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {
+                        "type": "string",
+                        "format": "uuid",
+                        "x-native-uuid": True,
+                        "x-primary-key": True,
+                    },
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division_id": {
+                        "type": "string",
+                        "format": "uuid",
+                        "x-native-uuid": True,
+                        "x-foreign-key": "division.id",
+                    },
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+        }
+    }
+}
+DIVISION_ID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.mark.parametrize(
+    "division_id",
+    [
+        pytest.param(DIVISION_ID, id="UUID"),
+        pytest.param(str(DIVISION_ID), id="str"),
+    ],
+)
+@pytest.mark.integration
+def test_from_dict_to_dict(models, sessionmaker, division_id):
+    """
+    GIVEN models with a uuid primary key and a uuid foreign key with x-native-uuid
+    WHEN instances are constructed using from_dict, inserted and queried by the uuid
+        and to_dict is called
+    THEN the values are UUIDs on the instances and strings in the dictionaries.
+    """
+    session = sessionmaker()
+    session.add(models["Division"].from_dict(id=division_id, name="division 1"))
+    session.add(models["Employee"].from_dict(id=1, division_id=division_id))
+    session.commit()
+
+    queried_division = (
+        sessionmaker().query(models["Division"]).filter_by(id=DIVISION_ID).one()
+    )
+    queried_employee = (
+        sessionmaker()
+        .query(models["Employee"])
+        .filter(models["Employee"].division_id == DIVISION_ID)
+        .one()
+    )
+
+    assert queried_division.id == DIVISION_ID
+    assert queried_employee.division_id == DIVISION_ID
+    assert queried_division.to_dict() == {
+        "id": str(DIVISION_ID),
+        "name": "division 1",
+    }
+    assert queried_employee.to_dict()["division_id"] == str(DIVISION_ID)
+
+
+@pytest.mark.integration
+def test_storage(models, engine, sessionmaker):
+    """
+    GIVEN model with a uuid primary key with x-native-uuid
+    WHEN an instance is inserted
+    THEN the uuid is stored as the 32 hexadecimal digits in the database.
+    """
+    session = sessionmaker()
+    session.add(models["Division"](id=DIVISION_ID, name="division 1"))
+    session.commit()
+
+    with engine.connect() as connection:
+        stored_id = connection.execute(
+            sqlalchemy.text("SELECT id FROM division")
+        ).scalar()
+
+    assert stored_id == DIVISION_ID.hex
+
+
+@pytest.mark.integration
+def test_not_native(engine, sessionmaker, create_models):
+    """
+    GIVEN model with a uuid primary key with maxLength without x-native-uuid
+    WHEN an instance is constructed using from_dict and inserted
+    THEN the uuid is a string on the instance and in the database.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {
+                    "properties": {
+                        "id": {
+                            "type": "string",
+                            "format": "uuid",
+                            "maxLength": 36,
+                            "x-primary-key": True,
+                        }
+                    },
+                    "x-tablename": "division",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    model = create_models(spec)["Division"]
+    session = sessionmaker()
+    session.add(model.from_dict(id=str(DIVISION_ID)))
+    session.commit()
+
+    queried_division = sessionmaker().query(model).one()
+    with engine.connect() as connection:
+        stored_id = connection.execute(
+            sqlalchemy.text("SELECT id FROM division")
+        ).scalar()
+
+    assert isinstance(model.__table__.c.id.type, sqlalchemy.String)
+    assert model.__table__.c.id.type.length == 36
+    assert queried_division.id == str(DIVISION_ID)
+    assert queried_division.to_dict() == {"id": str(DIVISION_ID)}
+    assert stored_id == str(DIVISION_ID)
@@ -1,10 +1,12 @@
 """Integration tests for initialization."""
 
 import json
+import pathlib
 import sys
 from unittest import mock
 
 import pytest
+import sqlalchemy
 import yaml
 
 import open_alchemy
@@ -323,6 +325,80 @@ def test_init_yaml(engine, sessionmaker, tmp_path):
     assert cache.schemas_valid(str(spec_file)) is True
 
 
+@pytest.mark.integration
+def test_init_yaml_spec_cache(tmp_path, monkeypatch):
+    """
+    GIVEN specification stored in a YAML file
+    WHEN init_yaml is called twice with the file and the spec cache turned on and then
+        after the file changes
+    THEN the YAML is only parsed for the first call and after the file changed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from open_alchemy.facades import yaml as yaml_facade
+
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    mock_load = mock.MagicMock(side_effect=yaml_facade.load)
+    monkeypatch.setattr(yaml_facade, "load", mock_load)
+
+    open_alchemy.init_yaml(str(spec_file), spec_cache=True)
+    assert mock_load.call_count == 1
+    assert cache.calculate_spec_cache_path(spec_file).is_file()
+
+    _, model_factory = open_alchemy.init_yaml(str(spec_file), spec_cache=True)
+    assert mock_load.call_count == 1
+    assert model_factory(name="Table").__tablename__ == "table"
+
+    spec_file.write_text(yaml.dump(BASIC_SPEC) + "\n")
+    open_alchemy.init_yaml(str(spec_file), spec_cache=True)
+    assert mock_load.call_count == 2
+
+
+@pytest.mark.integration
+def test_init_yaml_spec_cache_default(tmp_path, monkeypatch):
+    """
+    GIVEN specification stored in a YAML file
+    WHEN init_yaml is called twice with the file
+    THEN the YAML is parsed for both calls and no spec cache is written.
+    """
+    # pylint: disable=import-outside-toplevel
+    from open_alchemy.facades import yaml as yaml_facade
+
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    mock_load = mock.MagicMock(side_effect=yaml_facade.load)
+    monkeypatch.setattr(yaml_facade, "load", mock_load)
+
+    open_alchemy.init_yaml(str(spec_file))
+    open_alchemy.init_yaml(str(spec_file))
+
+    assert mock_load.call_count == 2
+    assert not cache.calculate_spec_cache_path(spec_file).exists()
+
+
+@pytest.mark.integration
+def test_init_yaml_spec_cache_read_only(tmp_path, monkeypatch):
+    """
+    GIVEN specification stored in a YAML file in a folder that cannot be written to
+    WHEN init_yaml is called with the file and the spec cache turned on
+    THEN a valid model factory is returned.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    monkeypatch.setattr(
+        pathlib.Path,
+        "write_bytes",
+        mock.MagicMock(side_effect=PermissionError("read-only")),
+    )
+
+    _, model_factory = open_alchemy.init_yaml(str(spec_file), spec_cache=True)
+
+    assert model_factory(name="Table").__tablename__ == "table"
+    assert not cache.calculate_spec_cache_path(spec_file).exists()
+
+
 @pytest.mark.integration
 def test_init_yaml_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_store):
     """
@@ -639,8 +715,217 @@ class TTable({expected_model_base}):
         """
         ...
 
+    def update_from_dict(self, **kwargs: typing.Any) -> None:
+        """
+        Update the instance in place from a dictionary (eg. a PATCH payload).
+
+        Args:
+            kwargs: The values to update the instance with.
+
+        """
+        ...
+
+    @classmethod
+    def precompile(cls) -> None:
+        """Compile what the model otherwise compiles the first time it is used."""
+        ...
+
+    @classmethod
+    def parallel_from_dicts(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Check and convert dictionaries in worker processes.
+
+        Returns:
+            The values for the columns of each row.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Insert rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> typing.Any:
+        """
+        Insert or update rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted and updated.
+
+        """
+        ...
+
+    @classmethod
+    def rows_to_dicts(
+        cls, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert rows with the values of the columns to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def select_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Query rows selecting only the columns and convert them to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        session: typing.Any,
+        after: typing.Optional[str] = None,
+        limit: int = 100,
+        order_by: typing.Optional[typing.Iterable[str]] = None,
+        stmt: typing.Any = None,
+        dicts: bool = False,
+    ) -> typing.Any:
+        """
+        Query a page of rows after the last row of the previous page.
+
+        Returns:
+            The items of the page and the cursor of the next page.
+
+        """
+        ...
+
+    @classmethod
+    def to_columns(
+        cls,
+        items: typing.Iterable[typing.Any],
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instances or rows to a column for each property.
+
+        Returns:
+            The column of each property.
+
+        """
+        ...
+
+    @classmethod
+    def stream_binary(
+        cls,
+        session: typing.Any,
+        name: str,
+        ident: typing.Any,
+        *,
+        chunk_size: int = 1048576,
+    ) -> typing.Iterator[bytes]:
+        """
+        Stream the value of a binary property in chunks.
+
+        Returns:
+            The chunks of the value.
+
+        """
+        ...
+
+    @classmethod
+    def to_dict_load_options(
+        cls, depth: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict accesses.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
+    @classmethod
+    def load_only_options(
+        cls,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load what to_dict converts.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
 
 Table: typing.Type[TTable] = models.Table  # type: ignore
+
+
+class TTableDto({expected_model_base}):
+    """Data transfer object protocol for Table."""
+
+    # Model properties
+    column: typing.Optional[int]
+
+    def __init__(self, *, column: typing.Optional[int] = None) -> None:
+        """Construct."""
+        ...
+
+    @classmethod
+    def from_row(cls, row: typing.Any) -> "TTableDto":
+        """
+        Construct from a row with the values keyed by the name of the property.
+
+        Returns:
+            Data transfer object based on the row.
+
+        """
+        ...
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Convert to a dictionary in the same way as the model.
+
+        Returns:
+            Dictionary based on the data transfer object.
+
+        """
+        ...
+
+
+TableDto: typing.Type[TTableDto] = models.Table.Dto  # type: ignore
 '''
     assert models_file_contents == expected_contents
 
@@ -801,3 +1086,119 @@ def test_build_yaml_import_error():
     with mock.patch.dict("sys.modules", {"yaml": None}):
         with pytest.raises(ImportError):
             open_alchemy.build_yaml("some file", "some package", "some path")
+
+
+ADVISE_SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "type": "object",
+                "x-tablename": "division",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            },
+            "Employee": {
+                "type": "object",
+                "x-tablename": "employee",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division_id": {
+                        "type": "integer",
+                        "x-foreign-key": "division.id",
+                    },
+                },
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "filename, dump, advisor",
+    [
+        pytest.param("spec.json", json.dumps, "advise_json", id="json"),
+        pytest.param("spec.yaml", yaml.dump, "advise_yaml", id="yaml"),
+    ],
+)
+@pytest.mark.integration
+def test_advise(tmp_path, filename, dump, advisor):
+    """
+    GIVEN file with a spec with a foreign key that is not indexed
+    WHEN advise_json or advise_yaml is called with the path to the file
+    THEN the finding for the foreign key is returned.
+    """
+    spec_path = tmp_path / filename
+    spec_path.write_text(dump(ADVISE_SPEC))
+
+    returned_findings = getattr(open_alchemy, advisor)(str(spec_path))
+
+    assert [
+        (finding.code.value, finding.model, finding.property)
+        for finding in returned_findings
+    ] == [("foreign-key-not-indexed", "Employee", "division_id")]
+
+
+PRELOAD_SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "type": "object",
+                "x-tablename": "division",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "employees": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Employee"},
+                    },
+                },
+            },
+            "Employee": {
+                "type": "object",
+                "x-tablename": "employee",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "filename, dump",
+    [
+        pytest.param("spec.json", json.dumps, id="json"),
+        pytest.param("spec.yaml", yaml.dump, id="yaml"),
+    ],
+)
+@pytest.mark.integration
+def test_preload(tmp_path, filename, dump):
+    """
+    GIVEN file with a spec with a relationship
+    WHEN preload is called with the path to the file without freezing
+    THEN all models are constructed with their from_dict converters compiled and
+        their mappers configured.
+    """
+    spec_path = tmp_path / filename
+    spec_path.write_text(dump(PRELOAD_SPEC))
+
+    base, model_factory = open_alchemy.preload(str(spec_path), freeze=False)
+
+    for name in ("Division", "Employee"):
+        model = model_factory(name=name)
+        assert issubclass(model, base)
+        assert "_from_dict_converter" in vars(model)
+        assert sqlalchemy.inspect(model).configured
+
+
+@pytest.mark.integration
+def test_preload_freeze(tmp_path, mocker):
+    """
+    GIVEN file with a spec
+    WHEN preload is called with the path to the file
+    THEN the objects are frozen for the garbage collector.
+    """
+    mock_freeze = mocker.patch("open_alchemy.helpers.preload.gc.freeze")
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(PRELOAD_SPEC))
+
+    open_alchemy.preload(str(spec_path))
+
+    mock_freeze.assert_called_once_with()
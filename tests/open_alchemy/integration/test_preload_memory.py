@@ -0,0 +1,135 @@
+"""Integration tests for the memory of workers forked after preload."""
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import open_alchemy
+
+SMAPS_ROLLUP = pathlib.Path("/proc/self/smaps_rollup")
+MODEL_COUNT = 40
+WORKER_COUNT = 3
+
+# Forks workers and prints the average unique memory of the workers in kB. With
+# preload the models are constructed in the master process, otherwise each worker
+# constructs the models using init_json. Each worker then uses every model and
+# collects garbage before measuring the memory only it uses.
+SCRIPT = """
+import gc
+import os
+import sys
+
+import open_alchemy
+
+mode, spec_filename, names = sys.argv[1], sys.argv[2], sys.argv[3].split(",")
+
+
+def unique_memory():
+    with open("/proc/self/smaps_rollup") as in_file:
+        return sum(
+            int(line.split()[1])
+            for line in in_file
+            if line.startswith(("Private_Clean:", "Private_Dirty:"))
+        )
+
+
+def work():
+    if mode == "lazy":
+        open_alchemy.init_json(spec_filename)
+    from open_alchemy import models
+
+    for name in names:
+        getattr(models, name).from_dict(id=1, name="name 1").to_dict()
+    gc.collect()
+    return unique_memory()
+
+
+if mode == "preload":
+    open_alchemy.preload(spec_filename)
+
+memories = []
+for _ in range(int(sys.argv[4])):
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, str(work()).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as in_file:
+        memories.append(int(in_file.read()))
+    os.waitpid(pid, 0)
+
+print(sum(memories) // len(memories))  # allow-print
+"""
+
+
+def _spec():
+    """Construct a specification with models that refer to the previous model."""
+    schemas = {}
+    for index in range(MODEL_COUNT):
+        properties = {
+            "id": {"type": "integer", "x-primary-key": True},
+            "name": {"type": "string", "maxLength": 256},
+            "created": {"type": "string", "format": "date-time"},
+            "salary": {"type": "number"},
+            "active": {"type": "boolean", "default": True},
+            "status": {"type": "string", "enum": ["pending", "approved"]},
+        }
+        if index > 0:
+            properties["previous"] = {"$ref": f"#/components/schemas/Model{index - 1}"}
+        schemas[f"Model{index}"] = {
+            "type": "object",
+            "x-tablename": f"model_{index}",
+            "properties": properties,
+        }
+    return {"components": {"schemas": schemas}}
+
+
+def _measure(mode, spec_path):
+    """Measure the average unique memory of the workers in kB."""
+    names = ",".join(f"Model{index}" for index in range(MODEL_COUNT))
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            SCRIPT,
+            mode,
+            str(spec_path),
+            names,
+            str(WORKER_COUNT),
+        ],
+        cwd=str(pathlib.Path(open_alchemy.__file__).parent.parent),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return int(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.skipif(
+    not SMAPS_ROLLUP.exists(), reason="measuring unique memory requires Linux"
+)
+@pytest.mark.integration
+@pytest.mark.slow
+def test_preload_worker_memory(tmp_path):
+    """
+    GIVEN specification with many models
+    WHEN workers are forked after preload and, separately, workers are forked that
+        each construct the models
+    THEN the workers forked after preload use less unique memory.
+    """
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(_spec()))
+
+    lazy_memory = _measure("lazy", spec_path)
+    preload_memory = _measure("preload", spec_path)
+
+    print(  # allow-print
+        f"\nunique memory per worker: lazy {lazy_memory} kB, "
+        f"preload {preload_memory} kB"
+    )
+    assert preload_memory < lazy_memory / 2
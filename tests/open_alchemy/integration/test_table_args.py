@@ -1,6 +1,7 @@
 """Integration tests."""
 
 import pytest
+import sqlalchemy
 from sqlalchemy.ext import declarative
 
 import open_alchemy
@@ -127,3 +128,85 @@ def test_table_args_unique(engine, schema_additions, sql, expected_contents):
     results = "\n".join(results_list)
     for expected_content in expected_contents:
         assert expected_content in results
+
+
+GIN_INDEX_SPEC = {
+    "components": {
+        "schemas": {
+            "Table": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "data": {
+                        "type": "object",
+                        "x-json": True,
+                        "x-gin-index": "jsonb_path_ops",
+                    },
+                },
+                "x-tablename": "table",
+                "type": "object",
+            }
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "url, expected_column, expected_index_ddl",
+    [
+        pytest.param(
+            "postgresql://",
+            "data JSONB",
+            [
+                'CREATE INDEX ix_table_data_gin ON "table" USING gin '
+                "(data jsonb_path_ops)"
+            ],
+            id="postgresql",
+        ),
+        pytest.param("mysql://", "data JSON", [], id="mysql"),
+    ],
+)
+@pytest.mark.integration
+def test_table_args_gin_index_ddl(url, expected_column, expected_index_ddl):
+    """
+    GIVEN schema with a JSON property with x-gin-index and a database
+    WHEN the model is constructed and the DDL to create the tables is compiled for
+        the database
+    THEN the column has the expected type and the GIN index is only created on
+        PostgreSQL.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=GIN_INDEX_SPEC, base=base)
+    model_factory(name="Table")
+    statements = []
+    engine = sqlalchemy.create_mock_engine(
+        url,
+        lambda sql, *_, **__: statements.append(
+            str(sql.compile(dialect=engine.dialect)).strip()
+        ),
+    )
+
+    base.metadata.create_all(engine, checkfirst=False)
+
+    table_ddl, *index_ddl = statements
+    assert expected_column in table_ddl
+    assert index_ddl == expected_index_ddl
+
+
+@pytest.mark.integration
+def test_table_args_gin_index_sqlite(engine):
+    """
+    GIVEN schema with a JSON property with x-gin-index
+    WHEN models are constructed and created in SQLite
+    THEN the column is JSON and no index is created.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=GIN_INDEX_SPEC, base=base)
+    model_factory(name="Table")
+
+    base.metadata.create_all(engine)
+
+    results = "\n".join(
+        str(result) for result in engine.execute("SELECT sql FROM sqlite_master")
+    )
+    assert "data JSON" in results
+    assert "INDEX" not in results
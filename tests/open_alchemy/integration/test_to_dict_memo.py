@@ -0,0 +1,171 @@
+"""Integration tests for converting shared and cyclic instances using to_dict."""
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy.utility_base.to_dict import memo
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "employees": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Employee"},
+                    },
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Team": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "team",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "team": {"$ref": "#/components/schemas/Team"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def models():
+    """Construct the models."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=SPEC, base=base)
+    return {name: model_factory(name=name) for name in SPEC["components"]["schemas"]}
+
+
+@pytest.mark.integration
+def test_shared(models):
+    """
+    GIVEN instances that reference the same instance
+    WHEN to_dict is called
+    THEN the dictionary of the shared instance is calculated once and reused.
+    """
+    team = models["Team"](id=1)
+    division = models["Division"](
+        id=1,
+        employees=[
+            models["Employee"](id=1, team=team),
+            models["Employee"](id=2, team=team),
+        ],
+    )
+
+    returned_dict = division.to_dict()
+
+    assert returned_dict == {
+        "id": 1,
+        "employees": [{"id": 1, "team": {"id": 1}}, {"id": 2, "team": {"id": 1}}],
+    }
+    employee_dicts = returned_dict["employees"]
+    assert employee_dicts[0]["team"] is employee_dicts[1]["team"]
+    assert memo.get() is None
+
+
+@pytest.mark.parametrize("cycle", [None, "none", memo.CycleStrategy.NONE])
+@pytest.mark.integration
+def test_cycle_none(models, cycle):
+    """
+    GIVEN instances that form a cycle
+    WHEN to_dict is called with the none cycle strategy
+    THEN the instance that is reached again is converted to None.
+    """
+    division = models["Division"](id=1)
+    team = models["Team"](id=1, division=division)
+    division.employees = [models["Employee"](id=1, team=team)]
+    kwargs = {} if cycle is None else {"cycle": cycle}
+
+    returned_dict = division.to_dict(**kwargs)
+
+    assert returned_dict == {
+        "id": 1,
+        "employees": [{"id": 1, "team": {"id": 1, "division": None}}],
+    }
+    assert memo.get() is None
+
+
+@pytest.mark.integration
+def test_cycle_none_not_reused(models):
+    """
+    GIVEN instance that is reached inside a cycle and again outside of the cycle
+    WHEN to_dict is called with the none cycle strategy
+    THEN the dictionary calculated inside the cycle is not reused outside of it.
+    """
+    cycle_division = models["Division"](id=2)
+    cycle_employee = models["Employee"](
+        id=2, team=models["Team"](id=2, division=cycle_division)
+    )
+    cycle_division.employees = [cycle_employee]
+    division = models["Division"](
+        id=1,
+        employees=[
+            models["Employee"](
+                id=1, team=models["Team"](id=1, division=cycle_division)
+            ),
+            cycle_employee,
+        ],
+    )
+
+    returned_dict = division.to_dict()
+
+    assert returned_dict["employees"] == [
+        {
+            "id": 1,
+            "team": {
+                "id": 1,
+                "division": {
+                    "id": 2,
+                    "employees": [{"id": 2, "team": {"id": 2, "division": None}}],
+                },
+            },
+        },
+        {
+            "id": 2,
+            "team": {"id": 2, "division": {"id": 2, "employees": [None]}},
+        },
+    ]
+
+
+@pytest.mark.integration
+def test_cycle_error(models):
+    """
+    GIVEN instances that form a cycle
+    WHEN to_dict is called with the error cycle strategy
+    THEN InstanceCycleError is raised.
+    """
+    division = models["Division"](id=1)
+    team = models["Team"](id=1, division=division)
+    division.employees = [models["Employee"](id=1, team=team)]
+
+    with pytest.raises(exceptions.InstanceCycleError):
+        division.to_dict(cycle="error")
+
+    assert memo.get() is None
+
+
+@pytest.mark.integration
+def test_cycle_invalid(models):
+    """
+    GIVEN instance
+    WHEN to_dict is called with an invalid cycle strategy
+    THEN ValueError is raised.
+    """
+    division = models["Division"](id=1)
+
+    with pytest.raises(ValueError):
+        division.to_dict(cycle="invalid")
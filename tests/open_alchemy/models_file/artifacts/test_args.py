@@ -27,7 +27,7 @@ def _construct_model_artifacts(properties, backrefs):
 
 
 def _construct_simple_property_artifacts(
-    type_, format_, default, dict_ignore, read_only, required
+    type_, format_, default, dict_ignore, read_only, required, native_uuid=None
 ):
     """Construct the artifacts for a simple property."""
     return schemas_artifacts.types.SimplePropertyArtifacts(
@@ -40,6 +40,7 @@ def _construct_simple_property_artifacts(
             default=default,
             read_only=read_only,
             write_only=None,
+            enum=None,
         ),
         extension=schemas_artifacts.types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -51,6 +52,9 @@ def _construct_simple_property_artifacts(
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=dict_ignore,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=native_uuid,
         ),
         schema={},  # type: ignore
         required=required,
@@ -74,6 +78,7 @@ def _construct_json_property_artifacts():
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={},  # type: ignore
         required=False,
@@ -279,6 +284,31 @@ MAP_DEAULT_TESTS = [
         "datetime.datetime(2000, 1, 1, 1, 1, 1)",
         id="simple string format date-time default defined",
     ),
+    pytest.param(
+        _construct_simple_property_artifacts(
+            type_="string",
+            format_="uuid",
+            default="12345678-1234-5678-1234-567812345678",
+            dict_ignore=None,
+            read_only=None,
+            required=True,
+        ),
+        '"12345678-1234-5678-1234-567812345678"',
+        id="simple string format uuid default defined",
+    ),
+    pytest.param(
+        _construct_simple_property_artifacts(
+            type_="string",
+            format_="uuid",
+            default="12345678-1234-5678-1234-567812345678",
+            dict_ignore=None,
+            read_only=None,
+            required=True,
+            native_uuid=True,
+        ),
+        'uuid.UUID("12345678-1234-5678-1234-567812345678")',
+        id="simple string format native uuid default defined",
+    ),
     pytest.param(
         _construct_simple_property_artifacts(
             type_="boolean",
@@ -38,6 +38,7 @@ def _construct_simple_property_artifacts(required):
             default=None,
             read_only=None,
             write_only=None,
+            enum=None,
         ),
         extension=schemas_artifacts.types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -49,6 +50,9 @@ def _construct_simple_property_artifacts(required):
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=None,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={},  # type: ignore
         required=required,
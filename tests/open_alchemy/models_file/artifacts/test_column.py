@@ -36,6 +36,7 @@ def _construct_simple_property_artifacts(dict_ignore, description):
             default=None,
             read_only=None,
             write_only=None,
+            enum=None,
         ),
         extension=schemas_artifacts.types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -47,6 +48,9 @@ def _construct_simple_property_artifacts(dict_ignore, description):
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=dict_ignore,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={},  # type: ignore
         required=False,
@@ -70,6 +74,7 @@ def _construct_json_property_artifacts():
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={},  # type: ignore
         required=False,
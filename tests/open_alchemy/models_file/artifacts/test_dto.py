@@ -0,0 +1,86 @@
+"""Tests for calculating data transfer object artifacts."""
+
+import pytest
+
+from open_alchemy.models_file import types as models_types
+from open_alchemy.models_file.artifacts import dto as models_dto
+from open_alchemy.schemas import artifacts as schemas_artifacts
+
+
+@pytest.mark.parametrize(
+    "properties, expected_fields",
+    [
+        pytest.param({}, [], id="empty"),
+        pytest.param(
+            {"prop_1": {"type": "integer"}},
+            [
+                models_types.DtoFieldArtifacts(
+                    name="prop_1", type="typing.Optional[int]", nullable=True
+                )
+            ],
+            id="single nullable",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "string", "format": "date", "nullable": False}},
+            [
+                models_types.DtoFieldArtifacts(
+                    name="prop_1", type="datetime.date", nullable=False
+                )
+            ],
+            id="single not nullable",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "object", "x-json": True}},
+            [
+                models_types.DtoFieldArtifacts(
+                    name="prop_1", type="typing.Any", nullable=True
+                )
+            ],
+            id="json",
+        ),
+        pytest.param(
+            {
+                "prop_1": {"type": "integer", "writeOnly": True},
+                "prop_2": {"type": "integer", "x-dict-ignore": True},
+            },
+            [],
+            id="excluded",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer"}, "prop_2": {"type": "boolean"}},
+            [
+                models_types.DtoFieldArtifacts(
+                    name="prop_1", type="typing.Optional[int]", nullable=True
+                ),
+                models_types.DtoFieldArtifacts(
+                    name="prop_2", type="typing.Optional[bool]", nullable=True
+                ),
+            ],
+            id="multiple",
+        ),
+    ],
+)
+@pytest.mark.models_file
+def test_calculate(properties, expected_fields):
+    """
+    GIVEN schema artifacts of a model with properties
+    WHEN calculate is called with the artifacts
+    THEN the expected data transfer object field artifacts are returned.
+    """
+    schemas = {
+        "Model": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True, "writeOnly": True},
+                **properties,
+            },
+        }
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=False
+    )["Model"]
+
+    returned_fields = models_dto.calculate(artifacts=artifacts)
+
+    assert returned_fields == expected_fields
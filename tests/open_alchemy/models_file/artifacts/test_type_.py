@@ -1,11 +1,17 @@
 """Tests for type_."""
 
+import sys
+
 import pytest
 
 from open_alchemy import types
 from open_alchemy.models_file.artifacts import type_ as artifacts_type
 from open_alchemy.schemas import artifacts as schemas_artifacts
 
+_EXPECTED_LITERAL = "typing.Literal"
+if sys.version_info[1] < 8:
+    _EXPECTED_LITERAL = "typing_extensions.Literal"
+
 
 def _construct_simple_artifacts(
     *,
@@ -15,7 +21,11 @@ def _construct_simple_artifacts(
     generated=None,
     default=None,
     required=False,
-    server_default=None
+    server_default=None,
+    binary_encoding=None,
+    enum=None,
+    enum_storage=None,
+    native_uuid=None,
 ):
     """Construct the artifacts for a simple property."""
     return schemas_artifacts.types.SimplePropertyArtifacts(
@@ -28,6 +38,7 @@ def _construct_simple_artifacts(
             default=default,
             read_only=None,
             write_only=None,
+            enum=enum,
         ),
         extension=schemas_artifacts.types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -39,6 +50,9 @@ def _construct_simple_artifacts(
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=None,
+            binary_encoding=binary_encoding,
+            enum_storage=enum_storage,
+            native_uuid=native_uuid,
         ),
         schema={},  # type: ignore
         required=required,
@@ -62,6 +76,7 @@ def _construct_json_artifacts(required=False):
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={},  # type: ignore
         required=required,
@@ -227,6 +242,35 @@ def _construct_backref_property_artifacts(sub_type):
             "datetime.datetime",
             id="simple string date-time format",
         ),
+        pytest.param(
+            _construct_simple_artifacts(type_="string", format_="uuid", nullable=False),
+            "str",
+            id="simple string uuid format",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", format_="uuid", nullable=False, native_uuid=True
+            ),
+            "uuid.UUID",
+            id="simple string uuid format native",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", enum=["a", "b"], nullable=False
+            ),
+            "str",
+            id="simple string enum",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string",
+                enum=["a", "b"],
+                enum_storage="small-integer",
+                nullable=False,
+            ),
+            f'{_EXPECTED_LITERAL}["a", "b"]',
+            id="simple string enum x-enum-storage",
+        ),
         pytest.param(
             _construct_simple_artifacts(type_="boolean", nullable=False),
             "bool",
@@ -407,6 +451,20 @@ def test_model(artifacts, expected_type):
             "typing.Optional[str]",
             id="simple binary",
         ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", format_="binary", binary_encoding="base64"
+            ),
+            "typing.Optional[str]",
+            id="simple binary base64",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", format_="binary", binary_encoding="bytes"
+            ),
+            "typing.Optional[bytes]",
+            id="simple binary bytes",
+        ),
         pytest.param(
             _construct_simple_artifacts(type_="string", format_="date"),
             "typing.Optional[str]",
@@ -417,6 +475,25 @@ def test_model(artifacts, expected_type):
             "typing.Optional[str]",
             id="simple date-time",
         ),
+        pytest.param(
+            _construct_simple_artifacts(type_="string", format_="uuid"),
+            "typing.Optional[str]",
+            id="simple uuid",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", format_="uuid", native_uuid=True
+            ),
+            "typing.Optional[str]",
+            id="simple native uuid",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", enum=["a", "b"], enum_storage="native"
+            ),
+            f'typing.Optional[{_EXPECTED_LITERAL}["a", "b"]]',
+            id="simple enum x-enum-storage",
+        ),
         pytest.param(
             _construct_json_artifacts(),
             "typing.Any",
@@ -536,6 +613,20 @@ def test_arg_init(nullable, required, default, expected_type):
             'typing.Sequence["RefModelDict"]',
             id="relationship many-to-many",
         ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", format_="binary", required=True
+            ),
+            "typing.Union[str, bytes, bytearray, memoryview]",
+            id="binary",
+        ),
+        pytest.param(
+            _construct_simple_artifacts(
+                type_="string", format_="binary", required=False
+            ),
+            "typing.Optional[typing.Union[str, bytes, bytearray, memoryview]]",
+            id="binary not required",
+        ),
     ],
 )
 @pytest.mark.models_file
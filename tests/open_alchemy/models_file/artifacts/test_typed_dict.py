@@ -40,6 +40,7 @@ def _construct_simple_property_artifacts(
             default=None,
             read_only=None,
             write_only=write_only,
+            enum=None,
         ),
         extension=schemas_artifacts.types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -51,6 +52,9 @@ def _construct_simple_property_artifacts(
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=dict_ignore,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={},  # type: ignore
         required=required,
@@ -74,6 +78,7 @@ def _construct_json_property_artifacts(write_only):
             foreign_key=None,
             kwargs=None,
             foreign_key_kwargs=None,
+            gin_index=None,
         ),
         schema={},  # type: ignore
         required=False,
@@ -0,0 +1,113 @@
+"""Tests for data transfer object source generation."""
+
+import pytest
+
+from open_alchemy.models_file import types
+from open_alchemy.models_file.model import source as model_source
+
+_DtoArtifacts = types.DtoArtifacts
+_DtoFieldArtifacts = types.DtoFieldArtifacts
+
+_METHODS = '''
+    @classmethod
+    def from_row(cls, row: typing.Any) -> "TModelDto":
+        """
+        Construct from a row with the values keyed by the name of the property.
+
+        Returns:
+            Data transfer object based on the row.
+
+        """
+        ...
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Convert to a dictionary in the same way as the model.
+
+        Returns:
+            Dictionary based on the data transfer object.
+
+        """
+        ...
+
+
+ModelDto: typing.Type[TModelDto] = models.Model.Dto  # type: ignore'''
+
+
+@pytest.mark.parametrize(
+    "artifacts, expected_source",
+    [
+        pytest.param(
+            _DtoArtifacts(name="Model", fields=[], parent_cls="Parent"),
+            '''
+
+class TModelDto(Parent):
+    """Data transfer object protocol for Model."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        ...
+'''
+            + _METHODS,
+            id="empty",
+        ),
+        pytest.param(
+            _DtoArtifacts(
+                name="Model",
+                fields=[
+                    _DtoFieldArtifacts(name="col_1", type="type_1", nullable=False)
+                ],
+                parent_cls="Parent",
+            ),
+            '''
+
+class TModelDto(Parent):
+    """Data transfer object protocol for Model."""
+
+    # Model properties
+    col_1: type_1
+
+    def __init__(self, *, col_1: type_1) -> None:
+        """Construct."""
+        ...
+'''
+            + _METHODS,
+            id="single not nullable",
+        ),
+        pytest.param(
+            _DtoArtifacts(
+                name="Model",
+                fields=[
+                    _DtoFieldArtifacts(name="col_1", type="type_1", nullable=True),
+                    _DtoFieldArtifacts(name="col_2", type="type_2", nullable=False),
+                ],
+                parent_cls="Parent",
+            ),
+            '''
+
+class TModelDto(Parent):
+    """Data transfer object protocol for Model."""
+
+    # Model properties
+    col_1: type_1
+    col_2: type_2
+
+    def __init__(self, *, col_1: type_1 = None, col_2: type_2) -> None:
+        """Construct."""
+        ...
+'''
+            + _METHODS,
+            id="multiple nullable",
+        ),
+    ],
+)
+@pytest.mark.models_file
+def test_dto(artifacts, expected_source):
+    """
+    GIVEN artifacts for a data transfer object
+    WHEN dto is called with the artifacts
+    THEN the source code for the data transfer object protocol is returned.
+    """
+    source = model_source.dto(artifacts=artifacts)
+
+    assert source == expected_source
@@ -11,8 +11,43 @@ _ColumnArtifacts = types.ColumnArtifacts
 _ColumnArgArtifacts = types.ColumnArgArtifacts
 _TypedDictArtifacts = types.TypedDictArtifacts
 _TypedDictClassArtifacts = types.TypedDictClassArtifacts
+_DtoArtifacts = types.DtoArtifacts
 _ModelArtifacts = types.ModelArtifacts
 
+_DTO_SOURCE = '''
+
+
+class TModelDto(Parent):
+    """Data transfer object protocol for Model."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        ...
+
+    @classmethod
+    def from_row(cls, row: typing.Any) -> "TModelDto":
+        """
+        Construct from a row with the values keyed by the name of the property.
+
+        Returns:
+            Data transfer object based on the row.
+
+        """
+        ...
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Convert to a dictionary in the same way as the model.
+
+        Returns:
+            Dictionary based on the data transfer object.
+
+        """
+        ...
+
+
+ModelDto: typing.Type[TModelDto] = models.Model.Dto  # type: ignore'''
+
 
 @pytest.mark.parametrize(
     "artifacts, expected_source",
@@ -37,6 +72,7 @@ _ModelArtifacts = types.ModelArtifacts
                         parent_class="typing.TypedDict",
                     ),
                 ),
+                dto=_DtoArtifacts(name="Model", fields=[], parent_cls="Parent"),
             ),
             '''
 
@@ -98,8 +134,183 @@ class TModel(Parent):
         """
         ...
 
+    def update_from_dict(self, **kwargs: typing.Any) -> None:
+        """
+        Update the instance in place from a dictionary (eg. a PATCH payload).
+
+        Args:
+            kwargs: The values to update the instance with.
+
+        """
+        ...
+
+    @classmethod
+    def precompile(cls) -> None:
+        """Compile what the model otherwise compiles the first time it is used."""
+        ...
+
+    @classmethod
+    def parallel_from_dicts(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Check and convert dictionaries in worker processes.
+
+        Returns:
+            The values for the columns of each row.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Insert rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> typing.Any:
+        """
+        Insert or update rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted and updated.
+
+        """
+        ...
+
+    @classmethod
+    def rows_to_dicts(
+        cls, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert rows with the values of the columns to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def select_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Query rows selecting only the columns and convert them to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        session: typing.Any,
+        after: typing.Optional[str] = None,
+        limit: int = 100,
+        order_by: typing.Optional[typing.Iterable[str]] = None,
+        stmt: typing.Any = None,
+        dicts: bool = False,
+    ) -> typing.Any:
+        """
+        Query a page of rows after the last row of the previous page.
+
+        Returns:
+            The items of the page and the cursor of the next page.
+
+        """
+        ...
+
+    @classmethod
+    def to_columns(
+        cls,
+        items: typing.Iterable[typing.Any],
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instances or rows to a column for each property.
+
+        Returns:
+            The column of each property.
+
+        """
+        ...
+
+    @classmethod
+    def stream_binary(
+        cls,
+        session: typing.Any,
+        name: str,
+        ident: typing.Any,
+        *,
+        chunk_size: int = 1048576,
+    ) -> typing.Iterator[bytes]:
+        """
+        Stream the value of a binary property in chunks.
+
+        Returns:
+            The chunks of the value.
+
+        """
+        ...
+
+    @classmethod
+    def to_dict_load_options(
+        cls, depth: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict accesses.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
+    @classmethod
+    def load_only_options(
+        cls,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load what to_dict converts.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
 
-Model: typing.Type[TModel] = models.Model  # type: ignore''',
+Model: typing.Type[TModel] = models.Model  # type: ignore'''
+            + _DTO_SOURCE,
         ),
         (
             _ModelArtifacts(
@@ -130,6 +341,7 @@ Model: typing.Type[TModel] = models.Model  # type: ignore''',
                         parent_class="typing.TypedDict",
                     ),
                 ),
+                dto=_DtoArtifacts(name="Model", fields=[], parent_cls="Parent"),
             ),
             '''
 
@@ -211,8 +423,183 @@ class TModel(Parent):
         """
         ...
 
+    def update_from_dict(self, **kwargs: typing.Any) -> None:
+        """
+        Update the instance in place from a dictionary (eg. a PATCH payload).
+
+        Args:
+            kwargs: The values to update the instance with.
+
+        """
+        ...
+
+    @classmethod
+    def precompile(cls) -> None:
+        """Compile what the model otherwise compiles the first time it is used."""
+        ...
+
+    @classmethod
+    def parallel_from_dicts(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Check and convert dictionaries in worker processes.
+
+        Returns:
+            The values for the columns of each row.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Insert rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> typing.Any:
+        """
+        Insert or update rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted and updated.
+
+        """
+        ...
+
+    @classmethod
+    def rows_to_dicts(
+        cls, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert rows with the values of the columns to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def select_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Query rows selecting only the columns and convert them to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        session: typing.Any,
+        after: typing.Optional[str] = None,
+        limit: int = 100,
+        order_by: typing.Optional[typing.Iterable[str]] = None,
+        stmt: typing.Any = None,
+        dicts: bool = False,
+    ) -> typing.Any:
+        """
+        Query a page of rows after the last row of the previous page.
+
+        Returns:
+            The items of the page and the cursor of the next page.
+
+        """
+        ...
+
+    @classmethod
+    def to_columns(
+        cls,
+        items: typing.Iterable[typing.Any],
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instances or rows to a column for each property.
+
+        Returns:
+            The column of each property.
+
+        """
+        ...
+
+    @classmethod
+    def stream_binary(
+        cls,
+        session: typing.Any,
+        name: str,
+        ident: typing.Any,
+        *,
+        chunk_size: int = 1048576,
+    ) -> typing.Iterator[bytes]:
+        """
+        Stream the value of a binary property in chunks.
+
+        Returns:
+            The chunks of the value.
+
+        """
+        ...
+
+    @classmethod
+    def to_dict_load_options(
+        cls, depth: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict accesses.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
+    @classmethod
+    def load_only_options(
+        cls,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load what to_dict converts.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
 
-Model: typing.Type[TModel] = models.Model  # type: ignore''',
+Model: typing.Type[TModel] = models.Model  # type: ignore'''
+            + _DTO_SOURCE,
         ),
         (
             _ModelArtifacts(
@@ -243,6 +630,7 @@ Model: typing.Type[TModel] = models.Model  # type: ignore''',
                         props=[], empty=True, name=None, parent_class=None
                     ),
                 ),
+                dto=_DtoArtifacts(name="Model", fields=[], parent_cls="Parent"),
             ),
             '''
 
@@ -324,8 +712,183 @@ class TModel(Parent):
         """
         ...
 
+    def update_from_dict(self, **kwargs: typing.Any) -> None:
+        """
+        Update the instance in place from a dictionary (eg. a PATCH payload).
+
+        Args:
+            kwargs: The values to update the instance with.
+
+        """
+        ...
+
+    @classmethod
+    def precompile(cls) -> None:
+        """Compile what the model otherwise compiles the first time it is used."""
+        ...
+
+    @classmethod
+    def parallel_from_dicts(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Check and convert dictionaries in worker processes.
+
+        Returns:
+            The values for the columns of each row.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Insert rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> typing.Any:
+        """
+        Insert or update rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted and updated.
+
+        """
+        ...
+
+    @classmethod
+    def rows_to_dicts(
+        cls, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert rows with the values of the columns to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def select_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Query rows selecting only the columns and convert them to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        session: typing.Any,
+        after: typing.Optional[str] = None,
+        limit: int = 100,
+        order_by: typing.Optional[typing.Iterable[str]] = None,
+        stmt: typing.Any = None,
+        dicts: bool = False,
+    ) -> typing.Any:
+        """
+        Query a page of rows after the last row of the previous page.
+
+        Returns:
+            The items of the page and the cursor of the next page.
+
+        """
+        ...
+
+    @classmethod
+    def to_columns(
+        cls,
+        items: typing.Iterable[typing.Any],
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instances or rows to a column for each property.
+
+        Returns:
+            The column of each property.
+
+        """
+        ...
+
+    @classmethod
+    def stream_binary(
+        cls,
+        session: typing.Any,
+        name: str,
+        ident: typing.Any,
+        *,
+        chunk_size: int = 1048576,
+    ) -> typing.Iterator[bytes]:
+        """
+        Stream the value of a binary property in chunks.
+
+        Returns:
+            The chunks of the value.
+
+        """
+        ...
+
+    @classmethod
+    def to_dict_load_options(
+        cls, depth: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict accesses.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
+    @classmethod
+    def load_only_options(
+        cls,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load what to_dict converts.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
 
-Model: typing.Type[TModel] = models.Model  # type: ignore''',
+Model: typing.Type[TModel] = models.Model  # type: ignore'''
+            + _DTO_SOURCE,
         ),
         (
             _ModelArtifacts(
@@ -368,6 +931,7 @@ Model: typing.Type[TModel] = models.Model  # type: ignore''',
                         parent_class="_ModelDictBase",
                     ),
                 ),
+                dto=_DtoArtifacts(name="Model", fields=[], parent_cls="Parent"),
             ),
             '''
 
@@ -459,8 +1023,183 @@ class TModel(Parent):
         """
         ...
 
+    def update_from_dict(self, **kwargs: typing.Any) -> None:
+        """
+        Update the instance in place from a dictionary (eg. a PATCH payload).
+
+        Args:
+            kwargs: The values to update the instance with.
+
+        """
+        ...
+
+    @classmethod
+    def precompile(cls) -> None:
+        """Compile what the model otherwise compiles the first time it is used."""
+        ...
+
+    @classmethod
+    def parallel_from_dicts(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Check and convert dictionaries in worker processes.
+
+        Returns:
+            The values for the columns of each row.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Insert rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        ...
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+    ) -> typing.Any:
+        """
+        Insert or update rows from dictionaries.
+
+        Returns:
+            The number of rows that were inserted and updated.
+
+        """
+        ...
+
+    @classmethod
+    def rows_to_dicts(
+        cls, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert rows with the values of the columns to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def select_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Query rows selecting only the columns and convert them to dictionaries.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        ...
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        session: typing.Any,
+        after: typing.Optional[str] = None,
+        limit: int = 100,
+        order_by: typing.Optional[typing.Iterable[str]] = None,
+        stmt: typing.Any = None,
+        dicts: bool = False,
+    ) -> typing.Any:
+        """
+        Query a page of rows after the last row of the previous page.
+
+        Returns:
+            The items of the page and the cursor of the next page.
+
+        """
+        ...
+
+    @classmethod
+    def to_columns(
+        cls,
+        items: typing.Iterable[typing.Any],
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instances or rows to a column for each property.
+
+        Returns:
+            The column of each property.
+
+        """
+        ...
+
+    @classmethod
+    def stream_binary(
+        cls,
+        session: typing.Any,
+        name: str,
+        ident: typing.Any,
+        *,
+        chunk_size: int = 1048576,
+    ) -> typing.Iterator[bytes]:
+        """
+        Stream the value of a binary property in chunks.
+
+        Returns:
+            The chunks of the value.
+
+        """
+        ...
+
+    @classmethod
+    def to_dict_load_options(
+        cls, depth: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict accesses.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
+    @classmethod
+    def load_only_options(
+        cls,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load what to_dict converts.
+
+        Returns:
+            The loader options.
+
+        """
+        ...
+
 
-Model: typing.Type[TModel] = models.Model  # type: ignore''',
+Model: typing.Type[TModel] = models.Model  # type: ignore'''
+            + _DTO_SOURCE,
         ),
     ],
     ids=["empty", "required empty", "not required empty", "full"],
@@ -82,6 +82,44 @@ from open_alchemy import models
 Base = models.Base  # type: ignore
 model 1 datetime.
 model 2 datetime.
+""",
+        ),
+        (
+            ["model 1 uuid.", "model 2 datetime."],
+            f"""{_DOCSTRING}
+# pylint: disable=no-member,super-init-not-called,unused-argument
+
+import datetime
+import typing
+import uuid
+
+import sqlalchemy{_ADDITIONAL_IMPORT}
+from sqlalchemy import orm
+
+from open_alchemy import models
+
+Base = models.Base  # type: ignore
+model 1 uuid.
+model 2 datetime.
+""",
+        ),
+        (
+            ["model 1 datetime. uuid.", "model 2"],
+            f"""{_DOCSTRING}
+# pylint: disable=no-member,super-init-not-called,unused-argument
+
+import datetime
+import typing
+import uuid
+
+import sqlalchemy{_ADDITIONAL_IMPORT}
+from sqlalchemy import orm
+
+from open_alchemy import models
+
+Base = models.Base  # type: ignore
+model 1 datetime. uuid.
+model 2
 """,
         ),
     ],
@@ -90,6 +128,8 @@ model 2 datetime.
         "multiple models",
         "contains datetime",
         "contains duplicate imports",
+        "contains uuid",
+        "contains all imports",
     ],
 )
 @pytest.mark.models_file
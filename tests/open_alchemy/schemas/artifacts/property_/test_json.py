@@ -337,6 +337,30 @@ GET_TESTS = [
         {"key_3": "value 3"},
         id="allOf x-foreign-key-kwargs",
     ),
+    pytest.param(
+        None,
+        {},
+        {},
+        "extension.gin_index",
+        None,
+        id="x-gin-index undefined",
+    ),
+    pytest.param(
+        None,
+        {"x-gin-index": True},
+        {},
+        "extension.gin_index",
+        True,
+        id="x-gin-index",
+    ),
+    pytest.param(
+        None,
+        {"$ref": "#/components/schemas/RefSchema"},
+        {"RefSchema": {"x-gin-index": "jsonb_path_ops"}},
+        "extension.gin_index",
+        "jsonb_path_ops",
+        id="$ref x-gin-index",
+    ),
 ]
 
 
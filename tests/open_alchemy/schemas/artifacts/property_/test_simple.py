@@ -73,6 +73,38 @@ GET_TESTS = [
         {**DEFAULT_SCHEMA, "x-dict-ignore": True},
         id="schema keep x-dict-ignore",
     ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "x-binary-encoding": "base64"},
+        {},
+        "schema",
+        {**DEFAULT_SCHEMA, "x-binary-encoding": "base64"},
+        id="schema keep x-binary-encoding",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "format": "uuid", "x-native-uuid": True},
+        {},
+        "schema",
+        {**DEFAULT_SCHEMA, "format": "uuid", "x-native-uuid": True},
+        id="schema keep x-native-uuid",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "enum": ["a", "b"]},
+        {},
+        "schema",
+        {**DEFAULT_SCHEMA},
+        id="schema remove enum",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "enum": ["a", "b"], "x-enum-storage": "small-integer"},
+        {},
+        "schema",
+        {**DEFAULT_SCHEMA, "enum": ["a", "b"], "x-enum-storage": "small-integer"},
+        id="schema keep enum and x-enum-storage",
+    ),
     pytest.param(
         None,
         {**DEFAULT_SCHEMA, "type": "type 1"},
@@ -675,6 +707,70 @@ GET_TESTS = [
         None,
         id="allOf x-dict-ignore",
     ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA},
+        {},
+        "extension.binary_encoding",
+        None,
+        id="x-binary-encoding undefined",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "x-binary-encoding": "bytes"},
+        {},
+        "extension.binary_encoding",
+        "bytes",
+        id="x-binary-encoding",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA},
+        {},
+        "extension.native_uuid",
+        None,
+        id="x-native-uuid undefined",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "format": "uuid", "x-native-uuid": True},
+        {},
+        "extension.native_uuid",
+        True,
+        id="x-native-uuid",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA},
+        {},
+        "open_api.enum",
+        None,
+        id="enum undefined",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "enum": ["a", "b"]},
+        {},
+        "open_api.enum",
+        ["a", "b"],
+        id="enum",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA},
+        {},
+        "extension.enum_storage",
+        None,
+        id="x-enum-storage undefined",
+    ),
+    pytest.param(
+        None,
+        {**DEFAULT_SCHEMA, "x-enum-storage": "native"},
+        {},
+        "extension.enum_storage",
+        "native",
+        id="x-enum-storage",
+    ),
 ]
 
 
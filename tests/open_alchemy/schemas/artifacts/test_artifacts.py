@@ -390,6 +390,7 @@ def _construct_simple_property_artifacts(type_, required):
             default=None,
             read_only=None,
             write_only=None,
+            enum=None,
         ),
         extension=artifacts.types.ExtensionSimplePropertyArtifacts(
             primary_key=False,
@@ -401,6 +402,9 @@ def _construct_simple_property_artifacts(type_, required):
             kwargs=None,
             foreign_key_kwargs=None,
             dict_ignore=None,
+            binary_encoding=None,
+            enum_storage=None,
+            native_uuid=None,
         ),
         schema={"type": type_},
         required=required,
@@ -18,6 +18,7 @@ from open_alchemy.schemas import artifacts
                 default=None,
                 read_only=None,
                 write_only=None,
+                enum=None,
             ),
             {"type": "integer"},
             id="open api opt values None",
@@ -31,6 +32,7 @@ from open_alchemy.schemas import artifacts
                 default="default 1",
                 read_only=False,
                 write_only=True,
+                enum=["a", "b"],
             ),
             {
                 "type": "string",
@@ -40,6 +42,7 @@ from open_alchemy.schemas import artifacts
                 "default": "default 1",
                 "read_only": False,
                 "write_only": True,
+                "enum": ["a", "b"],
             },
             id="open api opt values defined",
         ),
@@ -54,6 +57,9 @@ from open_alchemy.schemas import artifacts
                 kwargs=None,
                 foreign_key_kwargs=None,
                 dict_ignore=None,
+                binary_encoding=None,
+                enum_storage=None,
+                native_uuid=None,
             ),
             {"primary_key": True},
             id="extension opt values None",
@@ -69,6 +75,9 @@ from open_alchemy.schemas import artifacts
                 kwargs={"key_1": "value 1"},
                 foreign_key_kwargs={"key_2": "value 2"},
                 dict_ignore=True,
+                binary_encoding="base64",
+                enum_storage="native",
+                native_uuid=True,
             ),
             {
                 "primary_key": True,
@@ -78,6 +87,9 @@ from open_alchemy.schemas import artifacts
                 "foreign_key": "foreign.key",
                 "kwargs": {"key_1": "value 1"},
                 "foreign_key_kwargs": {"key_2": "value 2"},
+                "binary_encoding": "base64",
+                "enum_storage": "native",
+                "native_uuid": True,
             },
             id="extension opt values defined",
         ),
@@ -93,6 +105,7 @@ from open_alchemy.schemas import artifacts
                     default=None,
                     read_only=None,
                     write_only=None,
+                    enum=None,
                 ),
                 extension=artifacts.types.ExtensionSimplePropertyArtifacts(
                     primary_key=True,
@@ -104,6 +117,9 @@ from open_alchemy.schemas import artifacts
                     kwargs=None,
                     foreign_key_kwargs=None,
                     dict_ignore=None,
+                    binary_encoding=None,
+                    enum_storage=None,
+                    native_uuid=None,
                 ),
                 schema={"type": "integer"},
                 required=True,
@@ -129,6 +145,7 @@ from open_alchemy.schemas import artifacts
                     default=None,
                     read_only=None,
                     write_only=None,
+                    enum=None,
                 ),
                 extension=artifacts.types.ExtensionSimplePropertyArtifacts(
                     primary_key=True,
@@ -140,6 +157,9 @@ from open_alchemy.schemas import artifacts
                     kwargs=None,
                     foreign_key_kwargs=None,
                     dict_ignore=None,
+                    binary_encoding=None,
+                    enum_storage=None,
+                    native_uuid=None,
                 ),
                 schema={"type": "integer"},
                 required=True,
@@ -202,6 +222,7 @@ def test_simple_property_artifacts(artifacts_value, expected_dict):
                 foreign_key=None,
                 kwargs=None,
                 foreign_key_kwargs=None,
+                gin_index=None,
             ),
             {"primary_key": True},
             id="extension opt values None",
@@ -214,6 +235,7 @@ def test_simple_property_artifacts(artifacts_value, expected_dict):
                 foreign_key="foreign.key",
                 kwargs={"key_1": "value 1"},
                 foreign_key_kwargs={"key_2": "value 2"},
+                gin_index="jsonb_path_ops",
             ),
             {
                 "primary_key": True,
@@ -222,6 +244,7 @@ def test_simple_property_artifacts(artifacts_value, expected_dict):
                 "foreign_key": "foreign.key",
                 "kwargs": {"key_1": "value 1"},
                 "foreign_key_kwargs": {"key_2": "value 2"},
+                "gin_index": "jsonb_path_ops",
             },
             id="extension opt values defined",
         ),
@@ -241,6 +264,7 @@ def test_simple_property_artifacts(artifacts_value, expected_dict):
                     foreign_key=None,
                     kwargs=None,
                     foreign_key_kwargs=None,
+                    gin_index=None,
                 ),
                 schema={"type": "integer"},
                 required=True,
@@ -270,6 +294,7 @@ def test_simple_property_artifacts(artifacts_value, expected_dict):
                     foreign_key=None,
                     kwargs=None,
                     foreign_key_kwargs=None,
+                    gin_index=None,
                 ),
                 schema={"type": "integer"},
                 required=True,
@@ -4,6 +4,7 @@ import pytest
 
 from open_alchemy import types
 from open_alchemy.schemas import association
+from open_alchemy.schemas.helpers import index as index_helper
 
 
 class TestCombineDefinedExpectedSchemas:
@@ -358,8 +359,10 @@ class TestCombineDefinedExpectedSchemas:
             and schemas
         THEN the expected schemas are returned.
         """
+        index = index_helper.calculate(schemas=schemas)
+
         returned_schemas = association._combine_defined_expected_schemas(
-            association_schemas=association_schemas, schemas=schemas
+            association_schemas=association_schemas, schemas=schemas, index=index
         )
 
         assert list(returned_schemas) == expected_schemas
@@ -3,6 +3,7 @@
 import pytest
 
 from open_alchemy.schemas import association
+from open_alchemy.schemas.helpers import index as index_helper
 
 
 class TestGetTablenameSchemaNames:
@@ -207,8 +208,10 @@ class TestGetTablenameSchemaNames:
         WHEN _get_tablename_schema_names is called with the schemas and tablenames
         THEN the expected mapping is returned.
         """
+        index = index_helper.calculate(schemas=schemas)
+
         returned_mapping = association._get_tablename_schema_names(
-            schemas=schemas, tablenames=tablenames
+            index=index, tablenames=tablenames
         )
 
         assert returned_mapping == expected_mapping
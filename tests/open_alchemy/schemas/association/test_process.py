@@ -2,7 +2,9 @@
 
 import pytest
 
+from open_alchemy.helpers import inheritance
 from open_alchemy.schemas import association
+from open_alchemy.schemas.helpers import index as index_helper
 
 TESTS = [
     pytest.param({}, {}, id="empty"),
@@ -62,6 +64,7 @@ TESTS = [
                         "type": "string",
                         "x-primary-key": True,
                         "x-foreign-key": "child_schema.child_prop_1",
+                        "x-index": True,
                     },
                 },
                 "required": [
@@ -134,6 +137,7 @@ TESTS = [
                                 "type": "string",
                                 "x-primary-key": True,
                                 "x-foreign-key": "child_schema.child_prop_1",
+                                "x-index": True,
                             },
                         },
                     },
@@ -229,6 +233,7 @@ TESTS = [
                         "type": "string",
                         "x-primary-key": True,
                         "x-foreign-key": "child_schema_1.child_1_prop_1",
+                        "x-index": True,
                     },
                 },
                 "required": [
@@ -249,6 +254,7 @@ TESTS = [
                         "type": "string",
                         "x-primary-key": True,
                         "x-foreign-key": "child_schema_2.child_2_prop_1",
+                        "x-index": True,
                     },
                 },
                 "required": [
@@ -360,6 +366,7 @@ TESTS = [
                         "type": "string",
                         "x-primary-key": True,
                         "x-foreign-key": "child_schema.child_prop_1",
+                        "x-index": True,
                     },
                 },
                 "required": [
@@ -380,6 +387,7 @@ TESTS = [
                         "type": "string",
                         "x-primary-key": True,
                         "x-foreign-key": "child_schema.child_prop_1",
+                        "x-index": True,
                     },
                 },
                 "required": [
@@ -405,3 +413,126 @@ def test_process(schemas, expected_schemas):
     association.process(schemas=schemas)
 
     assert schemas == expected_schemas
+
+
+@pytest.mark.schemas
+@pytest.mark.association
+def test_process_index():
+    """
+    GIVEN schemas with a many-to-many relationship and the index of the schemas
+    WHEN process is called with the schemas and index
+    THEN the association schema is added to the index.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "parent_schema",
+            "properties": {
+                "parent_prop_1": {"type": "integer", "x-primary-key": True},
+                "parent_prop_2": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/RefSchema"},
+                },
+            },
+        },
+        "RefSchema": {
+            "x-tablename": "child_schema",
+            "x-secondary": "association",
+            "properties": {
+                "child_prop_1": {"type": "string", "x-primary-key": True},
+            },
+        },
+    }
+    index = index_helper.calculate(schemas=schemas)
+
+    association.process(schemas=schemas, index=index)
+
+    assert list(index) == ["Schema", "RefSchema", "Association"]
+    assert index["Association"] == index_helper.IndexEntry(
+        tablename="association", parent=None, inheritance_type=inheritance.Type.NONE
+    )
+    assert index == index_helper.calculate(schemas=schemas)
+
+
+@pytest.mark.parametrize(
+    "composite_index, expected_child_schema",
+    [
+        pytest.param(
+            ["parent_schema_parent_prop_1"],
+            {
+                "type": "string",
+                "x-primary-key": True,
+                "x-foreign-key": "child_schema.child_prop_1",
+                "x-index": True,
+            },
+            id="other column",
+        ),
+        pytest.param(
+            ["child_schema_child_prop_1"],
+            {
+                "type": "string",
+                "x-primary-key": True,
+                "x-foreign-key": "child_schema.child_prop_1",
+            },
+            id="child column",
+        ),
+        pytest.param(
+            [{"expressions": ["child_schema_child_prop_1", "created"]}],
+            {
+                "type": "string",
+                "x-primary-key": True,
+                "x-foreign-key": "child_schema.child_prop_1",
+            },
+            id="child column first expression",
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.association
+def test_process_composite_index(composite_index, expected_child_schema):
+    """
+    GIVEN schemas with a many-to-many relationship and a defined association schema
+        with x-composite-index
+    WHEN process is called with the schemas
+    THEN the child property is only indexed if x-composite-index does not already
+        index it and x-composite-index is retained.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "parent_schema",
+            "properties": {
+                "parent_prop_1": {"type": "integer", "x-primary-key": True},
+                "parent_prop_2": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/RefSchema"},
+                },
+            },
+        },
+        "RefSchema": {
+            "x-tablename": "child_schema",
+            "x-secondary": "association",
+            "properties": {
+                "child_prop_1": {"type": "string", "x-primary-key": True},
+            },
+        },
+        "DefinedAssociation": {
+            "type": "object",
+            "x-tablename": "association",
+            "properties": {
+                "parent_schema_parent_prop_1": {
+                    "type": "integer",
+                    "x-primary-key": True,
+                    "x-foreign-key": "parent_schema.parent_prop_1",
+                },
+                "created": {"type": "string", "format": "date-time"},
+            },
+            "x-composite-index": composite_index,
+        },
+    }
+
+    association.process(schemas=schemas)
+
+    expected_schema, defined_schema = schemas["DefinedAssociation"]["allOf"]
+    assert expected_schema["properties"] == {
+        "child_schema_child_prop_1": expected_child_schema
+    }
+    assert defined_schema["x-composite-index"] == composite_index
@@ -4,35 +4,64 @@ import pytest
 
 from open_alchemy.schemas.helpers import association
 
+_PARENT_SCHEMA = {
+    "x-tablename": "parent_table",
+    "properties": {"parent_column": {"type": "parent type", "x-primary-key": True}},
+}
+_REF_SCHEMA = {
+    "x-tablename": "ref_table",
+    "x-secondary": "association",
+    "properties": {"ref_column": {"type": "ref type", "x-primary-key": True}},
+}
+
 SCHEMA_TESTS = [
     pytest.param(
-        {
-            "x-tablename": "parent_table",
-            "properties": {
-                "parent_column": {"type": "parent type", "x-primary-key": True}
-            },
-        },
+        _PARENT_SCHEMA,
         {"items": {"$ref": "#/components/schemas/RefSchema"}},
+        {"RefSchema": _REF_SCHEMA},
+        {"x-index": True},
+        id="items $ref",
+    ),
+    pytest.param(
+        _PARENT_SCHEMA,
+        {"items": {"$ref": "#/components/schemas/RefSchema"}},
+        {"RefSchema": {**_REF_SCHEMA, "x-secondary-index": True}},
+        {"x-index": True},
+        id="items $ref x-secondary-index true",
+    ),
+    pytest.param(
+        _PARENT_SCHEMA,
+        {"items": {"$ref": "#/components/schemas/RefSchema"}},
+        {"RefSchema": {**_REF_SCHEMA, "x-secondary-index": False}},
+        {},
+        id="items $ref x-secondary-index false",
+    ),
+    pytest.param(
+        _PARENT_SCHEMA,
         {
-            "RefSchema": {
-                "x-tablename": "ref_table",
-                "x-secondary": "association",
-                "properties": {
-                    "ref_column": {"type": "ref type", "x-primary-key": True}
-                },
+            "items": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-secondary-index": False},
+                ]
             }
         },
-        id="items $ref",
+        {"RefSchema": {**_REF_SCHEMA, "x-secondary-index": True}},
+        {},
+        id="items allOf x-secondary-index false",
     ),
 ]
 
 
-@pytest.mark.parametrize("parent_schema, property_schema, schemas", SCHEMA_TESTS)
+@pytest.mark.parametrize(
+    "parent_schema, property_schema, schemas, expected_ref_additions", SCHEMA_TESTS
+)
 @pytest.mark.schemas
 @pytest.mark.helper
-def test_schema(parent_schema, property_schema, schemas):
+def test_schema(parent_schema, property_schema, schemas, expected_ref_additions):
     """
-    GIVEN parent and property schema, schemas and expected schema
+    GIVEN parent and property schema, schemas and expected additions to the schema of
+        the property referencing the child
     WHEN calculate_schema is called with the parent and property schema and schemas
     THEN the expected schema is returned.
     """
@@ -55,6 +84,7 @@ def test_schema(parent_schema, property_schema, schemas):
                 "type": "ref type",
                 "x-primary-key": True,
                 "x-foreign-key": "ref_table.ref_column",
+                **expected_ref_additions,
             },
         },
         "required": ["parent_table_parent_column", "ref_table_ref_column"],
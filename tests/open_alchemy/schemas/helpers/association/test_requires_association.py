@@ -1,4 +1,4 @@
-"""Tests for the _requires_association association helper."""
+"""Tests for the requires_association association helper."""
 
 import pytest
 
@@ -6,7 +6,7 @@ from open_alchemy.schemas.helpers import association
 
 
 class TestRequiresAssociation:
-    """Tests for _requires_association."""
+    """Tests for requires_association."""
 
     # pylint: disable=protected-access
 
@@ -32,9 +32,9 @@ class TestRequiresAssociation:
     def test_(schema, schemas, expected_result):
         """
         GIVEN schema, schemas and expected result
-        WHEN _requires_association is called with the schema and schemas
+        WHEN requires_association is called with the schema and schemas
         THEN the expected result is returned.
         """
-        returned_result = association._requires_association(schemas, schema)
+        returned_result = association.requires_association(schemas, schema)
 
         assert returned_result == expected_result
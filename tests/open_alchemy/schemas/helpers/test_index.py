@@ -0,0 +1,112 @@
+"""Tests for the index of the constructable schemas."""
+
+import pytest
+
+from open_alchemy.helpers import inheritance
+from open_alchemy.schemas.helpers import index as index_helper
+
+CALCULATE_TESTS = [
+    pytest.param({}, {}, id="empty"),
+    pytest.param([], {}, id="schemas not dict"),
+    pytest.param({"Schema1": {}}, {}, id="single not constructable"),
+    pytest.param(
+        {"Schema1": {"allOf": [{"$ref": "#/components/schemas/Schema2"}, {}]}},
+        {},
+        id="single missing reference",
+    ),
+    pytest.param(
+        {"Schema1": {"x-tablename": "table 1"}},
+        {
+            "Schema1": index_helper.IndexEntry(
+                tablename="table 1", parent=None, inheritance_type=inheritance.Type.NONE
+            )
+        },
+        id="single",
+    ),
+    pytest.param(
+        {"Schema1": {"x-tablename": True}},
+        {"Schema1": index_helper.IndexEntry(None, None, None)},
+        id="single malformed tablename",
+    ),
+    pytest.param(
+        {"Schema1": {"x-tablename": "table 1", "x-inherits": "Schema2"}},
+        {"Schema1": index_helper.IndexEntry("table 1", None, None)},
+        id="single parent missing",
+    ),
+    pytest.param(
+        {
+            "Schema2": {"x-tablename": "table 2"},
+            "Schema1": {
+                "allOf": [
+                    {"x-inherits": True, "x-tablename": "table 1"},
+                    {"$ref": "#/components/schemas/Schema2"},
+                ]
+            },
+        },
+        {
+            "Schema2": index_helper.IndexEntry(
+                tablename="table 2", parent=None, inheritance_type=inheritance.Type.NONE
+            ),
+            "Schema1": index_helper.IndexEntry(
+                tablename="table 1",
+                parent="Schema2",
+                inheritance_type=inheritance.Type.JOINED_TABLE,
+            ),
+        },
+        id="joined table inheritance",
+    ),
+    pytest.param(
+        {
+            "Schema1": {
+                "allOf": [
+                    {"x-inherits": "Schema2"},
+                    {"$ref": "#/components/schemas/Schema2"},
+                ]
+            },
+            "Schema2": {"x-tablename": "table 2"},
+        },
+        {
+            "Schema1": index_helper.IndexEntry(
+                tablename="table 2",
+                parent="Schema2",
+                inheritance_type=inheritance.Type.SINGLE_TABLE,
+            ),
+            "Schema2": index_helper.IndexEntry(
+                tablename="table 2", parent=None, inheritance_type=inheritance.Type.NONE
+            ),
+        },
+        id="single table inheritance",
+    ),
+]
+
+
+@pytest.mark.parametrize("schemas, expected_index", CALCULATE_TESTS)
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_calculate(schemas, expected_index):
+    """
+    GIVEN schemas and expected index
+    WHEN calculate is called with the schemas
+    THEN the expected index is returned in the order of the schemas.
+    """
+    returned_index = index_helper.calculate(schemas=schemas)
+
+    assert returned_index == expected_index
+    assert list(returned_index) == list(expected_index)
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_update():
+    """
+    GIVEN index and schemas with a schema that is not in the index
+    WHEN update is called with the index, schemas and name of the schema
+    THEN the schema is added to the index.
+    """
+    schemas = {"Schema1": {"x-tablename": "table 1"}}
+    index = index_helper.calculate(schemas=schemas)
+    schemas["Schema2"] = {"x-tablename": "table 2"}
+
+    index_helper.update(index=index, schemas=schemas, name="Schema2")
+
+    assert index == index_helper.calculate(schemas=schemas)
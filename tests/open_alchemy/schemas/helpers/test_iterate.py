@@ -2,6 +2,7 @@
 
 import pytest
 
+from open_alchemy.schemas.helpers import index as index_helper
 from open_alchemy.schemas.helpers import iterate
 
 
@@ -68,6 +69,25 @@ def test_constructable(schemas, expected_schemas):
     assert list(returned_schemas) == expected_schemas
 
 
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_constructable_index():
+    """
+    GIVEN schemas and index with a subset of the schemas
+    WHEN constructable is called with the schemas and index
+    THEN the names and schemas in the index are returned.
+    """
+    schemas = {
+        "Schema1": {"x-tablename": "table 1"},
+        "Schema2": {"x-tablename": "table 2"},
+    }
+    index = {"Schema2": index_helper.IndexEntry("table 2", None, None)}
+
+    returned_schemas = iterate.constructable(schemas=schemas, index=index)
+
+    assert list(returned_schemas) == [("Schema2", {"x-tablename": "table 2"})]
+
+
 @pytest.mark.parametrize(
     "schemas, expected_schemas",
     [
@@ -0,0 +1,179 @@
+"""Tests for relationships schemas processing."""
+
+import copy
+
+import pytest
+
+from open_alchemy.schemas import association
+from open_alchemy.schemas import backref
+from open_alchemy.schemas import foreign_key
+from open_alchemy.schemas import relationships
+from open_alchemy.schemas.helpers import index as index_helper
+
+SCHEMAS_TESTS = [
+    pytest.param({}, id="empty"),
+    pytest.param(
+        {
+            "Schema": {
+                "type": "object",
+                "x-tablename": "schema",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            }
+        },
+        id="no relationships",
+    ),
+    pytest.param(
+        {
+            "Schema": {
+                "type": "object",
+                "x-tablename": "schema",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "ref_many_to_one": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/RefSchema"},
+                            {"x-backref": "schemas_many_to_one"},
+                        ]
+                    },
+                    "ref_one_to_many": {
+                        "type": "array",
+                        "items": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/RefSchema"},
+                                {"x-backref": "schema_one_to_many"},
+                            ]
+                        },
+                    },
+                    "ref_many_to_many": {
+                        "type": "array",
+                        "items": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/RefSchema"},
+                                {"x-secondary": "schema_ref_schema"},
+                                {"x-backref": "schemas_many_to_many"},
+                            ]
+                        },
+                    },
+                },
+            },
+            "RefSchema": {
+                "type": "object",
+                "x-tablename": "ref_schema",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+            },
+        },
+        id="many-to-one, one-to-many and many-to-many",
+    ),
+    pytest.param(
+        {
+            "Schema": {
+                "type": "object",
+                "x-tablename": "schema",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "ref_many_to_one_1": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/RefSchema1"},
+                            {"x-backref": "schemas_1"},
+                        ]
+                    },
+                    "ref_many_to_one_2": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/RefSchema2"},
+                            {"x-backref": "schemas_2"},
+                        ]
+                    },
+                },
+            },
+            "RefSchema2": {
+                "type": "object",
+                "x-tablename": "ref_schema_2",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            },
+            "RefSchema1": {
+                "type": "object",
+                "x-tablename": "ref_schema_1",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "ref_many_to_one": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/RefSchema2"},
+                            {"x-backref": "ref_schemas_1"},
+                        ]
+                    },
+                },
+            },
+        },
+        id="multiple schemas",
+    ),
+    pytest.param(
+        {
+            "Schema": {
+                "type": "object",
+                "x-tablename": "schema",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "refs": {
+                        "type": "array",
+                        "items": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/RefSchema"},
+                                {"x-secondary": "schema_ref_schema"},
+                            ]
+                        },
+                    },
+                },
+            },
+            "RefSchema": {
+                "type": "object",
+                "x-tablename": "ref_schema",
+                "properties": {"id": {"type": "string", "x-primary-key": True}},
+            },
+            "SchemaRefSchema": {
+                "type": "object",
+                "x-tablename": "schema_ref_schema",
+                "properties": {
+                    "schema_id": {"type": "integer", "description": "parent"},
+                },
+            },
+        },
+        id="many-to-many association defined",
+    ),
+]
+
+
+@pytest.mark.parametrize("schemas", SCHEMAS_TESTS)
+@pytest.mark.schemas
+def test_process(schemas):
+    """
+    GIVEN schemas
+    WHEN process is called with the schemas
+    THEN the schemas are the same as after calling the back reference, foreign key and
+        association pre-processors one after the other.
+    """
+    expected_schemas = copy.deepcopy(schemas)
+    backref.process(schemas=expected_schemas)
+    foreign_key.process(schemas=expected_schemas)
+    association.process(schemas=expected_schemas)
+
+    relationships.process(schemas=schemas)
+
+    assert schemas == expected_schemas
+
+
+@pytest.mark.parametrize("schemas", SCHEMAS_TESTS)
+@pytest.mark.schemas
+def test_process_index(schemas):
+    """
+    GIVEN schemas and their index
+    WHEN process is called with the schemas and index
+    THEN the index is updated to match the processed schemas.
+    """
+    index = index_helper.calculate(schemas=schemas)
+
+    relationships.process(schemas=schemas, index=index)
+
+    assert index == index_helper.calculate(schemas=schemas)
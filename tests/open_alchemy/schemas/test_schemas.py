@@ -164,6 +164,7 @@ def test_process_association():
                     "type": "string",
                     "x-primary-key": True,
                     "x-foreign-key": "child_schema.child_prop_1",
+                    "x-index": True,
                 },
             },
             "required": [
@@ -480,6 +480,72 @@ TESTS = [
         (False, "many-to-many relationship does not support x-foreign-key-column"),
         id="many to many foreign-key-column allOf",
     ),
+    pytest.param(
+        {"type": "array", "items": {"$ref": "#/components/schemas/RefSchema"}},
+        {
+            "RefSchema": {
+                "type": "object",
+                "x-tablename": "ref_schema",
+                "x-secondary": "schema_ref_schema",
+                "x-secondary-index": False,
+            }
+        },
+        (True, None),
+        id="many to many $ref secondary-index",
+    ),
+    pytest.param(
+        {
+            "type": "array",
+            "items": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-secondary": "schema_ref_schema"},
+                    {"x-secondary-index": "False"},
+                ]
+            },
+        },
+        {"RefSchema": {"type": "object", "x-tablename": "ref_schema"}},
+        (
+            False,
+            "malformed schema :: The x-secondary-index property must be of type "
+            "boolean. ",
+        ),
+        id="many to many secondary-index allOf not boolean",
+    ),
+    pytest.param(
+        {
+            "type": "array",
+            "items": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-secondary-index": False},
+                ]
+            },
+        },
+        {"RefSchema": {"type": "object", "x-tablename": "ref_schema"}},
+        (False, "x-secondary-index can only be defined alongside x-secondary"),
+        id="many to many secondary-index without secondary",
+    ),
+    pytest.param(
+        {
+            "type": "array",
+            "x-secondary-index": False,
+            "items": {"$ref": "#/components/schemas/RefSchema"},
+        },
+        {
+            "RefSchema": {
+                "type": "object",
+                "x-tablename": "ref_schema",
+                "x-secondary": "schema_ref_schema",
+            }
+        },
+        (
+            False,
+            "x-secondary-index cannot be defined on x-to-many relationship property "
+            "root",
+        ),
+        id="many to many secondary-index on root",
+    ),
     pytest.param(
         {
             "type": "array",
@@ -152,6 +152,23 @@ CHECK_TESTS = [
         id="integer x-primary-key prefer local not boolean",
     ),
     pytest.param({"x-primary-key": True}, {}, (True, None), id="x-primary-key"),
+    pytest.param(
+        {"x-gin-index": "other"},
+        {},
+        (
+            False,
+            "malformed schema :: A x-gin-index value must be a boolean or one of "
+            "jsonb_ops or jsonb_path_ops. ",
+        ),
+        id="malformed x-gin-index",
+    ),
+    pytest.param({"x-gin-index": True}, {}, (True, None), id="x-gin-index"),
+    pytest.param(
+        {"x-gin-index": "jsonb_path_ops"},
+        {},
+        (True, None),
+        id="x-gin-index operator class",
+    ),
     pytest.param(
         {"x-autoincrement": "False"},
         {},
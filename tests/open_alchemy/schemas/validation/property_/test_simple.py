@@ -417,6 +417,162 @@ TESTS = [
         (False, "boolean does not support x-autoincrement"),
         id="boolean x-autoincrement",
     ),
+    pytest.param(
+        {"type": "string", "format": "binary", "x-binary-encoding": "other"},
+        {},
+        (
+            False,
+            "malformed schema :: A x-binary-encoding value must be one of utf-8, "
+            "base64 or bytes. ",
+        ),
+        id="string binary x-binary-encoding invalid",
+    ),
+    pytest.param(
+        {"type": "string", "format": "binary", "x-binary-encoding": "base64"},
+        {},
+        (True, None),
+        id="string binary x-binary-encoding",
+    ),
+    pytest.param(
+        {"type": "string", "x-binary-encoding": "base64"},
+        {},
+        (False, "string does not support x-binary-encoding"),
+        id="string x-binary-encoding",
+    ),
+    pytest.param(
+        {"type": "integer", "x-binary-encoding": "base64"},
+        {},
+        (False, "integer does not support x-binary-encoding"),
+        id="integer x-binary-encoding",
+    ),
+    pytest.param(
+        {"type": "string", "enum": "a"},
+        {},
+        (False, "malformed schema :: An enum value must be of type list. "),
+        id="enum not list",
+    ),
+    pytest.param(
+        {"type": "string", "enum": ["a"], "x-enum-storage": "other"},
+        {},
+        (
+            False,
+            "malformed schema :: A x-enum-storage value must be one of native or "
+            "small-integer. ",
+        ),
+        id="string x-enum-storage invalid",
+    ),
+    pytest.param(
+        {"type": "string", "enum": ["a", "b"], "x-enum-storage": "native"},
+        {},
+        (True, None),
+        id="string x-enum-storage native",
+    ),
+    pytest.param(
+        {"type": "string", "enum": ["a", "b"], "x-enum-storage": "small-integer"},
+        {},
+        (True, None),
+        id="string x-enum-storage small-integer",
+    ),
+    pytest.param(
+        {"type": "integer", "enum": [1, 2], "x-enum-storage": "native"},
+        {},
+        (False, "integer does not support x-enum-storage"),
+        id="integer x-enum-storage",
+    ),
+    pytest.param(
+        {
+            "type": "string",
+            "format": "date",
+            "enum": ["2000-01-01"],
+            "x-enum-storage": "native",
+        },
+        {},
+        (False, "string date format does not support x-enum-storage"),
+        id="string format x-enum-storage",
+    ),
+    pytest.param(
+        {"type": "string", "x-enum-storage": "native"},
+        {},
+        (False, "x-enum-storage requires an enum with values"),
+        id="string x-enum-storage enum missing",
+    ),
+    pytest.param(
+        {"type": "string", "enum": [], "x-enum-storage": "native"},
+        {},
+        (False, "x-enum-storage requires an enum with values"),
+        id="string x-enum-storage enum empty",
+    ),
+    pytest.param(
+        {"type": "string", "enum": ["a", 1], "x-enum-storage": "native"},
+        {},
+        (False, "x-enum-storage requires string enum values"),
+        id="string x-enum-storage enum not string",
+    ),
+    pytest.param(
+        {"type": "string", "enum": ["a", "a"], "x-enum-storage": "native"},
+        {},
+        (False, "x-enum-storage requires unique enum values"),
+        id="string x-enum-storage enum duplicate",
+    ),
+    pytest.param(
+        {
+            "type": "string",
+            "enum": [str(value) for value in range(32769)],
+            "x-enum-storage": "small-integer",
+        },
+        {},
+        (False, "x-enum-storage small-integer supports at most 32768 enum values"),
+        id="string x-enum-storage small-integer too many values",
+    ),
+    pytest.param(
+        {
+            "type": "string",
+            "enum": [str(value) for value in range(32769)],
+            "x-enum-storage": "native",
+        },
+        {},
+        (True, None),
+        id="string x-enum-storage native many values",
+    ),
+    pytest.param(
+        {"type": "string", "format": "uuid", "x-native-uuid": True},
+        {},
+        (True, None),
+        id="string uuid x-native-uuid",
+    ),
+    pytest.param(
+        {"type": "string", "x-native-uuid": True},
+        {},
+        (False, "string does not support x-native-uuid"),
+        id="string x-native-uuid",
+    ),
+    pytest.param(
+        {"type": "string", "format": "date", "x-native-uuid": False},
+        {},
+        (False, "string date format does not support x-native-uuid"),
+        id="string date format x-native-uuid",
+    ),
+    pytest.param(
+        {"type": "string", "format": "uuid", "x-native-uuid": "True"},
+        {},
+        (
+            False,
+            "malformed schema :: A x-native-uuid value must be of type boolean. ",
+        ),
+        id="string uuid x-native-uuid not boolean",
+    ),
+    pytest.param(
+        {"type": "integer", "x-gin-index": True},
+        {},
+        (False, "integer does not support x-gin-index"),
+        id="integer x-gin-index",
+    ),
+    pytest.param(
+        {"type": "string", "x-gin-index": "jsonb_path_ops"},
+        {},
+        (False, "string does not support x-gin-index"),
+        id="string x-gin-index",
+    ),
     pytest.param(
         {"type": "integer", "x-index": "True"},
         {},
@@ -471,6 +471,32 @@ TESTS = [
         (True, None),
         id="x-mixins string",
     ),
+    pytest.param(
+        {
+            "x-to-dict-cache": "True",
+            "x-tablename": "schema",
+            "type": "object",
+            "properties": {"key": {}},
+        },
+        {},
+        (
+            False,
+            "malformed schema :: The x-to-dict-cache property must be of type "
+            "boolean. ",
+        ),
+        id="x-to-dict-cache not boolean",
+    ),
+    pytest.param(
+        {
+            "x-to-dict-cache": True,
+            "x-tablename": "schema",
+            "type": "object",
+            "properties": {"key": {}},
+        },
+        {},
+        (True, None),
+        id="x-to-dict-cache boolean",
+    ),
     pytest.param(
         {
             "x-kwargs": True,
@@ -3,8 +3,10 @@
 import functools
 
 import pytest
+import sqlalchemy
 
 from open_alchemy import exceptions
+from open_alchemy.schemas import artifacts as schemas_artifacts
 from open_alchemy.table_args import factory
 
 
@@ -386,3 +388,130 @@ def test_index_factory():
 
     assert index_1.expressions == ["column 1"]
     assert index_2.expressions == ["column 2"]
+
+
+def _calculate_artifacts(properties):
+    """Calculate the artifacts of a model with properties."""
+    schemas = {
+        "Model": {"x-tablename": "table_1", "type": "object", "properties": properties}
+    }
+    return schemas_artifacts.get_from_schemas(schemas=schemas, stay_within_model=True)[
+        "Model"
+    ]
+
+
+@pytest.mark.parametrize(
+    "properties, expected_statements",
+    [
+        pytest.param({"prop_1": {"type": "integer"}}, [], id="simple"),
+        pytest.param({"prop_1": {"type": "object", "x-json": True}}, [], id="json"),
+        pytest.param(
+            {"prop_1": {"type": "object", "x-json": True, "x-gin-index": False}},
+            [],
+            id="json x-gin-index false",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "object", "x-json": True, "x-gin-index": True}},
+            ["CREATE INDEX ix_table_1_prop_1_gin ON %(fullname)s USING gin (prop_1)"],
+            id="json x-gin-index true",
+        ),
+        pytest.param(
+            {
+                "prop_1": {
+                    "type": "object",
+                    "x-json": True,
+                    "x-gin-index": "jsonb_path_ops",
+                }
+            },
+            [
+                "CREATE INDEX ix_table_1_prop_1_gin ON %(fullname)s USING gin "
+                "(prop_1 jsonb_path_ops)"
+            ],
+            id="json x-gin-index operator class",
+        ),
+        pytest.param(
+            {"Prop 1%": {"type": "object", "x-json": True, "x-gin-index": True}},
+            [
+                'CREATE INDEX "ix_table_1_Prop 1%%_gin" ON %(fullname)s USING gin '
+                '("Prop 1%%")'
+            ],
+            id="json x-gin-index quoted",
+        ),
+        pytest.param(
+            {
+                "prop_1": {"type": "object", "x-json": True, "x-gin-index": True},
+                "prop_2": {"type": "object", "x-json": True, "x-gin-index": True},
+            },
+            [
+                "CREATE INDEX ix_table_1_prop_1_gin ON %(fullname)s USING gin "
+                "(prop_1)",
+                "CREATE INDEX ix_table_1_prop_2_gin ON %(fullname)s USING gin "
+                "(prop_2)",
+            ],
+            id="multiple json x-gin-index",
+        ),
+    ],
+)
+@pytest.mark.table_args
+def test_gin_index_factory(properties, expected_statements):
+    """
+    GIVEN artifacts of a model with properties
+    WHEN gin_index_factory is called with the artifacts
+    THEN DDL with the expected statements that is only executed on PostgreSQL is
+        returned.
+    """
+    artifacts = _calculate_artifacts(properties)
+
+    returned_ddls = factory.gin_index_factory(artifacts=artifacts)
+
+    assert [ddl.statement for ddl in returned_ddls] == expected_statements
+    assert all(ddl.dialect == "postgresql" for ddl in returned_ddls)
+
+
+@pytest.mark.parametrize(
+    "url, expected_index_ddl",
+    [
+        pytest.param(
+            "postgresql://",
+            [
+                "CREATE INDEX ix_table_1_prop_1_gin ON schema_1.table_1 USING gin "
+                "(prop_1 jsonb_path_ops)"
+            ],
+            id="postgresql",
+        ),
+        pytest.param("mysql://", [], id="mysql"),
+        pytest.param("sqlite://", [], id="sqlite"),
+    ],
+)
+@pytest.mark.table_args
+def test_gin_index_factory_ddl(url, expected_index_ddl):
+    """
+    GIVEN artifacts of a model with a JSON property with x-gin-index and a database
+    WHEN gin_index_factory is called with the artifacts and the DDL of a table that
+        listens to the returned DDL is compiled for the database
+    THEN the GIN index is only created on PostgreSQL.
+    """
+    artifacts = _calculate_artifacts(
+        {"prop_1": {"type": "object", "x-json": True, "x-gin-index": "jsonb_path_ops"}}
+    )
+    ddls = factory.gin_index_factory(artifacts=artifacts)
+    metadata = sqlalchemy.MetaData()
+    sqlalchemy.Table(
+        "table_1",
+        metadata,
+        sqlalchemy.Column("prop_1", sqlalchemy.JSON),
+        schema="schema_1",
+        listeners=[("after_create", ddl) for ddl in ddls],
+    )
+    statements = []
+    engine = sqlalchemy.create_mock_engine(
+        url,
+        lambda sql, *_, **__: statements.append(
+            str(sql.compile(dialect=engine.dialect)).strip()
+        ),
+    )
+
+    metadata.create_all(engine, checkfirst=False)
+
+    assert statements[0].startswith("CREATE TABLE schema_1.table_1")
+    assert statements[1:] == expected_index_ddl
@@ -5,6 +5,7 @@ from sqlalchemy import schema as sa_schema
 
 from open_alchemy import table_args
 from open_alchemy import types
+from open_alchemy.schemas import artifacts as schemas_artifacts
 
 
 @pytest.mark.parametrize(
@@ -56,6 +57,41 @@ def test_construct(schema, expected_args):
     )
 
 
+@pytest.mark.table_args
+def test_construct_artifacts():
+    """
+    GIVEN schema and artifacts of a model with a JSON property with x-gin-index
+    WHEN construct is called with the schema and artifacts
+    THEN a tuple with the composite index and kwargs with a listener that creates the
+        GIN index after the table is created is returned.
+    """
+    schema = {
+        "x-tablename": "table_1",
+        "type": "object",
+        "properties": {
+            "prop_1": {"type": "object", "x-json": True, "x-gin-index": True}
+        },
+        "x-composite-index": ["prop_1"],
+        "x-schema-name": "schema_1",
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas={"Model": schema}, stay_within_model=True
+    )["Model"]
+
+    returned_args = table_args.construct(schema=schema, artifacts=artifacts)
+
+    assert len(returned_args) == 2
+    composite_index, kwargs = returned_args
+    assert isinstance(composite_index, sa_schema.Index)
+    assert composite_index.name is None
+    assert kwargs["schema"] == "schema_1"
+    ((event_name, ddl),) = kwargs["listeners"]
+    assert event_name == "after_create"
+    assert ddl.statement == (
+        "CREATE INDEX ix_table_1_prop_1_gin ON %(fullname)s USING gin (prop_1)"
+    )
+
+
 @pytest.mark.parametrize(
     "schema, expected_kwargs",
     [
@@ -0,0 +1,339 @@
+"""Tests for advise."""
+
+import pytest
+
+from open_alchemy import advise
+from open_alchemy import exceptions
+
+
+def _division(**properties):
+    """Construct the schema of the division model with additional properties."""
+    return {
+        "x-tablename": "division",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            **properties,
+        },
+    }
+
+
+def _employee(division_id=None, **properties):
+    """Construct the schema of the employee model with a division foreign key."""
+    if division_id is None:
+        division_id = {"type": "integer", "x-foreign-key": "division.id"}
+    return {
+        "x-tablename": "employee",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "division_id": division_id,
+            **properties,
+        },
+    }
+
+
+CASES = [
+    pytest.param(
+        {"Model": {**_division(), "x-tablename": "model"}},
+        [],
+        id="no problems",
+    ),
+    pytest.param(
+        {"Division": _division(), "Employee": _employee()},
+        [(advise.Code.FOREIGN_KEY_NOT_INDEXED, "Employee", "division_id")],
+        id="foreign key not indexed",
+    ),
+    pytest.param(
+        {
+            "Division": _division(),
+            "Employee": _employee(
+                {"type": "integer", "x-foreign-key": "division.id", "x-index": True}
+            ),
+        },
+        [],
+        id="foreign key x-index",
+    ),
+    pytest.param(
+        {
+            "Division": _division(),
+            "Employee": _employee(
+                {"type": "integer", "x-foreign-key": "division.id", "x-unique": True}
+            ),
+        },
+        [],
+        id="foreign key x-unique",
+    ),
+    pytest.param(
+        {
+            "Division": _division(),
+            "Employee": {
+                "x-tablename": "employee",
+                "type": "object",
+                "properties": {
+                    "division_id": {
+                        "type": "integer",
+                        "x-foreign-key": "division.id",
+                        "x-primary-key": True,
+                    },
+                    "id": {"type": "integer", "x-primary-key": True},
+                },
+            },
+        },
+        [],
+        id="foreign key first primary key",
+    ),
+    pytest.param(
+        {
+            "Division": _division(),
+            "Employee": {
+                **_employee(),
+                "x-composite-index": ["division_id", "id"],
+            },
+        },
+        [],
+        id="foreign key leads x-composite-index",
+    ),
+    pytest.param(
+        {
+            "Division": _division(),
+            "Employee": {
+                **_employee(),
+                "x-composite-index": ["id", "division_id"],
+            },
+        },
+        [(advise.Code.FOREIGN_KEY_NOT_INDEXED, "Employee", "division_id")],
+        id="foreign key second in x-composite-index",
+    ),
+    pytest.param(
+        {
+            "Division": _division(),
+            "Employee": {
+                **_employee(),
+                "x-composite-unique": ["division_id", "id"],
+            },
+        },
+        [],
+        id="foreign key leads x-composite-unique",
+    ),
+    pytest.param(
+        {
+            "Division": _division(
+                employees={
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Employee"},
+                }
+            ),
+            "Employee": {
+                "x-tablename": "employee",
+                "type": "object",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            },
+        },
+        [(advise.Code.ONE_TO_MANY_NOT_INDEXED, "Division", "employees")],
+        id="one-to-many not indexed",
+    ),
+    pytest.param(
+        {
+            "Division": _division(
+                employees={
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Employee"},
+                }
+            ),
+            "Employee": {
+                "x-tablename": "employee",
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division_employees_id": {
+                        "type": "integer",
+                        "x-foreign-key": "division.id",
+                        "x-index": True,
+                    },
+                },
+            },
+        },
+        [],
+        id="one-to-many indexed",
+    ),
+    pytest.param(
+        {
+            "Division": _division(
+                code={"type": "string", "maxLength": 8, "x-index": False}
+            ),
+            "Employee": _employee(
+                {"type": "string", "maxLength": 8, "x-index": True},
+                division={
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Division"},
+                        {"x-foreign-key-column": "code"},
+                    ]
+                },
+            ),
+        },
+        [(advise.Code.RELATIONSHIP_TARGET_NOT_INDEXED, "Employee", "division")],
+        id="relationship target not indexed",
+    ),
+    pytest.param(
+        {
+            "Division": _division(
+                code={"type": "string", "maxLength": 8, "x-unique": True}
+            ),
+            "Employee": _employee(
+                {"type": "string", "maxLength": 8, "x-index": True},
+                division={
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Division"},
+                        {"x-foreign-key-column": "code"},
+                    ]
+                },
+            ),
+        },
+        [],
+        id="relationship target indexed",
+    ),
+    pytest.param(
+        {
+            "Model": {
+                "x-tablename": "model",
+                "type": "object",
+                "properties": {"id": {"type": "string", "x-primary-key": True}},
+            }
+        },
+        [(advise.Code.UNBOUNDED_STRING_PRIMARY_KEY, "Model", "id")],
+        id="unbounded string primary key",
+    ),
+    pytest.param(
+        {
+            "Model": {
+                "x-tablename": "model",
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "maxLength": 32, "x-primary-key": True}
+                },
+            }
+        },
+        [],
+        id="string primary key maxLength",
+    ),
+    pytest.param(
+        {
+            "Model": {
+                "x-tablename": "model",
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "format": "uuid", "x-primary-key": True}
+                },
+            }
+        },
+        [(advise.Code.UNBOUNDED_STRING_PRIMARY_KEY, "Model", "id")],
+        id="string primary key uuid",
+    ),
+    pytest.param(
+        {
+            "Model": {
+                "x-tablename": "model",
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "string",
+                        "format": "uuid",
+                        "x-native-uuid": True,
+                        "x-primary-key": True,
+                    }
+                },
+            }
+        },
+        [],
+        id="string primary key native uuid",
+    ),
+    pytest.param(
+        {
+            "Model": {
+                "x-tablename": "model",
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "data": {"type": "object", "x-json": True},
+                },
+                "x-composite-index": ["name", "data"],
+            }
+        },
+        [(advise.Code.JSON_COMPOSITE_INDEX, "Model", "data")],
+        id="json composite index",
+    ),
+]
+
+
+@pytest.mark.parametrize("schemas, expected_findings", CASES)
+@pytest.mark.advise
+def test_advise(schemas, expected_findings):
+    """
+    GIVEN schemas
+    WHEN advise is called with the schemas
+    THEN the expected findings are returned.
+    """
+    returned_findings = advise.advise(schemas=schemas)
+
+    assert [
+        (finding.code, finding.model, finding.property) for finding in returned_findings
+    ] == expected_findings
+    for finding in returned_findings:
+        assert finding.message
+
+
+@pytest.mark.advise
+def test_finding_to_dict():
+    """
+    GIVEN finding
+    WHEN to_dict is called
+    THEN the dictionary representation of the finding is returned.
+    """
+    finding = advise.Finding(
+        code=advise.Code.FOREIGN_KEY_NOT_INDEXED,
+        model="Employee",
+        property="division_id",
+        message="message 1",
+    )
+
+    returned_dict = finding.to_dict()
+
+    assert returned_dict == {
+        "code": "foreign-key-not-indexed",
+        "model": "Employee",
+        "property": "division_id",
+        "message": "message 1",
+    }
+
+
+@pytest.mark.advise
+def test_execute():
+    """
+    GIVEN specification with a foreign key that is not indexed
+    WHEN execute is called with the specification
+    THEN the finding for the foreign key is returned.
+    """
+    spec = {
+        "components": {"schemas": {"Division": _division(), "Employee": _employee()}}
+    }
+
+    returned_findings = advise.execute(spec=spec)
+
+    assert [finding.code for finding in returned_findings] == [
+        advise.Code.FOREIGN_KEY_NOT_INDEXED
+    ]
+
+
+@pytest.mark.advise
+def test_execute_invalid():
+    """
+    GIVEN specification that is not valid
+    WHEN execute is called with the specification
+    THEN MalformedSchemaError is raised.
+    """
+    spec = {"components": {"schemas": {"Model": {"type": "object"}}}}
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        advise.execute(spec=spec)
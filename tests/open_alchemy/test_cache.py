@@ -1,7 +1,10 @@
 """Tests for the cache."""
 
+import datetime
 import json
+import marshal
 import pathlib
+from unittest import mock
 
 import pytest
 
@@ -357,3 +360,189 @@ def test_schemas_are_valid_cache_exists(tmpdir, cache_contents):
     cache.schemas_are_valid(str(spec_file))
 
     assert cache.schemas_valid(str(spec_file)) is True
+
+
+@pytest.mark.cache
+def test_calculate_spec_cache_path():
+    """
+    GIVEN spec path
+    WHEN calculate_spec_cache_path is called with the spec path
+    THEN the expected path is returned.
+    """
+    returned_path = cache.calculate_spec_cache_path(pathlib.Path("parent/some.file"))
+
+    assert str(returned_path) == str(
+        pathlib.Path(
+            f"parent/__open_alchemy_{cache.calculate_hash('some.file')}_spec_cache__"
+        )
+    )
+
+
+@pytest.mark.cache
+def test_spec_get_cache_missing(tmpdir):
+    """
+    GIVEN spec file without spec cache
+    WHEN spec_get is called with the filename
+    THEN None is returned.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+
+    returned_spec = cache.spec_get(filename=str(spec_file), file_hash="hash 1")
+
+    assert returned_spec is None
+
+
+@pytest.mark.cache
+def test_spec_get_cache_is_folder(tmpdir):
+    """
+    GIVEN spec file with spec cache that is a folder
+    WHEN spec_get is called with the filename
+    THEN None is returned.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    cache.calculate_spec_cache_path(spec_file).mkdir()
+
+    returned_spec = cache.spec_get(filename=str(spec_file), file_hash="hash 1")
+
+    assert returned_spec is None
+
+
+@pytest.mark.parametrize(
+    "cache_contents",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b"not marshal", id="invalid marshal"),
+        pytest.param(marshal.dumps(True), id="not dict"),
+        pytest.param(marshal.dumps({}), id="empty dict"),
+        pytest.param(
+            marshal.dumps({"version": marshal.version, "spec": {}}), id="hash missing"
+        ),
+        pytest.param(
+            marshal.dumps({"hash": "hash 2", "version": marshal.version, "spec": {}}),
+            id="hash different",
+        ),
+        pytest.param(
+            marshal.dumps({"hash": "hash 1", "version": -1, "spec": {}}),
+            id="version different",
+        ),
+        pytest.param(
+            marshal.dumps({"hash": "hash 1", "version": marshal.version}),
+            id="spec missing",
+        ),
+    ],
+)
+@pytest.mark.cache
+def test_spec_get_invalid(tmpdir, cache_contents):
+    """
+    GIVEN spec file with spec cache with invalid contents
+    WHEN spec_get is called with the filename
+    THEN None is returned.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    cache.calculate_spec_cache_path(spec_file).write_bytes(cache_contents)
+
+    returned_spec = cache.spec_get(filename=str(spec_file), file_hash="hash 1")
+
+    assert returned_spec is None
+
+
+@pytest.mark.cache
+def test_spec_set(tmpdir):
+    """
+    GIVEN spec file
+    WHEN spec_set is called with the filename and a spec
+    THEN spec_get returns the spec for the same hash and None for a different hash.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    spec = {"components": {"schemas": {"Schema": {"type": "object"}}}}
+
+    cache.spec_set(filename=str(spec_file), file_hash="hash 1", spec=spec)
+
+    assert cache.spec_get(filename=str(spec_file), file_hash="hash 1") == spec
+    assert cache.spec_get(filename=str(spec_file), file_hash="hash 2") is None
+
+
+@pytest.mark.cache
+def test_spec_set_cache_folder(tmpdir):
+    """
+    GIVEN spec file and spec cache that is a folder
+    WHEN spec_set is called with the filename and a spec
+    THEN spec_get returns the spec.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    cache_file = cache.calculate_spec_cache_path(spec_file)
+    cache_file.mkdir()
+    (cache_file / "some.file").write_text("some contents")
+    spec = {"key": "value"}
+
+    cache.spec_set(filename=str(spec_file), file_hash="hash 1", spec=spec)
+
+    assert cache.spec_get(filename=str(spec_file), file_hash="hash 1") == spec
+
+
+@pytest.mark.cache
+def test_spec_set_not_marshallable(tmpdir):
+    """
+    GIVEN spec file and spec with a value that cannot be marshalled
+    WHEN spec_set is called with the filename and the spec
+    THEN the spec cache is not created.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    spec = {"key": datetime.date(2000, 1, 1)}
+
+    cache.spec_set(filename=str(spec_file), file_hash="hash 1", spec=spec)
+
+    assert not cache.calculate_spec_cache_path(spec_file).exists()
+
+
+@pytest.mark.parametrize(
+    "create_folder",
+    [
+        pytest.param(False, id="cache missing"),
+        pytest.param(True, id="cache folder"),
+    ],
+)
+@pytest.mark.cache
+def test_spec_set_write_error(tmpdir, monkeypatch, create_folder):
+    """
+    GIVEN spec file in a folder where the spec cache cannot be written
+    WHEN spec_set is called with the filename and a spec
+    THEN no exception is raised and spec_get returns None.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    if create_folder:
+        cache.calculate_spec_cache_path(spec_file).mkdir()
+        monkeypatch.setattr(
+            cache.shutil,
+            "rmtree",
+            mock.MagicMock(side_effect=PermissionError("read-only")),
+        )
+    monkeypatch.setattr(
+        pathlib.Path,
+        "write_bytes",
+        mock.MagicMock(side_effect=PermissionError("read-only")),
+    )
+
+    cache.spec_set(filename=str(spec_file), file_hash="hash 1", spec={"key": "value"})
+
+    assert cache.spec_get(filename=str(spec_file), file_hash="hash 1") is None
+
+
+@pytest.mark.cache
+def test_spec_get_read_error(tmpdir, monkeypatch):
+    """
+    GIVEN spec cache that cannot be read
+    WHEN spec_get is called with the filename
+    THEN None is returned.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.yaml"
+    cache.spec_set(filename=str(spec_file), file_hash="hash 1", spec={"key": "value"})
+    monkeypatch.setattr(
+        pathlib.Path,
+        "read_bytes",
+        mock.MagicMock(side_effect=PermissionError("not readable")),
+    )
+
+    returned_spec = cache.spec_get(filename=str(spec_file), file_hash="hash 1")
+
+    assert returned_spec is None
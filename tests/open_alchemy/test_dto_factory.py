@@ -0,0 +1,582 @@
+"""Tests for the data transfer object factory."""
+# pylint: disable=protected-access
+
+import datetime
+import types
+import uuid
+
+import pytest
+
+from open_alchemy import dto_factory
+from open_alchemy.schemas import artifacts as schemas_artifacts
+
+
+def _calculate_artifacts(properties, required=None):
+    """Calculate the artifacts of a model with properties."""
+    schema = {"x-tablename": "table 1", "type": "object", "properties": properties}
+    if required is not None:
+        schema["required"] = required
+    schemas = {"Model": schema}
+    return schemas_artifacts.get_from_schemas(schemas=schemas, stay_within_model=True)[
+        "Model"
+    ]
+
+
+@pytest.mark.parametrize(
+    "properties, required, expected_fields",
+    [
+        pytest.param(
+            {"prop_1": {"type": "integer"}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=False)],
+            id="simple",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer"}},
+            ["prop_1"],
+            [dto_factory.Field(name="prop_1", nullable=False, return_none=True)],
+            id="simple required",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer", "nullable": True}},
+            ["prop_1"],
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=True)],
+            id="simple required nullable",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer", "nullable": False}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=False, return_none=False)],
+            id="simple not nullable",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer", "default": 1}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=False, return_none=False)],
+            id="simple default",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer", "x-autoincrement": True}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=False, return_none=False)],
+            id="simple autoincrement",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "string", "format": "date"}},
+            None,
+            [
+                dto_factory.Field(
+                    name="prop_1",
+                    nullable=True,
+                    return_none=False,
+                    to_dict="{}.isoformat()",
+                )
+            ],
+            id="simple date",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "string", "format": "uuid"}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=False)],
+            id="simple uuid",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "string", "format": "uuid", "x-native-uuid": True}},
+            None,
+            [
+                dto_factory.Field(
+                    name="prop_1",
+                    nullable=True,
+                    return_none=False,
+                    to_dict="str({})",
+                )
+            ],
+            id="simple native uuid",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "string", "format": "binary"}},
+            None,
+            [
+                dto_factory.Field(
+                    name="prop_1",
+                    nullable=True,
+                    return_none=False,
+                    to_dict="str({}, 'utf-8')",
+                )
+            ],
+            id="simple binary",
+        ),
+        pytest.param(
+            {
+                "prop_1": {
+                    "type": "string",
+                    "format": "binary",
+                    "x-binary-encoding": "base64",
+                }
+            },
+            None,
+            [
+                dto_factory.Field(
+                    name="prop_1",
+                    nullable=True,
+                    return_none=False,
+                    to_dict="base64.b64encode({}).decode('ascii')",
+                )
+            ],
+            id="simple binary base64",
+        ),
+        pytest.param(
+            {
+                "prop_1": {
+                    "type": "string",
+                    "format": "binary",
+                    "x-binary-encoding": "bytes",
+                }
+            },
+            None,
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=False)],
+            id="simple binary bytes",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "string", "format": "password"}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=False)],
+            id="simple other format",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer", "writeOnly": True}},
+            None,
+            [],
+            id="simple writeOnly",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "integer", "x-dict-ignore": True}},
+            None,
+            [],
+            id="simple x-dict-ignore",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "object", "x-json": True}},
+            None,
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=False)],
+            id="json",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "object", "x-json": True}},
+            ["prop_1"],
+            [dto_factory.Field(name="prop_1", nullable=True, return_none=True)],
+            id="json required",
+        ),
+        pytest.param(
+            {"prop_1": {"type": "object", "x-json": True, "writeOnly": True}},
+            None,
+            [],
+            id="json writeOnly",
+        ),
+        pytest.param(
+            {
+                "prop_1": {"type": "integer"},
+                "prop_2": {"type": "string"},
+            },
+            None,
+            [
+                dto_factory.Field(name="prop_1", nullable=True, return_none=False),
+                dto_factory.Field(name="prop_2", nullable=True, return_none=False),
+            ],
+            id="multiple",
+        ),
+    ],
+)
+@pytest.mark.model
+def test_calculate_fields(properties, required, expected_fields):
+    """
+    GIVEN artifacts of a model with properties
+    WHEN calculate_fields is called with the artifacts
+    THEN the expected fields are returned.
+    """
+    artifacts = _calculate_artifacts(properties, required)
+
+    returned_fields = dto_factory.calculate_fields(artifacts=artifacts)
+
+    assert returned_fields == expected_fields
+
+
+@pytest.mark.model
+def test_calculate_fields_relationship():
+    """
+    GIVEN artifacts of a model with a relationship
+    WHEN calculate_fields is called with the artifacts
+    THEN the relationship is not included.
+    """
+    schemas = {
+        "Model": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                "ref": {"$ref": "#/components/schemas/RefModel"},
+            },
+        },
+        "RefModel": {
+            "x-tablename": "ref_table",
+            "type": "object",
+            "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        },
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )["Model"]
+
+    returned_fields = dto_factory.calculate_fields(artifacts=artifacts)
+
+    assert [field.name for field in returned_fields] == ["id"]
+
+
+@pytest.fixture
+def dto():
+    """Construct the DTO class for a model with properties of each kind."""
+    artifacts = _calculate_artifacts(
+        {
+            "id": {"type": "integer", "x-primary-key": True, "x-autoincrement": True},
+            "name": {"type": "string"},
+            "joined": {"type": "string", "format": "date"},
+            "updated": {"type": "string", "format": "date-time", "nullable": True},
+            "photo": {"type": "string", "format": "binary"},
+            "settings": {"type": "object", "x-json": True},
+        },
+        ["name"],
+    )
+    return dto_factory.dto_factory(name="Model", artifacts=artifacts, parent=None)
+
+
+@pytest.mark.model
+def test_dto_factory(dto):
+    """
+    GIVEN artifacts of a model
+    WHEN dto_factory is called with the artifacts
+    THEN a class with slots for the properties and without a __dict__ is returned.
+    """
+    assert dto.__name__ == "ModelDto"
+    assert dto.__doc__ == "Data transfer object for the Model model."
+    assert dto.__slots__ == ("id", "name", "joined", "updated", "photo", "settings")
+
+    instance = dto(id=1, name="name 1")
+
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.other = "value"  # pylint: disable=attribute-defined-outside-init
+    assert instance.id == 1
+    assert instance.name == "name 1"
+    assert instance.joined is None
+
+
+@pytest.mark.model
+def test_dto_factory_required_argument(dto):
+    """
+    GIVEN DTO class of a model
+    WHEN it is constructed without a value for a property that is not nullable
+    THEN TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        dto(id=1)
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        pytest.param({"id": 1, "name": "name 1"}, id="dictionary"),
+        pytest.param(
+            types.SimpleNamespace(_mapping={"id": 1, "name": "name 1"}), id="row"
+        ),
+    ],
+)
+@pytest.mark.model
+def test_dto_factory_from_row(dto, row):
+    """
+    GIVEN DTO class of a model and row
+    WHEN from_row is called with the row
+    THEN an instance with the values of the row and None for missing values is
+        returned.
+    """
+    instance = dto.from_row(row)
+
+    assert instance == dto(id=1, name="name 1", joined=None)
+
+
+@pytest.mark.model
+def test_dto_factory_from_row_missing(dto):
+    """
+    GIVEN DTO class of a model and row without a value that is not nullable
+    WHEN from_row is called with the row
+    THEN KeyError is raised.
+    """
+    with pytest.raises(KeyError):
+        dto.from_row({"name": "name 1"})
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_dict",
+    [
+        pytest.param(
+            {"id": 1, "name": None},
+            {"id": 1, "name": None, "updated": None},
+            id="None values",
+        ),
+        pytest.param(
+            {
+                "id": 1,
+                "name": "name 1",
+                "joined": datetime.date(2000, 1, 2),
+                "updated": datetime.datetime(2000, 1, 2, 3, 4, 5),
+                "photo": b"photo 1",
+                "settings": {"key": "value"},
+            },
+            {
+                "id": 1,
+                "name": "name 1",
+                "joined": "2000-01-02",
+                "updated": "2000-01-02T03:04:05",
+                "photo": "photo 1",
+                "settings": {"key": "value"},
+            },
+            id="all values",
+        ),
+    ],
+)
+@pytest.mark.model
+def test_dto_factory_to_dict(dto, kwargs, expected_dict):
+    """
+    GIVEN DTO class of a model and values
+    WHEN an instance is constructed with the values and to_dict is called
+    THEN the expected dictionary is returned with the keys in the order of the
+        properties.
+    """
+    returned_dict = dto(**kwargs).to_dict()
+
+    assert returned_dict == expected_dict
+    assert list(returned_dict) == list(expected_dict)
+
+
+@pytest.mark.parametrize(
+    "encoding, required, value, expected_value",
+    [
+        pytest.param("base64", False, b"\x00\xff", "AP8=", id="base64"),
+        pytest.param("base64", True, b"\x00\xff", "AP8=", id="base64 required"),
+        pytest.param("base64", True, None, None, id="base64 required None"),
+        pytest.param("bytes", False, memoryview(b"\x00\xff"), b"\x00\xff", id="bytes"),
+    ],
+)
+@pytest.mark.model
+def test_dto_factory_to_dict_binary_encoding(encoding, required, value, expected_value):
+    """
+    GIVEN DTO class of a model with a binary property with x-binary-encoding
+    WHEN an instance is constructed with a value and to_dict is called
+    THEN the value is converted based on the encoding.
+    """
+    artifacts = _calculate_artifacts(
+        {
+            "photo": {
+                "type": "string",
+                "format": "binary",
+                "nullable": True,
+                "x-binary-encoding": encoding,
+            }
+        },
+        ["photo"] if required else None,
+    )
+    dto = dto_factory.dto_factory(name="Model", artifacts=artifacts, parent=None)
+
+    returned_dict = dto(photo=value).to_dict()
+
+    assert returned_dict == {"photo": expected_value}
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [
+        pytest.param(None, None, id="None"),
+        pytest.param(
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "12345678-1234-5678-1234-567812345678",
+            id="UUID",
+        ),
+    ],
+)
+@pytest.mark.model
+def test_dto_factory_to_dict_uuid(value, expected_value):
+    """
+    GIVEN DTO class of a model with a required uuid property with x-native-uuid
+    WHEN an instance is constructed with a value and to_dict is called
+    THEN the value is converted to a string.
+    """
+    artifacts = _calculate_artifacts(
+        {
+            "id": {
+                "type": "string",
+                "format": "uuid",
+                "nullable": True,
+                "x-native-uuid": True,
+            }
+        },
+        ["id"],
+    )
+    dto = dto_factory.dto_factory(name="Model", artifacts=artifacts, parent=None)
+
+    returned_dict = dto(id=value).to_dict()
+
+    assert returned_dict == {"id": expected_value}
+
+
+@pytest.mark.model
+def test_dto_factory_repr_eq(dto):
+    """
+    GIVEN DTO class of a model
+    WHEN instances are compared and converted to a string
+    THEN instances with the same values are equal and the values are in the string.
+    """
+    instance = dto(id=1, name="name 1")
+
+    assert instance == dto(id=1, name="name 1")
+    assert instance != dto(id=2, name="name 1")
+    assert instance != types.SimpleNamespace(id=1, name="name 1")
+    assert repr(instance) == (
+        "ModelDto(id=1, name='name 1', joined=None, updated=None, photo=None, "
+        "settings=None)"
+    )
+
+
+@pytest.mark.model
+def test_dto_factory_inherits(dto):
+    """
+    GIVEN DTO class of a parent model and artifacts of a model that inherits
+    WHEN dto_factory is called with the artifacts and the parent DTO class
+    THEN a class that derives from the parent with slots for the new properties is
+        returned.
+    """
+    artifacts = _calculate_artifacts(
+        {"id": {"type": "integer"}, "child_prop": {"type": "string"}}, ["id"]
+    )
+
+    child = dto_factory.dto_factory(name="Child", artifacts=artifacts, parent=dto)
+
+    assert issubclass(child, dto)
+    assert child.__slots__ == ("child_prop",)
+    instance = child.from_row({"id": 1, "name": "name 1", "child_prop": "value"})
+    assert not hasattr(instance, "__dict__")
+    assert instance.to_dict() == {
+        "id": 1,
+        "name": "name 1",
+        "updated": None,
+        "child_prop": "value",
+    }
+    assert instance != dto(id=1, name="name 1")
+
+
+@pytest.mark.model
+def test_dto_factory_no_fields():
+    """
+    GIVEN artifacts of a model without properties stored on the DTO
+    WHEN dto_factory is called with the artifacts
+    THEN a class without fields is returned.
+    """
+    artifacts = _calculate_artifacts({"prop_1": {"type": "integer", "writeOnly": True}})
+
+    dto = dto_factory.dto_factory(name="Model", artifacts=artifacts, parent=None)
+
+    instance = dto.from_row({})
+    assert instance.to_dict() == {}
+    assert instance == dto()
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        pytest.param("first-name", id="hyphen"),
+        pytest.param("from", id="keyword"),
+        pytest.param("class", id="keyword class"),
+        pytest.param("self", id="parameter name"),
+        pytest.param("first name", id="space"),
+        pytest.param("x')\nimport os\n#", id="source"),
+    ],
+)
+@pytest.mark.model
+def test_dto_factory_name_not_identifier(name):
+    """
+    GIVEN artifacts of a model with properties with a name that is not an identifier
+    WHEN dto_factory is called with the artifacts and an instance is constructed,
+        converted to a dictionary, compared and converted to a string
+    THEN the values are stored and converted using the name.
+    """
+    artifacts = _calculate_artifacts(
+        {"id": {"type": "integer"}, name: {"type": "string", "format": "date"}},
+        ["id", name],
+    )
+
+    dto = dto_factory.dto_factory(name="Model-1", artifacts=artifacts, parent=None)
+
+    assert dto.__name__ == "Model-1Dto"
+    instance = dto.from_row({"id": 1, name: datetime.date(2000, 1, 2)})
+    assert not hasattr(instance, "__dict__")
+    assert getattr(instance, name) == datetime.date(2000, 1, 2)
+    assert instance.to_dict() == {"id": 1, name: "2000-01-02"}
+    assert instance == dto(**{"id": 1, name: datetime.date(2000, 1, 2)})
+    assert instance != dto(**{"id": 1, name: None})
+    assert repr(instance) == (f"Model-1Dto(id=1, {name}={datetime.date(2000, 1, 2)!r})")
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, expected_message",
+    [
+        pytest.param(
+            (), {}, "missing required keyword arguments: ['from']", id="missing"
+        ),
+        pytest.param(
+            (),
+            {"from": 1, "other": 2},
+            "unexpected keyword arguments: ['other']",
+            id="unexpected",
+        ),
+        pytest.param((1,), {"from": 1}, "takes no positional arguments", id="args"),
+    ],
+)
+@pytest.mark.model
+def test_dto_factory_name_not_identifier_invalid(args, kwargs, expected_message):
+    """
+    GIVEN DTO class of a model with a property with a name that is a keyword
+    WHEN it is constructed with invalid arguments
+    THEN TypeError is raised.
+    """
+    artifacts = _calculate_artifacts(
+        {"from": {"type": "integer"}, "to": {"type": "integer"}}, ["from"]
+    )
+    dto = dto_factory.dto_factory(name="Model", artifacts=artifacts, parent=None)
+
+    with pytest.raises(TypeError) as exc:
+        dto(*args, **kwargs)
+
+    assert expected_message in str(exc.value)
+
+
+@pytest.mark.model
+def test_dto_factory_name_not_identifier_inherits(dto):
+    """
+    GIVEN DTO class of a parent model and artifacts of a model that inherits with a
+        property with a name that is not an identifier
+    WHEN dto_factory is called with the artifacts and the parent DTO class
+    THEN a class that derives from the parent is returned.
+    """
+    artifacts = _calculate_artifacts(
+        {"id": {"type": "integer"}, "child-prop": {"type": "string"}}, ["id"]
+    )
+
+    child = dto_factory.dto_factory(name="Child", artifacts=artifacts, parent=dto)
+
+    instance = child(**{"id": 1, "name": "name 1", "child-prop": "value"})
+    assert not hasattr(instance, "__dict__")
+    assert getattr(instance, "child-prop") == "value"
+    assert instance.to_dict() == {
+        "id": 1,
+        "name": "name 1",
+        "updated": None,
+        "child-prop": "value",
+    }
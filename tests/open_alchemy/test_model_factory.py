@@ -262,6 +262,78 @@ def test_inherits():
     assert getattr(model, "__tablename__", None) is None
 
 
+@pytest.mark.model
+def test_dto():
+    """
+    GIVEN schemas with schema
+    WHEN model_factory is called with the name of the schema
+    THEN a model with a data transfer object class for the properties is returned.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {"property_1": {"type": "integer"}},
+        }
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    model = model_factory.model_factory(
+        name="Schema", get_base=_mock_get_base, schemas=schemas, artifacts=artifacts
+    )
+
+    assert model.Dto.__name__ == "SchemaDto"
+    assert model.Dto.__slots__ == ("property_1",)
+
+
+@pytest.mark.model
+def test_dto_inherits():
+    """
+    GIVEN schemas with schema that inherits from a parent with a data transfer object
+    WHEN model_factory is called with the name of the schema
+    THEN the data transfer object of the model derives from the one of the parent.
+    """
+    schemas = {
+        "Child": {
+            "allOf": [
+                {
+                    "x-inherits": True,
+                    "type": "object",
+                    "properties": {"property_2": {"type": "integer"}},
+                },
+                {"$ref": "#/components/schemas/Parent"},
+            ]
+        },
+        "Parent": {
+            "x-tablename": "parent",
+            "type": "object",
+            "properties": {"property_1": {"type": "string"}},
+        },
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+    parent = model_factory.model_factory(
+        name="Parent", get_base=_mock_get_base, schemas=schemas, artifacts=artifacts
+    )
+
+    model = model_factory.model_factory(
+        name="Child",
+        get_base=lambda **_: parent,
+        schemas=schemas,
+        artifacts=artifacts,
+    )
+
+    assert issubclass(model.Dto, parent.Dto)
+    assert model.Dto.__slots__ == ("property_2",)
+    assert model.Dto(property_1="value 1", property_2=2).to_dict() == {
+        "property_1": "value 1",
+        "property_2": 2,
+    }
+
+
 @pytest.mark.parametrize(
     "schemas, expected_schema",
     [
@@ -403,6 +475,34 @@ def test_inherits():
             },
             id="single description",
         ),
+        pytest.param(
+            {
+                "Schema": {
+                    "x-tablename": "table 1",
+                    "type": "object",
+                    "properties": {"property_1": {"type": "integer"}},
+                    "x-to-dict-cache": False,
+                }
+            },
+            {"type": "object", "properties": {"property_1": {"type": "integer"}}},
+            id="x-to-dict-cache false",
+        ),
+        pytest.param(
+            {
+                "Schema": {
+                    "x-tablename": "table 1",
+                    "type": "object",
+                    "properties": {"property_1": {"type": "integer"}},
+                    "x-to-dict-cache": True,
+                }
+            },
+            {
+                "type": "object",
+                "properties": {"property_1": {"type": "integer"}},
+                "x-to-dict-cache": True,
+            },
+            id="x-to-dict-cache",
+        ),
         pytest.param(
             {
                 "Schema": {
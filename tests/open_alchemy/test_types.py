@@ -0,0 +1,113 @@
+"""Tests for types."""
+
+import copy
+import dataclasses
+import inspect
+import pickle
+import tracemalloc
+
+import pytest
+
+from open_alchemy import types
+
+ARTIFACTS_CLASSES = [
+    value
+    for _, value in inspect.getmembers(types, inspect.isclass)
+    if dataclasses.is_dataclass(value) and value.__module__ == types.__name__
+]
+
+
+def _create_artifacts():
+    """Create OpenAPI simple property artifacts."""
+    return types.OpenApiSimplePropertyArtifacts(
+        type="integer",
+        format="int32",
+        max_length=None,
+        nullable=True,
+        default=None,
+        read_only=None,
+        write_only=None,
+        enum=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "cls", [pytest.param(cls, id=cls.__name__) for cls in ARTIFACTS_CLASSES]
+)
+def test_artifacts_slotted(cls):
+    """
+    GIVEN artifacts dataclass
+    WHEN the class is inspected
+    THEN it is frozen and instances do not have a __dict__.
+    """
+    assert cls.__dataclass_params__.frozen is True
+    assert cls.__dictoffset__ == 0
+    assert "__slots__" in vars(cls)
+
+
+def test_artifacts_frozen():
+    """
+    GIVEN artifacts
+    WHEN a field is assigned to
+    THEN FrozenInstanceError is raised.
+    """
+    artifacts = _create_artifacts()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        artifacts.type = "string"
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        pytest.param(copy.copy, id="copy"),
+        pytest.param(copy.deepcopy, id="deepcopy"),
+        pytest.param(lambda value: pickle.loads(pickle.dumps(value)), id="pickle"),
+    ],
+)
+def test_artifacts_copy(func):
+    """
+    GIVEN artifacts
+    WHEN the artifacts are copied
+    THEN the copy is equal to the artifacts.
+    """
+    artifacts = _create_artifacts()
+
+    returned_artifacts = func(artifacts)
+
+    assert returned_artifacts is not artifacts
+    assert returned_artifacts == artifacts
+
+
+def test_artifacts_memory():
+    """
+    GIVEN slotted artifacts and an equivalent dataclass without slots
+    WHEN many instances of each are created
+    THEN the slotted artifacts use less memory.
+    """
+    unslotted_cls = dataclasses.make_dataclass(
+        "UnslottedOpenApiSimplePropertyArtifacts",
+        [
+            (field.name, field.type)
+            for field in dataclasses.fields(types.OpenApiSimplePropertyArtifacts)
+        ],
+        frozen=True,
+    )
+    count = 1000
+
+    def measure(cls):
+        """Measure the memory retained by instances of a class."""
+        kwargs = dataclasses.asdict(_create_artifacts())
+        tracemalloc.start()
+        try:
+            instances = [cls(**kwargs) for _ in range(count)]
+            memory, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(instances) == count
+        return memory
+
+    slotted_memory = measure(types.OpenApiSimplePropertyArtifacts)
+    unslotted_memory = measure(unslotted_cls)
+
+    assert slotted_memory < unslotted_memory
@@ -0,0 +1,400 @@
+"""Tests for generating the from_dict validation and conversion."""
+
+import itertools
+import uuid
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.facades import jsonschema
+from open_alchemy.utility_base import from_dict
+from open_alchemy.utility_base.from_dict import codegen
+
+PROPERTIES = {
+    "integer": {"type": "integer", "x-primary-key": True},
+    "number": {"type": "number", "description": "number"},
+    "string": {"type": "string", "maxLength": 3},
+    "string_enum": {"type": "string", "enum": ["a", "b"]},
+    "integer_enum": {"type": "integer", "enum": [0, 1]},
+    "boolean_enum": {"type": "boolean", "enum": [True]},
+    "boolean": {"type": "boolean"},
+    "date": {"type": "string", "format": "date"},
+    "date_time": {"type": "string", "format": "date-time"},
+    "binary": {"type": "string", "format": "binary"},
+    "uuid": {"type": "string", "format": "uuid", "maxLength": 36},
+    "native_uuid": {"type": "string", "format": "uuid", "x-native-uuid": True},
+    "nullable": {"type": "string", "nullable": True},
+    "json": {"type": "object", "x-json": True},
+    "read_only": {"type": "integer", "readOnly": True},
+    "minimum": {"type": "integer", "minimum": 2},
+    "object": {"type": "object", "x-de-$ref": "RefModel"},
+    "array": {"type": "array", "items": {"type": "object", "x-de-$ref": "RefModel"}},
+}
+SCHEMA = {"type": "object", "properties": PROPERTIES, "required": ["integer"]}
+VALUES = [
+    0,
+    1,
+    3,
+    1.0,
+    1.5,
+    True,
+    False,
+    None,
+    "a",
+    "abcd",
+    "2000-01-01",
+    "2000-01-01T01:01:01",
+    "12345678-1234-5678-1234-567812345678",
+    "invalid",
+    {},
+    {"key": "value"},
+    [],
+    [{}],
+    [1],
+]
+
+
+def _outcome(func, kwargs):
+    """Calculate the result or the type of exception of a function."""
+    try:
+        return func(kwargs)
+    except (jsonschema.ValidationError, codegen.ValidationError):
+        return "invalid"
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc)
+
+
+def _reference(schema):
+    """Validate the dictionary using jsonschema and convert each value."""
+
+    def convert(kwargs):
+        jsonschema.validate(instance=kwargs, schema=schema)
+        if "properties" not in schema:
+            raise exceptions.MalformedSchemaError("no properties")
+        model_dict = {}
+        for name, value in kwargs.items():
+            property_schema = schema["properties"].get(name)
+            if property_schema is None:
+                raise exceptions.MalformedModelDictionaryError("unknown")
+            model_dict[name] = from_dict.convert(value=value, schema=property_schema)
+        return model_dict
+
+    return convert
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    list(itertools.product(PROPERTIES.keys(), VALUES)),
+)
+@pytest.mark.utility_base
+def test_compile_same_as_jsonschema(
+    mocked_facades_models_get_model, name, value
+):  # pylint: disable=unused-argument
+    """
+    GIVEN schema with a property and a value for the property
+    WHEN compile_ is called with the schema and the function is called with the value
+    THEN the outcome is the same as validating with jsonschema and converting.
+    """
+    kwargs = {"integer": 1, name: value}
+
+    returned_outcome = _outcome(codegen.compile_(schema=SCHEMA), kwargs)
+
+    assert returned_outcome == _outcome(_reference(SCHEMA), kwargs)
+
+
+@pytest.mark.parametrize(
+    "schema, kwargs, expected_outcome",
+    [
+        pytest.param(SCHEMA, {}, "invalid", id="required missing"),
+        pytest.param(
+            SCHEMA,
+            {"integer": 1.0, "string": "abcd"},
+            "invalid",
+            id="conversion error before invalid",
+        ),
+        pytest.param(
+            SCHEMA,
+            {"integer": 1, "unknown": 1, "string": "abcd"},
+            "invalid",
+            id="unknown before invalid",
+        ),
+        pytest.param(
+            SCHEMA,
+            {"integer": 1, "read_only": 1, "minimum": 1},
+            "invalid",
+            id="readOnly before invalid fallback",
+        ),
+        pytest.param(
+            SCHEMA,
+            {"integer": 1.0, "unknown": 1},
+            exceptions.InvalidInstanceError,
+            id="conversion error before unknown",
+        ),
+        pytest.param(
+            SCHEMA,
+            {"integer": 1, "unknown": 1},
+            exceptions.MalformedModelDictionaryError,
+            id="unknown",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}, "minProperties": 2},
+            {"key": 1},
+            "invalid",
+            id="unsupported model keyword",
+        ),
+        pytest.param(
+            {"required": ["key"]},
+            {"key": 1},
+            exceptions.MalformedSchemaError,
+            id="no properties",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": ["integer", "string"]}}},
+            {"key": "a"},
+            exceptions.TypeMissingError,
+            id="unsupported type",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "object"}}},
+            {"key": {}},
+            exceptions.MalformedSchemaError,
+            id="object without x-de-$ref",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "array", "items": {"type": "integer"}}}},
+            {"key": [1]},
+            exceptions.MalformedSchemaError,
+            id="array of simple items",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile(schema, kwargs, expected_outcome):
+    """
+    GIVEN schema, dictionary and expected outcome
+    WHEN compile_ is called with the schema and the function with the dictionary
+    THEN the expected outcome is the same as validating with jsonschema and
+        converting.
+    """
+    returned_outcome = _outcome(codegen.compile_(schema=schema), kwargs)
+
+    assert returned_outcome == expected_outcome
+    assert returned_outcome == _outcome(_reference(schema), kwargs)
+
+
+@pytest.mark.utility_base
+def test_compile_error_annotated():
+    """
+    GIVEN schema and dictionary with a value that cannot be converted
+    WHEN compile_ is called with the schema and the function with the dictionary
+    THEN the error includes the schema and the property name, schema and value.
+    """
+    with pytest.raises(exceptions.InvalidInstanceError) as exc:
+        codegen.compile_(schema=SCHEMA)({"integer": 1.0})
+
+    assert exc.value.schema == SCHEMA
+    assert exc.value.property_schema == PROPERTIES["integer"]
+    assert exc.value.property_name == "integer"
+    assert exc.value.property_value == 1.0
+
+
+@pytest.mark.parametrize(
+    "encoding, value, expected_outcome",
+    [
+        pytest.param(None, "a", b"a", id="utf-8 default str"),
+        pytest.param("utf-8", "a", b"a", id="utf-8 str"),
+        pytest.param(None, b"a", b"a", id="bytes"),
+        pytest.param(None, bytearray(b"a"), b"a", id="bytearray"),
+        pytest.param(None, memoryview(b"a"), b"a", id="memoryview"),
+        pytest.param("base64", "AP8=", b"\x00\xff", id="base64 str"),
+        pytest.param("base64", b"\x00\xff", b"\x00\xff", id="base64 bytes"),
+        pytest.param(
+            "base64",
+            "not base64!",
+            exceptions.InvalidInstanceError,
+            id="base64 invalid",
+        ),
+        pytest.param("bytes", "a", b"a", id="bytes encoding str"),
+        pytest.param(None, 1, "invalid", id="invalid type"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_binary(encoding, value, expected_outcome):
+    """
+    GIVEN schema with a binary property with an encoding and a value
+    WHEN compile_ is called with the schema and the function with the value
+    THEN the expected outcome is returned and bytes like values are not copied.
+    """
+    property_schema = {"type": "string", "format": "binary"}
+    if encoding is not None:
+        property_schema["x-binary-encoding"] = encoding
+    schema = {"properties": {"key": property_schema}}
+
+    returned_outcome = _outcome(codegen.compile_(schema=schema), {"key": value})
+
+    if isinstance(expected_outcome, bytes):
+        assert returned_outcome == {"key": expected_outcome}
+        if not isinstance(value, str):
+            assert returned_outcome["key"] is value
+    else:
+        assert returned_outcome == expected_outcome
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param(
+            {
+                "properties": {
+                    "key": {"type": "string", "format": "binary", "minLength": 1}
+                }
+            },
+            id="property fallback",
+        ),
+        pytest.param(
+            {
+                "properties": {"key": {"type": "string", "format": "binary"}},
+                "additionalProperties": False,
+            },
+            id="model fallback",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "value, expected_outcome",
+    [
+        pytest.param("a", b"a", id="str"),
+        pytest.param(b"a", b"a", id="bytes"),
+        pytest.param(bytearray(b"a"), b"a", id="bytearray"),
+        pytest.param(memoryview(b"a"), b"a", id="memoryview"),
+        pytest.param(1, "invalid", id="invalid type"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_binary_fallback(schema, value, expected_outcome):
+    """
+    GIVEN schema with a binary property that is validated using jsonschema and a
+        value
+    WHEN compile_ is called with the schema and the function with the value
+    THEN bytes like values are accepted in the same way as without the fallback.
+    """
+    returned_outcome = _outcome(codegen.compile_(schema=schema), {"key": value})
+
+    if isinstance(expected_outcome, bytes):
+        assert returned_outcome == {"key": expected_outcome}
+    else:
+        assert returned_outcome == expected_outcome
+
+
+@pytest.mark.parametrize(
+    "value, expected_outcome",
+    [
+        pytest.param(
+            "12345678-1234-5678-1234-567812345678",
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            id="str",
+        ),
+        pytest.param(
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            id="UUID",
+        ),
+        pytest.param("invalid", exceptions.InvalidInstanceError, id="str invalid"),
+        pytest.param(1, "invalid", id="invalid type"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_uuid(value, expected_outcome):
+    """
+    GIVEN schema with a native uuid property with a maximum length and a value
+    WHEN compile_ is called with the schema and the function with the value
+    THEN the expected outcome is returned.
+    """
+    schema = {
+        "properties": {
+            "key": {
+                "type": "string",
+                "format": "uuid",
+                "maxLength": 36,
+                "x-native-uuid": True,
+            }
+        }
+    }
+
+    returned_outcome = _outcome(codegen.compile_(schema=schema), {"key": value})
+
+    if isinstance(expected_outcome, uuid.UUID):
+        assert returned_outcome == {"key": expected_outcome}
+    else:
+        assert returned_outcome == expected_outcome
+
+
+@pytest.mark.parametrize(
+    "property_schema, expected_fallback",
+    [
+        pytest.param({"type": "integer"}, False, id="simple"),
+        pytest.param({"type": "string", "enum": ["a"]}, False, id="enum"),
+        pytest.param({"type": "integer", "maxLength": 1}, False, id="maxLength"),
+        pytest.param({"type": "object", "x-de-$ref": "Ref"}, False, id="object"),
+        pytest.param(
+            {"type": "array", "items": {"type": "object", "x-de-$ref": "Ref"}},
+            False,
+            id="array",
+        ),
+        pytest.param({"type": "object", "x-json": True}, True, id="json"),
+        pytest.param({"type": "integer", "readOnly": True}, True, id="readOnly"),
+        pytest.param({"type": "integer", "minimum": 1}, True, id="unsupported"),
+        pytest.param({"type": "string", "format": ["date"]}, True, id="format"),
+        pytest.param(
+            {"type": "string", "maxLength": "1"}, True, id="maxLength not int"
+        ),
+        pytest.param({"type": "string", "enum": "a"}, True, id="enum not list"),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "base64"},
+            False,
+            id="binary encoding",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "other"},
+            True,
+            id="binary encoding unsupported",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_generate(property_schema, expected_fallback):
+    """
+    GIVEN schema with a property
+    WHEN generate is called with the schema
+    THEN jsonschema is only used for the property if it is not supported.
+    """
+    source, constants, names = codegen.generate(
+        schema={"properties": {"key": property_schema}}
+    )
+
+    assert names == {"key": "property_0"}
+    assert "def convert_property_0(value):" in source
+    assert ("property_0_validator" in constants) == expected_fallback
+
+
+@pytest.mark.parametrize(
+    "value, enum, expected_result",
+    [
+        pytest.param("a", ["a", "b"], True, id="in"),
+        pytest.param("c", ["a", "b"], False, id="not in"),
+        pytest.param(1, [1], True, id="1 in"),
+        pytest.param(1, [True], False, id="1 not in True"),
+        pytest.param(True, [1], False, id="True not in 1"),
+        pytest.param(False, [0, False], True, id="False in"),
+        pytest.param(0, [False], False, id="0 not in False"),
+        pytest.param(1.0, [1], True, id="1.0 in 1"),
+    ],
+)
+@pytest.mark.utility_base
+def test_enum_contains(value, enum, expected_result):
+    """
+    GIVEN value, enum and expected result
+    WHEN enum_contains is called with the value and enum
+    THEN the expected result is returned.
+    """
+    assert codegen.enum_contains(value, enum) == expected_result
@@ -0,0 +1,202 @@
+"""Tests for checking and converting dictionaries in worker processes."""
+
+import datetime
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base.from_dict import parallel
+
+MODEL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "joined": {"type": "string", "format": "date"},
+        "settings": {"type": "object", "x-json": True},
+        "division": {"type": "object", "x-de-$ref": "Division"},
+    },
+    "required": ["id"],
+}
+PARENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "teams": {
+            "type": "array",
+            "items": {"type": "object", "x-de-$ref": "Team"},
+        },
+    },
+    "required": ["name"],
+}
+
+
+@pytest.mark.parametrize(
+    "schemas, row, expected_row",
+    [
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+            {"id": 1},
+            {"id": 1},
+            id="single",
+        ),
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+            {"id": 1, "joined": "2000-01-01", "settings": {"key": "value"}},
+            {
+                "id": 1,
+                "joined": datetime.date(year=2000, month=1, day=1),
+                "settings": {"key": "value"},
+            },
+            id="multiple",
+        ),
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=PARENT_SCHEMA),
+            {"id": 1, "name": "name 1"},
+            {"id": 1, "name": "name 1"},
+            id="parent",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile(schemas, row, expected_row):
+    """
+    GIVEN schemas, row and expected row
+    WHEN compile_ is called with the schemas and the function with the row
+    THEN the expected row is returned.
+    """
+    returned_row = parallel.compile_(schemas=schemas)(row)
+
+    assert returned_row == expected_row
+
+
+@pytest.mark.parametrize(
+    "schemas, row",
+    [
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=None), {}, id="required"
+        ),
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+            {"id": "1"},
+            id="invalid",
+        ),
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=PARENT_SCHEMA),
+            {"id": 1},
+            id="parent required",
+        ),
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+            {"id": 1, "division": {"id": 2}},
+            id="object relationship",
+        ),
+        pytest.param(
+            parallel.Schemas(model=MODEL_SCHEMA, parent=PARENT_SCHEMA),
+            {"id": 1, "name": "name 1", "teams": []},
+            id="parent array relationship",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_malformed(schemas, row):
+    """
+    GIVEN schemas and row that is not valid or includes a relationship
+    WHEN compile_ is called with the schemas and the function with the row
+    THEN MalformedModelDictionaryError is raised.
+    """
+    convert = parallel.compile_(schemas=schemas)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        convert(row)
+
+
+@pytest.mark.utility_base
+def test_convert_chunk(monkeypatch):
+    """
+    GIVEN initialized worker
+    WHEN convert_chunk is called with rows
+    THEN the converted rows are returned in order.
+    """
+    monkeypatch.setattr(parallel, "_CONVERTER", None)
+    parallel.initialize(parallel.Schemas(model=MODEL_SCHEMA, parent=None))
+
+    returned_rows = parallel.convert_chunk([{"id": 2}, {"id": 1}])
+
+    assert returned_rows == [{"id": 2}, {"id": 1}]
+
+
+@pytest.mark.utility_base
+def test_convert_chunk_not_initialized(monkeypatch):
+    """
+    GIVEN worker that is not initialized
+    WHEN convert_chunk is called
+    THEN RuntimeError is raised.
+    """
+    monkeypatch.setattr(parallel, "_CONVERTER", None)
+
+    with pytest.raises(RuntimeError):
+        parallel.convert_chunk([{"id": 1}])
+
+
+@pytest.mark.parametrize(
+    "workers, chunk_size",
+    [
+        pytest.param(0, 1, id="workers zero"),
+        pytest.param(1, 0, id="chunk size zero"),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert_invalid_arguments(workers, chunk_size):
+    """
+    GIVEN number of workers or chunk size that is not positive
+    WHEN convert is called
+    THEN ValueError is raised before any rows are converted.
+    """
+    with pytest.raises(ValueError):
+        parallel.convert(
+            schemas=parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+            rows=[],
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2])
+@pytest.mark.utility_base
+def test_convert(workers):
+    """
+    GIVEN rows and number of workers
+    WHEN convert is called with a chunk size smaller than the number of rows
+    THEN the converted rows are returned in the same order as the rows.
+    """
+    rows = [{"id": index, "joined": "2000-01-01"} for index in range(11)]
+
+    returned_rows = parallel.convert(
+        schemas=parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+        rows=iter(rows),
+        workers=workers,
+        chunk_size=2,
+    )
+
+    assert list(returned_rows) == [
+        {"id": index, "joined": datetime.date(year=2000, month=1, day=1)}
+        for index in range(11)
+    ]
+
+
+@pytest.mark.utility_base
+def test_convert_malformed():
+    """
+    GIVEN rows where one row is not valid
+    WHEN convert is called
+    THEN MalformedModelDictionaryError is raised in the current process.
+    """
+    returned_rows = parallel.convert(
+        schemas=parallel.Schemas(model=MODEL_SCHEMA, parent=None),
+        rows=[{"id": 1}, {"id": "2"}],
+        workers=1,
+        chunk_size=1,
+    )
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        list(returned_rows)
@@ -1,6 +1,7 @@
 """Tests for converting simple types."""
 
 import datetime
+import uuid
 from unittest import mock
 
 import pytest
@@ -37,6 +38,24 @@ from open_alchemy.utility_base.from_dict import simple
             exceptions.InvalidInstanceError,
             id="string different type",
         ),
+        pytest.param(
+            {"type": "string", "format": "binary"},
+            1,
+            exceptions.InvalidInstanceError,
+            id="string binary different type",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "base64"},
+            "not base64!",
+            exceptions.InvalidInstanceError,
+            id="string binary base64 invalid",
+        ),
+        pytest.param(
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            "value 1",
+            exceptions.InvalidInstanceError,
+            id="string uuid invalid",
+        ),
         pytest.param(
             {"type": "boolean"},
             1,
@@ -131,6 +150,30 @@ def test_convert_invalid(schema, value, exception):
             b"value 1",
             id="string  binary not NOne",
         ),
+        pytest.param(
+            {"type": "string", "format": "binary"},
+            b"value 1",
+            b"value 1",
+            id="string  binary bytes",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary"},
+            memoryview(b"value 1"),
+            b"value 1",
+            id="string  binary memoryview",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "base64"},
+            "AP8=",
+            b"\x00\xff",
+            id="string  binary base64",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "bytes"},
+            "value 1",
+            b"value 1",
+            id="string  binary bytes encoding str",
+        ),
         pytest.param(
             {"type": "string", "format": "date"},
             None,
@@ -155,6 +198,30 @@ def test_convert_invalid(schema, value, exception):
             datetime.datetime(2000, 1, 1, 1, 1, 1),
             id="string  date-time not None",
         ),
+        pytest.param(
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            None,
+            None,
+            id="string  uuid None",
+        ),
+        pytest.param(
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            "12345678-1234-5678-1234-567812345678",
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            id="string  uuid str",
+        ),
+        pytest.param(
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            id="string  uuid UUID",
+        ),
+        pytest.param(
+            {"type": "string", "format": "uuid"},
+            "12345678-1234-5678-1234-567812345678",
+            "12345678-1234-5678-1234-567812345678",
+            id="string  uuid not native",
+        ),
         pytest.param(
             {"type": "boolean"},
             True,
@@ -173,3 +240,20 @@ def test_convert(schema, value, expected_value):
     returned_value = simple.convert(schema=schema, value=value)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "value", [b"value 1", bytearray(b"value 1"), memoryview(b"value 1")]
+)
+@pytest.mark.utility_base
+def test_convert_binary_no_copy(value):
+    """
+    GIVEN bytes like value
+    WHEN convert is called with the value and a binary schema
+    THEN the same value is returned without copying it.
+    """
+    returned_value = simple.convert(
+        schema={"type": "string", "format": "binary"}, value=value
+    )
+
+    assert returned_value is value
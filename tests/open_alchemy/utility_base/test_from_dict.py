@@ -318,3 +318,132 @@ def test_from_str(__init__):
     instance = model.from_str('{"key_1": 1}')
 
     assert getattr(instance, "key_1") == 1
+
+
+@pytest.mark.parametrize(
+    "schema, dictionary, expected_values",
+    [
+        pytest.param(
+            {"properties": {"key_1": {"type": "integer"}}, "required": ["key_1"]},
+            {},
+            {"key_1": 0},
+            id="required missing",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string"},
+                },
+                "required": ["key_1", "key_2"],
+            },
+            {"key_2": "value 2"},
+            {"key_1": 0, "key_2": "value 2"},
+            id="some required",
+        ),
+        pytest.param(
+            {"properties": {"key_1": {"type": "string", "format": "date"}}},
+            {"key_1": "2000-01-01"},
+            {"key_1": datetime.date(year=2000, month=1, day=1)},
+            id="converted",
+        ),
+        pytest.param(
+            {
+                "properties": {"key_1": {"type": "integer"}},
+                "required": ["key_1"],
+                "minProperties": 0,
+            },
+            {},
+            {"key_1": 0},
+            id="required missing unsupported model keyword",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_update_from_dict(__init__, schema, dictionary, expected_values):
+    """
+    GIVEN schema, instance and dictionary with some of the properties
+    WHEN update_from_dict is called on the instance with the dictionary
+    THEN only the values in the dictionary are converted and set on the instance.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": schema, "__init__": __init__},
+    )
+    instance = model(key_1=0)
+
+    instance.update_from_dict(**dictionary)
+
+    for name, value in expected_values.items():
+        assert getattr(instance, name) == value
+
+
+@pytest.mark.parametrize(
+    "schema, dictionary",
+    [
+        pytest.param(
+            {"properties": {"key_1": {"type": "integer"}}},
+            {"key_1": "value 1"},
+            id="invalid",
+        ),
+        pytest.param(
+            {"properties": {"key_1": {"type": "integer"}}},
+            {"key_2": 2},
+            id="not a property",
+        ),
+        pytest.param(
+            {"properties": {"key_1": {"type": "integer", "readOnly": True}}},
+            {"key_1": 1},
+            id="readOnly",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_update_from_dict_malformed_dictionary(__init__, schema, dictionary):
+    """
+    GIVEN schema, instance and dictionary that does not satisfy the schema
+    WHEN update_from_dict is called on the instance with the dictionary
+    THEN MalformedModelDictionaryError is raised and the instance is not changed.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": schema, "__init__": __init__},
+    )
+    instance = model(key_1=0)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        instance.update_from_dict(**dictionary)
+
+    assert instance.key_1 == 0  # pylint: disable=no-member
+
+
+@pytest.mark.utility_base
+def test_update_from_dict_inheritance(mocked_facades_models_get_model, __init__):
+    """
+    GIVEN schema with parent model that has been mocked, instance and dictionary
+    WHEN update_from_dict is called on the instance with the dictionary
+    THEN construct_from_dict_update on the parent is called with the portion of the
+        dictionary for the parent and both portions are set on the instance.
+    """
+    construct = mocked_facades_models_get_model.return_value.construct_from_dict_update
+    construct.return_value = {"parent_key": "parent value"}
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "string"}},
+                "x-inherits": "Parent",
+            },
+            "__init__": __init__,
+        },
+    )
+    instance = model()
+
+    instance.update_from_dict(**{"key": "value", "parent_key": "parent value"})
+
+    construct.assert_called_once_with(**{"parent_key": "parent value"})
+    assert instance.key == "value"  # pylint: disable=no-member
+    assert instance.parent_key == "parent value"  # pylint: disable=no-member
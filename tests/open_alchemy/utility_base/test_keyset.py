@@ -0,0 +1,159 @@
+"""Tests for keyset pagination."""
+
+import base64
+import datetime
+import json
+import types
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import keyset
+
+OrderColumn = keyset.OrderColumn
+
+
+@pytest.mark.parametrize(
+    "order_by, primary_key, expected_order",
+    [
+        pytest.param(None, ["id"], [OrderColumn("id", False)], id="default"),
+        pytest.param(
+            None,
+            ["id_1", "id_2"],
+            [OrderColumn("id_1", False), OrderColumn("id_2", False)],
+            id="default composite primary key",
+        ),
+        pytest.param(
+            ["name"],
+            ["id"],
+            [OrderColumn("name", False), OrderColumn("id", False)],
+            id="property",
+        ),
+        pytest.param(
+            ["-name"],
+            ["id"],
+            [OrderColumn("name", True), OrderColumn("id", False)],
+            id="property descending",
+        ),
+        pytest.param(
+            ["-id"], ["id"], [OrderColumn("id", True)], id="primary key descending"
+        ),
+        pytest.param(
+            ["name", "id_2"],
+            ["id_1", "id_2"],
+            [
+                OrderColumn("name", False),
+                OrderColumn("id_2", False),
+                OrderColumn("id_1", False),
+            ],
+            id="part of primary key",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_order(order_by, primary_key, expected_order):
+    """
+    GIVEN order_by and the primary key
+    WHEN calculate_order is called with the order_by and the primary key
+    THEN the expected order is returned.
+    """
+    returned_order = keyset.calculate_order(order_by=order_by, primary_key=primary_key)
+
+    assert returned_order == expected_order
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "object", "x-json": True}, id="JSON"),
+        pytest.param({"type": "array", "items": {"type": "integer"}}, id="array"),
+    ],
+)
+@pytest.mark.utility_base
+def test_check_order_schema_invalid(schema):
+    """
+    GIVEN schema of a property that is not of a simple type
+    WHEN check_order_schema is called with the schema
+    THEN ModelAttributeError is raised.
+    """
+    with pytest.raises(exceptions.ModelAttributeError):
+        keyset.check_order_schema(name="prop_1", schema=schema)
+
+
+@pytest.mark.utility_base
+def test_check_order_schema_valid():
+    """
+    GIVEN schema of a property of a simple type
+    WHEN check_order_schema is called with the schema
+    THEN no exception is raised.
+    """
+    keyset.check_order_schema(name="prop_1", schema={"type": "integer"})
+
+
+ORDER = [OrderColumn("joined", True), OrderColumn("id", False)]
+SCHEMAS = {
+    "joined": {"type": "string", "format": "date"},
+    "id": {"type": "integer"},
+}
+
+
+@pytest.mark.utility_base
+def test_encode_decode_cursor():
+    """
+    GIVEN order and item
+    WHEN encode_cursor is called with the item and decode_cursor with the cursor
+    THEN the cursor is URL safe and the values of the item are returned.
+    """
+    item = types.SimpleNamespace(id=11, joined=datetime.date(2021, 1, 2), name="name")
+
+    cursor = keyset.encode_cursor(order=ORDER, schemas=SCHEMAS, item=item)
+    returned_values = keyset.decode_cursor(order=ORDER, schemas=SCHEMAS, cursor=cursor)
+
+    assert all(char.isalnum() or char in "-_=" for char in cursor)
+    assert returned_values == [datetime.date(2021, 1, 2), 11]
+
+
+def _encode(payload):
+    """Encode a payload in the same way as a cursor."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("not base64!", id="not base64"),
+        pytest.param("é", id="not ascii"),
+        pytest.param(base64.urlsafe_b64encode(b"not json").decode(), id="not JSON"),
+        pytest.param(_encode([1]), id="not object"),
+        pytest.param(
+            _encode({"order": ["joined", "id"], "values": ["2021-01-02", 11]}),
+            id="other order",
+        ),
+        pytest.param(_encode({"order": ["-joined", "id"]}), id="values missing"),
+        pytest.param(
+            _encode({"order": ["-joined", "id"], "values": "2021-01-02"}),
+            id="values not list",
+        ),
+        pytest.param(
+            _encode({"order": ["-joined", "id"], "values": ["2021-01-02"]}),
+            id="values too short",
+        ),
+        pytest.param(
+            _encode({"order": ["-joined", "id"], "values": ["2021-01-02", "11"]}),
+            id="value wrong type",
+        ),
+        pytest.param(
+            _encode({"order": ["-joined", "id"], "values": ["2021-01-02", None]}),
+            id="value None",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_decode_cursor_invalid(cursor):
+    """
+    GIVEN cursor that is not valid for the order
+    WHEN decode_cursor is called with the cursor
+    THEN InvalidCursorError is raised.
+    """
+    with pytest.raises(exceptions.InvalidCursorError):
+        keyset.decode_cursor(order=ORDER, schemas=SCHEMAS, cursor=cursor)
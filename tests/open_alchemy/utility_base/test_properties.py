@@ -0,0 +1,125 @@
+"""Tests for the properties of models."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import utility_base
+from open_alchemy.utility_base import properties
+
+PARENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "parent_key": {"type": "string", "nullable": False},
+        "parent_ref": {"type": "object", "x-de-$ref": "Ref"},
+    },
+}
+CHILD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key": {"type": "string"},
+        "secret": {"type": "string", "writeOnly": True},
+        "refs": {
+            "type": "array",
+            "items": {"type": "object", "x-de-$ref": "Ref"},
+        },
+    },
+    "x-inherits": "Parent",
+}
+
+
+def _model(name, schema):
+    """Construct a model with a schema."""
+    return type(name, (utility_base.UtilityBase,), {"_schema": schema})
+
+
+@pytest.mark.parametrize(
+    "schema, get_model_return_value, expected_exception",
+    [
+        pytest.param({}, None, exceptions.MalformedSchemaError, id="missing"),
+        pytest.param(
+            {"x-inherits": True}, None, exceptions.MalformedSchemaError, id="not str"
+        ),
+        pytest.param(
+            {"x-inherits": "Parent"},
+            None,
+            exceptions.SchemaNotFoundError,
+            id="not found",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_get_parent_error(
+    mocked_facades_models_get_model, schema, get_model_return_value, expected_exception
+):
+    """
+    GIVEN schema and the model returned by open_alchemy.models
+    WHEN get_parent is called with the schema
+    THEN the expected exception is raised.
+    """
+    mocked_facades_models_get_model.return_value = get_model_return_value
+
+    with pytest.raises(expected_exception):
+        properties.get_parent(schema=schema)
+
+
+@pytest.mark.parametrize(
+    "schema, expected_parent",
+    [
+        pytest.param(PARENT_SCHEMA, False, id="not inherits"),
+        pytest.param(CHILD_SCHEMA, True, id="inherits"),
+    ],
+)
+@pytest.mark.utility_base
+def test_get_parent_model(mocked_facades_models_get_model, schema, expected_parent):
+    """
+    GIVEN schema
+    WHEN get_parent_model is called with the schema
+    THEN the parent model is returned if the model inherits and otherwise None.
+    """
+    returned_parent = properties.get_parent_model(schema=schema)
+
+    if expected_parent:
+        assert returned_parent is mocked_facades_models_get_model.return_value
+        mocked_facades_models_get_model.assert_called_once_with(name="Parent")
+    else:
+        assert returned_parent is None
+
+
+@pytest.mark.utility_base
+def test_row_properties(mocked_facades_models_get_model):
+    """
+    GIVEN model that inherits
+    WHEN row_properties is called with the model
+    THEN the properties of the model and the parent stored in columns that are not
+        writeOnly are returned.
+    """
+    mocked_facades_models_get_model.return_value = _model("Parent", PARENT_SCHEMA)
+    model = _model("Child", CHILD_SCHEMA)
+
+    returned_properties = properties.row_properties(model=model)
+
+    assert returned_properties == {
+        "id": ({"type": "integer"}, False),
+        "parent_key": ({"type": "string", "nullable": False}, False),
+        "key": ({"type": "string"}, False),
+    }
+
+
+@pytest.mark.utility_base
+def test_relationships(mocked_facades_models_get_model):
+    """
+    GIVEN model that inherits
+    WHEN relationships is called with the model
+    THEN the properties of the model and the parent that are not stored in columns
+        are returned.
+    """
+    mocked_facades_models_get_model.return_value = _model("Parent", PARENT_SCHEMA)
+    model = _model("Child", CHILD_SCHEMA)
+
+    returned_relationships = properties.relationships(model=model)
+
+    assert returned_relationships == {
+        "parent_ref": PARENT_SCHEMA["properties"]["parent_ref"],
+        "refs": CHILD_SCHEMA["properties"]["refs"],
+    }
@@ -0,0 +1,199 @@
+"""Tests for rows_to_dicts on UtilityBase."""
+
+import datetime
+import types
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import utility_base
+
+
+@pytest.mark.parametrize(
+    "schema, rows, expected_dicts",
+    [
+        pytest.param({"properties": {"key": {"type": "integer"}}}, [], [], id="empty"),
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}},
+            [{"key": 1}],
+            [{"key": 1}],
+            id="single",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}},
+            [{"key": 1}, {"key": 2}],
+            [{"key": 1}, {"key": 2}],
+            id="multiple rows",
+        ),
+        pytest.param(
+            {"properties": {"key_1": {"type": "integer"}, "key_2": {"type": "string"}}},
+            [{"key_1": 1, "key_2": "value 2"}],
+            [{"key_1": 1, "key_2": "value 2"}],
+            id="multiple properties",
+        ),
+        pytest.param(
+            {"properties": {"key_1": {"type": "integer"}, "key_2": {"type": "string"}}},
+            [{"key_1": 1}],
+            [{"key_1": 1}],
+            id="property missing from row",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}},
+            [{"key": None}],
+            [{}],
+            id="null value not return",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer", "nullable": True}}},
+            [{"key": None}],
+            [{"key": None}],
+            id="null value return nullable",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}, "required": ["key"]},
+            [{"key": None}],
+            [{"key": None}],
+            id="null value return required",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer", "writeOnly": True}}},
+            [{"key": 1}],
+            [{}],
+            id="writeOnly",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key_1": {"type": "string", "format": "date"},
+                    "key_2": {"type": "string", "format": "date-time"},
+                    "key_3": {"type": "string", "format": "binary"},
+                }
+            },
+            [
+                {
+                    "key_1": datetime.date(2000, 1, 1),
+                    "key_2": datetime.datetime(2000, 1, 1, 1, 1, 1),
+                    "key_3": b"value 3",
+                }
+            ],
+            [
+                {
+                    "key_1": "2000-01-01",
+                    "key_2": "2000-01-01T01:01:01",
+                    "key_3": "value 3",
+                }
+            ],
+            id="formats",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "object", "x-json": True}}},
+            [{"key": {"json_key": "json value"}}],
+            [{"key": {"json_key": "json value"}}],
+            id="json",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "object", "x-de-$ref": "RefSchema"},
+                }
+            },
+            [{"key_1": 1, "key_2": "value 2"}],
+            [{"key_1": 1}],
+            id="relationship",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_rows_to_dicts(schema, rows, expected_dicts):
+    """
+    GIVEN class that derives from UtilityBase with a schema and rows
+    WHEN rows_to_dicts is called with the rows
+    THEN the expected dictionaries are returned.
+    """
+    model = type("model", (utility_base.UtilityBase,), {"_schema": schema})
+
+    returned_dicts = model.rows_to_dicts(rows)
+
+    assert returned_dicts == expected_dicts
+
+
+@pytest.mark.utility_base
+def test_rows_to_dicts_row_mapping():
+    """
+    GIVEN class that derives from UtilityBase and rows with a mapping of the values
+    WHEN rows_to_dicts is called with the rows
+    THEN the dictionaries are calculated from the mapping.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"count": {"type": "integer"}}}},
+    )
+    row = types.SimpleNamespace(_mapping={"count": 1})
+
+    returned_dicts = model.rows_to_dicts([row])
+
+    assert returned_dicts == [{"count": 1}]
+
+
+@pytest.mark.utility_base
+def test_rows_to_dicts_error():
+    """
+    GIVEN class that derives from UtilityBase with a schema and a row with an invalid
+        value
+    WHEN rows_to_dicts is called with the rows
+    THEN InvalidInstanceError is raised with the property name.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}},
+    )
+
+    with pytest.raises(exceptions.InvalidInstanceError) as exc:
+        model.rows_to_dicts([{"key": "1"}])
+
+    assert exc.value.property_name == "key"
+
+
+@pytest.mark.utility_base
+def test_rows_to_dicts_inheritance(mocked_facades_models_get_model):
+    """
+    GIVEN class that derives from UtilityBase with a schema that inherits
+    WHEN rows_to_dicts is called with rows
+    THEN the dictionaries include the properties of the parent.
+    """
+    parent = type(
+        "Parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string"},
+                }
+            }
+        },
+    )
+    mocked_facades_models_get_model.return_value = parent
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "x-inherits": "Parent",
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_3": {"type": "boolean"},
+                },
+            }
+        },
+    )
+
+    returned_dicts = model.rows_to_dicts(
+        [{"key_1": 1, "key_2": "value 2", "key_3": True}]
+    )
+
+    assert returned_dicts == [{"key_1": 1, "key_2": "value 2", "key_3": True}]
+    mocked_facades_models_get_model.assert_called_once_with(name="Parent")
@@ -0,0 +1,163 @@
+"""Tests for to_columns on UtilityBase."""
+
+import types
+
+import numpy
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import utility_base
+
+
+@pytest.mark.parametrize(
+    "schema, items, fields, expected_columns",
+    [
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}, "required": ["key"]},
+            [],
+            None,
+            {"key": []},
+            id="empty",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string"},
+                },
+                "required": ["key_1", "key_2"],
+            },
+            [{"key_1": 1, "key_2": "value 2"}, {"key_1": 3, "key_2": "value 4"}],
+            None,
+            {"key_1": [1, 3], "key_2": ["value 2", "value 4"]},
+            id="multiple",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string"},
+                },
+                "required": ["key_1", "key_2"],
+            },
+            [{"key_1": 1, "key_2": "value 2"}],
+            ["key_2"],
+            {"key_2": ["value 2"]},
+            id="fields",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "integer", "writeOnly": True},
+                    "key_3": {"type": "object", "x-de-$ref": "RefSchema"},
+                },
+                "required": ["key_1"],
+            },
+            [{"key_1": 1, "key_2": 2, "key_3": "value 3"}],
+            None,
+            {"key_1": [1]},
+            id="writeOnly and relationship",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_to_columns(schema, items, fields, expected_columns):
+    """
+    GIVEN class that derives from UtilityBase with a schema, items and fields
+    WHEN to_columns is called with the items and fields
+    THEN the expected columns are returned.
+    """
+    model = type("model", (utility_base.UtilityBase,), {"_schema": schema})
+
+    returned_columns = model.to_columns(items, fields=fields, backend="numpy")
+
+    assert {
+        name: array.tolist() for name, array in returned_columns.items()
+    } == expected_columns
+
+
+@pytest.mark.utility_base
+def test_to_columns_instances():
+    """
+    GIVEN class that derives from UtilityBase with a nullable property and instances
+    WHEN to_columns is called with the instances
+    THEN the values of the instances are masked where they are None.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "number"}}}},
+    )
+    instances = [types.SimpleNamespace(key=1.1), types.SimpleNamespace(key=None)]
+
+    returned_columns = model.to_columns(instances, backend="numpy")
+
+    assert isinstance(returned_columns["key"], numpy.ma.MaskedArray)
+    assert returned_columns["key"].tolist() == [1.1, None]
+
+
+@pytest.mark.utility_base
+def test_to_columns_none_not_nullable():
+    """
+    GIVEN class that derives from UtilityBase with a required property and a row
+        where it is None
+    WHEN to_columns is called with the row
+    THEN InvalidInstanceError is raised.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}, "required": ["key"]}},
+    )
+
+    with pytest.raises(exceptions.InvalidInstanceError):
+        model.to_columns([{"key": None}])
+
+
+@pytest.mark.utility_base
+def test_to_columns_inheritance(mocked_facades_models_get_model):
+    """
+    GIVEN class that derives from UtilityBase with a schema that inherits
+    WHEN to_columns is called with rows
+    THEN the columns include the properties of the parent based on the schema of the
+        parent.
+    """
+    parent = type(
+        "Parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string"},
+                },
+                "required": ["key_2"],
+            }
+        },
+    )
+    mocked_facades_models_get_model.return_value = parent
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "x-inherits": "Parent",
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_3": {"type": "boolean"},
+                },
+                "required": ["key_1"],
+            }
+        },
+    )
+
+    returned_columns = model.to_columns(
+        [{"key_1": 1, "key_2": "value 2", "key_3": True}], backend="numpy"
+    )
+
+    assert list(returned_columns) == ["key_1", "key_2", "key_3"]
+    assert not isinstance(returned_columns["key_1"], numpy.ma.MaskedArray)
+    assert not isinstance(returned_columns["key_2"], numpy.ma.MaskedArray)
+    assert isinstance(returned_columns["key_3"], numpy.ma.MaskedArray)
+    mocked_facades_models_get_model.assert_called_once_with(name="Parent")
@@ -167,7 +167,7 @@ def test_to_dict_inheritance_call(mocked_facades_models_get_model, __init__):
     assert returned_dict == {"key": "value", "parent_key": "parent value"}
     mocked_facades_models_get_model.assert_called_once_with(name="Parent")
     check_func = mocked_facades_models_get_model.return_value.instance_to_dict
-    check_func.assert_called_once_with(instance)
+    check_func.assert_called_once_with(instance, fields=None, exclude=None, depth=None)
 
 
 @pytest.mark.utility_base
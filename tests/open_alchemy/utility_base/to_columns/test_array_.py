@@ -0,0 +1,73 @@
+"""Tests for constructing the arrays of columns using the array module."""
+
+import array
+import datetime
+
+import pytest
+
+from open_alchemy.utility_base.to_columns import Column
+from open_alchemy.utility_base.to_columns import ColumnType
+from open_alchemy.utility_base.to_columns import array_
+
+
+@pytest.mark.parametrize(
+    "column, values, expected_array",
+    [
+        pytest.param(
+            Column(type_=ColumnType.INT64, nullable=False),
+            [1, 2],
+            array.array("q", [1, 2]),
+            id="integer",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.FLOAT64, nullable=False),
+            [1.1, 2],
+            array.array("d", [1.1, 2.0]),
+            id="number",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.BOOL, nullable=False),
+            [True, False],
+            array.array("b", [1, 0]),
+            id="boolean",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.DATE, nullable=False),
+            [datetime.date(2000, 1, 1)],
+            [datetime.date(2000, 1, 1)],
+            id="date",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.STRING, nullable=False),
+            ["value 1", "value 2"],
+            ["value 1", "value 2"],
+            id="string",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.INT64, nullable=True),
+            [1, None],
+            array_.MaskedArray(
+                values=array.array("q", [1, 0]), mask=array.array("b", [0, 1])
+            ),
+            id="integer nullable",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.OBJECT, nullable=True),
+            [None, {"key": "value"}],
+            array_.MaskedArray(
+                values=[None, {"key": "value"}], mask=array.array("b", [1, 0])
+            ),
+            id="json nullable",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert(column, values, expected_array):
+    """
+    GIVEN column and values
+    WHEN convert is called with the column and values
+    THEN the expected array is returned.
+    """
+    returned_array = array_.convert(column=column, values=values)
+
+    assert returned_array == expected_array
@@ -0,0 +1,87 @@
+"""Tests for constructing the arrays of columns using Apache Arrow."""
+
+import datetime
+import uuid
+
+import pyarrow
+import pytest
+
+from open_alchemy.utility_base.to_columns import Column
+from open_alchemy.utility_base.to_columns import ColumnType
+from open_alchemy.utility_base.to_columns import arrow
+
+
+@pytest.mark.parametrize(
+    "type_, values, expected_type, expected_values",
+    [
+        pytest.param(
+            ColumnType.INT64, [1, None], pyarrow.int64(), [1, None], id="integer"
+        ),
+        pytest.param(
+            ColumnType.FLOAT64,
+            [1.1, None],
+            pyarrow.float64(),
+            [1.1, None],
+            id="number",
+        ),
+        pytest.param(
+            ColumnType.BOOL, [True, None], pyarrow.bool_(), [True, None], id="boolean"
+        ),
+        pytest.param(
+            ColumnType.DATE,
+            [datetime.date(2000, 1, 2), None],
+            pyarrow.date32(),
+            [datetime.date(2000, 1, 2), None],
+            id="date",
+        ),
+        pytest.param(
+            ColumnType.DATETIME,
+            [datetime.datetime(2000, 1, 2, 3, 4, 5, 6), None],
+            pyarrow.timestamp("us"),
+            [datetime.datetime(2000, 1, 2, 3, 4, 5, 6), None],
+            id="date-time",
+        ),
+        pytest.param(
+            ColumnType.STRING,
+            ["value 1", None],
+            pyarrow.string(),
+            ["value 1", None],
+            id="string",
+        ),
+        pytest.param(
+            ColumnType.BINARY,
+            [b"value 1", None],
+            pyarrow.binary(),
+            [b"value 1", None],
+            id="binary",
+        ),
+        pytest.param(
+            ColumnType.UUID,
+            [uuid.UUID("12345678-1234-5678-1234-567812345678"), None],
+            pyarrow.binary(16),
+            [uuid.UUID("12345678-1234-5678-1234-567812345678").bytes, None],
+            id="uuid",
+        ),
+        pytest.param(
+            ColumnType.OBJECT,
+            [{"key": "value"}, [1, 2], None],
+            pyarrow.string(),
+            ['{"key": "value"}', "[1, 2]", None],
+            id="json",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert(type_, values, expected_type, expected_values):
+    """
+    GIVEN column and values
+    WHEN convert is called with the column and values
+    THEN an array with the expected type and values is returned where None values
+        are null.
+    """
+    column = Column(type_=type_, nullable=True)
+
+    returned_array = arrow.convert(column=column, values=values)
+
+    assert returned_array.type == expected_type
+    assert returned_array.to_pylist() == expected_values
@@ -0,0 +1,286 @@
+"""Tests for converting model instances or rows to arrays for each column."""
+
+import sys
+import types
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import to_columns
+from open_alchemy.utility_base.to_columns import array_
+
+
+@pytest.mark.parametrize(
+    "schema, expected_column",
+    [
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}},
+            to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=True),
+            id="integer",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "number"}}},
+            to_columns.Column(type_=to_columns.ColumnType.FLOAT64, nullable=True),
+            id="number",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "boolean"}}},
+            to_columns.Column(type_=to_columns.ColumnType.BOOL, nullable=True),
+            id="boolean",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "string"}}},
+            to_columns.Column(type_=to_columns.ColumnType.STRING, nullable=True),
+            id="string",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "string", "format": "password"}}},
+            to_columns.Column(type_=to_columns.ColumnType.STRING, nullable=True),
+            id="string other format",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "string", "format": "date"}}},
+            to_columns.Column(type_=to_columns.ColumnType.DATE, nullable=True),
+            id="date",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "string", "format": "date-time"}}},
+            to_columns.Column(type_=to_columns.ColumnType.DATETIME, nullable=True),
+            id="date-time",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "string", "format": "binary"}}},
+            to_columns.Column(type_=to_columns.ColumnType.BINARY, nullable=True),
+            id="binary",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "string", "format": "uuid"}}},
+            to_columns.Column(type_=to_columns.ColumnType.STRING, nullable=True),
+            id="uuid",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "key": {"type": "string", "format": "uuid", "x-native-uuid": True}
+                }
+            },
+            to_columns.Column(type_=to_columns.ColumnType.UUID, nullable=True),
+            id="native uuid",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "object", "x-json": True}}},
+            to_columns.Column(type_=to_columns.ColumnType.OBJECT, nullable=True),
+            id="json",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer"}}, "required": ["key"]},
+            to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False),
+            id="required",
+        ),
+        pytest.param(
+            {
+                "properties": {"key": {"type": "integer", "nullable": True}},
+                "required": ["key"],
+            },
+            to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=True),
+            id="required nullable",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer", "nullable": False}}},
+            to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False),
+            id="not nullable",
+        ),
+        pytest.param(
+            {"properties": {"key": {"type": "integer", "default": 1}}},
+            to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False),
+            id="default",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_column(schema, expected_column):
+    """
+    GIVEN model schema
+    WHEN calculate_column is called with the schema and the name of a property
+    THEN the expected column is returned.
+    """
+    returned_column = to_columns.calculate_column(schema=schema, property_name="key")
+
+    assert returned_column == expected_column
+
+
+@pytest.mark.parametrize(
+    "items, expected_values",
+    [
+        pytest.param([], {"key_1": [], "key_2": []}, id="empty"),
+        pytest.param(
+            [{"key_1": 1, "key_2": "value 2"}],
+            {"key_1": [1], "key_2": ["value 2"]},
+            id="dictionary",
+        ),
+        pytest.param(
+            [{"key_1": 1}],
+            {"key_1": [1], "key_2": [None]},
+            id="dictionary missing value",
+        ),
+        pytest.param(
+            [types.SimpleNamespace(_mapping={"key_1": 1, "key_2": "value 2"})],
+            {"key_1": [1], "key_2": ["value 2"]},
+            id="row",
+        ),
+        pytest.param(
+            [types.SimpleNamespace(key_1=1, key_2="value 2")],
+            {"key_1": [1], "key_2": ["value 2"]},
+            id="instance",
+        ),
+        pytest.param(
+            [types.SimpleNamespace(key_1=1)],
+            {"key_1": [1], "key_2": [None]},
+            id="instance missing value",
+        ),
+        pytest.param(
+            iter([{"key_1": 1, "key_2": "value 2"}, {"key_1": 3, "key_2": None}]),
+            {"key_1": [1, 3], "key_2": ["value 2", None]},
+            id="multiple",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_collect(items, expected_values):
+    """
+    GIVEN columns and items
+    WHEN collect is called with the columns and items
+    THEN the expected values are returned.
+    """
+    columns = {
+        "key_1": to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False),
+        "key_2": to_columns.Column(type_=to_columns.ColumnType.STRING, nullable=True),
+    }
+
+    returned_values = to_columns.collect(columns=columns, items=items)
+
+    assert returned_values == expected_values
+
+
+@pytest.mark.utility_base
+def test_collect_none_not_nullable():
+    """
+    GIVEN column that is not nullable and item with a None value for it
+    WHEN collect is called with the column and item
+    THEN InvalidInstanceError is raised.
+    """
+    columns = {
+        "key": to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False)
+    }
+
+    with pytest.raises(exceptions.InvalidInstanceError):
+        to_columns.collect(columns=columns, items=[{"key": 1}, {"key": None}])
+
+
+@pytest.mark.parametrize(
+    "backend, expected_type",
+    [
+        pytest.param(None, "ndarray", id="default"),
+        pytest.param("numpy", "ndarray", id="numpy"),
+        pytest.param("arrow", "Int64Array", id="arrow"),
+        pytest.param("array", "array", id="array"),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert(backend, expected_type):
+    """
+    GIVEN columns, items and backend
+    WHEN convert is called with the columns, items and backend
+    THEN an array of the expected type is returned for each column.
+    """
+    columns = {
+        "key": to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False)
+    }
+
+    returned_arrays = to_columns.convert(
+        columns=columns, items=[{"key": 1}, {"key": 2}], backend=backend
+    )
+
+    assert list(returned_arrays) == ["key"]
+    assert type(returned_arrays["key"]).__name__ == expected_type
+
+
+@pytest.mark.utility_base
+def test_convert_invalid_backend():
+    """
+    GIVEN backend that is not known
+    WHEN convert is called with the backend
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        to_columns.convert(columns={}, items=[], backend="pandas")
+
+
+@pytest.mark.parametrize(
+    "backend, package, module",
+    [
+        pytest.param("numpy", "numpy", "numpy_", id="numpy"),
+        pytest.param("arrow", "pyarrow", "arrow", id="arrow"),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert_backend_not_installed(monkeypatch, backend, package, module):
+    """
+    GIVEN backend where the package it requires is not installed
+    WHEN convert is called with the backend
+    THEN ImportError is raised that refers to the package.
+    """
+    monkeypatch.setitem(sys.modules, package, None)
+    monkeypatch.delitem(sys.modules, f"{to_columns.__name__}.{module}", raising=False)
+
+    with pytest.raises(ImportError) as exc:
+        to_columns.convert(columns={}, items=[], backend=backend)
+
+    assert f"pip install {package}" in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    "missing, expected_type",
+    [
+        pytest.param(("numpy",), "Int64Array", id="numpy missing"),
+        pytest.param(("numpy", "pyarrow"), "array", id="numpy and pyarrow missing"),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert_default_backend_fallback(monkeypatch, missing, expected_type):
+    """
+    GIVEN packages that are not installed
+    WHEN convert is called without a backend
+    THEN the next available backend is used.
+    """
+    for package, module in (("numpy", "numpy_"), ("pyarrow", "arrow")):
+        monkeypatch.delitem(
+            sys.modules, f"{to_columns.__name__}.{module}", raising=False
+        )
+        if package in missing:
+            monkeypatch.setitem(sys.modules, package, None)
+    columns = {
+        "key": to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=False)
+    }
+
+    returned_arrays = to_columns.convert(columns=columns, items=[{"key": 1}])
+
+    assert type(returned_arrays["key"]).__name__ == expected_type
+
+
+@pytest.mark.utility_base
+def test_convert_array_nullable():
+    """
+    GIVEN nullable column and items with None values
+    WHEN convert is called with the array backend
+    THEN a masked array is returned.
+    """
+    columns = {
+        "key": to_columns.Column(type_=to_columns.ColumnType.INT64, nullable=True)
+    }
+
+    returned_arrays = to_columns.convert(
+        columns=columns, items=[{"key": 1}, {"key": None}], backend="array"
+    )
+
+    assert isinstance(returned_arrays["key"], array_.MaskedArray)
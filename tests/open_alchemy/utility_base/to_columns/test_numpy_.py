@@ -0,0 +1,151 @@
+"""Tests for constructing the arrays of columns using NumPy."""
+
+import datetime
+import uuid
+
+import numpy
+import pytest
+
+from open_alchemy.utility_base.to_columns import Column
+from open_alchemy.utility_base.to_columns import ColumnType
+from open_alchemy.utility_base.to_columns import numpy_
+
+
+@pytest.mark.parametrize(
+    "column, values, expected_dtype, expected_values",
+    [
+        pytest.param(
+            Column(type_=ColumnType.INT64, nullable=False),
+            [1, 2],
+            numpy.int64,
+            [1, 2],
+            id="integer",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.FLOAT64, nullable=False),
+            [1.1, 2],
+            numpy.float64,
+            [1.1, 2.0],
+            id="number",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.BOOL, nullable=False),
+            [True, False],
+            numpy.bool_,
+            [True, False],
+            id="boolean",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.DATE, nullable=False),
+            [datetime.date(2000, 1, 2)],
+            numpy.dtype("datetime64[D]"),
+            [numpy.datetime64("2000-01-02")],
+            id="date",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.DATETIME, nullable=False),
+            [datetime.datetime(2000, 1, 2, 3, 4, 5, 6)],
+            numpy.dtype("datetime64[us]"),
+            [numpy.datetime64("2000-01-02T03:04:05.000006")],
+            id="date-time",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.DATETIME, nullable=False),
+            [
+                datetime.datetime(
+                    2000,
+                    1,
+                    2,
+                    3,
+                    tzinfo=datetime.timezone(datetime.timedelta(hours=1)),
+                )
+            ],
+            numpy.dtype("datetime64[us]"),
+            [numpy.datetime64("2000-01-02T02:00:00")],
+            id="date-time timezone",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.STRING, nullable=False),
+            ["value 1", "value 2"],
+            object,
+            ["value 1", "value 2"],
+            id="string",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.BINARY, nullable=False),
+            [b"value 1"],
+            object,
+            [b"value 1"],
+            id="binary",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.UUID, nullable=False),
+            [uuid.UUID("12345678-1234-5678-1234-567812345678")],
+            object,
+            [uuid.UUID("12345678-1234-5678-1234-567812345678")],
+            id="uuid",
+        ),
+        pytest.param(
+            Column(type_=ColumnType.OBJECT, nullable=False),
+            [[1, 2], [3, 4]],
+            object,
+            [[1, 2], [3, 4]],
+            id="json lists",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert(column, values, expected_dtype, expected_values):
+    """
+    GIVEN column and values
+    WHEN convert is called with the column and values
+    THEN a one dimensional array with the expected dtype and values is returned.
+    """
+    returned_array = numpy_.convert(column=column, values=values)
+
+    assert not isinstance(returned_array, numpy.ma.MaskedArray)
+    assert returned_array.shape == (len(values),)
+    assert returned_array.dtype == expected_dtype
+    assert returned_array.tolist() == [
+        value.tolist() if isinstance(value, numpy.generic) else value
+        for value in expected_values
+    ]
+
+
+@pytest.mark.parametrize(
+    "type_, values, expected_data",
+    [
+        pytest.param(ColumnType.INT64, [1, None], [1, 0], id="integer"),
+        pytest.param(ColumnType.FLOAT64, [None, 1.1], [0.0, 1.1], id="number"),
+        pytest.param(ColumnType.BOOL, [True, None], [True, False], id="boolean"),
+        pytest.param(
+            ColumnType.DATE,
+            [datetime.date(2000, 1, 2), None],
+            [datetime.date(2000, 1, 2), None],
+            id="date",
+        ),
+        pytest.param(
+            ColumnType.DATETIME,
+            [None, datetime.datetime(2000, 1, 2)],
+            [None, datetime.datetime(2000, 1, 2)],
+            id="date-time",
+        ),
+        pytest.param(
+            ColumnType.STRING, ["value 1", None], ["value 1", None], id="string"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert_nullable(type_, values, expected_data):
+    """
+    GIVEN nullable column and values with None
+    WHEN convert is called with the column and values
+    THEN a masked array where the None values are masked is returned.
+    """
+    column = Column(type_=type_, nullable=True)
+
+    returned_array = numpy_.convert(column=column, values=values)
+
+    assert isinstance(returned_array, numpy.ma.MaskedArray)
+    assert returned_array.mask.tolist() == [value is None for value in values]
+    assert returned_array.data.tolist() == expected_data
@@ -0,0 +1,94 @@
+"""Tests for selecting the properties to include when converting to a dictionary."""
+
+import pytest
+
+from open_alchemy.utility_base.to_dict import fields
+
+
+@pytest.mark.parametrize(
+    "paths, expected_grouped",
+    [
+        pytest.param(None, None, id="none"),
+        pytest.param([], {}, id="empty"),
+        pytest.param(["id"], {"id": None}, id="single"),
+        pytest.param(["id", "name"], {"id": None, "name": None}, id="multiple"),
+        pytest.param(["division.id"], {"division": ["id"]}, id="nested"),
+        pytest.param(
+            ["division.id", "division.name"],
+            {"division": ["id", "name"]},
+            id="nested multiple",
+        ),
+        pytest.param(
+            ["division.manager.id"],
+            {"division": ["manager.id"]},
+            id="nested deep",
+        ),
+        pytest.param(
+            ["division", "division.id"], {"division": None}, id="all then nested"
+        ),
+        pytest.param(
+            ["division.id", "division"], {"division": None}, id="nested then all"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_group(paths, expected_grouped):
+    """
+    GIVEN dotted paths
+    WHEN group is called with the paths
+    THEN the expected grouped paths are returned.
+    """
+    returned_grouped = fields.group(paths)
+
+    assert returned_grouped == expected_grouped
+
+
+@pytest.mark.parametrize(
+    "name, grouped_fields, grouped_exclude, expected_result",
+    [
+        pytest.param("id", None, None, True, id="no fields no exclude"),
+        pytest.param("id", {"id": None}, None, True, id="in fields"),
+        pytest.param("id", {"name": None}, None, False, id="not in fields"),
+        pytest.param("division", {"division": ["id"]}, None, True, id="nested fields"),
+        pytest.param("id", None, {"id": None}, False, id="in exclude"),
+        pytest.param("id", None, {"name": None}, True, id="not in exclude"),
+        pytest.param("division", None, {"division": ["id"]}, True, id="nested exclude"),
+        pytest.param("id", {"id": None}, {"id": None}, False, id="fields and exclude"),
+    ],
+)
+@pytest.mark.utility_base
+def test_includes(name, grouped_fields, grouped_exclude, expected_result):
+    """
+    GIVEN name and grouped fields and exclude
+    WHEN includes is called with the name, fields and exclude
+    THEN the expected result is returned.
+    """
+    result = fields.includes(name, fields=grouped_fields, exclude=grouped_exclude)
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "name, grouped_fields, grouped_exclude, expected_result",
+    [
+        pytest.param("division", None, None, (None, None), id="no fields no exclude"),
+        pytest.param("division", {"division": None}, None, (None, None), id="all"),
+        pytest.param(
+            "division", {"division": ["id"]}, None, (["id"], None), id="nested fields"
+        ),
+        pytest.param(
+            "division", None, {"division": ["id"]}, (None, ["id"]), id="nested exclude"
+        ),
+        pytest.param("division", None, {"id": None}, (None, None), id="not in exclude"),
+    ],
+)
+@pytest.mark.utility_base
+def test_nested(name, grouped_fields, grouped_exclude, expected_result):
+    """
+    GIVEN name and grouped fields and exclude
+    WHEN nested is called with the name, fields and exclude
+    THEN the expected nested paths are returned.
+    """
+    result = fields.nested(name, fields=grouped_fields, exclude=grouped_exclude)
+
+    assert result == expected_result
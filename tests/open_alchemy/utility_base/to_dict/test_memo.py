@@ -0,0 +1,48 @@
+"""Tests for reusing the dictionaries of instances during to_dict."""
+
+import pytest
+
+from open_alchemy.utility_base.to_dict import memo
+
+
+@pytest.mark.utility_base
+def test_start():
+    """
+    GIVEN cycle strategy
+    WHEN start is entered and exited
+    THEN the memo is available through get until it is exited.
+    """
+    assert memo.get() is None
+
+    with memo.start(cycle=memo.CycleStrategy.ERROR) as returned_memo:
+        assert memo.get() is returned_memo
+        assert returned_memo.cycle == memo.CycleStrategy.ERROR
+        assert returned_memo.dicts == {}
+        assert returned_memo.converting == set()
+
+    assert memo.get() is None
+
+
+@pytest.mark.parametrize(
+    "kwargs_1, kwargs_2, expected_equal",
+    [
+        pytest.param({}, {}, True, id="same"),
+        pytest.param({"depth": 1}, {"depth": 2}, False, id="depth"),
+        pytest.param({"fields": ("id",)}, {"fields": ("name",)}, False, id="fields"),
+        pytest.param({"exclude": ("id",)}, {}, False, id="exclude"),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_key(kwargs_1, kwargs_2, expected_equal):
+    """
+    GIVEN instance and two selections
+    WHEN calculate_key is called with the instance and each selection
+    THEN the keys are equal if the selections are equal.
+    """
+    instance = object()
+    default_kwargs = {"fields": None, "exclude": None, "depth": None}
+
+    key_1 = memo.calculate_key(instance, **{**default_kwargs, **kwargs_1})
+    key_2 = memo.calculate_key(instance, **{**default_kwargs, **kwargs_2})
+
+    assert (key_1 == key_2) == expected_equal
@@ -64,6 +64,28 @@ class TestConvertRelationship:
         )
         assert returned_value == expected_return_value
 
+    @staticmethod
+    @pytest.mark.utility_base
+    def test_valid_fields():
+        """
+        GIVEN value that has a to_dict function and fields, exclude and depth
+        WHEN _convert_relationship is called with the value, fields, exclude and depth
+        THEN to_dict is called with the fields, exclude and depth.
+        """
+        object_value = mock.MagicMock()
+
+        returned_value = object_._convert_relationship(
+            value=object_value, fields=["key_1"], exclude=["key_2"], depth=1
+        )
+
+        object_value.to_dict.assert_called_once_with(  # pylint: disable=no-member
+            fields=["key_1"], exclude=["key_2"], depth=1
+        )
+        expected_return_value = (
+            object_value.to_dict.return_value  # pylint: disable=no-member
+        )
+        assert returned_value == expected_return_value
+
     @staticmethod
     @pytest.mark.utility_base
     def test_valid_none():
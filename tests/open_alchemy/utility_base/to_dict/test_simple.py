@@ -1,6 +1,7 @@
 """Tests for converting simple types."""
 
 import datetime
+import uuid
 from unittest import mock
 
 import pytest
@@ -32,6 +33,11 @@ from open_alchemy.utility_base.to_dict import simple
             "value",
             exceptions.InvalidInstanceError,
         ),
+        (
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            "12345678-1234-5678-1234-567812345678",
+            exceptions.InvalidInstanceError,
+        ),
         ({"type": "boolean"}, 1, exceptions.InvalidInstanceError),
     ],
     ids=[
@@ -43,6 +49,7 @@ from open_alchemy.utility_base.to_dict import simple
         "string binary different type",
         "string date different type",
         "string date-time different type",
+        "string uuid different type",
         "boolean different type",
     ],
 )
@@ -126,6 +133,30 @@ def test_convert_invalid(schema, value, exception):
             "value 1",
             id="string  binary not NOne",
         ),
+        pytest.param(
+            {"type": "string", "format": "binary"},
+            memoryview(b"value 1"),
+            "value 1",
+            id="string  binary memoryview",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "utf-8"},
+            b"value 1",
+            "value 1",
+            id="string  binary utf-8",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "base64"},
+            b"\x00\xff",
+            "AP8=",
+            id="string  binary base64",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary", "x-binary-encoding": "bytes"},
+            b"\x00\xff",
+            b"\x00\xff",
+            id="string  binary bytes",
+        ),
         pytest.param(
             {"type": "string", "format": "date"},
             None,
@@ -150,6 +181,24 @@ def test_convert_invalid(schema, value, exception):
             "2000-01-01T01:01:01",
             id="string  date-time not None",
         ),
+        pytest.param(
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            None,
+            None,
+            id="string  uuid None",
+        ),
+        pytest.param(
+            {"type": "string", "format": "uuid", "x-native-uuid": True},
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "12345678-1234-5678-1234-567812345678",
+            id="string  uuid not None",
+        ),
+        pytest.param(
+            {"type": "string", "format": "uuid"},
+            "12345678-1234-5678-1234-567812345678",
+            "12345678-1234-5678-1234-567812345678",
+            id="string  uuid not native",
+        ),
         pytest.param(
             {"type": "boolean"},
             True,
@@ -168,3 +217,20 @@ def test_convert(schema, value, expected_value):
     returned_value = simple.convert(schema=schema, value=value)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.utility_base
+def test_convert_binary_bytes_no_copy():
+    """
+    GIVEN binary schema with bytes encoding and memoryview value
+    WHEN convert is called with the value and schema
+    THEN the same value is returned without copying it.
+    """
+    value = memoryview(b"value 1")
+
+    returned_value = simple.convert(
+        schema={"type": "string", "format": "binary", "x-binary-encoding": "bytes"},
+        value=value,
+    )
+
+    assert returned_value is value
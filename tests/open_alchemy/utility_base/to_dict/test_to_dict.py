@@ -72,3 +72,133 @@ def test_return_none(schema, expected_result):
     result = to_dict.return_none(schema=schema, property_name="prop_1")
 
     assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "schema, expected_result",
+    [
+        pytest.param({"type": "integer"}, True, id="simple"),
+        pytest.param({"type": "object", "x-json": True}, True, id="json object"),
+        pytest.param({"type": "array", "x-json": True}, True, id="json array"),
+        pytest.param(
+            {"type": "object", "x-de-$ref": "RefSchema"}, False, id="relationship"
+        ),
+        pytest.param(
+            {"type": "array", "items": {"type": "object", "x-de-$ref": "RefSchema"}},
+            False,
+            id="many relationship",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "readOnly": True,
+                "properties": {"key": {"type": "integer"}},
+            },
+            False,
+            id="readOnly",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_is_column(schema, expected_result):
+    """
+    GIVEN schema of a property and expected result
+    WHEN is_column is called with the schema
+    THEN the expected result is returned.
+    """
+    result = to_dict.is_column(schema=schema)
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "schema, expected_result",
+    [
+        pytest.param(
+            {"type": "object", "x-de-$ref": "RefSchema"}, False, id="relationship"
+        ),
+        pytest.param(
+            {"type": "array", "items": {"type": "object", "x-de-$ref": "RefSchema"}},
+            False,
+            id="many relationship",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "readOnly": True,
+                "properties": {"key": {"type": "integer"}},
+            },
+            True,
+            id="readOnly",
+        ),
+        pytest.param(
+            {
+                "type": "array",
+                "readOnly": True,
+                "items": {"type": "object", "properties": {"key": {"type": "integer"}}},
+            },
+            True,
+            id="readOnly many",
+        ),
+        pytest.param(
+            {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "readOnly": True,
+                    "properties": {"key": {"type": "integer"}},
+                },
+            },
+            True,
+            id="readOnly items",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_is_read_only(schema, expected_result):
+    """
+    GIVEN schema of a property and expected result
+    WHEN is_read_only is called with the schema
+    THEN the expected result is returned.
+    """
+    result = to_dict.is_read_only(schema=schema)
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "schema, expected_result",
+    [
+        pytest.param(
+            {
+                "type": "object",
+                "readOnly": True,
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string"},
+                },
+            },
+            ["key_1", "key_2"],
+            id="object",
+        ),
+        pytest.param(
+            {
+                "type": "array",
+                "readOnly": True,
+                "items": {"type": "object", "properties": {"key": {"type": "integer"}}},
+            },
+            ["key"],
+            id="array",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_read_only_properties(schema, expected_result):
+    """
+    GIVEN schema of a readOnly property and expected result
+    WHEN read_only_properties is called with the schema
+    THEN the expected result is returned.
+    """
+    result = to_dict.read_only_properties(schema=schema)
+
+    assert result == expected_result
@@ -1,6 +1,7 @@
 """Tests for the CLI."""
 
 import argparse
+import json
 import os
 import pathlib
 import sys
@@ -73,6 +74,11 @@ def test_validate_specfile_does_not_exist(tmp_path):
             ["specfile='specfile.yaml'", "output='models.py'"],
             id="cli generate command",
         ),
+        pytest.param(
+            ["openalchemy", "advise", "specfile.yaml"],
+            ["specfile='specfile.yaml'"],
+            id="cli advise command",
+        ),
     ],
 )
 @pytest.mark.cli
@@ -127,6 +133,51 @@ def test_generate(tmp_path):
     assert "Autogenerated SQLAlchemy models" in model_file.read_text()
 
 
+@pytest.mark.cli
+def test_advise_findings(capsys):
+    """
+    GIVEN arguments from the parser with a specification with a foreign key that is
+        not indexed
+    WHEN they are passed to the advise() function
+    THEN the finding is written as JSON and the program exits with status 1.
+    """
+    args = argparse.Namespace(
+        specfile=str(
+            pathlib.Path.cwd()
+            / "examples"
+            / "relationship"
+            / "many_to_one"
+            / "example-spec.yml"
+        )
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.advise(args)
+
+    assert exc_info.value.code == 1
+    output = json.loads(capsys.readouterr().out)
+    assert [
+        (finding["code"], finding["model"], finding["property"])
+        for finding in output["findings"]
+    ] == [("foreign-key-not-indexed", "Employee", "division_id")]
+
+
+@pytest.mark.cli
+def test_advise_no_findings(capsys):
+    """
+    GIVEN arguments from the parser with a specification without performance problems
+    WHEN they are passed to the advise() function
+    THEN an empty list of findings is written as JSON.
+    """
+    args = argparse.Namespace(
+        specfile=str(pathlib.Path.cwd() / "examples" / "simple" / "example-spec.yml")
+    )
+
+    cli.advise(args)
+
+    assert json.loads(capsys.readouterr().out) == {"findings": []}
+
+
 @pytest.mark.parametrize(
     "command, expected_file",
     [